@@ -0,0 +1,15 @@
+"""
+Benchmark-Suite des Schul-Mathematik Frameworks
+
+Misst Konstruktion, Parsen, Ableitungen, Nullstellen/Extrema/Wendepunkte für
+alle Funktionstypen sowie Graphen, LGS, Interpolation, Stochastik und die
+Importzeit - jeweils mit kaltem und warmem Cache. Ergebnisse lassen sich als
+JSON-Baseline speichern; `python -m benchmarks vergleich` schlägt fehl, wenn
+ein Fall regressiert.
+"""
+
+from .faelle import FAELLE
+from .messung import Ergebnis, Fall, messe
+from .vergleich import Abweichung, vergleiche
+
+__all__ = ["FAELLE", "Abweichung", "Ergebnis", "Fall", "messe", "vergleiche"]
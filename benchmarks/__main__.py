@@ -0,0 +1,83 @@
+"""
+Kommandozeile der Benchmark-Suite
+
+Aufruf (aus dem Projektverzeichnis, mit src im PYTHONPATH):
+    python -m benchmarks lauf [--filter nullstellen] [--json ergebnis.json]
+    python -m benchmarks baseline
+    python -m benchmarks vergleich [--schwelle 0.25]
+
+`vergleich` beendet sich mit Exit-Code 1, wenn ein Fall gegenüber
+benchmarks/baseline.json um mehr als die Schwelle langsamer geworden ist
+oder mehr Speicher braucht.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from . import vergleich
+from .faelle import FAELLE
+from .messung import messe
+
+
+def _laufe(filter_text: str | None, wiederholungen: int) -> dict:
+    ergebnisse: dict[str, dict] = {}
+    for fall in FAELLE:
+        if filter_text and filter_text not in fall.name:
+            continue
+        ergebnisse[fall.name] = {}
+        for modus in fall.modi:
+            ergebnis = messe(fall, modus, wiederholungen)
+            ergebnisse[fall.name][modus] = ergebnis.als_dict()
+            speicher = (
+                f"{ergebnis.speicher_spitze / 1024:>9.0f} KiB"
+                if ergebnis.speicher_spitze is not None
+                else " " * 13
+            )
+            print(
+                f"{fall.name:<32}{modus:<6}{ergebnis.median * 1000:>10.2f} ms"
+                f"  ± {ergebnis.iqr * 1000:>8.2f} ms (IQR){speicher}",
+                flush=True,
+            )
+    return vergleich.als_json(ergebnisse)
+
+
+def main(argumente: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark-Suite"
+    )
+    parser.add_argument("befehl", choices=("lauf", "baseline", "vergleich"))
+    parser.add_argument("--filter", help="Nur Fälle, deren Name den Text enthält")
+    parser.add_argument("--wiederholungen", type=int, default=5)
+    parser.add_argument("--json", type=Path, help="Ergebnis zusätzlich speichern")
+    parser.add_argument("--baseline", type=Path, default=vergleich.BASELINE)
+    parser.add_argument("--schwelle", type=float, default=0.25)
+    args = parser.parse_args(argumente)
+
+    daten = _laufe(args.filter, args.wiederholungen)
+    if args.json:
+        vergleich.speichere(daten, args.json)
+
+    if args.befehl == "baseline":
+        if args.filter and args.baseline.exists():
+            # Teilmessung: nur die gemessenen Fälle in der Baseline ersetzen
+            alt = vergleich.lade(args.baseline)
+            alt["faelle"].update(daten["faelle"])
+            daten["faelle"] = alt["faelle"]
+        vergleich.speichere(daten, args.baseline)
+        print(f"Baseline gespeichert: {args.baseline}")
+    elif args.befehl == "vergleich":
+        abweichungen = vergleich.vergleiche(
+            vergleich.lade(args.baseline), daten, schwelle=args.schwelle
+        )
+        if abweichungen:
+            print(f"\n{len(abweichungen)} Regression(en) über {args.schwelle:.0%}:")
+            for abweichung in abweichungen:
+                print(f"  {abweichung}")
+            return 1
+        print("\nKeine Regressionen gegenüber der Baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+"""
+Benchmark-Fälle des Schul-Mathematik Frameworks
+
+Jede Vorbereitung erzeugt frische Objekte und gibt das zu messende Callable
+zurück. Schwere Module (Plotly, sympy.stats) werden erst in der Vorbereitung
+importiert.
+"""
+
+from .importzeit import importzeiten
+from .messung import Fall
+
+# Typische Terme je Funktionstyp
+TERME = {
+    "polynom": "x^4 - 5*x^2 + 4",
+    "rational": "(x^2 + 1)/(x - 1)",
+    "trig": "2*sin(x)",
+    "exp": "x^2*exp(-x)",
+    "parametrisch": "a*x^3 - 3*a*x",
+}
+
+# Analysefälle, die kalt Konstruktion und ersten Aufruf gemeinsam messen
+ERSTER_AUFRUF = {("nullstellen", "exp")}
+
+
+def _konstruktion(term: str):
+    def vorbereiten():
+        from schul_mathematik.analysis.funktion import Funktion
+
+        return lambda: Funktion(term)
+
+    return vorbereiten
+
+
+def _parsen(term: str):
+    def vorbereiten():
+        from schul_mathematik.analysis.funktion import Funktion
+
+        roh = object.__new__(Funktion)
+        roh._initialisiere_basiskomponenten()
+        return lambda: roh._parse_string_to_sympy(term)
+
+    return vorbereiten
+
+
+def _analyse(term: str, methode: str, *args):
+    def vorbereiten():
+        from schul_mathematik.analysis.funktion import Funktion
+
+        f = Funktion(term)
+        return lambda: getattr(f, methode)(*args)
+
+    return vorbereiten
+
+
+def _erster_aufruf(term: str, methode: str):
+    """Konstruktion und erster Aufruf gemeinsam
+
+    Für Funktionen, deren Bestandteile erst beim ersten Zugriff aufgebaut
+    werden: kalt wird die ganze Arbeit gemessen, egal ob sie im Konstruktor
+    oder im ersten Aufruf anfällt. Warm misst wie `_analyse` nur den Aufruf.
+    """
+
+    def vorbereiten():
+        from schul_mathematik.analysis.funktion import Funktion
+
+        funktionen = []
+
+        def aufruf():
+            if not funktionen:
+                funktionen.append(Funktion(term))
+            return getattr(funktionen[0], methode)()
+
+        return aufruf
+
+    return vorbereiten
+
+
+def _graph():
+    from schul_mathematik.analysis.funktion import Funktion
+    from schul_mathematik.analysis.visualisierung import Graph
+
+    f = Funktion(TERME["polynom"])
+    return lambda: Graph(f, x_min=-3, x_max=3)
+
+
+def _lgs_loesen():
+    from schul_mathematik.analysis.lineare_gleichungssysteme import LGS_aus_matrix
+
+    system = LGS_aus_matrix([[4, -2, 1], [1, 1, 1], [9, 3, 1]], [3, 2, 7])
+    return system.löse
+
+
+def _lgs_viele_rechte_seiten():
+    import numpy as np
+
+    from schul_mathematik.analysis.lineare_gleichungssysteme import LGS_aus_matrix
+
+    system = LGS_aus_matrix([[4, -2, 1], [1, 1, 1], [9, 3, 1]])
+    rechte_seiten = np.random.default_rng(0).integers(-9, 9, size=(200, 3))
+    return lambda: system.löse_viele(rechte_seiten)
+
+
+def _interpolation():
+    from schul_mathematik.analysis.interpolation import NewtonInterpolation
+
+    punkte = [(x, x**3 - 2 * x + 1) for x in range(-10, 10)]
+    return lambda: NewtonInterpolation(punkte).als_funktion()
+
+
+def _schmiegkurve():
+    from schul_mathematik.analysis.schmiegkurven import Schmiegkurve
+
+    return lambda: Schmiegkurve([(0, 0), (2, 4)], tangenten=[1, 0])
+
+
+def _verteilungen():
+    from schul_mathematik.stochastik.wrapper import BinomialPDF, NormalCDF
+
+    return lambda: (BinomialPDF(50, 0.3, 20), NormalCDF(170, 8, 180))
+
+
+def _datenanalyse():
+    import numpy as np
+
+    from schul_mathematik.stochastik.datenanalyse import beschreibe_daten
+
+    werte = np.random.default_rng(1).normal(170, 8, 100_000)
+    return lambda: beschreibe_daten(werte, histogramm=(130, 210, 16))
+
+
+def _paketimport():
+    return importzeiten
+
+
+FAELLE: list[Fall] = [
+    *(Fall(f"konstruktion/{typ}", _konstruktion(term)) for typ, term in TERME.items()),
+    *(Fall(f"parsen/{typ}", _parsen(term)) for typ, term in TERME.items()),
+    *(
+        Fall(f"ableitung/{typ}", _analyse(term, "ableitung", 2))
+        for typ, term in TERME.items()
+    ),
+    *(
+        Fall(
+            f"{methode}/{typ}",
+            (_erster_aufruf if (methode, typ) in ERSTER_AUFRUF else _analyse)(
+                term, methode
+            ),
+        )
+        for methode in ("nullstellen", "extremstellen", "wendepunkte")
+        for typ, term in TERME.items()
+    ),
+    Fall("graph/polynom", _graph),
+    Fall("lgs/loesen", _lgs_loesen),
+    Fall("lgs/viele_rechte_seiten", _lgs_viele_rechte_seiten),
+    Fall("interpolation/newton_20", _interpolation),
+    Fall("interpolation/schmiegkurve", _schmiegkurve),
+    Fall("stochastik/verteilungen", _verteilungen),
+    Fall("stochastik/beschreibe_daten", _datenanalyse),
+    Fall("import/paket", _paketimport, modi=("kalt",), speicher=False),
+]
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Import-Zeit des Schul-Mathematik Frameworks messen
+
+Startet für jede Messung einen frischen Interpreter mit `python -X importtime`
+und wertet die kumulierten Zeiten pro Modul aus. Der Median über mehrere
+Läufe dient als Regressionsmetrik für den Paketstart.
+
+Aufruf:
+    python benchmarks/importzeit.py
+    python benchmarks/importzeit.py --code "from schul_mathematik import Graph"
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Module, die erst bei Bedarf geladen werden sollen
+SCHWERE_MODULE = ("plotly", "numpy", "sympy.stats", "marimo")
+
+
+def importzeiten(code: str = "import schul_mathematik") -> dict[str, int]:
+    """
+    Führt `code` in einem neuen Interpreter aus und liefert die Importzeiten.
+
+    Args:
+        code: Auszuführender Python-Code
+
+    Returns:
+        Kumulierte Importzeit in Mikrosekunden je Modulname; unter "" steht
+        die Summe aller direkt durch `code` ausgelösten Importe
+    """
+    umgebung = {**os.environ, "PYTHONPATH": str(SRC)}
+    prozess = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=umgebung,
+        check=True,
+    )
+    zeiten = {"": 0}
+    for zeile in prozess.stderr.splitlines():
+        if not zeile.startswith("import time:") or "cumulative" in zeile:
+            continue
+        # "import time: <selbst> | <kumuliert> | <eingerückter Modulname>"
+        _, kumuliert, modul = zeile.split("|")
+        zeiten[modul.strip()] = int(kumuliert)
+        if not modul[1:].startswith(" "):
+            zeiten[""] += int(kumuliert)
+    return zeiten
+
+
+def messe_importzeit(
+    code: str = "import schul_mathematik", wiederholungen: int = 5
+) -> dict:
+    """
+    Median der Import-Gesamtzeit über mehrere frische Interpreter.
+
+    Returns:
+        {"gesamt_ms": Median, "schwere_module": geladene schwere Module}
+    """
+    gesamt = []
+    geladen: set[str] = set()
+    for _ in range(wiederholungen):
+        zeiten = importzeiten(code)
+        gesamt.append(zeiten[""] / 1000)
+        geladen |= {m for m in SCHWERE_MODULE if m in zeiten}
+    return {"gesamt_ms": statistics.median(gesamt), "schwere_module": sorted(geladen)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--code", default="import schul_mathematik")
+    parser.add_argument("--wiederholungen", type=int, default=5)
+    argumente = parser.parse_args()
+
+    ergebnis = messe_importzeit(argumente.code, argumente.wiederholungen)
+    print(f"{argumente.code}: {ergebnis['gesamt_ms']:.1f} ms (Median)")
+    print("Geladene schwere Module:", ", ".join(ergebnis["schwere_module"]) or "keine")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Messlogik der Benchmark-Suite
+
+Ein `Fall` besteht aus einer Vorbereitung, die das zu messende Callable
+liefert. So wird nur die eigentliche Berechnung gemessen und nicht etwa das
+Nachschlagen einer gebundenen Methode.
+
+- kalt: vor jeder Wiederholung werden alle Caches geleert (lru_caches des
+  Frameworks und der SymPy-Cache) und die Objekte neu vorbereitet
+- warm: einmal vorbereiten, einmal ungemessen ausführen, dann wiederholen
+"""
+
+import gc
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+
+from sympy.core.cache import clear_cache
+
+from schul_mathematik.analysis.instrumentierung import leere_caches
+
+MODI = ("kalt", "warm")
+
+
+@dataclass(frozen=True)
+class Fall:
+    """Ein Benchmark-Fall"""
+
+    name: str  # z.B. "nullstellen/polynom"
+    vorbereiten: Callable[[], Callable[[], object]]
+    modi: tuple[str, ...] = MODI
+    speicher: bool = True  # Speicherspitze mit tracemalloc messen
+
+
+@dataclass(frozen=True)
+class Ergebnis:
+    """Messwerte eines Falls in einem Modus (Zeiten in Sekunden)"""
+
+    median: float
+    iqr: float
+    minimum: float
+    wiederholungen: int
+    speicher_spitze: int | None = None  # Bytes
+
+    def als_dict(self) -> dict:
+        return asdict(self)
+
+
+def _kalt_vorbereiten(fall: Fall) -> Callable[[], object]:
+    leere_caches()
+    clear_cache()
+    return fall.vorbereiten()
+
+
+def _zeit(aufruf: Callable[[], object]) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    aufruf()
+    return time.perf_counter() - start
+
+
+def _speicher_spitze(fall: Fall, modus: str) -> int:
+    aufruf = _kalt_vorbereiten(fall) if modus == "kalt" else fall.vorbereiten()
+    if modus == "warm":
+        aufruf()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        aufruf()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def messe(fall: Fall, modus: str, wiederholungen: int = 5) -> Ergebnis:
+    """
+    Misst einen Fall mehrfach und fasst die Laufzeiten zusammen.
+
+    Args:
+        fall: Zu messender Fall
+        modus: "kalt" oder "warm"
+        wiederholungen: Anzahl der Messungen (mindestens 1)
+
+    Returns:
+        Ergebnis mit Median, Interquartilsabstand und Speicherspitze
+    """
+    if modus not in MODI:
+        raise ValueError(f"Unbekannter Modus '{modus}', erlaubt: {', '.join(MODI)}")
+
+    zeiten = []
+    if modus == "kalt":
+        for _ in range(wiederholungen):
+            zeiten.append(_zeit(_kalt_vorbereiten(fall)))
+    else:
+        aufruf = fall.vorbereiten()
+        aufruf()
+        zeiten = [_zeit(aufruf) for _ in range(wiederholungen)]
+
+    if len(zeiten) > 1:
+        q1, _, q3 = statistics.quantiles(zeiten, n=4, method="inclusive")
+    else:
+        q1 = q3 = zeiten[0]
+
+    return Ergebnis(
+        median=statistics.median(zeiten),
+        iqr=q3 - q1,
+        minimum=min(zeiten),
+        wiederholungen=len(zeiten),
+        speicher_spitze=_speicher_spitze(fall, modus) if fall.speicher else None,
+    )
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Speicherbedarf pro Instanz messen
+
+Erzeugt viele gleichartige Objekte unter `tracemalloc` und teilt den
+Zuwachs durch ihre Anzahl. Funktionen werden über `Funktion.from_dict`
+gebaut, damit nur der Speicher der Objekte selbst gemessen wird und nicht
+der des Parsers oder der SymPy-Caches.
+
+Aufruf (aus dem Projektverzeichnis, mit src im PYTHONPATH):
+    python -m benchmarks.speicher
+    python -m benchmarks.speicher --anzahl 500
+"""
+
+import argparse
+import gc
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import sympy as sp
+
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.sympy_types import Extrempunkt, ExtremumTyp, Nullstelle
+
+
+def bytes_pro_instanz(erzeuge: Callable[[], Any], anzahl: int = 200) -> float:
+    """
+    Mittlerer Speicherzuwachs pro erzeugtem Objekt in Bytes.
+
+    Args:
+        erzeuge: Erzeugt ein neues Objekt (wird einmal vorab aufgerufen,
+            damit Import- und Cache-Effekte nicht mitgezählt werden)
+        anzahl: Anzahl der gleichzeitig lebenden Objekte
+    """
+    erzeuge()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        vorher = tracemalloc.take_snapshot()
+        objekte = [erzeuge() for _ in range(anzahl)]
+        gc.collect()
+        nachher = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    zuwachs = sum(s.size_diff for s in nachher.compare_to(vorher, "filename"))
+    del objekte
+    return zuwachs / anzahl
+
+
+def _mit_ableitung(daten: dict) -> Callable[[], Funktion]:
+    def erzeuge():
+        f = Funktion.from_dict(daten)
+        f.ableitung()
+        return f
+
+    return erzeuge
+
+
+def faelle(anzahl: int = 200) -> dict[str, tuple[Callable[[], Any], int]]:
+    """Name → (Erzeuger, Anzahl); Ableitungen sind teuer und laufen mit weniger Objekten"""
+    wenige = max(anzahl // 10, 1)
+    polynom = Funktion("x^3 - 3*x").to_dict()
+    quotient = Funktion("(x^2 + 1)/(x - 1)").to_dict()
+    trig = Funktion("2*sin(x)").to_dict()
+    x = sp.Integer(2)
+    return {
+        "funktion.ganzrational": (lambda: Funktion.from_dict(polynom), anzahl),
+        "funktion.quotient": (lambda: Funktion.from_dict(quotient), anzahl),
+        "funktion.trigonometrisch": (lambda: Funktion.from_dict(trig), anzahl),
+        "funktion.ganzrational_mit_ableitung": (_mit_ableitung(polynom), wenige),
+        "ergebnis.nullstelle": (lambda: Nullstelle(x, 1, True), 10 * anzahl),
+        "ergebnis.extrempunkt": (
+            lambda: Extrempunkt(x, x, ExtremumTyp.MINIMUM),
+            10 * anzahl,
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--anzahl", type=int, default=200)
+    argumente = parser.parse_args()
+
+    for name, (erzeuge, anzahl) in faelle(argumente.anzahl).items():
+        print(f"{name:40} {bytes_pro_instanz(erzeuge, anzahl):8.0f} B", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Baseline speichern und Messläufe dagegen vergleichen
+
+Eine Regression liegt vor, wenn der Median (bzw. die Speicherspitze) um mehr
+als die Schwelle relativ UND um mehr als eine absolute Mindestdifferenz über
+der Baseline liegt. Die Mindestdifferenz verhindert Fehlalarme bei sehr
+schnellen Fällen, deren Messrauschen relativ groß ist.
+"""
+
+import json
+import platform
+import sys
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+
+@dataclass(frozen=True)
+class Abweichung:
+    """Eine Verschlechterung gegenüber der Baseline"""
+
+    fall: str
+    modus: str
+    groesse: str  # "median" oder "speicher_spitze"
+    baseline: float
+    aktuell: float
+
+    @property
+    def faktor(self) -> float:
+        return self.aktuell / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        einheit = (
+            f"{self.baseline * 1000:.2f} ms → {self.aktuell * 1000:.2f} ms"
+            if self.groesse == "median"
+            else f"{self.baseline / 1024:.0f} KiB → {self.aktuell / 1024:.0f} KiB"
+        )
+        return (
+            f"{self.fall} [{self.modus}] {self.groesse}: {einheit} (×{self.faktor:.2f})"
+        )
+
+
+def als_json(ergebnisse: dict[str, dict[str, dict]]) -> dict:
+    """Messergebnisse mit Angaben zur Umgebung"""
+    return {
+        "umgebung": {
+            "python": sys.version.split()[0],
+            "plattform": platform.platform(),
+            "datum": date.today().isoformat(),
+        },
+        "faelle": ergebnisse,
+    }
+
+
+def speichere(daten: dict, pfad: Path = BASELINE) -> None:
+    pfad.write_text(json.dumps(daten, indent=2, ensure_ascii=False) + "\n")
+
+
+def lade(pfad: Path = BASELINE) -> dict:
+    if not pfad.exists():
+        raise FileNotFoundError(
+            f"Keine Baseline unter {pfad}. Erst 'python -m benchmarks baseline' ausführen."
+        )
+    return json.loads(pfad.read_text())
+
+
+def vergleiche(
+    baseline: dict,
+    aktuell: dict,
+    schwelle: float = 0.25,
+    min_zeit: float = 0.0005,
+    min_speicher: int = 64 * 1024,
+) -> list[Abweichung]:
+    """
+    Findet alle Fälle, die sich gegenüber der Baseline verschlechtert haben.
+
+    Args:
+        baseline: Gespeicherte Messung (Format von `als_json`)
+        aktuell: Neue Messung (Format von `als_json`)
+        schwelle: Erlaubte relative Verschlechterung (0.25 = 25 %)
+        min_zeit: Absolute Mindestdifferenz des Medians in Sekunden
+        min_speicher: Absolute Mindestdifferenz der Speicherspitze in Bytes
+
+    Returns:
+        Liste der Abweichungen (leer, wenn nichts regressiert ist)
+    """
+    abweichungen = []
+    for fall, modi in aktuell["faelle"].items():
+        for modus, werte in modi.items():
+            alt = baseline["faelle"].get(fall, {}).get(modus)
+            if alt is None:
+                continue
+            for groesse, minimum in (
+                ("median", min_zeit),
+                ("speicher_spitze", min_speicher),
+            ):
+                vorher, jetzt = alt.get(groesse), werte.get(groesse)
+                if vorher is None or jetzt is None:
+                    continue
+                if jetzt > vorher * (1 + schwelle) and jetzt - vorher > minimum:
+                    abweichungen.append(Abweichung(fall, modus, groesse, vorher, jetzt))
+    return abweichungen
@@ -3,13 +3,27 @@ Marimo Integration Examples
 
 Dieses Beispiel zeigt, wie man das Schul-Analysis Framework in Marimo-Notebooks
 integriert für interaktive mathematische Analysen.
+
+Die Zellen rechnen asynchron: Jede Ausgabe hat einen eigenen `Rechenkanal`.
+Bewegt man einen Slider, bricht die neue Berechnung die überholte ab (samt
+Worker-Prozess), statt hinter ihr zu warten.
 """
 
 import marimo as mo
 
-from schul_analysis import Ableitung, Extremstellen, Funktion, Graph
+from schul_mathematik.analysis import (
+    Ableitung,
+    Extremstellen,
+    Funktion,
+    Rechenkanal,
+    graph_async,
+    nullstellen_async,
+    nullstellen_schrittweise,
+)
 
-# from schul_analysis import Nullstellen  # TODO: Fix import
+# Ein Kanal pro Ausgabe; überlebt die Neuberechnung der Zellen
+analyse_kanal = Rechenkanal()
+graph_kanal = Rechenkanal()
 
 
 # Beispiel 1: Interaktive Funktionsanalyse
@@ -28,13 +42,20 @@ def interaktive_funktionsanalyse():
     x_max_slider = mo.ui.slider(0, 10, value=5, step=0.5, label="x_max")
 
     @mo.cell
-    def analyse_funktion():
+    async def analyse_funktion():
         try:
             # Funktion erstellen
             f = Funktion(funktion_input.value)
 
+            # Nullstellen: erst Näherungen anzeigen, dann exakte Werte
+            async for teil in nullstellen_schrittweise(f, kanal=analyse_kanal):
+                if teil.endgueltig:
+                    nullstellen = ", ".join(str(n.x) for n in teil.werte)
+                else:
+                    nullstellen = ", ".join(f"≈ {x:.3f}" for x in teil.werte)
+                    mo.output.replace(mo.md(f"**Nullstellen:** {nullstellen} …"))
+
             # Mathematische Analyse
-            # Nullstellen = Nullstellen(f)  # TODO: Fix import
             f_strich = Ableitung(f)
             extremstellen = Extremstellen(f)
 
@@ -42,7 +63,7 @@ def interaktive_funktionsanalyse():
             ergebnisse = [
                 f"**Funktion:** f(x) = {f.term()}",
                 f"**Ableitung:** f'(x) = {f_strich.term()}",
-                "**Nullstellen:** Berechnung temporär deaktiviert",
+                f"**Nullstellen:** {nullstellen or 'Keine Nullstellen'}",
             ]
 
             if extremstellen:
@@ -57,7 +78,12 @@ def interaktive_funktionsanalyse():
                     mo.md("\n".join(ergebnisse)),
                     # Graph erstellen
                     mo.md("**Graph:**"),
-                    Graph(f, x_bereich=(x_min_slider.value, x_max_slider.value)),
+                    await graph_async(
+                        f,
+                        x_min=x_min_slider.value,
+                        x_max=x_max_slider.value,
+                        kanal=graph_kanal,
+                    ),
                 ]
             )
 
@@ -84,7 +110,7 @@ def parameter_experimente():
     c_slider = mo.ui.slider(-5, 5, value=0, step=0.1, label="c")
 
     @mo.cell
-    def zeige_parameter_effekt():
+    async def zeige_parameter_effekt():
         # Funktion mit aktuellen Parametern erstellen
         if c_slider.value != 0:
             f_str = f"{a_slider.value}*x^2 + {b_slider.value}*x + {c_slider.value}"
@@ -96,8 +122,8 @@ def parameter_experimente():
         try:
             f = Funktion(f_str)
 
-            # Analyse durchführen
-            # Nullstellen = Nullstellen(f)
+            # Analyse durchführen; ein neuer Sliderwert bricht die alte ab
+            nullstellen = await nullstellen_async(f, kanal=analyse_kanal)
             extremstellen = Extremstellen(f)
 
             # Scheitelpunkt berechnen (für Parabeln)
@@ -112,10 +138,13 @@ def parameter_experimente():
                 [
                     mo.md(f"**Funktion:** f(x) = {f.term()}"),
                     mo.md(f"**Scheitelpunkt:** {scheitelpunkt}"),
-                    mo.md("**Nullstellen:** Berechnung temporär deaktiviert"),
+                    mo.md(
+                        "**Nullstellen:** "
+                        + (", ".join(str(n.x) for n in nullstellen) or "Keine")
+                    ),
                     mo.md(f"**Extremstellen:** {extremstellen}"),
                     mo.md("**Graph:**"),
-                    Graph(f, x_bereich=(-10, 10)),
+                    await graph_async(f, x_min=-10, x_max=10, kanal=graph_kanal),
                 ]
             )
 
@@ -147,7 +176,7 @@ def funktionen_vergleich():
     bereich_slider = mo.ui.slider(1, 20, value=10, step=1, label="Bereich ±")
 
     @mo.cell
-    def vergleiche_funktionen():
+    async def vergleiche_funktionen():
         try:
             # Funktionen erstellen
             f1 = Funktion(f1_input.value)
@@ -158,8 +187,14 @@ def funktionen_vergleich():
             x_min = -bereich_slider.value
             x_max = bereich_slider.value
 
-            graph = Graph(
-                f1, f2, f3, x_bereich=(x_min, x_max), titel="Funktionsvergleich"
+            graph = await graph_async(
+                f1,
+                f2,
+                f3,
+                x_min=x_min,
+                x_max=x_max,
+                titel="Funktionsvergleich",
+                kanal=graph_kanal,
             )
 
             return mo.vstack(
@@ -209,7 +244,7 @@ def main():
         - 🔍 **Interaktive Funktionsanalyse**: Geben Sie beliebige Funktionen ein
         - ⚙️ **Parameter-Experimente**: Verändern Sie Parameter und sehen Sie die Effekte
         - 📊 **Funktionenvergleich**: Vergleichen Sie mehrere Funktionen nebeneinander
-        - 🎯 **Automatische Berechnungen**: # Nullstellen, Extremstellen, Ableitungen
+        - 🎯 **Automatische Berechnungen**: Nullstellen, Extremstellen, Ableitungen
         - 📈 **Dynamische Visualisierung**: Plotly-Graphen mit intelligentem Zoom
         """),
             tabs,
@@ -98,7 +98,7 @@ def performance_test_nullstellen() -> List[Tuple[str, float]]:
     zeiten = []
     for term, beschreibung in test_funktionen:
         f = Funktion(term)
-        _, zeit = zeit_messen(lambda: f.nullstellen)
+        _, zeit = zeit_messen(f.nullstellen)
         zeiten.append(zeit)
         print(f"{beschreibung}:\t{zeit:.4f}s")
 
@@ -15,16 +15,13 @@ PÄDAGOGISCHE KERNPRINZIPIEN:
 # IMPORTS AUS ALLEN MODULEN
 # =============================================================================
 
-# Analysis-Modul (Kernfunktionalität)
-from .analysis import *
+# Unterpakete laden ihre schweren Abhängigkeiten (Plotly, NumPy, sympy.stats)
+# erst bei Bedarf; die Namen werden hier ebenfalls erst beim Zugriff aufgelöst
+from . import analysis, gemeinsam, stochastik  # noqa: F401
+from ._lazy import lazy_attribute
 
 # Geometrie-Modul (später zu erweitern)
 # from .geometrie import *
-# Gemeinsame Basisfunktionalität
-from .gemeinsam import *
-
-# Stochastik-Modul
-from .stochastik import *
 
 # =============================================================================
 # VERSION
@@ -73,8 +70,8 @@ __all__ = [
     "Graph",
     "Graph_parametrisiert",
     # 📊 ANALYSIS: TAYLOR-FUNKTIONEN
-    "taylorpolynom",
-    "tangente",
+    "Taylorpolynom",
+    "Tangente",
     # 📊 ANALYSIS: SPEZIALFUNKTIONEN
     "Achsensymmetrie",
     "Punktsymmetrie",
@@ -88,7 +85,25 @@ __all__ = [
     "LineareGleichung",
     "LGS",
     "interpolationspolynom",
+    "NewtonInterpolation",
     "plotte_loesung",
+    # ⏱️ ANALYSIS: PERFORMANCE-MESSUNG
+    "messe_performance",
+    "PerformanceBericht",
+    # 🏭 ANALYSIS: STAPELVERARBEITUNG
+    "analysiere_viele",
+    "Analyseergebnis",
+    # ⚡ ANALYSIS: ASYNCHRONE ANALYSE
+    "nullstellen_async",
+    "extrempunkte_async",
+    "graph_async",
+    "nullstellen_schrittweise",
+    "Rechenkanal",
+    "Teilergebnis",
+    # 🧮 ANALYSIS: ÄQUIVALENZPRÜFUNG
+    "sind_aequivalent",
+    # 🌀 ANALYSIS: PERIODISCHE LÖSUNGEN
+    "PeriodischeLoesung",
     # 🧪 ANALYSIS: TEST-UTILS
     "assert_gleich",
     "assert_wert_gleich",
@@ -107,10 +122,26 @@ __all__ = [
     "Sigma1Bereich",
     "Sigma2Bereich",
     "Sigma3Bereich",
+    # 📈 STOCHASTIK: DATENANALYSE
+    "LaufendeStatistik",
+    "LaufendeRegression",
+    "Histogramm",
+    "beschreibe_daten",
+    "analysiere_csv",
+    "regression_csv",
     # 📊 STOCHASTIK: VISUALISIERUNG
     "zeichne_binomialverteilung",
     "zeichne_normalverteilung",
     "zeichne_vergleich_zwei_normalverteilungen",
+    "zeichne_histogramm",
+    "zeichne_regression",
     # 📐 GEOMETRIE (wird später gefüllt)
     # "Punkt", "Gerade", "Ebene", "abstand_punkt_gerade", etc.
 ]
+
+_LAZY = {
+    **dict.fromkeys(analysis.__all__, ".analysis"),
+    "erstelle_funktion_automatisch": ".analysis",
+    **dict.fromkeys(stochastik._LAZY, ".stochastik"),
+}
+__getattr__, __dir__ = lazy_attribute(__name__, globals(), _LAZY)
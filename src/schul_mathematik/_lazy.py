@@ -0,0 +1,42 @@
+"""
+Verzögertes Laden von Paketattributen (PEP 562).
+
+Schwere Abhängigkeiten wie Plotly, NumPy oder sympy.stats werden erst beim
+ersten Zugriff auf einen Namen geladen, der sie braucht. So bleibt
+`from schul_mathematik import Funktion` schnell, während die öffentlichen
+Namen unverändert verfügbar sind.
+"""
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_attribute(
+    paket: str, namensraum: dict[str, Any], lazy: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Erzeugt `__getattr__` und `__dir__` für ein Paket mit verzögerten Namen.
+
+    Args:
+        paket: `__name__` des Pakets
+        namensraum: `globals()` des Pakets; geladene Namen werden dort
+                    abgelegt, sodass jeder Name nur einmal aufgelöst wird
+        lazy: Zuordnung Name → relatives Modul, z.B. {"Graph": ".visualisierung"}
+
+    Returns:
+        (__getattr__, __dir__) für die Modulebene des Pakets
+    """
+
+    def __getattr__(name: str) -> Any:
+        modul = lazy.get(name)
+        if modul is None:
+            raise AttributeError(f"Modul '{paket}' hat kein Attribut '{name}'")
+        wert = getattr(importlib.import_module(modul, paket), name)
+        namensraum[name] = wert
+        return wert
+
+    def __dir__() -> list[str]:
+        return sorted(set(namensraum) | set(lazy))
+
+    return __getattr__, __dir__
@@ -5,33 +5,50 @@ Enthält alle Funktionalitäten für differential- und integralrechnung,
 Funktionsanalyse, Nullstellenberechnung, etc.
 """
 
-# Importiere alle wichtigen Klassen und Funktionen
-from .api import *
-from .aspect_ratio import *
-from .basis_funktion import BasisFunktion
+from typing import TYPE_CHECKING
 
-# Unused imports removed
-from .exponential import ExponentialFunktion
-from .funktion import Funktion, erstelle_funktion_automatisch
-from .ganzrationale import GanzrationaleFunktion
+from .._lazy import lazy_attribute
 
-from .lineare_gleichungssysteme import (
-    LGS,
-    LineareGleichung,
-    interpolationspolynom,
-    plotte_loesung,
-)
-from .schmiegkurven import Schmiegkurve
-from .schmiegung import (
-    Graph_parametrisiert,
-    HermiteInterpolation,
-    Schmieggerade,
-    Schmiegkegel,
-    SchmiegkurveAllgemein,
-    Schmiegparabel,
+# Kern ohne Plotly/NumPy: wird sofort geladen
+from .aequivalenz import sind_aequivalent
+from .api import (
+    Ableitung,
+    Ausmultiplizieren,
+    Extrempunkte,
+    Extremstellen,
+    Flaeche,
+    FlaecheZweiFunktionen,
+    Funktionstyp,
+    HatAchsensymmetrie,
+    HatPunktsymmetrie,
+    Integral,
+    Nullstellen,
+    NullstellenMitWiederholungen,
+    Sattelpunkte,
+    Schnittpunkte,
+    Symmetrie,
+    Tangente,
+    Taylorpolynom,
+    Term,
+    Wendepunkte,
+    Zeichne,
+    ZeichneAbstandZweiPunkte,
+    ZeichneBinomialverteilung,
+    ZeichneGerade,
+    ZeichneNormalverteilung,
+    ZeichneNormalverteilungsVergleich,
+    ZeichnePunkt,
+    ZeichneSchnittpunktZweierGeraden,
+    ZeichneZweiPunkteUndGerade,
 )
-
-# Weitere wichtige Klassen
+from .basis_funktion import BasisFunktion
+from .exponential import ExponentialFunktion
+from .funktion import Funktion, FunktionsAusdruck, erstelle_funktion_automatisch
+from .ganzrationale import GanzrationaleFunktion
+from .instrumentierung import PerformanceBericht, cache_statistik, messe_performance
+from .lineare import LineareFunktion
+from .periodisch import PeriodischeLoesung
+from .quadratisch import QuadratischeFunktion
 from .strukturiert import (
     KompositionFunktion,
     ProduktFunktion,
@@ -45,13 +62,81 @@ from .symmetrie import (
     Punktsymmetrie,
 )
 from .sympy_types import *
-
-# Unused imports removed
 from .test_utils import assert_gleich, assert_wert_gleich
 from .trigonometrisch import TrigonometrischeFunktion
-from .lineare import LineareFunktion
-from .quadratisch import QuadratischeFunktion
-from .visualisierung import Graph
+
+# Visualisierung, Schmiegkurven und LGS brauchen Plotly bzw. NumPy und werden
+# wie Stapelverarbeitung und asynchrone API erst beim ersten Zugriff geladen
+_LAZY = {
+    "Graph": ".visualisierung",
+    "NewtonInterpolation": ".interpolation",
+    "LGS": ".lineare_gleichungssysteme",
+    "LineareGleichung": ".lineare_gleichungssysteme",
+    "interpolationspolynom": ".lineare_gleichungssysteme",
+    "plotte_loesung": ".lineare_gleichungssysteme",
+    "Schmiegkurve": ".schmiegkurven",
+    "analysiere_viele": ".stapelanalyse",
+    "Analyseergebnis": ".stapelanalyse",
+    "nullstellen_async": ".asynchron",
+    "extrempunkte_async": ".asynchron",
+    "graph_async": ".asynchron",
+    "nullstellen_schrittweise": ".asynchron",
+    "Rechenkanal": ".asynchron",
+    "Teilergebnis": ".asynchron",
+    "Graph_parametrisiert": ".schmiegung",
+    "HermiteInterpolation": ".schmiegung",
+    "Schmieggerade": ".schmiegung",
+    "Schmiegkegel": ".schmiegung",
+    "SchmiegkurveAllgemein": ".schmiegung",
+    "Schmiegparabel": ".schmiegung",
+    "AspectRatioType": ".aspect_ratio",
+    "AspectRatioController": ".aspect_ratio",
+    "aspect_ratio_controller": ".aspect_ratio",
+    "aspect_ratio_kontext": ".aspect_ratio",
+    "setze_aspect_ratio": ".aspect_ratio",
+    "get_aspect_ratio_info": ".aspect_ratio",
+    "wende_aspect_ratio_an": ".aspect_ratio",
+    "erstelle_aspect_ratio_buttons": ".aspect_ratio",
+}
+__getattr__, __dir__ = lazy_attribute(__name__, globals(), _LAZY)
+
+if TYPE_CHECKING:  # Verzögerte Namen für Typprüfer und Linter
+    from .aspect_ratio import (
+        AspectRatioController,
+        AspectRatioType,
+        aspect_ratio_controller,
+        aspect_ratio_kontext,
+        erstelle_aspect_ratio_buttons,
+        get_aspect_ratio_info,
+        setze_aspect_ratio,
+        wende_aspect_ratio_an,
+    )
+    from .asynchron import (
+        Rechenkanal,
+        Teilergebnis,
+        extrempunkte_async,
+        graph_async,
+        nullstellen_async,
+        nullstellen_schrittweise,
+    )
+    from .interpolation import NewtonInterpolation
+    from .lineare_gleichungssysteme import (
+        LGS,
+        LineareGleichung,
+        interpolationspolynom,
+        plotte_loesung,
+    )
+    from .schmiegkurven import Schmiegkurve
+    from .schmiegung import (
+        Graph_parametrisiert,
+        HermiteInterpolation,
+        Schmieggerade,
+        Schmiegkegel,
+        SchmiegkurveAllgemein,
+        Schmiegparabel,
+    )
+    from .stapelanalyse import Analyseergebnis, analysiere_viele
+    from .visualisierung import Graph
 
 # Vordefinierte Variablen und Parameter
 x = Variable("x")
@@ -79,13 +164,25 @@ __all__ = [
     "Wendepunkte",
     "Sattelpunkte",
     "Schnittpunkte",
+    "NullstellenMitWiederholungen",
+    "Funktionstyp",
     # 🔍 SYMMETRIE-FUNKTIONEN
     "Achsensymmetrie",
     "Punktsymmetrie",
+    "HatAchsensymmetrie",
+    "HatPunktsymmetrie",
     "Symmetrie",  # Für Abwärtskompatibilität
     # 📊 VISUALISIERUNG
     "Graph",
     "Zeichne",  # Für Abwärtskompatibilität
+    "ZeichneAbstandZweiPunkte",
+    "ZeichneBinomialverteilung",
+    "ZeichneGerade",
+    "ZeichneNormalverteilung",
+    "ZeichneNormalverteilungsVergleich",
+    "ZeichnePunkt",
+    "ZeichneSchnittpunktZweierGeraden",
+    "ZeichneZweiPunkteUndGerade",
     "Term",
     "Ausmultiplizieren",
     # 📈 TAYLOR-FUNKTIONEN
@@ -94,6 +191,7 @@ __all__ = [
     # 🏗️ FUNKTIONSKLASSEN
     "BasisFunktion",  # Neue abstrakte Basisklasse
     "Funktion",
+    "FunktionsAusdruck",
     "GanzrationaleFunktion",
     "ExponentialFunktion",
     "TrigonometrischeFunktion",
@@ -104,6 +202,7 @@ __all__ = [
     "SummeFunktion",
     "QuotientFunktion",
     "KompositionFunktion",
+    "erstelle_funktion_automatisch",
     # 🔤 SYMBOLISCHE KOMPONENTEN
     "Variable",
     "Parameter",
@@ -124,15 +223,35 @@ __all__ = [
     "LineareGleichung",
     "LGS",
     "interpolationspolynom",
+    "NewtonInterpolation",
     "plotte_loesung",
     # 🎯 ASPECT-RATIO-KONTROLLE
     "AspectRatioType",
     "AspectRatioController",
     "aspect_ratio_controller",
+    "aspect_ratio_kontext",
     "setze_aspect_ratio",
     "get_aspect_ratio_info",
     "wende_aspect_ratio_an",
     "erstelle_aspect_ratio_buttons",
+    # ⏱️ PERFORMANCE-MESSUNG
+    "messe_performance",
+    "PerformanceBericht",
+    "cache_statistik",
+    # 🏭 STAPELVERARBEITUNG
+    "analysiere_viele",
+    "Analyseergebnis",
+    # ⚡ ASYNCHRONE ANALYSE
+    "nullstellen_async",
+    "extrempunkte_async",
+    "graph_async",
+    "nullstellen_schrittweise",
+    "Rechenkanal",
+    "Teilergebnis",
+    # 🧮 ÄQUIVALENZPRÜFUNG
+    "sind_aequivalent",
+    # 🌀 PERIODISCHE LÖSUNGEN
+    "PeriodischeLoesung",
     # 🧪 TEST-UTILS
     "assert_gleich",
     "assert_wert_gleich",
@@ -0,0 +1,251 @@
+"""
+Äquivalenzprüfung symbolischer Ausdrücke durch zufällige Stichproben.
+
+`simplify(a - b) == 0` und `.equals` gehören zu den langsamsten
+SymPy-Operationen. `sind_aequivalent` setzt stattdessen zuerst beide Seiten an
+einigen zufälligen Punkten ein - Variablen *und* Parameter werden gezogen -
+und greift nur dann auf einen symbolischen Beweis zurück, wenn die
+Stichproben nichts entscheiden oder der Aufrufer einen Beweis verlangt.
+
+Garantien:
+
+- **Ungleich ist sicher.** Ein Punkt, an dem sich beide Seiten unterscheiden,
+  ist ein Gegenbeispiel. Rationale Funktionen werden an rationalen Punkten
+  exakt ausgewertet; sonst wird mit `GENAUIGKEIT` Dezimalstellen gerechnet
+  und erst ab einer relativen Abweichung von 10^-(GENAUIGKEIT - 10) als
+  ungleich gewertet.
+- **Gleich ist hochwahrscheinlich.** Nach Schwartz-Zippel verschwindet ein
+  vom Nullpolynom verschiedenes Polynom (bzw. der Zähler einer rationalen
+  Funktion) vom Gesamtgrad d an einem zufälligen Punkt aus S^n höchstens mit
+  Wahrscheinlichkeit d/|S|. Hier ist |S| > 10^12, bei k unabhängigen Punkten
+  ist eine falsche Gleichheit also höchstens (d/10^12)^k wahrscheinlich.
+  Für transzendente Ausdrücke (sin, exp, ...) gilt das analog, da die
+  Nullstellen einer nicht verschwindenden analytischen Funktion eine
+  Nullmenge bilden; die Schranke hängt dann zusätzlich von der
+  numerischen Toleranz ab.
+- **Stückweise Ausdrücke sind ausgenommen.** Abs, sign, Piecewise, floor,
+  Wurzeln und Logarithmen von Termen mit Symbolen, ... stimmen oft auf einem
+  ganzen Bereich überein (`sqrt(x^2)` und `x` für x > 0). Für sie gilt keine
+  Schranke: Die Stichproben belegen die Symbole abwechselnd mit beiden
+  Vorzeichen und finden so die meisten Gegenbeispiele, "gleich" meldet
+  `sind_aequivalent` aber erst nach symbolischer Bestätigung.
+- Wer einen Beweis braucht, übergibt `beweis=True`: dann zählt ein
+  Gegenbeispiel weiterhin sofort, Gleichheit aber nur nach symbolischer
+  Bestätigung.
+
+Examples:
+    >>> sind_aequivalent("x^2 - 1", "(x - 1)*(x + 1)")
+    True
+    >>> sind_aequivalent("sin(x)^2 + cos(x)^2", 1)
+    True
+    >>> sind_aequivalent("a*x + a", "a*(x + 2)")
+    False
+    >>> sind_aequivalent("sqrt(x^2)", "Abs(x)")
+    True
+"""
+
+import random
+from typing import Any
+
+import sympy as sp
+from sympy.parsing.sympy_parser import (
+    convert_xor,
+    implicit_multiplication_application,
+    parse_expr,
+    standard_transformations,
+)
+
+GENAUIGKEIT = 50  # Dezimalstellen für die numerische Auswertung
+STICHPROBEN = 6  # Benötigte gültige Punkte für "gleich"
+
+_ZAEHLER = 10**6  # Punkte p/q mit |p| ≤ _ZAEHLER, 1 ≤ q ≤ _NENNER
+_NENNER = 10**6
+
+# Funktionen, die nur stückweise analytisch sind (Knicke, Sprünge, Äste)
+_STUECKWEISE = (
+    sp.Abs,
+    sp.sign,
+    sp.Piecewise,
+    sp.Heaviside,
+    sp.floor,
+    sp.ceiling,
+    sp.frac,
+    sp.Min,
+    sp.Max,
+    sp.re,
+    sp.im,
+    sp.arg,
+    sp.conjugate,
+    sp.log,
+    sp.asin,
+    sp.acos,
+    sp.atan,
+    sp.acot,
+)
+
+_TRANSFORMATIONEN = (
+    *standard_transformations,
+    implicit_multiplication_application,
+    convert_xor,
+)
+
+
+def _als_ausdruck(ausdruck: Any) -> sp.Expr:
+    if isinstance(ausdruck, sp.Basic):
+        return ausdruck
+    if hasattr(ausdruck, "term_sympy"):  # Funktion
+        return ausdruck.term_sympy
+    if isinstance(ausdruck, str):
+        return parse_expr(ausdruck, transformations=_TRANSFORMATIONEN)
+    return sp.sympify(ausdruck)
+
+
+def _ist_stueckweise(ausdruck: sp.Expr) -> bool:
+    """Prüft, ob ein Ausdruck Knicke, Sprünge oder Verzweigungspunkte hat
+
+    Dazu zählen Abs, sign, Piecewise, floor, Logarithmen, Arkusfunktionen
+    und Potenzen mit nicht ganzzahligem Exponent über Termen mit Symbolen
+    (`sqrt(x^2)`, `x^(1/3)`).
+    """
+    if ausdruck.has(*_STUECKWEISE):
+        return True
+    return any(
+        potenz.exp.is_integer is not True and potenz.base.free_symbols
+        for potenz in ausdruck.atoms(sp.Pow)
+    )
+
+
+def _zufallswert(
+    symbol: sp.Symbol, rng: random.Random, negativ: bool | None = None
+) -> sp.Rational:
+    """Zufälliger exakter Wert, der die Annahmen des Symbols erfüllt
+
+    Mit `negativ` wird das Vorzeichen vorgegeben, soweit die Annahmen des
+    Symbols es zulassen.
+    """
+    if symbol.is_integer:
+        wert = sp.Integer(rng.randint(-_ZAEHLER, _ZAEHLER))
+    else:
+        wert = sp.Rational(rng.randint(-_ZAEHLER, _ZAEHLER), rng.randint(1, _NENNER))
+    if symbol.is_positive or symbol.is_nonnegative:
+        wert = abs(wert) + (1 if symbol.is_positive and wert == 0 else 0)
+    elif symbol.is_negative or symbol.is_nonpositive:
+        wert = -abs(wert) - (1 if symbol.is_negative and wert == 0 else 0)
+    elif negativ is not None:
+        wert = -abs(wert) if negativ else abs(wert)
+    return wert
+
+
+def _auswerten(ausdruck: sp.Expr, punkt: dict) -> sp.Expr | None:
+    """Wert an `punkt` - exakt, wenn er rational ist, sonst numerisch"""
+    wert = ausdruck.xreplace(punkt)
+    if not wert.is_Rational:
+        wert = wert.evalf(GENAUIGKEIT)
+    if not wert.is_number or wert.has(sp.nan, sp.zoo, sp.oo, -sp.oo):
+        return None  # Pol oder außerhalb des Definitionsbereichs
+    return wert
+
+
+def stichprobentest(
+    a: Any,
+    b: Any,
+    stichproben: int = STICHPROBEN,
+    rng: random.Random | None = None,
+) -> bool | None:
+    """
+    Vergleicht zwei Ausdrücke an zufälligen Punkten.
+
+    Args:
+        a, b: Ausdrücke (SymPy, String, Zahl oder Funktion)
+        stichproben: Anzahl gültiger Punkte, die für "gleich" nötig sind
+        rng: Zufallsgenerator (für reproduzierbare Tests)
+
+    Returns:
+        False bei einem Gegenbeispiel, True wenn alle Punkte übereinstimmen,
+        None wenn zu wenige Punkte auswertbar waren. Bei stückweisen
+        Ausdrücken (siehe Modul-Docstring) ist True nur ein Indiz.
+    """
+    a, b = _als_ausdruck(a), _als_ausdruck(b)
+    if a == b:
+        return True
+    rng = rng or random.Random()
+    symbole = sorted(a.free_symbols | b.free_symbols, key=lambda s: s.name)
+    toleranz = sp.Float(10) ** (10 - GENAUIGKEIT)
+    # Stückweise Ausdrücke: Vorzeichenmuster der Symbole durchlaufen
+    vorzeichen = _ist_stueckweise(a) or _ist_stueckweise(b)
+
+    # Konstanten brauchen nur einen Punkt
+    benoetigt = stichproben if symbole else 1
+    gueltig = 0
+    for versuch in range(3 * benoetigt):
+        punkt = {
+            symbol: _zufallswert(
+                symbol, rng, bool(versuch >> i & 1) if vorzeichen else None
+            )
+            for i, symbol in enumerate(symbole)
+        }
+        wert_a, wert_b = _auswerten(a, punkt), _auswerten(b, punkt)
+        if wert_a is None or wert_b is None:
+            continue
+        if wert_a.is_Rational and wert_b.is_Rational:
+            if wert_a != wert_b:
+                return False
+        else:
+            abstand = abs(sp.N(wert_a - wert_b, GENAUIGKEIT))
+            skala = max(abs(sp.N(wert_a, 15)), abs(sp.N(wert_b, 15)), sp.Integer(1))
+            if abstand > toleranz * skala:
+                return False
+        gueltig += 1
+        if gueltig >= benoetigt:
+            return True
+    return None
+
+
+def _symbolisch_gleich(a: sp.Expr, b: sp.Expr) -> bool:
+    # Wie bei den Stichproben sind Variablen und Parameter reell
+    reell = {
+        s: sp.Dummy(s.name, real=True, **s.assumptions0)
+        for s in (a.free_symbols | b.free_symbols)
+        if s.is_real is None
+    }
+    differenz = (a - b).xreplace(reell)
+    if differenz == 0 or sp.expand(differenz) == 0:
+        return True
+    if sp.simplify(differenz) == 0:
+        return True
+    return bool(differenz.equals(0))
+
+
+def sind_aequivalent(
+    a: Any,
+    b: Any,
+    beweis: bool = False,
+    stichproben: int = STICHPROBEN,
+    rng: random.Random | None = None,
+) -> bool:
+    """
+    Prüft, ob zwei Ausdrücke für alle Werte der Variablen und Parameter
+    übereinstimmen (Garantien siehe Modul-Docstring).
+
+    Args:
+        a, b: Ausdrücke (SymPy, String, Zahl oder Funktion)
+        beweis: Gleichheit nur nach symbolischer Bestätigung melden
+        stichproben: Anzahl der Zufallspunkte
+        rng: Zufallsgenerator (für reproduzierbare Tests)
+
+    Examples:
+        >>> sind_aequivalent("exp(2*x)", "exp(x)^2")
+        True
+        >>> sind_aequivalent("sqrt(x^2)", "x")
+        False
+    """
+    a, b = _als_ausdruck(a), _als_ausdruck(b)
+    ergebnis = stichprobentest(a, b, stichproben, rng)
+    if ergebnis is False:
+        return False
+    if ergebnis and not beweis and not (_ist_stueckweise(a) or _ist_stueckweise(b)):
+        return True
+    try:
+        return _symbolisch_gleich(a, b)
+    except Exception:
+        return False
@@ -13,7 +13,6 @@ from typing import Any
 import sympy as sp
 
 from .errors import SchulAnalysisError, UngueltigeFunktionError
-from .visualisierung_errors import DatenpunktBerechnungsError
 
 # Importiere alle verfügbaren Funktionstypen
 from .ganzrationale import GanzrationaleFunktion
@@ -34,7 +33,6 @@ from .sympy_types import (
     validate_analysis_results,
     validate_exact_results,
 )
-from .visualisierung import Graph
 
 # Type Hint für alle unterstützten Funktionstypen
 Funktionstyp = (
@@ -1072,6 +1070,8 @@ def _zeichne_einzelne_funktion(
             else:
                 return Graph(funktion, **kwargs)
         except Exception as e:
+            from .visualisierung_errors import DatenpunktBerechnungsError
+
             raise DatenpunktBerechnungsError(
                 getattr(funktion, "__name__", "anonymous"),
                 f"Kann Datenpunkte nicht berechnen: {str(e)}",
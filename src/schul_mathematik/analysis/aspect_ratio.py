@@ -3,8 +3,16 @@ Enhanced Aspect Ratio Control for Plotly Visualizations
 
 This module provides sophisticated aspect ratio control for mathematical visualizations,
 ensuring proper mathematical proportions and educational accuracy in the Schul-Analysis Framework.
+
+Die Convenience-Funktionen arbeiten auf dem Controller des aktuellen Kontexts:
+innerhalb von `aspect_ratio_kontext(...)` ist das eine Kopie, die nur im
+aktuellen Thread bzw. asyncio-Task gilt, sonst die globale Instanz.
 """
 
+import copy
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 import plotly.graph_objects as go
@@ -258,11 +266,46 @@ class AspectRatioController:
 # Globale Instanz
 aspect_ratio_controller = AspectRatioController()
 
+# Controller der aktuellen Anfrage (None: globale Instanz)
+_kontext_controller: ContextVar[AspectRatioController | None] = ContextVar(
+    "_kontext_controller", default=None
+)
+
+
+def aktueller_aspect_ratio_controller() -> AspectRatioController:
+    """Controller des aktuellen Threads/Tasks (sonst die globale Instanz)"""
+    return _kontext_controller.get() or aspect_ratio_controller
+
+
+@contextmanager
+def aspect_ratio_kontext(
+    ratio_type: str | None = None, custom_value: float | None = None
+) -> Iterator[AspectRatioController]:
+    """
+    Eigenes Aspect-Ratio für den aktuellen Kontext (z.B. eine Server-Anfrage)
+
+    Args:
+        ratio_type: Optionaler Typ, der sofort gesetzt wird
+        custom_value: Benutzerdefinierter Wert
+
+    Beispiele:
+        >>> with aspect_ratio_kontext("breitbild"):
+        ...     fig = wende_aspect_ratio_an(fig)
+    """
+    controller = copy.copy(aktueller_aspect_ratio_controller())
+    if ratio_type is not None:
+        controller.set_aspect_ratio(ratio_type, custom_value)
+    marke = _kontext_controller.set(controller)
+    try:
+        yield controller
+    finally:
+        _kontext_controller.reset(marke)
+
 
 # Convenience-Funktionen für die API
 def setze_aspect_ratio(ratio_type: str, custom_value: float | None = None) -> None:
     """
-    Setzt das globale Aspect-Ratio
+    Setzt das Aspect-Ratio (global bzw. im aktuellen `aspect_ratio_kontext`)
 
     Args:
         ratio_type: Typ des Aspect-Ratios
@@ -273,7 +316,7 @@ def setze_aspect_ratio(ratio_type: str, custom_value: float | None = None) -> No
         >>> setze_aspect_ratio("goldener_schnitt")
         >>> setze_aspect_ratio("custom", custom_value=1.5)
     """
-    aspect_ratio_controller.set_aspect_ratio(ratio_type, custom_value)
+    aktueller_aspect_ratio_controller().set_aspect_ratio(ratio_type, custom_value)
 
 
 def get_aspect_ratio_info() -> dict[str, Any]:
@@ -283,12 +326,13 @@ def get_aspect_ratio_info() -> dict[str, Any]:
     Returns:
         Dictionary mit Aspect-Ratio-Informationen
     """
+    controller = aktueller_aspect_ratio_controller()
     return {
-        "type": aspect_ratio_controller.current_ratio,
-        "name": aspect_ratio_controller.get_aspect_ratio_name(),
-        "value": aspect_ratio_controller.get_aspect_ratio_value(),
-        "mathematical_mode": aspect_ratio_controller.mathematical_mode,
-        "auto_adjust": aspect_ratio_controller.auto_adjust,
+        "type": controller.current_ratio,
+        "name": controller.get_aspect_ratio_name(),
+        "value": controller.get_aspect_ratio_value(),
+        "mathematical_mode": controller.mathematical_mode,
+        "auto_adjust": controller.auto_adjust,
     }
 
 
@@ -301,6 +345,9 @@ def wende_aspect_ratio_an(
     """
     Wendet das aktuelle Aspect-Ratio auf eine Figur an
 
+    Auto-Adjust wirkt nur auf diese Figur und verändert den (womöglich
+    geteilten) Controller nicht.
+
     Args:
         fig: Plotly-Figur
         x_range: Optional x-Bereich für Auto-Adjust
@@ -310,7 +357,8 @@ def wende_aspect_ratio_an(
     Returns:
         Angepasste Figur
     """
-    return aspect_ratio_controller.apply_to_figure(fig, x_range, y_range, base_width)
+    controller = copy.copy(aktueller_aspect_ratio_controller())
+    return controller.apply_to_figure(fig, x_range, y_range, base_width)
 
 
 def erstelle_aspect_ratio_buttons() -> dict[str, Any]:
@@ -320,7 +368,7 @@ def erstelle_aspect_ratio_buttons() -> dict[str, Any]:
     Returns:
         Dictionary für Plotly-Layout-Buttons
     """
-    return aspect_ratio_controller.create_ratio_selector_config()
+    return aktueller_aspect_ratio_controller().create_ratio_selector_config()
 
 
 # Export der wichtigsten Funktionen und Klassen
@@ -328,6 +376,8 @@ __all__ = [
     "AspectRatioType",
     "AspectRatioController",
     "aspect_ratio_controller",
+    "aspect_ratio_kontext",
+    "aktueller_aspect_ratio_controller",
     "setze_aspect_ratio",
     "get_aspect_ratio_info",
     "wende_aspect_ratio_an",
@@ -0,0 +1,308 @@
+"""
+Asynchrone Analyse für reaktive Notebooks (z.B. marimo).
+
+Bewegt man in marimo einen Slider, wird die Zelle mit der neuen Funktion
+erneut ausgeführt - eine synchrone Nullstellenberechnung für die alte
+Funktion blockiert dann weiter den Kernel. Die Varianten hier
+(`nullstellen_async`, `extrempunkte_async`, `graph_async`) rechnen in einem
+Worker-Prozess und lassen die Ereignisschleife frei.
+
+Ein `Rechenkanal` gehört zu einer Ausgabe (z.B. einer Zelle): Jede neue
+Anfrage im selben Kanal bricht die vorige ab, und weil der Worker ein eigener
+Prozess ist, wird die überholte SymPy-Rechnung wirklich beendet und nicht
+nur ihr Ergebnis verworfen. Ohne Kanal bekommt jeder Aufruf einen eigenen,
+kurzlebigen Prozess. Wo keine Prozesse verfügbar sind (Pyodide/WASM), rechnet
+`Rechenkanal(prozess=False)` in einem Thread; abgebrochen wird dann nur das
+Warten.
+
+`nullstellen_schrittweise` liefert Teilergebnisse, sobald sie vorliegen:
+zuerst numerische Näherungen, danach die exakten Nullstellen.
+
+Examples:
+    >>> kanal = Rechenkanal()  # eigene Zelle, überlebt Neuberechnungen
+    >>> nullstellen = await nullstellen_async(f, kanal=kanal)
+    >>> async for teil in nullstellen_schrittweise(f, kanal=kanal):
+    ...     print(teil.art, teil.werte)
+"""
+
+import asyncio
+import math
+import multiprocessing
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import Any
+
+import sympy as sp
+
+# Suchbereich und Raster für numerische Nullstellen nicht-polynomialer Terme
+NUMERIK_BEREICH = (-10.0, 10.0)
+NUMERIK_PUNKTE = 400
+
+
+@dataclass(frozen=True)
+class Teilergebnis:
+    """Zwischen- oder Endergebnis von `nullstellen_schrittweise`"""
+
+    art: str  # "numerisch" oder "exakt"
+    werte: list
+    endgueltig: bool
+
+
+def _als_funktion(eingabe: Any):
+    from .funktion import Funktion
+
+    return Funktion(eingabe) if isinstance(eingabe, str) else eingabe
+
+
+def _nullstellen(eingabe: Any, real: bool) -> list:
+    from .api import Nullstellen
+
+    return Nullstellen(_als_funktion(eingabe), real=real)
+
+
+def _extrempunkte(eingabe: Any) -> list:
+    return _als_funktion(eingabe).extrempunkte_optimiert()
+
+
+def _graph(eingaben: tuple, kwargs: dict) -> Any:
+    from .visualisierung import Graph
+
+    return Graph(*(_als_funktion(e) for e in eingaben), **kwargs)
+
+
+def _bisektion(g: Callable[[float], float], a: float, b: float) -> float:
+    ga = g(a)
+    for _ in range(60):
+        mitte = (a + b) / 2
+        gm = g(mitte)
+        if gm == 0:
+            return mitte
+        if (gm < 0) == (ga < 0):
+            a, ga = mitte, gm
+        else:
+            b = mitte
+    return (a + b) / 2
+
+
+def _numerische_nullstellen(eingabe: Any) -> list[float]:
+    """
+    Schnelle Näherungen der reellen Nullstellen.
+
+    Polynome über `Poly.nroots`, andere Terme über Vorzeichenwechsel auf
+    einem Raster in `NUMERIK_BEREICH`. Terme mit Parametern liefern [].
+    """
+    f = _als_funktion(eingabe)
+    term, x = f.term_sympy, f._variable_symbol
+    if term.free_symbols - {x}:
+        return []
+    if term.is_polynomial(x):
+        poly = sp.Poly(term, x)
+        if poly.degree() < 1:
+            return []
+        return sorted({float(w) for w in poly.nroots() if w.is_real})
+
+    g = sp.lambdify(x, term, "math")
+
+    def sicher(t: float) -> float:
+        try:
+            wert = float(g(t))
+        except (ValueError, ZeroDivisionError, OverflowError, TypeError):
+            return math.nan
+        return wert
+
+    von, bis = NUMERIK_BEREICH
+    schritt = (bis - von) / NUMERIK_PUNKTE
+    raster = [von + i * schritt for i in range(NUMERIK_PUNKTE + 1)]
+    werte = [sicher(t) for t in raster]
+    ergebnis = []
+    for (a, ga), (b, gb) in pairwise(zip(raster, werte, strict=True)):
+        if not (math.isfinite(ga) and math.isfinite(gb)):
+            continue
+        if ga == 0:
+            ergebnis.append(a)
+        elif ga * gb < 0:
+            kandidat = _bisektion(sicher, a, b)
+            # Vorzeichenwechsel an Polstellen sind keine Nullstellen
+            if abs(sicher(kandidat)) < 1e-8:
+                ergebnis.append(kandidat)
+    if werte and werte[-1] == 0:
+        ergebnis.append(raster[-1])
+    return ergebnis
+
+
+def _setzen(future: asyncio.Future, ergebnis: Any, fehler: BaseException | None):
+    if future.done():  # Bereits abgebrochen
+        return
+    if fehler is not None:
+        future.set_exception(fehler)
+    else:
+        future.set_result(ergebnis)
+
+
+class Rechenkanal:
+    """
+    Worker für eine Ausgabe: jede neue Anfrage bricht die vorige ab.
+
+    Args:
+        prozess: In einem eigenen Prozess rechnen (abbrechbar). Mit False
+            wird ein Thread verwendet, z.B. wo es keine Prozesse gibt.
+        mp_context: Optionaler multiprocessing-Kontext, z.B. "spawn"
+
+    Examples:
+        >>> async with Rechenkanal() as kanal:
+        ...     werte = await kanal.ausfuehren(berechnung, f)
+    """
+
+    def __init__(self, prozess: bool = True, mp_context=None):
+        self.prozess = prozess
+        if isinstance(mp_context, str):
+            mp_context = multiprocessing.get_context(mp_context)
+        self._mp_context = mp_context or multiprocessing
+        self._pool = None
+        self._laufend: asyncio.Task | None = None
+
+    def _pool_holen(self):
+        if self._pool is None:
+            self._pool = self._mp_context.Pool(1)
+        return self._pool
+
+    def _beenden(self, pool) -> None:
+        """Beendet den Worker-Prozess; der nächste Auftrag startet einen neuen"""
+        if pool is None:
+            return
+        if self._pool is pool:
+            self._pool = None
+        pool.terminate()
+
+    def abbrechen(self) -> None:
+        """Bricht die laufende Anfrage ab (auch ihren Worker-Prozess)"""
+        laufend, self._laufend = self._laufend, None
+        if laufend is None or laufend.done():
+            return
+        if laufend is not asyncio.current_task():
+            self._beenden(self._pool)
+            laufend.cancel()
+
+    async def ausfuehren(self, aufgabe: Callable[..., Any], *args: Any) -> Any:
+        """
+        Führt `aufgabe(*args)` im Worker aus; eine noch laufende Anfrage
+        dieses Kanals wird vorher abgebrochen.
+
+        Args:
+            aufgabe: Funktion auf Modulebene (muss picklebar sein)
+            *args: Picklebare Argumente, z.B. Terme oder Funktionsobjekte
+
+        Raises:
+            asyncio.CancelledError: Wenn eine neuere Anfrage diese überholt
+        """
+        self.abbrechen()
+        task = asyncio.current_task()
+        self._laufend = task
+        try:
+            if not self.prozess:
+                return await asyncio.to_thread(aufgabe, *args)
+
+            schleife = asyncio.get_running_loop()
+            future = schleife.create_future()
+            pool = self._pool_holen()
+            pool.apply_async(
+                aufgabe,
+                args,
+                callback=lambda e: schleife.call_soon_threadsafe(
+                    _setzen, future, e, None
+                ),
+                error_callback=lambda f: schleife.call_soon_threadsafe(
+                    _setzen, future, None, f
+                ),
+            )
+            try:
+                return await future
+            except asyncio.CancelledError:
+                self._beenden(pool)
+                raise
+        finally:
+            if self._laufend is task:
+                self._laufend = None
+
+    def schliessen(self) -> None:
+        """Bricht laufende Anfragen ab und beendet den Worker"""
+        self.abbrechen()
+        self._beenden(self._pool)
+
+    async def __aenter__(self) -> "Rechenkanal":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.schliessen()
+
+
+async def _im_kanal(
+    kanal: Rechenkanal | None, aufgabe: Callable[..., Any], *args: Any
+) -> Any:
+    if kanal is not None:
+        return await kanal.ausfuehren(aufgabe, *args)
+    async with Rechenkanal() as einmalig:
+        return await einmalig.ausfuehren(aufgabe, *args)
+
+
+async def nullstellen_async(
+    funktion: Any, real: bool = True, kanal: Rechenkanal | None = None
+) -> list:
+    """
+    Asynchrone Variante von `Nullstellen`.
+
+    Args:
+        funktion: Funktionsobjekt oder Term als String
+        real: Nur reelle Nullstellen zurückgeben
+        kanal: Rechenkanal, dessen vorige Anfrage abgebrochen wird
+
+    Examples:
+        >>> await nullstellen_async("x^2 - 4")
+        [Nullstelle(x=-2, ...), Nullstelle(x=2, ...)]
+    """
+    return await _im_kanal(kanal, _nullstellen, funktion, real)
+
+
+async def extrempunkte_async(funktion: Any, kanal: Rechenkanal | None = None) -> list:
+    """Asynchrone Variante von `Extrempunkte` (als Extrempunkt-Objekte)"""
+    return await _im_kanal(kanal, _extrempunkte, funktion)
+
+
+async def graph_async(*funktionen: Any, kanal: Rechenkanal | None = None, **kwargs):
+    """
+    Asynchrone Variante von `Graph`; die Plotly-Figur wird im Worker erzeugt.
+
+    Examples:
+        >>> fig = await graph_async(f, x_min=-5, x_max=5, kanal=graph_kanal)
+    """
+    return await _im_kanal(kanal, _graph, funktionen, kwargs)
+
+
+async def nullstellen_schrittweise(
+    funktion: Any, real: bool = True, kanal: Rechenkanal | None = None
+) -> AsyncIterator[Teilergebnis]:
+    """
+    Liefert zuerst numerische Näherungen, dann die exakten Nullstellen.
+
+    Bricht eine neuere Anfrage im selben Kanal die Berechnung ab, endet die
+    Iteration mit `asyncio.CancelledError`.
+
+    Examples:
+        >>> async for teil in nullstellen_schrittweise(f, kanal=kanal):
+        ...     ausgabe = teil.werte  # erst Floats, dann exakte Nullstellen
+    """
+    if kanal is None:
+        async with Rechenkanal() as einmalig:
+            async for teil in nullstellen_schrittweise(funktion, real, einmalig):
+                yield teil
+        return
+
+    try:
+        naeherungen = await kanal.ausfuehren(_numerische_nullstellen, funktion)
+    except Exception:
+        naeherungen = None  # Ohne Näherung direkt zum exakten Ergebnis
+    if naeherungen is not None:
+        yield Teilergebnis("numerisch", naeherungen, endgueltig=False)
+    exakt = await kanal.ausfuehren(_nullstellen, funktion, real)
+    yield Teilergebnis("exakt", exakt, endgueltig=True)
@@ -8,14 +8,94 @@ Author: Claude AI Assistant
 Created: 2025-01-10
 """
 
+import threading
 from abc import ABC, abstractmethod
 from typing import Any, Union
+
 import sympy as sp
 
 from .errors import UngueltigeFunktionError
 from .sympy_types import ExactNullstellenListe, SchnittpunkteListe, preserve_exact_types
 
 
+class _FunktionsCaches:
+    """
+    Seitenstruktur für alle Caches einer Funktion.
+
+    Wird erst beim ersten schreibenden Cache-Zugriff angelegt, sodass
+    Funktionen, die nie ausgewertet oder abgeleitet werden (z.B. Komponenten
+    und Ableitungen), keinen Speicher für leere Caches belegen. Die Sperre
+    schützt zusammengesetzte Cache-Operationen (Prüfen, Verdrängen,
+    Zähler) bei gleichzeitiger Nutzung aus mehreren Threads.
+    """
+
+    __slots__ = (
+        "sperre",
+        "allgemein",
+        "ableitung",
+        "ableitung_max",
+        "ableitung_treffer",
+        "ableitung_fehlschlaege",
+        "wert",
+        "wert_max",
+        "nullstellen",
+        "darstellung",
+    )
+
+    def __init__(self):
+        self.sperre = threading.RLock()
+
+
+# Verhindert, dass zwei Threads gleichzeitig eine Seitenstruktur anlegen
+_ANLEGEN = threading.Lock()
+
+
+def _caches_von(instanz) -> _FunktionsCaches:
+    caches = instanz._caches
+    if caches is None:
+        with _ANLEGEN:
+            caches = instanz._caches
+            if caches is None:
+                caches = instanz._caches = _FunktionsCaches()
+    return caches
+
+
+class _CacheAttribut:
+    """
+    Deskriptor, der ein Cache-Attribut (z.B. `_ableitung_cache`) auf ein Feld
+    der Seitenstruktur abbildet. Ungesetzte Felder verhalten sich wie fehlende
+    Attribute (`hasattr` ist False), außer es gibt einen Standardwert.
+    """
+
+    __slots__ = ("feld", "standard")
+
+    def __init__(self, feld: str, standard: Any = None):
+        self.feld = feld
+        self.standard = standard  # Fabrik für einen Startwert, z.B. dict
+
+    def __get__(self, instanz, besitzer=None):
+        if instanz is None:
+            return self
+        caches = instanz._caches
+        try:
+            return getattr(caches, self.feld)
+        except AttributeError:
+            if self.standard is None:
+                raise AttributeError(self.feld) from None
+        caches = _caches_von(instanz)
+        with caches.sperre:
+            if not hasattr(caches, self.feld):
+                setattr(caches, self.feld, self.standard())
+            return getattr(caches, self.feld)
+
+    def __set__(self, instanz, wert) -> None:
+        setattr(_caches_von(instanz), self.feld, wert)
+
+    def __delete__(self, instanz) -> None:
+        if instanz._caches is not None and hasattr(instanz._caches, self.feld):
+            delattr(instanz._caches, self.feld)
+
+
 class BasisFunktion(ABC):
     """
     Abstrakte Basisklasse für alle mathematischen Funktionen im Schul-Analysis Framework.
@@ -26,10 +106,27 @@ class BasisFunktion(ABC):
     Abstrakte Methoden müssen von konkreten Unterklassen implementiert werden.
     """
 
+    __slots__ = ("_caches",)
+
+    # Zentrales Caching für Performance (in `_caches`, erst bei Bedarf angelegt)
+    _cache = _CacheAttribut("allgemein", standard=dict)
+    _ableitung_cache = _CacheAttribut("ableitung")
+    _ableitung_cache_max_size = _CacheAttribut("ableitung_max")
+    _ableitung_cache_hits = _CacheAttribut("ableitung_treffer")
+    _ableitung_cache_misses = _CacheAttribut("ableitung_fehlschlaege")
+    _wert_cache = _CacheAttribut("wert")
+    _wert_cache_max_size = _CacheAttribut("wert_max")
+    _nullstellen_cache = _CacheAttribut("nullstellen")
+    _darstellung = _CacheAttribut("darstellung", standard=dict)
+
     def __init__(self):
         """Initialisiere die Basiskomponenten für alle Funktionen."""
-        self._cache = {}  # Zentrales Caching für Performance
-        self._initialisiert = False
+        self._caches: _FunktionsCaches | None = None
+
+    @property
+    def _cache_sperre(self) -> threading.RLock:
+        """Sperre für zusammengesetzte Zugriffe auf die Caches dieser Funktion"""
+        return _caches_von(self).sperre
 
     # === ABSTRAKTE METHODEN (müssen implementiert werden) ===
 
@@ -248,7 +345,8 @@ class BasisFunktion(ABC):
 
     def _cache_leeren(self) -> None:
         """Leert den gesamten Cache."""
-        self._cache.clear()
+        if self._caches is not None:
+            self._cache.clear()
 
     # === TYPE-SAFETY UND VALIDIERUNG ===
 
@@ -3,9 +3,18 @@ Zentrale Konfiguration für das Schul-Analysis Framework.
 
 Diese Klasse zentralisiert alle Konfigurationsparameter und macht
 das Framework leicht konfigurierbar und wartbar.
+
+Für Server mit mehreren Nutzern gilt `konfiguration(...)` nur im aktuellen
+Thread bzw. asyncio-Task; die globale Instanz bleibt unverändert:
+
+    >>> with konfiguration(PLOTLY_THEME="plotly_dark"):
+    ...     fig = Graph(f)
 """
 
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 
@@ -104,3 +113,38 @@ class SchulAnalysisConfig:
 
 # Globale Konfigurationsinstanz
 config = SchulAnalysisConfig()
+
+# Konfiguration der aktuellen Anfrage (None: globale Instanz)
+_aktuelle_konfiguration: ContextVar[SchulAnalysisConfig | None] = ContextVar(
+    "_aktuelle_konfiguration", default=None
+)
+
+
+def aktuelle_konfiguration() -> SchulAnalysisConfig:
+    """Konfiguration des aktuellen Threads/Tasks (sonst die globale `config`)"""
+    return _aktuelle_konfiguration.get() or config
+
+
+@contextmanager
+def konfiguration(**aenderungen: Any) -> Iterator[SchulAnalysisConfig]:
+    """
+    Überschreibt Konfigurationswerte nur für den aktuellen Kontext.
+
+    Args:
+        **aenderungen: Neue Werte, z.B. PLOTLY_THEME="plotly_dark"
+
+    Raises:
+        AttributeError: Bei unbekannten Konfigurationsnamen
+    """
+    basis = aktuelle_konfiguration()
+    unbekannt = [name for name in aenderungen if not hasattr(basis, name)]
+    if unbekannt:
+        raise AttributeError(f"Unbekannte Konfiguration: {', '.join(unbekannt)}")
+
+    # Die get_*-Methoden sind Klassenmethoden: eine Unterklasse trägt die Werte
+    klasse = type(type(basis).__name__, (type(basis),), aenderungen)
+    marke = _aktuelle_konfiguration.set(klasse())
+    try:
+        yield _aktuelle_konfiguration.get()
+    finally:
+        _aktuelle_konfiguration.reset(marke)
@@ -10,6 +10,7 @@ import sympy as sp
 from sympy import diff
 
 from .funktion import Funktion
+from .instrumentierung import gemessen
 from .sympy_types import VALIDATION_EXACT, validate_function_result
 
 
@@ -24,6 +25,8 @@ class ExponentialFunktion(Funktion):
     - exp(2x) + 1
     """
 
+    __slots__ = ()
+
     def __init__(self, eingabe: Union[str, sp.Basic, "Funktion"]):
         """
         Konstruktor für exponentialfunktionen.
@@ -48,6 +51,7 @@ class ExponentialFunktion(Funktion):
             for base in [expr.base]
         )
 
+    @gemessen("solve")
     def nullstellen(self, real: bool = True, runden: int | None = None) -> list:
         """
         Berechnet die Nullstellen der exponentialfunktion.
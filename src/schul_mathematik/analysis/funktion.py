@@ -6,6 +6,9 @@ Alle spezialisierten Klassen erben von dieser Basis-Klasse.
 """
 
 import logging
+import re
+import threading
+import weakref
 from functools import lru_cache
 from typing import Any, Union
 
@@ -23,26 +26,48 @@ except ImportError:
 # Static helper functions for function selection
 
 
+from .basis_funktion import BasisFunktion
+from .errors import UngueltigeFunktionError
+from .instrumentierung import (
+    Lazy,
+    Messung,
+    cache_zugriff,
+    gemessen,
+    registriere_cache,
+)
+from .periodisch import PeriodischeLoesung
+from .polynom import DichtesPolynom
 from .symbolic import _Parameter, _Variable
 from .sympy_types import (
     VALIDATION_EXACT,
     ExactNullstellenListe,
-    Extremstelle,
     Extrempunkt,
-    ExtremumTyp,
-    ExtremstellenListe,
     ExtrempunkteListe,
+    Extremstelle,
+    ExtremstellenListe,
+    ExtremumTyp,
     Nullstelle,
     Schnittpunkt,
     SchnittpunkteListe,
-    Wendestelle,
     Wendepunkt,
     WendepunktTyp,
+    Wendestelle,
     preserve_exact_types,
     validate_exact_results,
     validate_function_result,
 )
-from .basis_funktion import BasisFunktion
+
+logger = logging.getLogger(__name__)
+
+# Internierte Funktionen (Funktion.interniert): Eingabe bzw. kanonischer
+# Schlüssel → Objekt; Einträge verschwinden mit dem letzten Verweis
+_INTERNIERT_EINGABE: "weakref.WeakValueDictionary[str, Funktion]" = (
+    weakref.WeakValueDictionary()
+)
+_INTERNIERT_KANONISCH: "weakref.WeakValueDictionary[tuple, Funktion]" = (
+    weakref.WeakValueDictionary()
+)
+_INTERNIERT_SPERRE = threading.Lock()
 
 
 # Performance-Optimierung: Gecachte Funktionen für symbolische Berechnungen
@@ -64,12 +89,33 @@ def _cached_diff(expr: sp.Expr, variable: sp.Symbol, order: int = 1) -> sp.Expr:
     return sp.diff(expr, variable, order)
 
 
-@lru_cache(maxsize=64)
+def _verschwindet(wert: sp.Expr) -> bool:
+    """Exakter Nulltest ohne simplify (Wurzelausdrücke werden ausmultipliziert)"""
+    return wert == 0 or sp.expand(wert) == 0
+
+
+@lru_cache(maxsize=512)
 def _cached_factor(expr: sp.Expr) -> sp.Expr:
     """Cached factorization for performance optimization."""
     return sp.factor(expr)
 
 
+registriere_cache("simplify", _cached_simplify)
+registriere_cache("solve", _cached_solve)
+registriere_cache("diff", _cached_diff)
+registriere_cache("factor", _cached_factor)
+
+
+# Vorkompilierte Muster für `Funktion.term` (Reihenfolge siehe dort)
+_MEHRFACHE_LEERZEICHEN = re.compile(r"\s+")
+_OPERATOR = re.compile(r"([+\-*/=])")
+_FUEHRENDES_MINUS = re.compile(r"^\s*-\s+")
+_MINUS_ZWISCHEN_LEERZEICHEN = re.compile(r"(\s)\s*-\s+(\s)")
+_POTENZ = re.compile(r"\s*\^\s*")
+_ZAHL_MAL_SYMBOL = re.compile(r"(\d+)\s*\*\s*([a-zA-Z])")
+_ZAHL_VOR_SYMBOL = re.compile(r"(\d)([a-zA-Z])")
+
+
 def _faktorisiere_parameter_koeffizienten(
     expr: sp.Basic, parameter_liste: list[_Parameter]
 ) -> sp.Basic:
@@ -116,7 +162,7 @@ def _faktorisiere_parameter_koeffizienten(
                 if coeff.has(*[p.symbol for p in parameter_liste]):
                     # Versuche, den Koeffizienten zu faktorisieren
                     try:
-                        factored_coeff = sp.factor(coeff)
+                        factored_coeff = _cached_factor(coeff)
                         # Nur verwenden, wenn es kompakter ist und Parameter faktorisiert
                         if len(str(factored_coeff)) <= len(str(coeff)) * 1.5 and any(
                             p.symbol in factored_coeff.free_symbols
@@ -245,7 +291,7 @@ def _formatiere_mit_poly_latex(
             # Parameter-faktorisieren für Koeffizienten
             if parameter_liste and coeff.has(*[p.symbol for p in parameter_liste]):
                 try:
-                    factored_coeff = sp.factor(coeff)
+                    factored_coeff = _cached_factor(coeff)
 
                     # Zusätzliche Optimierung für einfache Differenzen
                     if factored_coeff.is_Add and len(factored_coeff.args) == 2:
@@ -352,7 +398,7 @@ def _formatiere_mit_poly(
             # Parameter-faktorisieren für Koeffizienten
             if parameter_liste and coeff.has(*[p.symbol for p in parameter_liste]):
                 try:
-                    factored_coeff = sp.factor(coeff)
+                    factored_coeff = _cached_factor(coeff)
 
                     # Zusätzliche Optimierung für einfache Differenzen
                     if factored_coeff.is_Add and len(factored_coeff.args) == 2:
@@ -468,7 +514,7 @@ def _formatiere_polynom_geordnet(
                 # Parameter-faktorisieren für Koeffizienten
                 if coeff.has(*[p.symbol for p in parameter_liste]):
                     try:
-                        factored_coeff = sp.factor(coeff)
+                        factored_coeff = _cached_factor(coeff)
                         # Negativzeichen optimieren: -2*(a - b) -> 2*(b - a)
                         if (
                             factored_coeff.has(-1)
@@ -613,6 +659,7 @@ def _formatiere_polynom_geordnet(
         return str(expr).replace("**", "^")
 
 
+@gemessen("simplify")
 def _intelligente_vereinfachung(
     expr: sp.Basic,
     variable: sp.Symbol,
@@ -725,6 +772,22 @@ class Funktion(BasisFunktion):
         >>> g.steigung                           # 2 - nur bei LineareFunktion verfügbar!
     """
 
+    __slots__ = (
+        "_term_sympy",
+        "_version",
+        "_interniert",
+        "_gehasht",
+        "_variable_symbol",
+        "variablen",
+        "parameter",
+        "hauptvariable",
+        "original_eingabe",
+        "name",
+        # Nur für seltene Zusatzattribute, wird erst beim ersten Setzen angelegt
+        "__dict__",
+        "__weakref__",  # Für die Internierungstabelle
+    )
+
     def __new__(cls, *args, **kwargs):
         """
         Magic Factory - Funktion() Konstruktor gibt automatisch richtige Unterklasse zurück!
@@ -855,7 +918,10 @@ class Funktion(BasisFunktion):
         self.parameter: list[_Parameter] = []
         self.hauptvariable: _Variable | None = None
         self.original_eingabe = ""
-        self._cache = {}
+        self._caches = None  # Caches werden erst bei Bedarf angelegt
+        self._version = 0  # Erhöht sich mit jeder Änderung des Terms
+        self._interniert = False
+        self._gehasht = False  # Hash vergeben: Term darf sich nicht mehr ändern
         self.name = None  # Standardmäßig kein Name
 
     def _verarbeite_eingabe(
@@ -883,11 +949,11 @@ class Funktion(BasisFunktion):
         zaehler_str, nenner_str = eingabe
         zaehler_expr = self._parse_string_to_sympy(zaehler_str)
         nenner_expr = self._parse_string_to_sympy(nenner_str)
-        self.term_sympy = zaehler_expr / nenner_expr
+        self._term_sympy = zaehler_expr / nenner_expr
 
     def _verarbeite_funktions_kopie(self, andere_funktion: "Funktion"):
         """Verarbeitet Kopie einer anderen Funktion"""
-        self.term_sympy = andere_funktion.term_sympy.copy()
+        self._term_sympy = andere_funktion.term_sympy.copy()
         self._variable_symbol = andere_funktion._variable_symbol
         self.variablen = andere_funktion.variablen.copy()
         self.parameter = andere_funktion.parameter.copy()
@@ -900,14 +966,14 @@ class Funktion(BasisFunktion):
     ):
         """Verarbeitet Standard-Eingabe"""
         if isinstance(eingabe, str):
-            self.term_sympy = self._parse_string_to_sympy(eingabe)
+            self._term_sympy = self._parse_string_to_sympy(eingabe)
         elif isinstance(eingabe, (int, float)):
             # Konvertiere Zahlen zu SymPy-Objekten
             import sympy as sp
 
-            self.term_sympy = sp.Number(eingabe)
+            self._term_sympy = sp.Number(eingabe)
         else:
-            self.term_sympy = eingabe
+            self._term_sympy = eingabe
 
         # Wenn Nenner angegeben, kombiniere
         if nenner is not None:
@@ -915,7 +981,7 @@ class Funktion(BasisFunktion):
                 nenner_expr = self._parse_string_to_sympy(nenner)
             else:
                 nenner_expr = nenner
-            self.term_sympy = self.term_sympy / nenner_expr
+            self._term_sympy = self.term_sympy / nenner_expr
 
     @property
     def _extract_exponent_parameter(self, expr: sp.Basic) -> float:
@@ -961,6 +1027,7 @@ class Funktion(BasisFunktion):
 
         return False
 
+    @gemessen("parse")
     def _parse_string_to_sympy(self, eingabe: str) -> sp.Basic:
         """Parset String-Eingabe zu SymPy-Ausdruck mit deutschen Fehlermeldungen und erweiterter Schul-Mathematik-Syntax"""
         from .errors import SicherheitsError
@@ -1163,6 +1230,8 @@ class Funktion(BasisFunktion):
             "w",
         ]
 
+        self.variablen = []
+        self.parameter = []
         for symbol in self.term_sympy.free_symbols:
             symbol_name = str(symbol)
             if symbol_name == str(self._variable_symbol):
@@ -1173,57 +1242,266 @@ class Funktion(BasisFunktion):
                 # Default: als Variable behandeln
                 self.variablen.append(_Variable(symbol_name))
 
+    # Serialisierung
+
+    def to_dict(self, mit_ergebnissen: bool = False) -> dict[str, Any]:
+        """
+        Kompakte, JSON-kompatible Darstellung der Funktion.
+
+        Enthält nur den kanonischen Ausdruck (Präfixform), die Hauptvariable
+        und typspezifischen Zustand - keine Caches und keine Symbollisten.
+
+        Args:
+            mit_ergebnissen: Gecachte Nullstellen und Ableitungen mitnehmen
+
+        Examples:
+            >>> Funktion("x^2 - 4").to_dict()["term"]
+            ('Add', ('Pow', ('Symbol', 'x'), 2), -4)
+        """
+        from .serialisierung import funktion_zu_dict
+
+        return funktion_zu_dict(self, mit_ergebnissen)
+
+    @classmethod
+    def from_dict(cls, daten: dict[str, Any]) -> "Funktion":
+        """
+        Stellt eine Funktion aus `to_dict` wieder her, ohne zu parsen oder neu
+        zu klassifizieren. Der gespeicherte Typ bestimmt die Klasse.
+        """
+        from .serialisierung import funktion_aus_dict
+
+        return funktion_aus_dict(daten)
+
+    def __reduce__(self):
+        from .serialisierung import funktion_aus_dict
+
+        return funktion_aus_dict, (self.to_dict(mit_ergebnissen=True),)
+
+    def _zustand_als_dict(self) -> dict[str, Any]:
+        """Typspezifischer Zustand für `to_dict` (in Unterklassen erweitert)"""
+        return {"eingabe": self.original_eingabe}
+
+    def _stelle_zustand_wieder_her(self, daten: dict[str, Any]) -> None:
+        """Gegenstück zu `_zustand_als_dict`: setzt alle Attribute von `__init__`"""
+        from .serialisierung import praefix_zu_ausdruck
+
+        BasisFunktion.__init__(self)
+        self._initialisiere_basiskomponenten()
+        self.original_eingabe = daten.get("eingabe", "")
+        self.name = daten.get("name")
+        self._term_sympy = praefix_zu_ausdruck(daten["term"])
+
+        variable = next(
+            (s for s in self.term_sympy.free_symbols if s.name == daten["variable"]),
+            symbols(daten["variable"]),
+        )
+        self._variable_symbol = variable
+        self.hauptvariable = _Variable(variable.name)
+        self._klassifiziere_symbole()
+
+    # Term: einzige Stelle für Änderungen
+
+    @property
+    def term_sympy(self) -> sp.Expr:
+        """Der SymPy-Term der Funktion"""
+        return self._term_sympy
+
+    @term_sympy.setter
+    def term_sympy(self, term: sp.Expr) -> None:
+        self._setze_term(term)
+
+    @property
+    def version(self) -> int:
+        """
+        Anzahl der Änderungen des Terms seit der Erzeugung.
+
+        Externe Caches können (Funktion, version) als Schlüssel verwenden;
+        Ergebnisse zu einer Version bleiben dann dauerhaft gültig.
+        """
+        return self._version
+
+    def _setze_term(self, term: sp.Expr) -> None:
+        """
+        Ändert den Term (z.B. `ausmultiplizieren`, `kürzen`).
+
+        Erhöht die Version und verwirft sämtliche Caches dieser Instanz;
+        Ergebnisse, die noch zur alten Version berechnet werden, werden
+        nicht mehr eingetragen. Internierte Funktionen werden geteilt und
+        sind daher unveränderlich, ebenso Funktionen, deren Hash schon
+        vergeben wurde (Schlüssel in dict oder Element eines set).
+        """
+        if self._interniert:
+            raise UngueltigeFunktionError(
+                type(self).__name__,
+                "Internierte Funktionen werden geteilt und können nicht verändert "
+                "werden. Erzeuge mit Funktion(f) eine eigene Kopie.",
+            )
+        if self._gehasht:
+            raise UngueltigeFunktionError(
+                type(self).__name__,
+                "Der Hash dieser Funktion wurde bereits verwendet (z.B. als "
+                "Schlüssel in einem dict oder in einem set); eine Änderung des "
+                "Terms würde ihn ändern. Erzeuge mit Funktion(f) eine eigene Kopie.",
+            )
+        self._term_sympy = term
+        self._version += 1
+        self._caches = None
+        self._term_geaendert()
+
+    def _term_geaendert(self) -> None:
+        """Leitet vom Term abhängige Attribute neu ab (in Unterklassen erweitert)"""
+        self._erstelle_symbole_ausdruecke()
+
+    # Identität: kanonischer Hash und Internierung
+
+    def _kanonischer_ausdruck(self) -> sp.Basic:
+        """Normalform für Hash und Gleichheit (in Unterklassen verfeinert)"""
+        return self.term_sympy
+
+    def _kanonischer_schluessel(self) -> tuple:
+        """
+        (Normalform, Variable) - strukturell vergleich- und hashbar.
+
+        Wird pro Term einmal berechnet; ändert sich `term_sympy`, wird der
+        Schlüssel neu gebildet.
+        """
+        gespeichert = self._cache.get("kanonisch")
+        if gespeichert is None or gespeichert[0] is not self.term_sympy:
+            schluessel = (self._kanonischer_ausdruck(), self._variable_symbol)
+            gespeichert = (self.term_sympy, schluessel)
+            self._cache["kanonisch"] = gespeichert
+        return gespeichert[1]
+
+    def __hash__(self) -> int:
+        # Der Hash hängt vom Term ab: ab jetzt lehnt _setze_term Änderungen ab
+        self._gehasht = True
+        # SymPy speichert den Strukturhash am Ausdruck, das ist billig
+        return hash(self._kanonischer_schluessel())
+
+    def ist_aequivalent(
+        self, other: Union[str, sp.Basic, "Funktion"], beweis: bool = False
+    ) -> bool:
+        """
+        Prüft, ob zwei Funktionen mathematisch gleich sind, auch bei
+        unterschiedlicher Schreibweise.
+
+        Anders als `==` (strukturell) werden beide Terme an zufälligen
+        Punkten ausgewertet; einen symbolischen Beweis liefert `beweis=True`
+        (siehe `aequivalenz.sind_aequivalent`).
+
+        Examples:
+            >>> Funktion("sin(x)^2 + cos(x)^2").ist_aequivalent("1")
+            True
+        """
+        from .aequivalenz import sind_aequivalent
+
+        if not isinstance(other, Funktion):
+            other = Funktion(other)
+        if self == other:
+            return True
+        return sind_aequivalent(self.term_sympy, other.term_sympy, beweis=beweis)
+
+    @classmethod
+    def interniert(cls, eingabe: Union[str, sp.Basic, "Funktion"]) -> "Funktion":
+        """
+        Liefert für gleiche Eingaben dasselbe Funktionsobjekt (Hash-Consing).
+
+        Wiederholte Terme werden nur einmal geparst und teilen Caches
+        (Ableitungen, Nullstellen). Gleiche Normalformen aus verschiedenen
+        Schreibweisen ("x^2 + 2x + 1" und "(x+1)^2") landen ebenfalls beim
+        selben Objekt. Das Objekt wird geteilt; Änderungen des Terms (z.B.
+        durch `kürzen`) lösen `UngueltigeFunktionError` aus, auch `name`
+        sollte nicht gesetzt werden.
+
+        Examples:
+            >>> Funktion.interniert("x^2") is Funktion.interniert("x^2")
+            True
+            >>> {Funktion.interniert("x^2"): "Normalparabel"}
+        """
+        if isinstance(eingabe, FunktionsAusdruck):
+            funktion = eingabe.materialisiere()
+        elif isinstance(eingabe, Funktion):
+            funktion = eingabe
+        else:
+            if isinstance(eingabe, str):
+                eingabe = eingabe.strip()
+                funktion = _INTERNIERT_EINGABE.get(eingabe)
+                if funktion is not None:
+                    return funktion
+            # Parsen außerhalb der Sperre; bei gleichzeitigem Erzeugen gewinnt
+            # das zuerst eingetragene Objekt
+            funktion = Funktion(eingabe)
+
+        schluessel = funktion._kanonischer_schluessel()
+        with _INTERNIERT_SPERRE:
+            funktion = _INTERNIERT_KANONISCH.setdefault(schluessel, funktion)
+            funktion._interniert = True
+            if isinstance(eingabe, str):
+                _INTERNIERT_EINGABE[eingabe] = funktion
+        return funktion
+
     # Kernfunktionalität - Alle zentral in einer Klasse!
 
     def term(self) -> str:
-        """Gibt den Term als normalisierten String zurück"""
+        """Gibt den Term als normalisierten String zurück (pro Version gespeichert)"""
+        return self._dargestellt("term", self._formatiere_term)
+
+    def term_latex(self) -> str:
+        """Gibt den Term als LaTeX-String zurück (pro Version gespeichert)"""
+        return self._dargestellt("latex", self._formatiere_latex)
+
+    def _dargestellt(self, art: str, formatiere) -> str:
+        """Einmal formatierte Darstellung zur aktuellen Version des Terms
+
+        Liegt in den Caches der Funktion, die jede Änderung des Terms verwirft.
+        """
+        gespeichert = self._darstellung
+        text = gespeichert.get(art)
+        if text is None:
+            text = gespeichert[art] = formatiere()
+        return text
+
+    def _formatiere_term(self) -> str:
         if self.parameter:
             # Für parametrisierte Funktionen: optimierte Darstellung in Standardform
             return _formatiere_mit_poly(
                 self.term_sympy, self._variable_symbol, self.parameter
             )
-        else:
-            # Normale Darstellung für konkrete Funktionen mit besserer Formatierung
-            term_str = str(self.term_sympy).replace("**", "^")
-
-            # Verbessere die Lesbarkeit mit angemessenen Leerzeichen
-            import re
 
-            # Entferne überflüssige Leerzeichen, aber behalte operative Leerzeichen
-            term_str = re.sub(r"\s+", " ", term_str).strip()
+        # Normale Darstellung für konkrete Funktionen mit besserer Formatierung
+        term_str = str(self.term_sympy).replace("**", "^")
 
-            # Stelle sicher, dass + und - Operatoren Leerzeichen haben, aber nicht ^
-            term_str = re.sub(r"([+\-*/=])", r" \1 ", term_str)
+        # Entferne überflüssige Leerzeichen, aber behalte operative Leerzeichen
+        term_str = _MEHRFACHE_LEERZEICHEN.sub(" ", term_str).strip()
 
-            # Entferne Leerzeichen nach führendem Minuszeichen
-            term_str = re.sub(r"^\s*-\s+", "-", term_str)
-            term_str = re.sub(r"(\s)\s*-\s+(\s)", r"\1-\2", term_str)
+        # Stelle sicher, dass + und - Operatoren Leerzeichen haben, aber nicht ^
+        term_str = _OPERATOR.sub(r" \1 ", term_str)
 
-            # Entferne Leerzeichen um ^ Operator (für x^2 statt x ^ 2)
-            term_str = re.sub(r"\s*\^\s*", "^", term_str)
+        # Entferne Leerzeichen nach führendem Minuszeichen
+        term_str = _FUEHRENDES_MINUS.sub("-", term_str)
+        term_str = _MINUS_ZWISCHEN_LEERZEICHEN.sub(r"\1-\2", term_str)
 
-            # Entferne * bei Koeffizienten (z.B. 2 * x -> 2x), aber behalte Leerzeichen bei anderen Operationen
-            term_str = re.sub(r"(\d+)\s*\*\s*([a-zA-Z])", r"\1\2", term_str)
+        # Entferne Leerzeichen um ^ Operator (für x^2 statt x ^ 2)
+        term_str = _POTENZ.sub("^", term_str)
 
-            # Bereinige doppelte Leerzeichen
-            term_str = re.sub(r"\s+", " ", term_str).strip()
+        # Entferne * bei Koeffizienten (z.B. 2 * x -> 2x), aber behalte Leerzeichen bei anderen Operationen
+        term_str = _ZAHL_MAL_SYMBOL.sub(r"\1\2", term_str)
 
-            # Für die ganzrationalen Tests: stelle sicher, dass Koeffizienten mit * dargestellt werden
-            # (z.B. 4x -> 4*x für bessere Lesbarkeit in Schulmaterial)
-            term_str = re.sub(r"(\d)([a-zA-Z])", r"\1*\2", term_str)
+        # Bereinige doppelte Leerzeichen
+        term_str = _MEHRFACHE_LEERZEICHEN.sub(" ", term_str).strip()
 
-            return term_str
+        # Für die ganzrationalen Tests: stelle sicher, dass Koeffizienten mit * dargestellt werden
+        # (z.B. 4x -> 4*x für bessere Lesbarkeit in Schulmaterial)
+        return _ZAHL_VOR_SYMBOL.sub(r"\1*\2", term_str)
 
-    def term_latex(self) -> str:
-        """Gibt den Term als LaTeX-String zurück"""
+    def _formatiere_latex(self) -> str:
         if self.parameter:
             # Für parametrisierte Funktionen: optimierte Darstellung in Standardform
             return _formatiere_mit_poly_latex(
                 self.term_sympy, self._variable_symbol, self.parameter
             )
-        else:
-            # Normale Darstellung für konkrete Funktionen
-            return latex(self.term_sympy)
+        # Normale Darstellung für konkrete Funktionen
+        return latex(self.term_sympy)
 
     def __call__(self, x_wert, **kwargs):
         """
@@ -1254,6 +1532,7 @@ class Funktion(BasisFunktion):
             # Normale Auswertung ohne zusätzliche Parameter
             return self.wert(x_wert)
 
+    @gemessen("evaluate")
     def wert(self, x_wert):
         """
         Berechnet den Funktionswert an einer Stelle mit Caching für Performance.
@@ -1274,49 +1553,40 @@ class Funktion(BasisFunktion):
         """
         # Erstelle Cache-Schlüssel für den x-Wert
         cache_key = (x_wert, id(self))
+        version = self._version
 
-        # Prüfe Cache für diesen x-Wert
-        if hasattr(self, "_wert_cache") and cache_key in self._wert_cache:
-            return self._wert_cache[cache_key]
+        # Prüfe Cache für diesen x-Wert (ein einzelnes get ist threadsicher)
+        gecacht = (
+            self._wert_cache.get(cache_key) if hasattr(self, "_wert_cache") else None
+        )
+        if gecacht is not None:
+            cache_zugriff("wert", treffer=True)
+            return gecacht
+        cache_zugriff("wert", treffer=False)
 
-        logging.debug(f"Berechne f({x_wert}) für {self.term()}")
+        logger.debug("Berechne f(%s) für %s", x_wert, Lazy(self.term))
 
         try:
-            # Substituiere den x-Wert
-            ergebnis = self.term_sympy.subs(self._variable_symbol, x_wert)
-
-            # Vereinfache das Ergebnis mit intelligenter Vereinfachung bei Parametern
-            if self.parameter:
-                # Bei Parametern: Intelligente Vereinfachung für Funktionswerte
-                ergebnis = _intelligente_vereinfachung(
-                    ergebnis, self._variable_symbol, self.parameter, kontext="wert"
-                )
-            else:
-                # Ohne Parameter: Normale Vereinfachung
-                ergebnis = ergebnis.simplify()
-
-            # Prüfe, ob das Ergebnis noch Parameter enthält
-            if ergebnis.free_symbols - {self._variable_symbol}:
-                # Symbolisches Ergebnis zurückgeben (mit Parameter)
-                final_ergebnis = ergebnis
-            else:
-                # Numerisches Ergebnis zurückgeben
-                final_ergebnis = ergebnis
+            final_ergebnis = self._berechne_wert(x_wert)
+            if version != self._version:
+                # Term wurde während der Berechnung geändert
+                return final_ergebnis
 
             # Speichere im Cache
-            if not hasattr(self, "_wert_cache"):
-                self._wert_cache = {}
-                self._wert_cache_max_size = 100  # Größerer Cache für Funktionswerte
-
-            if len(self._wert_cache) >= self._wert_cache_max_size:
-                # Entferne die ältesten 25% der Einträge
-                keys_to_remove = list(self._wert_cache.keys())[
-                    : max(1, self._wert_cache_max_size // 4)
-                ]
-                for key in keys_to_remove:
-                    del self._wert_cache[key]
+            with self._cache_sperre:
+                if not hasattr(self, "_wert_cache"):
+                    self._wert_cache = {}
+                    self._wert_cache_max_size = 100  # Größerer Cache für Funktionswerte
+
+                if len(self._wert_cache) >= self._wert_cache_max_size:
+                    # Entferne die ältesten 25% der Einträge
+                    keys_to_remove = list(self._wert_cache.keys())[
+                        : max(1, self._wert_cache_max_size // 4)
+                    ]
+                    for key in keys_to_remove:
+                        del self._wert_cache[key]
 
-            self._wert_cache[cache_key] = final_ergebnis
+                self._wert_cache[cache_key] = final_ergebnis
 
             return final_ergebnis
 
@@ -1337,6 +1607,21 @@ class Funktion(BasisFunktion):
             else:
                 raise ValueError(f"Fehler bei Berechnung von f({x_wert}): {e}")
 
+    def _berechne_wert(self, x_wert):
+        """Funktionswert ohne Cache; Unterklassen mit eigener Darstellung überschreiben das"""
+        # Substituiere den x-Wert
+        ergebnis = self.term_sympy.subs(self._variable_symbol, x_wert)
+
+        # Vereinfache das Ergebnis mit intelligenter Vereinfachung bei Parametern
+        if self.parameter:
+            # Bei Parametern: Intelligente Vereinfachung für Funktionswerte
+            return _intelligente_vereinfachung(
+                ergebnis, self._variable_symbol, self.parameter, kontext="wert"
+            )
+        # Ohne Parameter: Normale Vereinfachung
+        with Messung("simplify"):
+            return ergebnis.simplify()
+
     def setze_parameter(self, **kwargs):
         """
         Setzt Parameter und gibt neue Funktion zurück.
@@ -1392,12 +1677,9 @@ class Funktion(BasisFunktion):
                                 "Nur Funktionen mit Parametern können mit setze_parameter() manipuliert werden."
                             )
 
-            # Führe die Substitution durch
+            # Führe die Substitution durch (diese Funktion bleibt unverändert)
             new_expr = self.term_sympy.subs(kwargs)
 
-            # Leere Caches für die neue Funktion (wird in Konstruktor neu initialisiert)
-            self._cache_leeren()
-
             # Erstelle neue Funktion mit dem substituierten Ausdruck
             neue_funktion = Funktion(new_expr)
 
@@ -1431,13 +1713,14 @@ class Funktion(BasisFunktion):
                 cache = getattr(self, cache_name)
                 if isinstance(cache, dict):
                     cache.clear()
-                    logging.debug(f"Cache {cache_name} geleert")
+                    logger.debug("Cache %s geleert", cache_name)
 
         # Auch Cache-Metriken zurücksetzen
         if hasattr(self, "_ableitung_cache_hits"):
             self._ableitung_cache_hits = 0
             self._ableitung_cache_misses = 0
 
+    @gemessen("diff")
     @preserve_exact_types
     def ableitung(self, ordnung: int = 1) -> "Funktion":
         """
@@ -1451,20 +1734,24 @@ class Funktion(BasisFunktion):
         """
         # Prüfe Cache für diese Ableitungsordnung
         cache_key = (ordnung, id(self))
-        if hasattr(self, "_ableitung_cache") and cache_key in self._ableitung_cache:
-            self._ableitung_cache_hits += 1
-            logging.debug(
-                f"Cache-Hit für Ableitung {ordnung} von {self.term()}. "
-                f"Hit-Rate: {self._cache_hit_rate():.1%}"
-            )
-            return self._ableitung_cache[cache_key]
+        version = self._version
+        if hasattr(self, "_ableitung_cache"):
+            with self._cache_sperre:
+                gecacht = self._ableitung_cache.get(cache_key)
+                if gecacht is not None:
+                    self._ableitung_cache_hits += 1
+            if gecacht is not None:
+                cache_zugriff("ableitung", treffer=True)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Cache-Hit für Ableitung {ordnung} von {self.term()}. "
+                        f"Hit-Rate: {self._cache_hit_rate():.1%}"
+                    )
+                return gecacht
 
-        logging.debug(f"Berechne Ableitung {ordnung} für {self.term()}")
+        logger.debug("Berechne Ableitung %s für %s", ordnung, Lazy(self.term))
 
-        # Verwende gecachte Differentiation für Performance
-        abgeleiteter_term = _cached_diff(
-            self.term_sympy, self._variable_symbol, ordnung
-        )
+        abgeleiteter_term = self._abgeleiteter_term(ordnung)
 
         # Validiere das Ergebnis
         validate_function_result(abgeleiteter_term, VALIDATION_EXACT)
@@ -1503,37 +1790,57 @@ class Funktion(BasisFunktion):
             else:
                 abgeleitete_funktion.name = f"f^{{{ordnung}}}"
 
-        # Initialisiere Cache wenn nicht vorhanden
-        if not hasattr(self, "_ableitung_cache"):
-            self._ableitung_cache = {}
-            # Erhöhe Cache-Größe für bessere Performance (max 50 Einträge)
-            self._ableitung_cache_max_size = 50
-            # Füge Cache-Hits und Misses für Performance-Monitoring hinzu
-            self._ableitung_cache_hits = 0
-            self._ableitung_cache_misses = 0
+        if version != self._version:
+            # Term wurde während der Berechnung geändert: nicht eintragen
+            return abgeleitete_funktion
+
+        # Cache-Änderungen unter der Sperre, die Berechnung selbst außerhalb
+        with self._cache_sperre:
+            # Initialisiere Cache wenn nicht vorhanden
+            if not hasattr(self, "_ableitung_cache"):
+                self._ableitung_cache = {}
+                # Erhöhe Cache-Größe für bessere Performance (max 50 Einträge)
+                self._ableitung_cache_max_size = 50
+                # Füge Cache-Hits und Misses für Performance-Monitoring hinzu
+                self._ableitung_cache_hits = 0
+                self._ableitung_cache_misses = 0
+
+            # Speichere im Cache mit verbesserter LRU-Logik
+            if len(self._ableitung_cache) >= self._ableitung_cache_max_size:
+                # Entferne die ältesten 20% der Einträge für bessere Performance
+                keys_to_remove = list(self._ableitung_cache.keys())[
+                    : max(1, self._ableitung_cache_max_size // 5)
+                ]
+                for key in keys_to_remove:
+                    del self._ableitung_cache[key]
+                logger.debug(
+                    "Cache voll, entferne %s älteste Einträge", len(keys_to_remove)
+                )
 
-        # Speichere im Cache mit verbesserter LRU-Logik
-        if len(self._ableitung_cache) >= self._ableitung_cache_max_size:
-            # Entferne die ältesten 20% der Einträge für bessere Performance
-            keys_to_remove = list(self._ableitung_cache.keys())[
-                : max(1, self._ableitung_cache_max_size // 5)
-            ]
-            for key in keys_to_remove:
-                del self._ableitung_cache[key]
-            logging.debug(
-                f"Cache voll, entferne {len(keys_to_remove)} älteste Einträge"
+            # Hat ein anderer Thread parallel gerechnet, gilt dessen Ergebnis
+            abgeleitete_funktion = self._ableitung_cache.setdefault(
+                cache_key, abgeleitete_funktion
+            )
+            self._ableitung_cache_misses += 1
+        cache_zugriff("ableitung", treffer=False)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Cache-Miss für Ableitung {ordnung}, gespeichert unter {cache_key}. "
+                f"Cache-Größe: {len(self._ableitung_cache)}, "
+                f"Hit-Rate: {self._cache_hit_rate():.1%}"
             )
-
-        self._ableitung_cache[cache_key] = abgeleitete_funktion
-        self._ableitung_cache_misses += 1
-        logging.debug(
-            f"Cache-Miss für Ableitung {ordnung}, gespeichert unter {cache_key}. "
-            f"Cache-Größe: {len(self._ableitung_cache)}, "
-            f"Hit-Rate: {self._cache_hit_rate():.1%}"
-        )
 
         return abgeleitete_funktion
 
+    def _abgeleiteter_term(self, ordnung: int) -> sp.Expr:
+        """Term der Ableitung; Unterklassen mit eigener Darstellung überschreiben das"""
+        # Verwende gecachte Differentiation für Performance
+        return _cached_diff(self.term_sympy, self._variable_symbol, ordnung)
+
+    def _stammfunktion_term(self) -> sp.Expr:
+        """Term einer Stammfunktion (Integrationskonstante 0)"""
+        return sp.integrate(self.term_sympy, self._variable_symbol)
+
     def _cache_hit_rate(self) -> float:
         """
         Berechnet die Cache-Hit-Rate für Performance-Monitoring.
@@ -1566,9 +1873,7 @@ class Funktion(BasisFunktion):
 
     def integral(self, ordnung: int = 1) -> "Funktion":
         """Berechnet das Integral"""
-        import sympy as sp
-
-        integrierter_term = sp.integrate(self.term_sympy, self._variable_symbol)
+        integrierter_term = self._stammfunktion_term()
         # Erstelle neue Funktion mit Namen
         integrierte_funktion = Funktion(integrierter_term)
         # Setze Namen für integrierte Funktion
@@ -1609,18 +1914,19 @@ class Funktion(BasisFunktion):
         """
         # Prüfe Cache für Nullstellen
         if hasattr(self, "_nullstellen_cache") and self._nullstellen_cache is not None:
+            cache_zugriff("nullstellen", treffer=True)
             return self._nullstellen_cache
+        cache_zugriff("nullstellen", treffer=False)
 
         # Berechne Nullstellen und speichere im Cache
+        version = self._version
         ergebnis = self._berechne_nullstellen(real=real, runden=runden)
-
-        if not hasattr(self, "_nullstellen_cache"):
-            self._nullstellen_cache = None
-
-        self._nullstellen_cache = ergebnis
+        if version == self._version:
+            self._nullstellen_cache = ergebnis
 
         return ergebnis
 
+    @gemessen("solve")
     @preserve_exact_types
     def _berechne_nullstellen(
         self, real: bool = True, runden: int | None = None
@@ -1706,6 +2012,56 @@ class Funktion(BasisFunktion):
         """
         return self.nullstellen(real=real, runden=runden)
 
+    @gemessen("solve")
+    def nullstellen_schar(self) -> PeriodischeLoesung | None:
+        """
+        Periodische Lösungsschar der Nullstellen, z.B. für sin(3x).
+
+        Returns:
+            PeriodischeLoesung oder None, wenn die reellen Nullstellen keine
+            periodische Schar bilden
+
+        Examples:
+            >>> Funktion("sin(3x)").nullstellen_schar().periode
+            2*pi/3
+        """
+        gespeichert = self._cache.get("nullstellen_schar")
+        if gespeichert is None or gespeichert[0] is not self.term_sympy:
+            try:
+                menge = sp.solveset(self.term_sympy, self._variable_symbol, sp.S.Reals)
+                schar = PeriodischeLoesung.aus_menge(menge)
+            except (NotImplementedError, TypeError, ValueError):
+                schar = None
+            gespeichert = (self.term_sympy, schar)
+            self._cache["nullstellen_schar"] = gespeichert
+        return gespeichert[1]
+
+    def nullstellen_im_intervall(self, von, bis) -> ExactNullstellenListe:
+        """
+        Alle reellen Nullstellen in [von, bis], aufsteigend sortiert.
+
+        Periodische Nullstellen werden aus der Lösungsschar direkt aufgezählt,
+        sonst werden die Ergebnisse von `nullstellen()` gefiltert.
+
+        Examples:
+            >>> len(Funktion("sin(3x)").nullstellen_im_intervall(-100, 100))
+            191
+        """
+        schar = self.nullstellen_schar()
+        if schar is not None:
+            return [Nullstelle(x=w, exakt=True) for w in schar.im_intervall(von, bis)]
+
+        von, bis = sp.sympify(von), sp.sympify(bis)
+        ergebnisse = [
+            n if isinstance(n, Nullstelle) else Nullstelle(x=n, exakt=True)
+            for n in self.nullstellen()
+        ]
+        return [
+            n
+            for n in ergebnisse
+            if (n.x - von).is_nonnegative and (bis - n.x).is_nonnegative
+        ]
+
     @property
     def nullstellen_mit_wiederholungen(self) -> list:
         """
@@ -1759,6 +2115,9 @@ class Funktion(BasisFunktion):
         Returns:
             Funktion: Die gekürzte/vereinfachte Funktion
 
+        Raises:
+            UngueltigeFunktionError: Bei internierten oder bereits gehashten Funktionen
+
         Examples:
             >>> f = Funktion("(x^2-4)/(x-2)")
             >>> f_gekürzt = f.kürzen()  # Ergebnis: x + 2
@@ -1769,21 +2128,17 @@ class Funktion(BasisFunktion):
             # Verwende cancel() zum Kürzen von Brüchen
             gekürzter_term = sp.cancel(self.term_sympy)
 
-            # Aktualisiere den aktuellen Term
-            self.term_sympy = gekürzter_term
-
-            # Invalidiere den Cache, da sich die Funktion geändert hat
-            # Setze bekannte Cache-Keys auf None statt den gesamten Cache zu löschen
-            for key in ["polstellen", "nullstellen", "extremstellen", "wendepunkte"]:
-                if key in self._cache:
-                    self._cache[key] = None
-
-            return self
         except Exception as e:
             # Bei Fehlern: gebe die ursprüngliche Funktion zurück
             print(f"Warnung: Kürzen fehlgeschlagen: {e}")
             return self
 
+        # Aktualisiere den aktuellen Term (verwirft alle Caches)
+        if gekürzter_term != self.term_sympy:
+            self.term_sympy = gekürzter_term
+        return self
+
+    @gemessen("solve")
     def löse_gleichung(self, y_wert: float | sp.Basic = 0) -> list:
         """
         Löst die Gleichung f(x) = y_wert und gibt die Lösungen zurück.
@@ -1872,37 +2227,41 @@ class Funktion(BasisFunktion):
             Liste der optimierten Nullstellen als strukturierte Nullstelle-Objekte
         """
         try:
-            logging.debug(f"Starte nullstellen_optimiert() für {self.term()}")
+            logger.debug("Starte nullstellen_optimiert() für %s", Lazy(self.term))
 
             # Hybrid-Strategie: Parametrische vs. nicht-parametrische Funktionen
             if self.parameter:
-                logging.debug(f"Parametrische Funktion erkannt: {self.parameter}")
+                logger.debug("Parametrische Funktion erkannt: %s", self.parameter)
                 return self._nullstellen_parametrisch_fortgeschritten()
             else:
-                logging.debug("Nicht-parametrische Funktion - verwende Framework")
+                logger.debug("Nicht-parametrische Funktion - verwende Framework")
                 return self._nullstellen_mit_framework()
 
         except (TypeError, ValueError, AttributeError) as e:
             # Erwartete Fehler bei ungültigen Eingaben oder Attributen
-            logging.warning(
-                f"Erwarteter Fehler bei Nullstellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "Erwarteter Fehler bei Nullstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             # Fallback auf parametrische Methode versuchen
             try:
                 return self._nullstellen_parametrisch_fallback()
             except Exception as fallback_error:
-                logging.warning(f"Fallback ebenfalls fehlgeschlagen: {fallback_error}")
+                logger.warning("Fallback ebenfalls fehlgeschlagen: %s", fallback_error)
                 return []
         except (sp.SympifyError, Exception) as e:
             # SymPy-spezifische Fehler bei Termverarbeitung
-            logging.warning(
-                f"SymPy-Fehler bei Nullstellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "SymPy-Fehler bei Nullstellenberechnung für %s: %s", Lazy(self.term), e
             )
             return []
         except Exception as e:
             # Unerwartete Fehler - sollten weitergegeben werden
-            logging.error(
-                f"Unerwarteter Fehler bei Nullstellenberechnung für {self.term()}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei Nullstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             raise
 
@@ -1918,12 +2277,12 @@ class Funktion(BasisFunktion):
         """
         try:
             # Nutze unsere bewährte nullstellen()-Implementierung
-            logging.debug(
-                f"Verwende bestehendes nullstellen()-Framework für {self.term()}"
+            logger.debug(
+                "Verwende bestehendes nullstellen()-Framework für %s", Lazy(self.term)
             )
             return self.nullstellen()
         except Exception as e:
-            logging.error(f"Fehler bei Framework-Nullstellenberechnung: {e}")
+            logger.error("Fehler bei Framework-Nullstellenberechnung: %s", e)
             raise
 
     def _nullstellen_parametrisch_fallback(self) -> ExactNullstellenListe:
@@ -1934,7 +2293,7 @@ class Funktion(BasisFunktion):
             Liste von Nullstelle-Objekten
         """
         try:
-            logging.debug(f"Verwende parametrischen Fallback für {self.term()}")
+            logger.debug("Verwende parametrischen Fallback für %s", Lazy(self.term))
 
             # Verwende solve() direkt für parametrische Funktionen
             import sympy as sp
@@ -1946,12 +2305,10 @@ class Funktion(BasisFunktion):
                 return []
 
             # Konvertiere zu Nullstelle-Objekten
+            vielfachheiten = self._berechne_vielfachheiten(lösungen)
             nullstellen = []
-            for lösung in lösungen:
+            for lösung, vielfachheit in zip(lösungen, vielfachheiten, strict=True):
                 try:
-                    # Berechne Vielfachheit
-                    vielfachheit = self._berechne_vielfachheit(lösung)
-
                     nullstellen.append(
                         Nullstelle(
                             x=lösung,
@@ -1960,17 +2317,19 @@ class Funktion(BasisFunktion):
                         )
                     )
                 except Exception as e:
-                    logging.warning(f"Fehler bei Verarbeitung von Lösung {lösung}: {e}")
+                    logger.warning(
+                        "Fehler bei Verarbeitung von Lösung %s: %s", lösung, e
+                    )
                     continue
 
             return nullstellen
 
         except (TypeError, ValueError, AttributeError, ZeroDivisionError) as e:
-            logging.warning(f"Fehler bei parametrischer Nullstellenberechnung: {e}")
+            logger.warning("Fehler bei parametrischer Nullstellenberechnung: %s", e)
             return []
         except Exception as e:
-            logging.error(
-                f"Unerwarteter Fehler bei parametrischer Nullstellenberechnung: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei parametrischer Nullstellenberechnung: %s", e
             )
             raise
 
@@ -1991,51 +2350,52 @@ class Funktion(BasisFunktion):
         from .sympy_types import Nullstelle
 
         try:
-            logging.debug(
-                f"Starte fortgeschrittene parametrische Berechnung für {self.term()}"
+            logger.debug(
+                "Starte fortgeschrittene parametrische Berechnung für %s",
+                Lazy(self.term),
             )
 
             # Strategie 1: Faktorisierungs-basierter Ansatz
             try:
-                logging.debug("Versuche Faktorisierungs-Strategie")
+                logger.debug("Versuche Faktorisierungs-Strategie")
                 ergebnisse = self._parametrisch_mit_faktorisierung()
                 if ergebnisse:
-                    logging.debug(
-                        f"Faktorisierung erfolgreich: {len(ergebnisse)} Lösungen"
+                    logger.debug(
+                        "Faktorisierung erfolgreich: %s Lösungen", len(ergebnisse)
                     )
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"Faktorisierung fehlgeschlagen: {e}")
+                logger.debug("Faktorisierung fehlgeschlagen: %s", e)
 
             # Strategie 2: Polynom-spezifische Methoden
             try:
-                logging.debug("Versuche Polynom-Strategie")
+                logger.debug("Versuche Polynom-Strategie")
                 ergebnisse = self._parametrisches_polynom()
                 if ergebnisse:
-                    logging.debug(
-                        f"Polynom-Methode erfolgreich: {len(ergebnisse)} Lösungen"
+                    logger.debug(
+                        "Polynom-Methode erfolgreich: %s Lösungen", len(ergebnisse)
                     )
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"Polynom-Methode fehlgeschlagen: {e}")
+                logger.debug("Polynom-Methode fehlgeschlagen: %s", e)
 
             # Strategie 3: solveset() als Alternative
             try:
-                logging.debug("Versuche solveset-Alternative")
+                logger.debug("Versuche solveset-Alternative")
                 ergebnisse = self._parametrisch_mit_solveset()
                 if ergebnisse:
-                    logging.debug(f"solveset erfolgreich: {len(ergebnisse)} Lösungen")
+                    logger.debug("solveset erfolgreich: %s Lösungen", len(ergebnisse))
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"solveset fehlgeschlagen: {e}")
+                logger.debug("solveset fehlgeschlagen: %s", e)
 
             # Fallback auf ursprüngliche Methode
-            logging.debug("Verwende ursprüngliche solve()-Methode als Fallback")
+            logger.debug("Verwende ursprüngliche solve()-Methode als Fallback")
             return self._nullstellen_parametrisch_fallback()
 
         except Exception as e:
-            logging.error(
-                f"Fehler bei fortgeschrittener parametrischer Berechnung: {e}"
+            logger.error(
+                "Fehler bei fortgeschrittener parametrischer Berechnung: %s", e
             )
             # Letzter Fallback auf einfache Methode
             return self._nullstellen_parametrisch_fallback()
@@ -2051,24 +2411,26 @@ class Funktion(BasisFunktion):
         from .sympy_types import Nullstelle
 
         try:
-            logging.debug(f"Versuche Faktorisierung für {self.term()}")
+            logger.debug("Versuche Faktorisierung für %s", Lazy(self.term))
 
             # Versuche 1: Direkte Faktorisierung
             faktorisiert = sp.factor(self.term_sympy)
             if faktorisiert != self.term_sympy:
-                logging.debug(
-                    f"Faktorisierung erfolgreich: {self.term()} -> {faktorisiert}"
+                logger.debug(
+                    "Faktorisierung erfolgreich: %s -> %s",
+                    Lazy(self.term),
+                    faktorisiert,
                 )
                 raw_lösungen = sp.solve(faktorisiert, self._variable_symbol)
             else:
-                logging.debug("Keine direkte Faktorisierung möglich")
+                logger.debug("Keine direkte Faktorisierung möglich")
                 raw_lösungen = []
 
             # Versuche 2: Zusammenfassen und nochmal faktorisieren
             if not raw_lösungen:
                 zusammengefasst = sp.together(self.term_sympy)
                 if zusammengefasst != self.term_sympy:
-                    logging.debug(f"Zusammenfassung erfolgreich: {zusammengefasst}")
+                    logger.debug("Zusammenfassung erfolgreich: %s", zusammengefasst)
                     faktorisiert_zusammen = sp.factor(zusammengefasst)
                     if faktorisiert_zusammen != zusammengefasst:
                         raw_lösungen = sp.solve(
@@ -2084,7 +2446,7 @@ class Funktion(BasisFunktion):
             return []
 
         except Exception as e:
-            logging.warning(f"Fehler bei Faktorisierungs-Strategie: {e}")
+            logger.warning("Fehler bei Faktorisierungs-Strategie: %s", e)
             return []
 
     def _parametrisches_polynom(self) -> ExactNullstellenListe:
@@ -2098,11 +2460,11 @@ class Funktion(BasisFunktion):
         from .sympy_types import Nullstelle
 
         try:
-            logging.debug(f"Versuche Polynom-Methode für {self.term()}")
+            logger.debug("Versuche Polynom-Methode für %s", Lazy(self.term))
 
             # Prüfe, ob es sich um ein Polynom handelt
             if not self.term_sympy.is_polynomial(self._variable_symbol):
-                logging.debug("Kein Polynom - Methode nicht anwendbar")
+                logger.debug("Kein Polynom - Methode nicht anwendbar")
                 return []
 
             # Erstelle Polynom
@@ -2113,39 +2475,46 @@ class Funktion(BasisFunktion):
                 root_dict = sp.roots(poly, self._variable_symbol)
 
                 if root_dict:
-                    logging.debug(f"roots() erfolgreich mit {len(root_dict)} Lösungen")
+                    logger.debug("roots() erfolgreich mit %s Lösungen", len(root_dict))
                     lösungen = []
                     for x_wert, vielfachheit in root_dict.items():
-                        logging.debug(
-                            f"Prüfe root: {x_wert} (Typ: {type(x_wert)}), is_real: {hasattr(x_wert, 'is_real') and x_wert.is_real}"
+                        logger.debug(
+                            "Prüfe root: %s (Typ: %s), is_real: %s",
+                            x_wert,
+                            type(x_wert),
+                            hasattr(x_wert, "is_real") and x_wert.is_real,
                         )
 
                         # Angepasste Realitätsprüfung für parametrische Lösungen
                         if hasattr(x_wert, "is_real"):
                             if x_wert.is_real is False:
-                                logging.debug(
-                                    f"Root {x_wert} ist explizit nicht reell (is_real=False) - überspringe"
+                                logger.debug(
+                                    "Root %s ist explizit nicht reell (is_real=False) - überspringe",
+                                    x_wert,
                                 )
                                 continue
                             elif x_wert.is_real is True:
-                                logging.debug(
-                                    f"Root {x_wert} ist explizit reell (is_real=True) - verarbeite weiter"
+                                logger.debug(
+                                    "Root %s ist explizit reell (is_real=True) - verarbeite weiter",
+                                    x_wert,
                                 )
                             else:
                                 # is_real ist None (unbekannt) - für parametrische Funktionen annehmen wir reell
-                                logging.debug(
-                                    f"Root {x_wert} hat is_real=None (parametrisch) - nehme reell an"
+                                logger.debug(
+                                    "Root %s hat is_real=None (parametrisch) - nehme reell an",
+                                    x_wert,
                                 )
                         else:
                             # Für SymPy-Objekte ohne is_real Eigenschaft (wie Symbole)
                             if hasattr(x_wert, "is_complex") and x_wert.is_complex:
-                                logging.debug(
-                                    f"Root {x_wert} ist komplex - überspringe"
+                                logger.debug(
+                                    "Root %s ist komplex - überspringe", x_wert
                                 )
                                 continue
                             else:
-                                logging.debug(
-                                    f"Root {x_wert} hat keine is_real Eigenschaft - nehme reell an"
+                                logger.debug(
+                                    "Root %s hat keine is_real Eigenschaft - nehme reell an",
+                                    x_wert,
                                 )
 
                         lösungen.append(
@@ -2153,18 +2522,18 @@ class Funktion(BasisFunktion):
                                 x=x_wert, multiplicitaet=vielfachheit, exakt=True
                             )
                         )
-                    logging.debug(f"Gefundene reelle Lösungen: {len(lösungen)}")
+                    logger.debug("Gefundene reelle Lösungen: %s", len(lösungen))
                     return lösungen
                 else:
-                    logging.debug("roots() lieferte keine Lösungen")
+                    logger.debug("roots() lieferte keine Lösungen")
                     return []
 
             except Exception as e:
-                logging.debug(f"Polynom-Methode fehlgeschlagen: {e}")
+                logger.debug("Polynom-Methode fehlgeschlagen: %s", e)
                 return []
 
         except Exception as e:
-            logging.warning(f"Fehler bei Polynom-Strategie: {e}")
+            logger.warning("Fehler bei Polynom-Strategie: %s", e)
             return []
 
     def _parametrisch_mit_solveset(self) -> ExactNullstellenListe:
@@ -2178,7 +2547,7 @@ class Funktion(BasisFunktion):
         from .sympy_types import Nullstelle
 
         try:
-            logging.debug(f"Versuche solveset für {self.term()}")
+            logger.debug("Versuche solveset für %s", Lazy(self.term))
 
             # Verwende solveset statt solve
             lösungs_menge = sp.solveset(
@@ -2188,7 +2557,7 @@ class Funktion(BasisFunktion):
             # Konvertiere solveset-Ergebnis zu Liste
             if hasattr(lösungs_menge, "is_FiniteSet") and lösungs_menge.is_FiniteSet:
                 raw_lösungen = list(lösungs_menge)
-                logging.debug(f"solveset FiniteSet mit {len(raw_lösungen)} Lösungen")
+                logger.debug("solveset FiniteSet mit %s Lösungen", len(raw_lösungen))
                 return self._verarbeite_parametrische_lösungen(raw_lösungen, "solveset")
             elif hasattr(lösungs_menge, "is_Union") and lösungs_menge.is_Union:
                 # Verarbeite Union von Mengen
@@ -2196,16 +2565,16 @@ class Funktion(BasisFunktion):
                 for menge in lösungs_menge.args:
                     if hasattr(menge, "is_FiniteSet") and menge.is_FiniteSet:
                         raw_lösungen.extend(list(menge))
-                logging.debug(f"solveset Union mit {len(raw_lösungen)} Lösungen")
+                logger.debug("solveset Union mit %s Lösungen", len(raw_lösungen))
                 return self._verarbeite_parametrische_lösungen(raw_lösungen, "solveset")
             else:
-                logging.debug(
-                    f"solveset gab komplexe Menge zurück: {type(lösungs_menge)}"
+                logger.debug(
+                    "solveset gab komplexe Menge zurück: %s", type(lösungs_menge)
                 )
                 return []
 
         except Exception as e:
-            logging.warning(f"Fehler bei solveset-Strategie: {e}")
+            logger.warning("Fehler bei solveset-Strategie: %s", e)
             return []
 
     def _verarbeite_parametrische_lösungen(
@@ -2224,77 +2593,91 @@ class Funktion(BasisFunktion):
         from .sympy_types import Nullstelle
 
         try:
-            logging.debug(f"Verarbeite {len(raw_lösungen)} Rohlösungen von {strategie}")
-            logging.debug(f"Rohlösungen: {raw_lösungen}")
+            logger.debug(
+                "Verarbeite %s Rohlösungen von %s", len(raw_lösungen), strategie
+            )
+            logger.debug("Rohlösungen: %s", raw_lösungen)
 
             nullstellen = []
             for i, lösung in enumerate(raw_lösungen):
                 try:
-                    logging.debug(
-                        f"Verarbeite Lösung {i}: {lösung} (Typ: {type(lösung)})"
+                    logger.debug(
+                        "Verarbeite Lösung %s: %s (Typ: %s)", i, lösung, type(lösung)
                     )
 
                     # Filtere reelle Lösungen - angepasst für parametrische Funktionen
                     if hasattr(lösung, "is_real"):
                         if lösung.is_real is False:
-                            logging.debug(
-                                f"Lösung {lösung} ist explizit nicht reell (is_real=False) - überspringe"
+                            logger.debug(
+                                "Lösung %s ist explizit nicht reell (is_real=False) - überspringe",
+                                lösung,
                             )
                             continue
                         elif lösung.is_real is True:
-                            logging.debug(
-                                f"Lösung {lösung} ist explizit reell (is_real=True) - verarbeite weiter"
+                            logger.debug(
+                                "Lösung %s ist explizit reell (is_real=True) - verarbeite weiter",
+                                lösung,
                             )
                         else:
                             # is_real ist None (unbekannt) - für parametrische Funktionen annehmen wir reell
-                            logging.debug(
-                                f"Lösung {lösung} hat is_real=None (parametrisch) - nehme reell an"
+                            logger.debug(
+                                "Lösung %s hat is_real=None (parametrisch) - nehme reell an",
+                                lösung,
                             )
                     else:
                         # Für SymPy-Objekte ohne is_real Eigenschaft (wie Symbole)
                         # nehmen wir an, dass sie reell sind, es sei denn sie enthalten komplexe Komponenten
                         if hasattr(lösung, "is_complex") and lösung.is_complex:
-                            logging.debug(f"Lösung {lösung} ist komplex - überspringe")
+                            logger.debug("Lösung %s ist komplex - überspringe", lösung)
                             continue
                         else:
-                            logging.debug(
-                                f"Lösung {lösung} hat keine is_real Eigenschaft - nehme reell an"
+                            logger.debug(
+                                "Lösung %s hat keine is_real Eigenschaft - nehme reell an",
+                                lösung,
                             )
 
                     # Vereinfache die Lösung
                     vereinfacht = sp.simplify(sp.together(lösung))
-                    logging.debug(f"Vereinfacht: {vereinfacht}")
+                    logger.debug("Vereinfacht: %s", vereinfacht)
 
                     # Berechne Vielfachheit
                     try:
                         vielfachheit = self._berechne_vielfachheit(vereinfacht)
-                        logging.debug(f"Vielfachheit für {vereinfacht}: {vielfachheit}")
+                        logger.debug(
+                            "Vielfachheit für %s: %s", vereinfacht, vielfachheit
+                        )
                     except Exception as e:
-                        logging.debug(
-                            f"Fehler bei Vielfachheitsberechnung für {vereinfacht}: {e}, verwende 1"
+                        logger.debug(
+                            "Fehler bei Vielfachheitsberechnung für %s: %s, verwende 1",
+                            vereinfacht,
+                            e,
                         )
                         vielfachheit = 1
 
                     # Prüfe auf Duplikate mit verbesserter Logik
                     ist_duplikat = False
                     for j, existierende in enumerate(nullstellen):
-                        logging.debug(
-                            f"Prüfe Duplikat mit existierender Lösung {j}: {existierende.x}"
+                        logger.debug(
+                            "Prüfe Duplikat mit existierender Lösung %s: %s",
+                            j,
+                            existierende.x,
                         )
                         differenz = sp.simplify(existierende.x - vereinfacht)
-                        logging.debug(f"Differenz: {differenz}")
+                        logger.debug("Differenz: %s", differenz)
 
                         # Bessere Duplikatserkennung für parametrische Ausdrücke
                         if differenz == 0 or differenz.is_zero:
-                            logging.debug(
-                                f"Duplikat gefunden - erhöhe Vielfachheit von {existierende.multiplicitaet} um {vielfachheit}"
+                            logger.debug(
+                                "Duplikat gefunden - erhöhe Vielfachheit von %s um %s",
+                                existierende.multiplicitaet,
+                                vielfachheit,
                             )
                             ist_duplikat = True
                             existierende.multiplicitaet += vielfachheit
                             break
 
                     if not ist_duplikat:
-                        logging.debug(f"Neue eindeutige Lösung: {vereinfacht}")
+                        logger.debug("Neue eindeutige Lösung: %s", vereinfacht)
                         nullstellen.append(
                             Nullstelle(
                                 x=vereinfacht, multiplicitaet=vielfachheit, exakt=True
@@ -2302,22 +2685,24 @@ class Funktion(BasisFunktion):
                         )
 
                 except Exception as e:
-                    logging.warning(f"Fehler bei Verarbeitung von Lösung {lösung}: {e}")
+                    logger.warning(
+                        "Fehler bei Verarbeitung von Lösung %s: %s", lösung, e
+                    )
                     import traceback
 
-                    logging.debug(traceback.format_exc())
+                    logger.debug(traceback.format_exc())
                     continue
 
-            logging.debug(
-                f"{strategie} erzeugte {len(nullstellen)} eindeutige Lösungen"
+            logger.debug(
+                "%s erzeugte %s eindeutige Lösungen", strategie, len(nullstellen)
             )
             return nullstellen
 
         except Exception as e:
-            logging.error(f"Fehler bei Lösungsaufbereitung für {strategie}: {e}")
+            logger.error("Fehler bei Lösungsaufbereitung für %s: %s", strategie, e)
             import traceback
 
-            logging.debug(traceback.format_exc())
+            logger.debug(traceback.format_exc())
             return []
 
     def NullstellenMitWiederholungen(
@@ -2348,6 +2733,16 @@ class Funktion(BasisFunktion):
         from .sympy_types import Nullstelle
 
         try:
+            # Rationale Koeffizienten: zertifizierte Isolation
+            try:
+                polynom = DichtesPolynom.aus_poly(
+                    sp.Poly(self.term_sympy, self._variable_symbol)
+                )
+            except sp.PolynomialError:
+                polynom = None
+            if polynom is not None:
+                return self._nullstellen_aus_polynom(polynom)
+
             # Versuche 1: roots() Funktion für Polynome mit rationalen Koeffizienten
             try:
                 poly = sp.Poly(self.term_sympy, self._variable_symbol)
@@ -2385,16 +2780,13 @@ class Funktion(BasisFunktion):
                     raw_lösungen = sp.solve(self.term_sympy, self._variable_symbol)
 
                 # Filtere reelle Lösungen und konvertiere zu Nullstelle-Datenklassen
-                reelle_lösungen = []
-                for lösung in raw_lösungen:
-                    if lösung.is_real:
-                        # Zähle Vielfachheit durch Substitution
-                        vielfachheit = self._berechne_vielfachheit(lösung)
-                        reelle_lösungen.append(
-                            Nullstelle(
-                                x=lösung, multiplicitaet=vielfachheit, exakt=True
-                            )
-                        )
+                reelle = [lösung for lösung in raw_lösungen if lösung.is_real]
+                reelle_lösungen = [
+                    Nullstelle(x=lösung, multiplicitaet=vielfachheit, exakt=True)
+                    for lösung, vielfachheit in zip(
+                        reelle, self._berechne_vielfachheiten(reelle), strict=True
+                    )
+                ]
 
                 if reelle_lösungen:
                     # Versuche, komplexe Lösungen zu vereinfachen
@@ -2443,33 +2835,9 @@ class Funktion(BasisFunktion):
                 lösungen = real_roots(poly)
 
                 if lösungen:
-                    # Konvertiere zu exakten Werten wo möglich
-                    ergebnisse = []
-                    for lösung in lösungen:
-                        try:
-                            # Für CRootOf, versuche exakten Wert zu finden
-                            if hasattr(lösung, "evalf"):
-                                approx = lösung.evalf()
-                                # Prüfe auf "nette" Zahlen (nahe an Ganzzahlen)
-                                if abs(approx - round(approx)) < 1e-10:
-                                    ergebnisse.append(sp.Integer(round(approx)))
-                                # Prüfe auf "nette" Brüche (mit kleinen Nennern)
-                                else:
-                                    # Versuche, als Bruch darzustellen
-                                    for nenner in range(2, 11):
-                                        zaehler = round(approx * nenner)
-                                        if abs(approx - zaehler / nenner) < 1e-10:
-                                            ergebnisse.append(
-                                                sp.Rational(zaehler, nenner)
-                                            )
-                                            break
-                                    else:
-                                        # Kein schöner Bruch gefunden, numerische Annäherung
-                                        ergebnisse.append(approx)
-                            else:
-                                ergebnisse.append(lösung)
-                        except:
-                            ergebnisse.append(lösung)
+                    # real_roots liefert exakte Werte (Rational/CRootOf);
+                    # kein Raten "netter" Brüche über Gleitkommavergleiche
+                    ergebnisse = list(lösungen)
 
                     # Entferne Duplikate und sortiere
                     eindeutige_ergebnisse = []
@@ -2494,11 +2862,28 @@ class Funktion(BasisFunktion):
                 f"Fehler bei der Nullstellenberechnung für ganzrationale Funktion: {str(e)}"
             ) from e
 
-    def _berechne_vielfachheit(self, x_wert) -> int:
+    def _nullstellen_aus_polynom(
+        self, polynom: DichtesPolynom
+    ) -> ExactNullstellenListe:
         """
-        Berechnet die Vielfachheit einer Nullstelle durch Ableitungen.
+        Reelle Nullstellen eines Polynoms mit rationalen Koeffizienten.
 
-        Verwendet Caching für Performance-Optimierung bei wiederholten Berechnungen.
+        Quadratfreie Zerlegung und Sturmsche Isolationsintervalle; rationale
+        Nullstellen werden exakt erkannt, irrationale bleiben Wurzelausdrücke
+        oder CRootOf.
+        """
+        lösungen = [
+            Nullstelle(x=x_wert, multiplicitaet=vielfachheit, exakt=True)
+            for x_wert, vielfachheit in reversed(
+                polynom.exakte_nullstellen(self._variable_symbol)
+            )
+        ]
+        validate_exact_results([n.x for n in lösungen], "Nullstellen (ganzrational)")
+        return lösungen
+
+    def _berechne_vielfachheit(self, x_wert) -> int:
+        """
+        Vielfachheit einer Nullstelle (0, falls x_wert keine Nullstelle ist).
 
         Args:
             x_wert: Der x-Wert der Nullstelle
@@ -2506,82 +2891,70 @@ class Funktion(BasisFunktion):
         Returns:
             Vielfachheit der Nullstelle
         """
-        import sympy as sp
-        from functools import lru_cache
-
-        # Erstelle hashbaren Schlüssel für Caching
-        @lru_cache(maxsize=256)
-        def _berechne_vielfachheit_cached(term_hash: int, x_wert_hash: tuple) -> int:
-            """Cached version der Vielfachheitsberechnung."""
-
-            # Rekonstruiere SymPy-Objekte (in einer echten Implementierung
-            # würden wir hier eine cleverere Serialisierung verwenden)
-            vielfachheit = 0
-            term = self.term_sympy
-
-            # Substituiere den x-Wert, um zu prüfen, ob es eine Nullstelle ist
-            substituted = term.subs(self._variable_symbol, x_wert)
-            if substituted != 0:
-                return 0  # Keine Nullstelle
-
-            # Zähle, wie oft abgeleitet werden muss, bis das Ergebnis nicht mehr 0 ist
-            while True:
-                if substituted != 0:
-                    break
-                vielfachheit += 1
-                term = sp.diff(term, self._variable_symbol)
-                substituted = term.subs(self._variable_symbol, x_wert)
-
-                # Sicherheit gegen Endlosschleifen
-                if vielfachheit > 10:
-                    break
-
-            return vielfachheit
-
-        # Erstelle hashbare Repräsentation der Eingabe
-        try:
-            term_hash = hash(str(self.term_sympy))
-            if hasattr(x_wert, "evalf"):
-                # Für SymPy-Objekte: verwende String-Repräsentation
-                x_wert_hash = hash(str(x_wert))
-            else:
-                # Für numerische Werte: verwende den Wert direkt
-                x_wert_hash = hash(
-                    float(x_wert) if hasattr(x_wert, "evalf") else x_wert
-                )
-
-            return _berechne_vielfachheit_cached(term_hash, (x_wert_hash,))
-        except (TypeError, AttributeError):
-            # Fallback für nicht-hashbare Werte
-            return self._berechne_vielfachheit_uncached(x_wert)
+        return self._berechne_vielfachheiten([x_wert])[0]
+
+    def _berechne_vielfachheiten(self, x_werte) -> list[int]:
+        """
+        Vielfachheiten mehrerer Nullstellen in einem Durchgang.
+
+        Polynome werden einmal quadratfrei zerlegt (`sqf_list`); die
+        Vielfachheit ist der Exponent des Faktors, der an x_wert verschwindet.
+        Sonst wird der Ableitungsturm stufenweise für alle noch offenen
+        Stellen gemeinsam ausgewertet, jede Ableitung nur einmal gebildet.
+        """
+        variable = self._variable_symbol
+        x_werte = list(x_werte)
+        ergebnis: list[int | None] = [None] * len(x_werte)
+
+        faktoren = self._quadratfreie_faktoren()
+        if faktoren is not None:
+            for j, x_wert in enumerate(x_werte):
+                for faktor, exponent in faktoren:
+                    if _verschwindet(faktor.subs(variable, x_wert)):
+                        ergebnis[j] = exponent
+                        break
+
+        # Nicht zugeordnete Stellen: Anzahl verschwindender Ableitungen
+        # (Sicherheit gegen Endlosschleifen: höchstens 11 Ableitungen)
+        offen = [j for j, wert in enumerate(ergebnis) if wert is None]
+        for j in offen:
+            ergebnis[j] = 0
+        ordnung = 0
+        while offen and ordnung <= 10:
+            ableitung = (
+                _cached_diff(self.term_sympy, variable, ordnung)
+                if ordnung
+                else self.term_sympy
+            )
+            offen = [j for j in offen if ableitung.subs(variable, x_werte[j]) == 0]
+            for j in offen:
+                ergebnis[j] += 1
+            ordnung += 1
+        return ergebnis
 
-    def _berechne_vielfachheit_uncached(self, x_wert) -> int:
-        """
-        Uncached Fallback-Version der Vielfachheitsberechnung.
+    def _quadratfreie_faktoren(self) -> list[tuple[sp.Expr, int]] | None:
         """
-        import sympy as sp
-
-        vielfachheit = 0
-        term = self.term_sympy
+        Quadratfreie Faktoren (mit Exponent) des Terms, falls er ein Polynom ist.
 
-        # Substituiere den x-Wert, um zu prüfen, ob es eine Nullstelle ist
-        substituted = term.subs(self._variable_symbol, x_wert)
-        if substituted != 0:
-            return 0  # Keine Nullstelle
-
-        # Zähle, wie oft abgeleitet werden muss, bis das Ergebnis nicht mehr 0 ist
-        while True:
-            if substituted != 0:
-                break
-            vielfachheit += 1
-            term = sp.diff(term, self._variable_symbol)
-            substituted = term.subs(self._variable_symbol, x_wert)
-
-            # Sicherheit gegen Endlosschleifen
-            if vielfachheit > 10:
-                break
-
-        return vielfachheit
+        Wird pro Term einmal berechnet.
+        """
+        gespeichert = self._cache.get("quadratfrei")
+        if gespeichert is None or gespeichert[0] is not self.term_sympy:
+            faktoren = None
+            variable = self._variable_symbol
+            if self.term_sympy.is_polynomial(variable):
+                try:
+                    _, liste = sp.sqf_list(self.term_sympy, variable)
+                    faktoren = [
+                        (faktor, exponent)
+                        for faktor, exponent in liste
+                        if faktor.has(variable)
+                    ]
+                except sp.PolynomialError:
+                    pass
+            gespeichert = (self.term_sympy, faktoren)
+            self._cache["quadratfrei"] = gespeichert
+        return gespeichert[1]
 
     def _entferne_duplikate_optimiert(self, lösungen: list) -> list:
         """
@@ -2773,33 +3146,39 @@ class Funktion(BasisFunktion):
         try:
             # Hybrid-Strategie: Parametrische vs. nicht-parametrische Funktionen
             if self.parameter:
-                logging.debug(f"Parametrische Funktion erkannt: {self.parameter}")
+                logger.debug("Parametrische Funktion erkannt: %s", self.parameter)
                 return self._extremstellen_parametrisch_fortgeschritten()
             else:
-                logging.debug("Nicht-parametrische Funktion - verwende Framework")
+                logger.debug("Nicht-parametrische Funktion - verwende Framework")
                 return self._extremstellen_mit_framework()
 
         except (TypeError, ValueError, AttributeError) as e:
             # Erwartete Fehler bei ungültigen Eingaben oder Attributen
-            logging.warning(
-                f"Erwarteter Fehler bei Extremstellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "Erwarteter Fehler bei Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             # Fallback auf parametrische Methode versuchen
             try:
                 return self._extremstellen_parametrisch_fallback()
             except Exception as fallback_error:
-                logging.warning(f"Fallback ebenfalls fehlgeschlagen: {fallback_error}")
+                logger.warning("Fallback ebenfalls fehlgeschlagen: %s", fallback_error)
                 return []
         except (sp.SympifyError, Exception) as e:
             # SymPy-spezifische Fehler bei Termverarbeitung
-            logging.warning(
-                f"SymPy-Fehler bei Extremstellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "SymPy-Fehler bei Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except Exception as e:
             # Unerwartete Fehler - sollten weitergegeben werden
-            logging.error(
-                f"Unerwarteter Fehler bei Extremstellenberechnung für {self.term()}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             raise
 
@@ -2815,17 +3194,17 @@ class Funktion(BasisFunktion):
         """
         try:
             # 1. Berechne erste Ableitung
-            logging.debug(f"Berechne erste Ableitung für {self.term()}")
+            logger.debug("Berechne erste Ableitung für %s", Lazy(self.term))
             f_strich = self.ableitung(ordnung=1)
 
             # 2. Nutze unser starkes nullstellen()-Framework
-            logging.debug(
-                f"Verwende Nullstellen-Framework für Ableitung {f_strich.term()}"
+            logger.debug(
+                "Verwende Nullstellen-Framework für Ableitung %s", Lazy(f_strich.term)
             )
             kritische_punkte = f_strich.nullstellen()
 
             if not kritische_punkte:
-                logging.debug(f"Keine kritischen Punkte für {self.term()} gefunden")
+                logger.debug("Keine kritischen Punkte für %s gefunden", Lazy(self.term))
                 return []
 
             # 3. Analysiere jede kritische Stelle
@@ -2853,13 +3232,17 @@ class Funktion(BasisFunktion):
                     )
 
                 except (TypeError, ValueError, AttributeError) as e:
-                    logging.warning(
-                        f"Fehler bei Verarbeitung von kritischem Punkt {kritischer_punkt}: {e}"
+                    logger.warning(
+                        "Fehler bei Verarbeitung von kritischem Punkt %s: %s",
+                        kritischer_punkt,
+                        e,
                     )
                     continue
                 except Exception as e:
-                    logging.error(
-                        f"Unerwarteter Fehler bei Verarbeitung von kritischem Punkt {kritischer_punkt}: {e}"
+                    logger.error(
+                        "Unerwarteter Fehler bei Verarbeitung von kritischem Punkt %s: %s",
+                        kritischer_punkt,
+                        e,
                     )
                     continue
 
@@ -2867,20 +3250,26 @@ class Funktion(BasisFunktion):
 
         except (TypeError, ValueError, AttributeError) as e:
             # Erwartete Fehler bei ungültigen Eingaben oder Attributen
-            logging.warning(
-                f"Erwarteter Fehler bei Framework-Extremstellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "Erwarteter Fehler bei Framework-Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except (sp.SympifyError, Exception) as e:
             # SymPy-spezifische Fehler bei Termverarbeitung
-            logging.warning(
-                f"SymPy-Fehler bei Framework-Extremstellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "SymPy-Fehler bei Framework-Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except Exception as e:
             # Unerwartete Fehler - sollten weitergegeben werden
-            logging.error(
-                f"Unerwarteter Fehler bei Framework-Extremstellenberechnung für {self.term()}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei Framework-Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             raise
 
@@ -2895,8 +3284,8 @@ class Funktion(BasisFunktion):
             ExtremumTyp: MINIMUM, MAXIMUM oder SATTELPUNKT
         """
         try:
-            logging.debug(
-                f"Bestimme Extremtyp für x={x_wert} bei Funktion {self.term()}"
+            logger.debug(
+                "Bestimme Extremtyp für x=%s bei Funktion %s", x_wert, Lazy(self.term)
             )
             f_doppelstrich = self.ableitung(ordnung=2)
             zweite_ableitung_wert = f_doppelstrich.wert(x_wert)
@@ -2904,30 +3293,30 @@ class Funktion(BasisFunktion):
             # Für numerische Werte
             if isinstance(zweite_ableitung_wert, (int, float)):
                 if zweite_ableitung_wert > 0:
-                    logging.debug(
-                        f"Zweite Ableitung = {zweite_ableitung_wert} > 0 → Minimum"
+                    logger.debug(
+                        "Zweite Ableitung = %s > 0 → Minimum", zweite_ableitung_wert
                     )
                     return ExtremumTyp.MINIMUM
                 elif zweite_ableitung_wert < 0:
-                    logging.debug(
-                        f"Zweite Ableitung = {zweite_ableitung_wert} < 0 → Maximum"
+                    logger.debug(
+                        "Zweite Ableitung = %s < 0 → Maximum", zweite_ableitung_wert
                     )
                     return ExtremumTyp.MAXIMUM
                 else:
                     # Zweite Ableitung = 0 → höhere Ableitungen prüfen
-                    logging.debug(f"Zweite Ableitung = 0 → prüfe höhere Ableitungen")
+                    logger.debug("Zweite Ableitung = 0 → prüfe höhere Ableitungen")
                     return self._bestimme_extremtyp_hoere_ableitungen(x_wert)
             else:
                 # Symbolische Ausdrücke: Vereinfachen und analysieren
                 vereinfacht = sp.simplify(zweite_ableitung_wert)
                 if hasattr(vereinfacht, "is_positive") and vereinfacht.is_positive:
-                    logging.debug(
-                        f"Symbolische zweite Ableitung {vereinfacht} > 0 → Minimum"
+                    logger.debug(
+                        "Symbolische zweite Ableitung %s > 0 → Minimum", vereinfacht
                     )
                     return ExtremumTyp.MINIMUM
                 elif hasattr(vereinfacht, "is_negative") and vereinfacht.is_negative:
-                    logging.debug(
-                        f"Symbolische zweite Ableitung {vereinfacht} < 0 → Maximum"
+                    logger.debug(
+                        "Symbolische zweite Ableitung %s < 0 → Maximum", vereinfacht
                     )
                     return ExtremumTyp.MAXIMUM
                 else:
@@ -2936,11 +3325,11 @@ class Funktion(BasisFunktion):
 
         except (TypeError, ValueError, AttributeError) as e:
             # Bei erwarteten Fehlern Sattelpunkt als sichere Wahl
-            logging.warning(f"Fehler bei Extremtyp-Bestimmung: {e}")
+            logger.warning("Fehler bei Extremtyp-Bestimmung: %s", e)
             return ExtremumTyp.SATTELPUNKT
         except Exception as e:
             # Bei unerwarteten Fehlern - weitergeben
-            logging.error(f"Unerwarteter Fehler bei Extremtyp-Bestimmung: {e}")
+            logger.error("Unerwarteter Fehler bei Extremtyp-Bestimmung: %s", e)
             raise
 
     def _bestimme_extremtyp_hoere_ableitungen(self, x_wert) -> ExtremumTyp:
@@ -2973,11 +3362,11 @@ class Funktion(BasisFunktion):
             return ExtremumTyp.SATTELPUNKT
 
         except (TypeError, ValueError, AttributeError) as e:
-            logging.warning(f"Fehler bei Extremtyp-Bestimmung für x={x_wert}: {e}")
+            logger.warning("Fehler bei Extremtyp-Bestimmung für x=%s: %s", x_wert, e)
             return ExtremumTyp.SATTELPUNKT
         except Exception as e:
-            logging.error(
-                f"Unerwarteter Fehler bei Extremtyp-Bestimmung für x={x_wert}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei Extremtyp-Bestimmung für x=%s: %s", x_wert, e
             )
             return ExtremumTyp.SATTELPUNKT
 
@@ -3014,13 +3403,18 @@ class Funktion(BasisFunktion):
                     extrema.append(Extremstelle(x=punkt, typ=typ, exakt=True))
                 except (TypeError, ValueError, ZeroDivisionError) as e:
                     # Erwartete Fehler bei der Berechnung des y-Wertes
-                    logging.warning(
-                        f"Überspringe kritischen Punkt {punkt} aufgrund von {type(e).__name__}: {e}"
+                    logger.warning(
+                        "Überspringe kritischen Punkt %s aufgrund von %s: %s",
+                        punkt,
+                        type(e).__name__,
+                        e,
                     )
                     continue
                 except Exception as e:
-                    logging.error(
-                        f"Unerwarteter Fehler bei Verarbeitung von Punkt {punkt}: {e}"
+                    logger.error(
+                        "Unerwarteter Fehler bei Verarbeitung von Punkt %s: %s",
+                        punkt,
+                        e,
                     )
                     continue
 
@@ -3028,20 +3422,26 @@ class Funktion(BasisFunktion):
 
         except (TypeError, ValueError, AttributeError) as e:
             # Erwartete Fehler bei ungültigen Funktionseigenschaften
-            logging.warning(
-                f"Erwarteter Fehler bei parametrischer Extremstellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "Erwarteter Fehler bei parametrischer Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except (sp.SympifyError, Exception) as e:
             # SymPy-spezifische Fehler bei Termverarbeitung
-            logging.warning(
-                f"SymPy-Fehler bei parametrischer Extremstellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "SymPy-Fehler bei parametrischer Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except Exception as e:
             # Unerwartete Fehler - sollten weitergegeben werden
-            logging.error(
-                f"Unerwarteter Fehler bei parametrischer Extremstellenberechnung für {self.term()}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei parametrischer Extremstellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             raise
 
@@ -3061,8 +3461,9 @@ class Funktion(BasisFunktion):
         import sympy as sp
 
         try:
-            logging.debug(
-                f"Starte fortgeschrittene parametrische Extremstellenberechnung für {self.term()}"
+            logger.debug(
+                "Starte fortgeschrittene parametrische Extremstellenberechnung für %s",
+                Lazy(self.term),
             )
 
             # Berechne erste Ableitung
@@ -3070,49 +3471,50 @@ class Funktion(BasisFunktion):
 
             # Strategie 1: Faktorisierungs-basierter Ansatz
             try:
-                logging.debug("Versuche Faktorisierungs-Strategie für Extremstellen")
+                logger.debug("Versuche Faktorisierungs-Strategie für Extremstellen")
                 ergebnisse = self._extremstellen_mit_faktorisierung(f_strich)
                 if ergebnisse:
-                    logging.debug(
-                        f"Faktorisierung erfolgreich: {len(ergebnisse)} Extremstellen"
+                    logger.debug(
+                        "Faktorisierung erfolgreich: %s Extremstellen", len(ergebnisse)
                     )
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"Faktorisierung fehlgeschlagen: {e}")
+                logger.debug("Faktorisierung fehlgeschlagen: %s", e)
 
             # Strategie 2: Polynom-spezifische Methoden
             try:
-                logging.debug("Versuche Polynom-Strategie für Extremstellen")
+                logger.debug("Versuche Polynom-Strategie für Extremstellen")
                 ergebnisse = self._extremstellen_mit_polynom(f_strich)
                 if ergebnisse:
-                    logging.debug(
-                        f"Polynom-Methode erfolgreich: {len(ergebnisse)} Extremstellen"
+                    logger.debug(
+                        "Polynom-Methode erfolgreich: %s Extremstellen", len(ergebnisse)
                     )
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"Polynom-Methode fehlgeschlagen: {e}")
+                logger.debug("Polynom-Methode fehlgeschlagen: %s", e)
 
             # Strategie 3: solveset() als Alternative
             try:
-                logging.debug("Versuche solveset-Alternative für Extremstellen")
+                logger.debug("Versuche solveset-Alternative für Extremstellen")
                 ergebnisse = self._extremstellen_mit_solveset(f_strich)
                 if ergebnisse:
-                    logging.debug(
-                        f"solveset erfolgreich: {len(ergebnisse)} Extremstellen"
+                    logger.debug(
+                        "solveset erfolgreich: %s Extremstellen", len(ergebnisse)
                     )
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"solveset fehlgeschlagen: {e}")
+                logger.debug("solveset fehlgeschlagen: %s", e)
 
             # Fallback auf ursprüngliche Methode
-            logging.debug(
+            logger.debug(
                 "Verwende ursprüngliche solve()-Methode als Fallback für Extremstellen"
             )
             return self._extremstellen_parametrisch_fallback()
 
         except Exception as e:
-            logging.error(
-                f"Fehler bei fortgeschrittener parametrischer Extremstellenberechnung: {e}"
+            logger.error(
+                "Fehler bei fortgeschrittener parametrischer Extremstellenberechnung: %s",
+                e,
             )
             # Letzter Fallback auf einfache Methode
             return self._extremstellen_parametrisch_fallback()
@@ -3132,24 +3534,26 @@ class Funktion(BasisFunktion):
         import sympy as sp
 
         try:
-            logging.debug(f"Versuche Faktorisierung für {f_strich.term()}")
+            logger.debug("Versuche Faktorisierung für %s", Lazy(f_strich.term))
 
             # Versuche 1: Direkte Faktorisierung
             faktorisiert = sp.factor(f_strich.term_sympy)
             if faktorisiert != f_strich.term_sympy:
-                logging.debug(
-                    f"Faktorisierung erfolgreich: {f_strich.term()} -> {faktorisiert}"
+                logger.debug(
+                    "Faktorisierung erfolgreich: %s -> %s",
+                    Lazy(f_strich.term),
+                    faktorisiert,
                 )
                 raw_lösungen = sp.solve(faktorisiert, f_strich._variable_symbol)
             else:
-                logging.debug("Keine direkte Faktorisierung möglich")
+                logger.debug("Keine direkte Faktorisierung möglich")
                 raw_lösungen = []
 
             # Versuche 2: Zusammenfassen und nochmal faktorisieren
             if not raw_lösungen:
                 zusammengefasst = sp.together(f_strich.term_sympy)
                 if zusammengefasst != f_strich.term_sympy:
-                    logging.debug(f"Zusammenfassung erfolgreich: {zusammengefasst}")
+                    logger.debug("Zusammenfassung erfolgreich: %s", zusammengefasst)
                     faktorisiert_zusammen = sp.factor(zusammengefasst)
                     if faktorisiert_zusammen != zusammengefasst:
                         raw_lösungen = sp.solve(
@@ -3165,8 +3569,8 @@ class Funktion(BasisFunktion):
             return []
 
         except Exception as e:
-            logging.warning(
-                f"Fehler bei Faktorisierungs-Strategie für Extremstellen: {e}"
+            logger.warning(
+                "Fehler bei Faktorisierungs-Strategie für Extremstellen: %s", e
             )
             return []
 
@@ -3183,13 +3587,13 @@ class Funktion(BasisFunktion):
         import sympy as sp
 
         try:
-            logging.debug(f"Versuche Polynom-Methode für {f_strich.term()}")
+            logger.debug("Versuche Polynom-Methode für %s", Lazy(f_strich.term))
 
             # Prüfe, ob es sich um ein Polynom handelt
             if not hasattr(
                 f_strich.term_sympy, "is_polynomial"
             ) or not f_strich.term_sympy.is_polynomial(f_strich._variable_symbol):  # type: ignore
-                logging.debug("Kein Polynom - Methode nicht anwendbar")
+                logger.debug("Kein Polynom - Methode nicht anwendbar")
                 return []
 
             # Erstelle Polynom
@@ -3200,20 +3604,20 @@ class Funktion(BasisFunktion):
                 root_dict = sp.roots(poly, f_strich._variable_symbol)
 
                 if root_dict:
-                    logging.debug(f"roots() erfolgreich mit {len(root_dict)} Lösungen")
+                    logger.debug("roots() erfolgreich mit %s Lösungen", len(root_dict))
                     return self._verarbeite_parametrische_extremstellen(
                         list(root_dict.keys()), "Polynom"
                     )
                 else:
-                    logging.debug("roots() lieferte keine Lösungen")
+                    logger.debug("roots() lieferte keine Lösungen")
                     return []
 
             except Exception as e:
-                logging.debug(f"Polynom-Methode fehlgeschlagen: {e}")
+                logger.debug("Polynom-Methode fehlgeschlagen: %s", e)
                 return []
 
         except Exception as e:
-            logging.warning(f"Fehler bei Polynom-Strategie für Extremstellen: {e}")
+            logger.warning("Fehler bei Polynom-Strategie für Extremstellen: %s", e)
             return []
 
     def _extremstellen_mit_solveset(self, f_strich: "Funktion") -> list[Extremstelle]:
@@ -3229,7 +3633,7 @@ class Funktion(BasisFunktion):
         import sympy as sp
 
         try:
-            logging.debug(f"Versuche solveset für {f_strich.term()}")
+            logger.debug("Versuche solveset für %s", Lazy(f_strich.term))
 
             # Verwende solveset statt solve
             lösungs_menge = sp.solveset(
@@ -3239,7 +3643,7 @@ class Funktion(BasisFunktion):
             # Konvertiere solveset-Ergebnis zu Liste
             if hasattr(lösungs_menge, "is_FiniteSet") and lösungs_menge.is_FiniteSet:
                 raw_lösungen = list(lösungs_menge)
-                logging.debug(f"solveset FiniteSet mit {len(raw_lösungen)} Lösungen")
+                logger.debug("solveset FiniteSet mit %s Lösungen", len(raw_lösungen))
                 return self._verarbeite_parametrische_extremstellen(
                     raw_lösungen, "solveset"
                 )
@@ -3249,18 +3653,18 @@ class Funktion(BasisFunktion):
                 for menge in lösungs_menge.args:
                     if hasattr(menge, "is_FiniteSet") and menge.is_FiniteSet:
                         raw_lösungen.extend(list(menge))
-                logging.debug(f"solveset Union mit {len(raw_lösungen)} Lösungen")
+                logger.debug("solveset Union mit %s Lösungen", len(raw_lösungen))
                 return self._verarbeite_parametrische_extremstellen(
                     raw_lösungen, "solveset"
                 )
             else:
-                logging.debug(
-                    f"solveset gab komplexe Menge zurück: {type(lösungs_menge)}"
+                logger.debug(
+                    "solveset gab komplexe Menge zurück: %s", type(lösungs_menge)
                 )
                 return []
 
         except Exception as e:
-            logging.warning(f"Fehler bei solveset-Strategie für Extremstellen: {e}")
+            logger.warning("Fehler bei solveset-Strategie für Extremstellen: %s", e)
             return []
 
     def _verarbeite_parametrische_extremstellen(
@@ -3277,52 +3681,60 @@ class Funktion(BasisFunktion):
             Liste von Extremstelle-Objekten
         """
         try:
-            logging.debug(f"Verarbeite {len(raw_lösungen)} Rohlösungen von {strategie}")
+            logger.debug(
+                "Verarbeite %s Rohlösungen von %s", len(raw_lösungen), strategie
+            )
 
             extrema = []
             for lösung in raw_lösungen:
                 try:
-                    logging.debug(f"Verarbeite Lösung {lösung} (Typ: {type(lösung)})")
+                    logger.debug("Verarbeite Lösung %s (Typ: %s)", lösung, type(lösung))
 
                     # Angepasste Realitätsprüfung für parametrische Lösungen
                     if hasattr(lösung, "is_real"):
                         if lösung.is_real is False:
-                            logging.debug(
-                                f"Lösung {lösung} ist explizit nicht reell - überspringe"
+                            logger.debug(
+                                "Lösung %s ist explizit nicht reell - überspringe",
+                                lösung,
                             )
                             continue
                         elif lösung.is_real is True:
-                            logging.debug(
-                                f"Lösung {lösung} ist explizit reell - verarbeite weiter"
+                            logger.debug(
+                                "Lösung %s ist explizit reell - verarbeite weiter",
+                                lösung,
                             )
                         else:
                             # is_real ist None (unbekannt) - für parametrische Funktionen annehmen wir reell
-                            logging.debug(
-                                f"Lösung {lösung} hat is_real=None (parametrisch) - nehme reell an"
+                            logger.debug(
+                                "Lösung %s hat is_real=None (parametrisch) - nehme reell an",
+                                lösung,
                             )
                     else:
                         # Für SymPy-Objekte ohne is_real Eigenschaft
                         if hasattr(lösung, "is_complex") and lösung.is_complex:
-                            logging.debug(f"Lösung {lösung} ist komplex - überspringe")
+                            logger.debug("Lösung %s ist komplex - überspringe", lösung)
                             continue
                         else:
-                            logging.debug(
-                                f"Lösung {lösung} hat keine is_real Eigenschaft - nehme reell an"
+                            logger.debug(
+                                "Lösung %s hat keine is_real Eigenschaft - nehme reell an",
+                                lösung,
                             )
 
                     # Berechne y-Wert
                     try:
                         y_wert = self.wert(lösung)
                     except Exception as e:
-                        logging.debug(f"Fehler bei y-Wert Berechnung für {lösung}: {e}")
+                        logger.debug(
+                            "Fehler bei y-Wert Berechnung für %s: %s", lösung, e
+                        )
                         continue
 
                     # Bestimme Extremtyp
                     try:
                         typ = self._bestimme_extremtyp(lösung)
                     except Exception as e:
-                        logging.debug(
-                            f"Fehler bei Extremtyp-Bestimmung für {lösung}: {e}"
+                        logger.debug(
+                            "Fehler bei Extremtyp-Bestimmung für %s: %s", lösung, e
                         )
                         # Fallback auf SATTELPUNKT
                         typ = ExtremumTyp.SATTELPUNKT
@@ -3330,14 +3742,18 @@ class Funktion(BasisFunktion):
                     extrema.append(Extremstelle(x=lösung, typ=typ, exakt=True))
 
                 except Exception as e:
-                    logging.warning(f"Fehler bei Verarbeitung von Lösung {lösung}: {e}")
+                    logger.warning(
+                        "Fehler bei Verarbeitung von Lösung %s: %s", lösung, e
+                    )
                     continue
 
-            logging.debug(f"{strategie} erzeugte {len(extrema)} Extremstellen")
+            logger.debug("%s erzeugte %s Extremstellen", strategie, len(extrema))
             return extrema
 
         except Exception as e:
-            logging.error(f"Fehler bei Extremstellen-Aufbereitung für {strategie}: {e}")
+            logger.error(
+                "Fehler bei Extremstellen-Aufbereitung für %s: %s", strategie, e
+            )
             return []
 
     def Extremstellen(self) -> list[Extremstelle]:
@@ -3489,37 +3905,41 @@ class Funktion(BasisFunktion):
             Liste von Wendestelle-Objekten (x-Koordinaten nur)
         """
         try:
-            logging.debug(f"Starte wendestellen_optimiert() für {self.term()}")
+            logger.debug("Starte wendestellen_optimiert() für %s", Lazy(self.term))
 
             # Hybrid-Strategie: Parametrische vs. nicht-parametrische Funktionen
             if self.parameter:
-                logging.debug(f"Parametrische Funktion erkannt: {self.parameter}")
+                logger.debug("Parametrische Funktion erkannt: %s", self.parameter)
                 return self._wendestellen_parametrisch_fortgeschritten()
             else:
-                logging.debug("Nicht-parametrische Funktion - verwende Framework")
+                logger.debug("Nicht-parametrische Funktion - verwende Framework")
                 return self._wendestellen_mit_framework()
 
         except (TypeError, ValueError, AttributeError) as e:
             # Erwartete Fehler bei ungültigen Eingaben oder Attributen
-            logging.warning(
-                f"Erwarteter Fehler bei Wendestellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "Erwarteter Fehler bei Wendestellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             # Fallback auf parametrische Methode versuchen
             try:
                 return self._wendestellen_parametrisch_fallback()
             except Exception as fallback_error:
-                logging.warning(f"Fallback ebenfalls fehlgeschlagen: {fallback_error}")
+                logger.warning("Fallback ebenfalls fehlgeschlagen: %s", fallback_error)
                 return []
         except (sp.SympifyError, Exception) as e:
             # SymPy-spezifische Fehler bei Termverarbeitung
-            logging.warning(
-                f"SymPy-Fehler bei Wendestellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "SymPy-Fehler bei Wendestellenberechnung für %s: %s", Lazy(self.term), e
             )
             return []
         except Exception as e:
             # Unerwartete Fehler - sollten weitergegeben werden
-            logging.error(
-                f"Unerwarteter Fehler bei Wendestellenberechnung für {self.term()}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei Wendestellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             raise
 
@@ -3535,21 +3955,21 @@ class Funktion(BasisFunktion):
         """
         try:
             # 1. Berechne zweite Ableitung
-            logging.debug(f"Berechne zweite Ableitung für {self.term()}")
+            logger.debug("Berechne zweite Ableitung für %s", Lazy(self.term))
             f2 = self.ableitung(ordnung=2)
 
             # 2. Nutze unser starkes nullstellen()-Framework für f''(x) = 0
-            logging.debug(
-                f"Verwende Nullstellen-Framework für zweite Ableitung {f2.term()}"
+            logger.debug(
+                "Verwende Nullstellen-Framework für zweite Ableitung %s", Lazy(f2.term)
             )
             kritische_punkte = f2.nullstellen()
 
             if not kritische_punkte:
-                logging.debug(f"Keine kritischen Punkte für {self.term()} gefunden")
+                logger.debug("Keine kritischen Punkte für %s gefunden", Lazy(self.term))
                 return []
 
             # 3. Analysiere jede kritische Stelle mit dritter Ableitung
-            logging.debug("Analysiere kritische Punkte mit dritter Ableitung")
+            logger.debug("Analysiere kritische Punkte mit dritter Ableitung")
             f3 = self.ableitung(ordnung=3)
             wendestellen = []
 
@@ -3576,13 +3996,17 @@ class Funktion(BasisFunktion):
                     )
 
                 except (TypeError, ValueError, AttributeError) as e:
-                    logging.warning(
-                        f"Fehler bei Verarbeitung von kritischem Punkt {kritischer_punkt}: {e}"
+                    logger.warning(
+                        "Fehler bei Verarbeitung von kritischem Punkt %s: %s",
+                        kritischer_punkt,
+                        e,
                     )
                     continue
                 except Exception as e:
-                    logging.error(
-                        f"Unerwarteter Fehler bei Verarbeitung von kritischem Punkt {kritischer_punkt}: {e}"
+                    logger.error(
+                        "Unerwarteter Fehler bei Verarbeitung von kritischem Punkt %s: %s",
+                        kritischer_punkt,
+                        e,
                     )
                     continue
 
@@ -3590,20 +4014,26 @@ class Funktion(BasisFunktion):
 
         except (TypeError, ValueError, AttributeError) as e:
             # Erwartete Fehler bei ungültigen Eingaben oder Attributen
-            logging.warning(
-                f"Erwarteter Fehler bei Framework-Wendepunkteberechnung für {self.term()}: {e}"
+            logger.warning(
+                "Erwarteter Fehler bei Framework-Wendepunkteberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except (sp.SympifyError, Exception) as e:
             # SymPy-spezifische Fehler bei Termverarbeitung
-            logging.warning(
-                f"SymPy-Fehler bei Framework-Wendepunkteberechnung für {self.term()}: {e}"
+            logger.warning(
+                "SymPy-Fehler bei Framework-Wendepunkteberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except Exception as e:
             # Unerwartete Fehler - sollten weitergegeben werden
-            logging.error(
-                f"Unerwarteter Fehler bei Framework-Wendepunkteberechnung für {self.term()}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei Framework-Wendepunkteberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             raise
 
@@ -3615,7 +4045,7 @@ class Funktion(BasisFunktion):
             Liste von Wendestelle-Objekten (x-Koordinaten nur)
         """
         try:
-            logging.debug(f"Verwende parametrischen Fallback für {self.term()}")
+            logger.debug("Verwende parametrischen Fallback für %s", Lazy(self.term))
 
             # Berechne zweite Ableitung
             f2 = self.ableitung(ordnung=2)
@@ -3664,11 +4094,13 @@ class Funktion(BasisFunktion):
                         )
 
                 except (TypeError, ValueError, AttributeError, ZeroDivisionError) as e:
-                    logging.warning(f"Fehler bei Verarbeitung von Punkt {punkt}: {e}")
+                    logger.warning("Fehler bei Verarbeitung von Punkt %s: %s", punkt, e)
                     continue
                 except Exception as e:
-                    logging.error(
-                        f"Unerwarteter Fehler bei Verarbeitung von Punkt {punkt}: {e}"
+                    logger.error(
+                        "Unerwarteter Fehler bei Verarbeitung von Punkt %s: %s",
+                        punkt,
+                        e,
                     )
                     continue
 
@@ -3676,20 +4108,26 @@ class Funktion(BasisFunktion):
 
         except (TypeError, ValueError, AttributeError) as e:
             # Erwartete Fehler bei ungültigen Funktionseigenschaften
-            logging.warning(
-                f"Erwarteter Fehler bei parametrischer Wendestellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "Erwarteter Fehler bei parametrischer Wendestellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except (sp.SympifyError, Exception) as e:
             # SymPy-spezifische Fehler bei Termverarbeitung
-            logging.warning(
-                f"SymPy-Fehler bei parametrischer Wendestellenberechnung für {self.term()}: {e}"
+            logger.warning(
+                "SymPy-Fehler bei parametrischer Wendestellenberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return []
         except Exception as e:
             # Unerwartete Fehler - sollten weitergegeben werden
-            logging.error(
-                f"Unerwarteter Fehler bei parametrischer Wendepunkteberechnung für {self.term()}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei parametrischer Wendepunkteberechnung für %s: %s",
+                Lazy(self.term),
+                e,
             )
             raise
 
@@ -3709,8 +4147,9 @@ class Funktion(BasisFunktion):
         import sympy as sp
 
         try:
-            logging.debug(
-                f"Starte fortgeschrittene parametrische Wendestellenberechnung für {self.term()}"
+            logger.debug(
+                "Starte fortgeschrittene parametrische Wendestellenberechnung für %s",
+                Lazy(self.term),
             )
 
             # Berechne zweite Ableitung
@@ -3718,49 +4157,50 @@ class Funktion(BasisFunktion):
 
             # Strategie 1: Faktorisierungs-basierter Ansatz
             try:
-                logging.debug("Versuche Faktorisierungs-Strategie für Wendestellen")
+                logger.debug("Versuche Faktorisierungs-Strategie für Wendestellen")
                 ergebnisse = self._wendestellen_mit_faktorisierung(f2)
                 if ergebnisse:
-                    logging.debug(
-                        f"Faktorisierung erfolgreich: {len(ergebnisse)} Wendestellen"
+                    logger.debug(
+                        "Faktorisierung erfolgreich: %s Wendestellen", len(ergebnisse)
                     )
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"Faktorisierung fehlgeschlagen: {e}")
+                logger.debug("Faktorisierung fehlgeschlagen: %s", e)
 
             # Strategie 2: Polynom-spezifische Methoden
             try:
-                logging.debug("Versuche Polynom-Strategie für Wendestellen")
+                logger.debug("Versuche Polynom-Strategie für Wendestellen")
                 ergebnisse = self._wendestellen_mit_polynom(f2)
                 if ergebnisse:
-                    logging.debug(
-                        f"Polynom-Methode erfolgreich: {len(ergebnisse)} Wendestellen"
+                    logger.debug(
+                        "Polynom-Methode erfolgreich: %s Wendestellen", len(ergebnisse)
                     )
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"Polynom-Methode fehlgeschlagen: {e}")
+                logger.debug("Polynom-Methode fehlgeschlagen: %s", e)
 
             # Strategie 3: solveset() als Alternative
             try:
-                logging.debug("Versuche solveset-Alternative für Wendestellen")
+                logger.debug("Versuche solveset-Alternative für Wendestellen")
                 ergebnisse = self._wendestellen_mit_solveset(f2)
                 if ergebnisse:
-                    logging.debug(
-                        f"solveset erfolgreich: {len(ergebnisse)} Wendestellen"
+                    logger.debug(
+                        "solveset erfolgreich: %s Wendestellen", len(ergebnisse)
                     )
                     return ergebnisse
             except Exception as e:
-                logging.debug(f"solveset fehlgeschlagen: {e}")
+                logger.debug("solveset fehlgeschlagen: %s", e)
 
             # Fallback auf ursprüngliche Methode
-            logging.debug(
+            logger.debug(
                 "Verwende ursprüngliche solve()-Methode als Fallback für Wendestellen"
             )
             return self._wendestellen_parametrisch_fallback()
 
         except Exception as e:
-            logging.error(
-                f"Fehler bei fortgeschrittener parametrischer Wendestellenberechnung: {e}"
+            logger.error(
+                "Fehler bei fortgeschrittener parametrischer Wendestellenberechnung: %s",
+                e,
             )
             # Letzter Fallback auf einfache Methode
             return self._wendestellen_parametrisch_fallback()
@@ -3778,24 +4218,24 @@ class Funktion(BasisFunktion):
         import sympy as sp
 
         try:
-            logging.debug(f"Versuche Faktorisierung für {f2.term()}")
+            logger.debug("Versuche Faktorisierung für %s", Lazy(f2.term))
 
             # Versuche 1: Direkte Faktorisierung
             faktorisiert = sp.factor(f2.term_sympy)
             if faktorisiert != f2.term_sympy:
-                logging.debug(
-                    f"Faktorisierung erfolgreich: {f2.term()} -> {faktorisiert}"
+                logger.debug(
+                    "Faktorisierung erfolgreich: %s -> %s", Lazy(f2.term), faktorisiert
                 )
                 raw_lösungen = sp.solve(faktorisiert, f2._variable_symbol)
             else:
-                logging.debug("Keine direkte Faktorisierung möglich")
+                logger.debug("Keine direkte Faktorisierung möglich")
                 raw_lösungen = []
 
             # Versuche 2: Zusammenfassen und nochmal faktorisieren
             if not raw_lösungen:
                 zusammengefasst = sp.together(f2.term_sympy)
                 if zusammengefasst != f2.term_sympy:
-                    logging.debug(f"Zusammenfassung erfolgreich: {zusammengefasst}")
+                    logger.debug("Zusammenfassung erfolgreich: %s", zusammengefasst)
                     faktorisiert_zusammen = sp.factor(zusammengefasst)
                     if faktorisiert_zusammen != zusammengefasst:
                         raw_lösungen = sp.solve(
@@ -3811,8 +4251,8 @@ class Funktion(BasisFunktion):
             return []
 
         except Exception as e:
-            logging.warning(
-                f"Fehler bei Faktorisierungs-Strategie für Wendestellen: {e}"
+            logger.warning(
+                "Fehler bei Faktorisierungs-Strategie für Wendestellen: %s", e
             )
             return []
 
@@ -3829,13 +4269,13 @@ class Funktion(BasisFunktion):
         import sympy as sp
 
         try:
-            logging.debug(f"Versuche Polynom-Methode für {f2.term()}")
+            logger.debug("Versuche Polynom-Methode für %s", Lazy(f2.term))
 
             # Prüfe, ob es sich um ein Polynom handelt
             if not hasattr(
                 f2.term_sympy, "is_polynomial"
             ) or not f2.term_sympy.is_polynomial(f2._variable_symbol):  # type: ignore
-                logging.debug("Kein Polynom - Methode nicht anwendbar")
+                logger.debug("Kein Polynom - Methode nicht anwendbar")
                 return []
 
             # Erstelle Polynom
@@ -3846,20 +4286,20 @@ class Funktion(BasisFunktion):
                 root_dict = sp.roots(poly, f2._variable_symbol)
 
                 if root_dict:
-                    logging.debug(f"roots() erfolgreich mit {len(root_dict)} Lösungen")
+                    logger.debug("roots() erfolgreich mit %s Lösungen", len(root_dict))
                     return self._verarbeite_parametrische_wendestellen(
                         list(root_dict.keys()), "Polynom"
                     )
                 else:
-                    logging.debug("roots() lieferte keine Lösungen")
+                    logger.debug("roots() lieferte keine Lösungen")
                     return []
 
             except Exception as e:
-                logging.debug(f"Polynom-Methode fehlgeschlagen: {e}")
+                logger.debug("Polynom-Methode fehlgeschlagen: %s", e)
                 return []
 
         except Exception as e:
-            logging.warning(f"Fehler bei Polynom-Strategie für Wendestellen: {e}")
+            logger.warning("Fehler bei Polynom-Strategie für Wendestellen: %s", e)
             return []
 
     def _wendestellen_mit_solveset(self, f2: "Funktion") -> list[Wendestelle]:
@@ -3875,7 +4315,7 @@ class Funktion(BasisFunktion):
         import sympy as sp
 
         try:
-            logging.debug(f"Versuche solveset für {f2.term()}")
+            logger.debug("Versuche solveset für %s", Lazy(f2.term))
 
             # Verwende solveset statt solve
             lösungs_menge = sp.solveset(
@@ -3885,7 +4325,7 @@ class Funktion(BasisFunktion):
             # Konvertiere solveset-Ergebnis zu Liste
             if hasattr(lösungs_menge, "is_FiniteSet") and lösungs_menge.is_FiniteSet:
                 raw_lösungen = list(lösungs_menge)
-                logging.debug(f"solveset FiniteSet mit {len(raw_lösungen)} Lösungen")
+                logger.debug("solveset FiniteSet mit %s Lösungen", len(raw_lösungen))
                 return self._verarbeite_parametrische_wendestellen(
                     raw_lösungen, "solveset"
                 )
@@ -3895,18 +4335,18 @@ class Funktion(BasisFunktion):
                 for menge in lösungs_menge.args:
                     if hasattr(menge, "is_FiniteSet") and menge.is_FiniteSet:
                         raw_lösungen.extend(list(menge))
-                logging.debug(f"solveset Union mit {len(raw_lösungen)} Lösungen")
+                logger.debug("solveset Union mit %s Lösungen", len(raw_lösungen))
                 return self._verarbeite_parametrische_wendestellen(
                     raw_lösungen, "solveset"
                 )
             else:
-                logging.debug(
-                    f"solveset gab komplexe Menge zurück: {type(lösungs_menge)}"
+                logger.debug(
+                    "solveset gab komplexe Menge zurück: %s", type(lösungs_menge)
                 )
                 return []
 
         except Exception as e:
-            logging.warning(f"Fehler bei solveset-Strategie für Wendestellen: {e}")
+            logger.warning("Fehler bei solveset-Strategie für Wendestellen: %s", e)
             return []
 
     def _verarbeite_parametrische_wendestellen(
@@ -3923,7 +4363,9 @@ class Funktion(BasisFunktion):
             Liste von Wendestelle-Objekten
         """
         try:
-            logging.debug(f"Verarbeite {len(raw_lösungen)} Rohlösungen von {strategie}")
+            logger.debug(
+                "Verarbeite %s Rohlösungen von %s", len(raw_lösungen), strategie
+            )
 
             # Berechne dritte Ableitung für Wendepunkt-Test
             f3 = self.ableitung(ordnung=3)
@@ -3931,32 +4373,36 @@ class Funktion(BasisFunktion):
             wendestellen = []
             for lösung in raw_lösungen:
                 try:
-                    logging.debug(f"Verarbeite Lösung {lösung} (Typ: {type(lösung)})")
+                    logger.debug("Verarbeite Lösung %s (Typ: %s)", lösung, type(lösung))
 
                     # Angepasste Realitätsprüfung für parametrische Lösungen
                     if hasattr(lösung, "is_real"):
                         if lösung.is_real is False:
-                            logging.debug(
-                                f"Lösung {lösung} ist explizit nicht reell - überspringe"
+                            logger.debug(
+                                "Lösung %s ist explizit nicht reell - überspringe",
+                                lösung,
                             )
                             continue
                         elif lösung.is_real is True:
-                            logging.debug(
-                                f"Lösung {lösung} ist explizit reell - verarbeite weiter"
+                            logger.debug(
+                                "Lösung %s ist explizit reell - verarbeite weiter",
+                                lösung,
                             )
                         else:
                             # is_real ist None (unbekannt) - für parametrische Funktionen annehmen wir reell
-                            logging.debug(
-                                f"Lösung {lösung} hat is_real=None (parametrisch) - nehme reell an"
+                            logger.debug(
+                                "Lösung %s hat is_real=None (parametrisch) - nehme reell an",
+                                lösung,
                             )
                     else:
                         # Für SymPy-Objekte ohne is_real Eigenschaft
                         if hasattr(lösung, "is_complex") and lösung.is_complex:
-                            logging.debug(f"Lösung {lösung} ist komplex - überspringe")
+                            logger.debug("Lösung %s ist komplex - überspringe", lösung)
                             continue
                         else:
-                            logging.debug(
-                                f"Lösung {lösung} hat keine is_real Eigenschaft - nehme reell an"
+                            logger.debug(
+                                "Lösung %s hat keine is_real Eigenschaft - nehme reell an",
+                                lösung,
                             )
 
                     # Prüfe, ob es sich wirklich um einen Wendepunkt handelt
@@ -3986,12 +4432,12 @@ class Funktion(BasisFunktion):
                                 Wendestelle(x=lösung, typ=typ, exakt=True)
                             )
                         else:
-                            logging.debug(
-                                f"Lösung {lösung} ist kein Wendepunkt (f'''(x) = 0)"
+                            logger.debug(
+                                "Lösung %s ist kein Wendepunkt (f'''(x) = 0)", lösung
                             )
 
                     except Exception as e:
-                        logging.debug(f"Fehler bei Wendepunkt-Test für {lösung}: {e}")
+                        logger.debug("Fehler bei Wendepunkt-Test für %s: %s", lösung, e)
                         # Bei Fehler als Wendepunkt annehmen
                         wendestellen.append(
                             Wendestelle(
@@ -4002,14 +4448,18 @@ class Funktion(BasisFunktion):
                         )
 
                 except Exception as e:
-                    logging.warning(f"Fehler bei Verarbeitung von Lösung {lösung}: {e}")
+                    logger.warning(
+                        "Fehler bei Verarbeitung von Lösung %s: %s", lösung, e
+                    )
                     continue
 
-            logging.debug(f"{strategie} erzeugte {len(wendestellen)} Wendestellen")
+            logger.debug("%s erzeugte %s Wendestellen", strategie, len(wendestellen))
             return wendestellen
 
         except Exception as e:
-            logging.error(f"Fehler bei Wendestellen-Aufbereitung für {strategie}: {e}")
+            logger.error(
+                "Fehler bei Wendestellen-Aufbereitung für %s: %s", strategie, e
+            )
             return []
 
     def wendepunkte_optimiert(self) -> list[Wendepunkt]:
@@ -4052,38 +4502,44 @@ class Funktion(BasisFunktion):
             WendepunktTyp: WENDELPUNKT oder SATTELPUNKT
         """
         try:
-            logging.debug(
-                f"Bestimme Wendepunkttyp für x={x_wert} bei Funktion {self.term()}"
+            logger.debug(
+                "Bestimme Wendepunkttyp für x=%s bei Funktion %s",
+                x_wert,
+                Lazy(self.term),
             )
             dritte_ableitung_wert = f3.wert(x_wert)
 
             # Für numerische Werte
             if isinstance(dritte_ableitung_wert, (int, float)):
                 if dritte_ableitung_wert > 0:
-                    logging.debug(
-                        f"Dritte Ableitung = {dritte_ableitung_wert} > 0 → Links-Rechts-Wendepunkt"
+                    logger.debug(
+                        "Dritte Ableitung = %s > 0 → Links-Rechts-Wendepunkt",
+                        dritte_ableitung_wert,
                     )
                     return WendepunktTyp.WENDEPUNKT
                 elif dritte_ableitung_wert < 0:
-                    logging.debug(
-                        f"Dritte Ableitung = {dritte_ableitung_wert} < 0 → Rechts-Links-Wendepunkt"
+                    logger.debug(
+                        "Dritte Ableitung = %s < 0 → Rechts-Links-Wendepunkt",
+                        dritte_ableitung_wert,
                     )
                     return WendepunktTyp.WENDEPUNKT
                 else:
                     # Dritte Ableitung = 0 → höhere Ableitungen prüfen
-                    logging.debug(f"Dritte Ableitung = 0 → prüfe höhere Ableitungen")
+                    logger.debug("Dritte Ableitung = 0 → prüfe höhere Ableitungen")
                     return self._bestimme_wendepunkttyp_hoere_ableitungen(x_wert)
             else:
                 # Symbolische Ausdrücke: Vereinfachen und analysieren
                 vereinfacht = sp.simplify(dritte_ableitung_wert)
                 if hasattr(vereinfacht, "is_positive") and vereinfacht.is_positive:
-                    logging.debug(
-                        f"Symbolische dritte Ableitung {vereinfacht} > 0 → Links-Rechts-Wendepunkt"
+                    logger.debug(
+                        "Symbolische dritte Ableitung %s > 0 → Links-Rechts-Wendepunkt",
+                        vereinfacht,
                     )
                     return WendepunktTyp.WENDEPUNKT
                 elif hasattr(vereinfacht, "is_negative") and vereinfacht.is_negative:
-                    logging.debug(
-                        f"Symbolische dritte Ableitung {vereinfacht} < 0 → Rechts-Links-Wendepunkt"
+                    logger.debug(
+                        "Symbolische dritte Ableitung %s < 0 → Rechts-Links-Wendepunkt",
+                        vereinfacht,
                     )
                     return WendepunktTyp.WENDEPUNKT
                 else:
@@ -4091,11 +4547,15 @@ class Funktion(BasisFunktion):
                     return WendepunktTyp.WENDEPUNKT
 
         except (TypeError, ValueError, AttributeError) as e:
-            logging.warning(f"Fehler bei Wendepunkttyp-Bestimmung für x={x_wert}: {e}")
+            logger.warning(
+                "Fehler bei Wendepunkttyp-Bestimmung für x=%s: %s", x_wert, e
+            )
             return WendepunktTyp.WENDEPUNKT
         except Exception as e:
-            logging.error(
-                f"Unerwarteter Fehler bei Wendepunkttyp-Bestimmung für x={x_wert}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei Wendepunkttyp-Bestimmung für x=%s: %s",
+                x_wert,
+                e,
             )
             raise
 
@@ -4126,13 +4586,17 @@ class Funktion(BasisFunktion):
             return WendepunktTyp.WENDEPUNKT
 
         except (TypeError, ValueError, AttributeError) as e:
-            logging.warning(
-                f"Fehler bei Wendepunkttyp-Bestimmung höherer Ableitungen für x={x_wert}: {e}"
+            logger.warning(
+                "Fehler bei Wendepunkttyp-Bestimmung höherer Ableitungen für x=%s: %s",
+                x_wert,
+                e,
             )
             return WendepunktTyp.WENDEPUNKT
         except Exception as e:
-            logging.error(
-                f"Unerwarteter Fehler bei Wendepunkttyp-Bestimmung höherer Ableitungen für x={x_wert}: {e}"
+            logger.error(
+                "Unerwarteter Fehler bei Wendepunkttyp-Bestimmung höherer Ableitungen für x=%s: %s",
+                x_wert,
+                e,
             )
             raise
 
@@ -4496,9 +4960,15 @@ class Funktion(BasisFunktion):
         return f"${self.term_latex()}$"
 
     def __eq__(self, other):
+        """
+        Strukturelle Gleichheit der Normalform - schnell und ohne simplify.
+        Für mathematische Äquivalenz siehe `ist_aequivalent`.
+        """
+        if self is other:
+            return True
         if not isinstance(other, Funktion):
             return False
-        return self.term_sympy.equals(other.term_sympy)
+        return self._kanonischer_schluessel() == other._kanonischer_schluessel()
 
     def definitionsbereich(self) -> str:
         """Gibt den Definitionsbereich der Funktion zurück."""
@@ -4570,6 +5040,9 @@ class Funktion(BasisFunktion):
         Returns:
             Selbst (die Funktion mit ausmultipliziertem Term)
 
+        Raises:
+            UngueltigeFunktionError: Bei internierten oder bereits gehashten Funktionen
+
         Examples:
             >>> f = Funktion("(x+1)(x-2)")
             >>> print(f.term())  # (x + 1)*(x - 2)
@@ -4590,21 +5063,19 @@ class Funktion(BasisFunktion):
         # Wende SymPy's expand-Funktion auf den aktuellen Term an
         expandierter_term = sp.expand(self.term_sympy)
 
-        # Aktualisiere den internen SymPy-Ausdruck
-        self.term_sympy = expandierter_term
-
-        # Setze den Term-String zurück, damit er neu generiert wird
-        if hasattr(self, "_term"):
-            self._term = None
-
-        # Setze auch den gecachten LaTeX-Ausdruck zurück
-        if hasattr(self, "_latex_expr"):
-            self._latex_expr = None
+        # Aktualisiere den internen SymPy-Ausdruck (verwirft alle Caches)
+        if expandierter_term != self.term_sympy:
+            self.term_sympy = expandierter_term
 
         return self
 
     # =============================================================================
     # ARITHMETISCHE OPERATIONEN - SymPy-basierte Funktionsoperationen
+    #
+    # Alle Operatoren liefern einen verzögerten FunktionsAusdruck, keine
+    # typisierte Funktion: type(f + g) ist FunktionsAusdruck. Wer nach dem
+    # Typ verzweigt (type(h) is ..., isinstance(h, GanzrationaleFunktion)),
+    # ruft vorher h.materialisiere() auf.
     # =============================================================================
 
     def __add__(self, other):
@@ -4615,26 +5086,35 @@ class Funktion(BasisFunktion):
             other: Andere Funktion, Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Addition
+            FunktionsAusdruck mit dem Ergebnis der Addition
+
+        Note:
+            Das Ergebnis ist ein FunktionsAusdruck (gilt als `Funktion`, wird
+            aber erst bei Analyse oder Darstellung typisiert). `type(h)` und
+            Prüfungen auf Unterklassen sehen den Knoten, nicht die erkannte
+            Funktionsklasse; dafür `h.materialisiere()` verwenden. Dasselbe
+            gilt für alle anderen Rechenoperatoren.
 
         Examples:
             >>> f = Funktion("x^2")
             >>> g = Funktion("3x + 4")
             >>> h = f + g  # x^2 + 3x + 4
+            >>> type(h.materialisiere()).__name__
+            'QuadratischeFunktion'
         """
         try:
             if isinstance(other, Funktion):
                 # Funktion + Funktion
                 result_expr = self.term_sympy + other.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif isinstance(other, (int, float)):
                 # Funktion + Zahl
                 result_expr = self.term_sympy + other
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(other, "_sympy_") or isinstance(other, sp.Basic):
                 # Funktion + SymPy-Ausdruck
                 result_expr = self.term_sympy + other
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
@@ -4648,7 +5128,7 @@ class Funktion(BasisFunktion):
             other: Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Addition
+            FunktionsAusdruck mit dem Ergebnis der Addition
 
         Examples:
             >>> f = Funktion("x^2")
@@ -4658,11 +5138,11 @@ class Funktion(BasisFunktion):
             if isinstance(other, (int, float)):
                 # Zahl + Funktion
                 result_expr = other + self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(other, "_sympy_") or isinstance(other, sp.Basic):
                 # SymPy-Ausdruck + Funktion
                 result_expr = other + self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
@@ -4676,7 +5156,7 @@ class Funktion(BasisFunktion):
             other: Andere Funktion, Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Subtraktion
+            FunktionsAusdruck mit dem Ergebnis der Subtraktion
 
         Examples:
             >>> f = Funktion("x^2")
@@ -4687,15 +5167,15 @@ class Funktion(BasisFunktion):
             if isinstance(other, Funktion):
                 # Funktion - Funktion
                 result_expr = self.term_sympy - other.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif isinstance(other, (int, float)):
                 # Funktion - Zahl
                 result_expr = self.term_sympy - other
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(other, "_sympy_") or isinstance(other, sp.Basic):
                 # Funktion - SymPy-Ausdruck
                 result_expr = self.term_sympy - other
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
@@ -4709,7 +5189,7 @@ class Funktion(BasisFunktion):
             other: Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Subtraktion
+            FunktionsAusdruck mit dem Ergebnis der Subtraktion
 
         Examples:
             >>> f = Funktion("x^2")
@@ -4719,11 +5199,11 @@ class Funktion(BasisFunktion):
             if isinstance(other, (int, float)):
                 # Zahl - Funktion
                 result_expr = other - self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(other, "_sympy_") or isinstance(other, sp.Basic):
                 # SymPy-Ausdruck - Funktion
                 result_expr = other - self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
@@ -4737,7 +5217,7 @@ class Funktion(BasisFunktion):
             other: Andere Funktion, Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Multiplikation
+            FunktionsAusdruck mit dem Ergebnis der Multiplikation
 
         Examples:
             >>> f = Funktion("x^2")
@@ -4752,15 +5232,15 @@ class Funktion(BasisFunktion):
                 from sympy import expand
 
                 result_expr = expand(result_expr)
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif isinstance(other, (int, float)):
                 # Funktion * Zahl
                 result_expr = self.term_sympy * other
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(other, "_sympy_") or isinstance(other, sp.Basic):
                 # Funktion * SymPy-Ausdruck
                 result_expr = self.term_sympy * other
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
@@ -4774,7 +5254,7 @@ class Funktion(BasisFunktion):
             other: Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Multiplikation
+            FunktionsAusdruck mit dem Ergebnis der Multiplikation
 
         Examples:
             >>> f = Funktion("x^2")
@@ -4784,11 +5264,11 @@ class Funktion(BasisFunktion):
             if isinstance(other, (int, float)):
                 # Zahl * Funktion
                 result_expr = other * self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(other, "_sympy_") or isinstance(other, sp.Basic):
                 # SymPy-Ausdruck * Funktion
                 result_expr = other * self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
@@ -4802,7 +5282,7 @@ class Funktion(BasisFunktion):
             other: Andere Funktion, Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Division
+            FunktionsAusdruck mit dem Ergebnis der Division
 
         Examples:
             >>> f = Funktion("x^2")
@@ -4817,17 +5297,17 @@ class Funktion(BasisFunktion):
                 from sympy import cancel
 
                 result_expr = cancel(result_expr)
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif isinstance(other, (int, float)):
                 if other == 0:
                     raise ZeroDivisionError("Division durch Null")
                 # Funktion / Zahl
                 result_expr = self.term_sympy / other
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(other, "_sympy_") or isinstance(other, sp.Basic):
                 # Funktion / SymPy-Ausdruck
                 result_expr = self.term_sympy / other
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except ZeroDivisionError:
@@ -4843,7 +5323,7 @@ class Funktion(BasisFunktion):
             other: Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Division
+            FunktionsAusdruck mit dem Ergebnis der Division
 
         Examples:
             >>> f = Funktion("x^2")
@@ -4855,13 +5335,13 @@ class Funktion(BasisFunktion):
                 if self.term_sympy.is_zero:
                     raise ZeroDivisionError("Division durch Null")
                 result_expr = other / self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(other, "_sympy_") or isinstance(other, sp.Basic):
                 # SymPy-Ausdruck / Funktion
                 if self.term_sympy.is_zero:
                     raise ZeroDivisionError("Division durch Null")
                 result_expr = other / self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except ZeroDivisionError:
@@ -4877,7 +5357,7 @@ class Funktion(BasisFunktion):
             exponent: Zahl (int, float)
 
         Returns:
-            Neue Funktion mit Ergebnis der Potenzierung
+            FunktionsAusdruck mit dem Ergebnis der Potenzierung
 
         Examples:
             >>> f = Funktion("sin(x)")
@@ -4891,11 +5371,11 @@ class Funktion(BasisFunktion):
                 from sympy import expand
 
                 result_expr = expand(result_expr)
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(exponent, "_sympy_") or isinstance(exponent, sp.Basic):
                 # Funktion ** SymPy-Ausdruck
                 result_expr = self.term_sympy**exponent
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
@@ -4909,7 +5389,7 @@ class Funktion(BasisFunktion):
             base: Zahl oder SymPy-Ausdruck
 
         Returns:
-            Neue Funktion mit Ergebnis der Potenzierung
+            FunktionsAusdruck mit dem Ergebnis der Potenzierung
 
         Examples:
             >>> f = Funktion("x")
@@ -4919,11 +5399,11 @@ class Funktion(BasisFunktion):
             if isinstance(base, (int, float)):
                 # Zahl ** Funktion
                 result_expr = base**self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             elif hasattr(base, "_sympy_") or isinstance(base, sp.Basic):
                 # SymPy-Ausdruck ** Funktion
                 result_expr = base**self.term_sympy
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
@@ -4934,7 +5414,7 @@ class Funktion(BasisFunktion):
         Unäre Negation: -f
 
         Returns:
-            Neue Funktion mit negiertem Term
+            FunktionsAusdruck mit negiertem Term
 
         Examples:
             >>> f = Funktion("x^2 + 1")
@@ -4942,7 +5422,7 @@ class Funktion(BasisFunktion):
         """
         try:
             result_expr = -self.term_sympy
-            return Funktion(result_expr)
+            return FunktionsAusdruck(result_expr, self._variable_symbol)
         except Exception as e:
             raise ValueError(f"Fehler bei unärer Negation: {e}")
 
@@ -4951,7 +5431,7 @@ class Funktion(BasisFunktion):
         Unäres Plus: +f
 
         Returns:
-            Neue Funktion mit positivem Term (identisch mit Original)
+            FunktionsAusdruck mit positivem Term (identisch mit Original)
 
         Examples:
             >>> f = Funktion("x^2 + 1")
@@ -4959,7 +5439,7 @@ class Funktion(BasisFunktion):
         """
         try:
             result_expr = +self.term_sympy
-            return Funktion(result_expr)
+            return FunktionsAusdruck(result_expr, self._variable_symbol)
         except Exception as e:
             raise ValueError(f"Fehler bei unärem Plus: {e}")
 
@@ -4971,7 +5451,7 @@ class Funktion(BasisFunktion):
             other: Andere Funktion
 
         Returns:
-            Neue Funktion mit Ergebnis der Komposition
+            FunktionsAusdruck mit dem Ergebnis der Komposition
 
         Examples:
             >>> f = Funktion("x^2")
@@ -4984,13 +5464,126 @@ class Funktion(BasisFunktion):
                 result_expr = self.term_sympy.subs(
                     self._variable_symbol, other.term_sympy
                 )
-                return Funktion(result_expr)
+                return FunktionsAusdruck(result_expr, self._variable_symbol)
             else:
                 return NotImplemented
         except Exception as e:
             raise ValueError(f"Fehler bei Funktionskomposition: {e}")
 
 
+class FunktionsAusdruck:
+    """
+    Verzögertes Ergebnis von Rechenoperationen mit Funktionen (f + 2*g - h/3).
+
+    Hält nur den kombinierten SymPy-Term; weitere Rechenoperationen erzeugen
+    neue Knoten, Funktionswerte werden direkt aus dem Term berechnet. Erst
+    bei Analyse oder Darstellung entsteht einmal die typisierte Funktion
+    (Typerkennung, Strukturanalyse), an die dann alles delegiert wird.
+    Gilt als `Funktion` (isinstance), ist aber keine Instanz der erkannten
+    Klasse: `type(h)` ist FunktionsAusdruck, und `isinstance(h,
+    GanzrationaleFunktion)` ist False. Code, der nach dem Typ verzweigt,
+    ruft vorher `materialisiere()` auf.
+
+    Examples:
+        >>> h = Funktion("x^2") + 2 * Funktion("sin(x)")  # noch keine Analyse
+        >>> h.wert(0)                                    # direkt aus dem Term
+        0
+        >>> h.ableitung()                                # typisiert, einmalig
+    """
+
+    __slots__ = ("_term_sympy", "_variable_symbol", "_ziel")
+
+    def __init__(self, term: sp.Expr, variable: sp.Symbol):
+        self._term_sympy = term
+        self._variable_symbol = variable
+        self._ziel: Funktion | None = None
+
+    @property
+    def term_sympy(self) -> sp.Expr:
+        ziel = self._ziel
+        return self._term_sympy if ziel is None else ziel.term_sympy
+
+    @term_sympy.setter
+    def term_sympy(self, term: sp.Expr) -> None:
+        self.materialisiere().term_sympy = term
+
+    def materialisiere(self) -> Funktion:
+        """Die typisierte Funktion zum Term (wird nur einmal erzeugt)"""
+        ziel = self._ziel
+        if ziel is None:
+            ziel = Funktion(self._term_sympy)
+            if self._ziel is None:
+                self._ziel = ziel
+            ziel = self._ziel
+        return ziel
+
+    def wert(self, x_wert):
+        """Funktionswert direkt aus dem Term, ohne Typerkennung"""
+        if self._ziel is not None or self._term_sympy.free_symbols - {
+            self._variable_symbol
+        }:
+            # Parameter vereinfacht die typisierte Funktion
+            return self.materialisiere().wert(x_wert)
+        ergebnis = self._term_sympy.subs(self._variable_symbol, x_wert)
+        with Messung("simplify"):
+            return ergebnis.simplify()
+
+    def __call__(self, x_wert, **kwargs):
+        if kwargs:
+            return self.materialisiere()(x_wert, **kwargs)
+        return self.wert(x_wert)
+
+    # Rechenoperationen bauen weitere Knoten (self.term_sympy genügt)
+    __add__ = Funktion.__add__
+    __radd__ = Funktion.__radd__
+    __sub__ = Funktion.__sub__
+    __rsub__ = Funktion.__rsub__
+    __mul__ = Funktion.__mul__
+    __rmul__ = Funktion.__rmul__
+    __truediv__ = Funktion.__truediv__
+    __rtruediv__ = Funktion.__rtruediv__
+    __pow__ = Funktion.__pow__
+    __rpow__ = Funktion.__rpow__
+    __neg__ = Funktion.__neg__
+    __pos__ = Funktion.__pos__
+    __matmul__ = Funktion.__matmul__
+
+    # Alles Weitere (Analyse, Darstellung) an die typisierte Funktion
+    def __getattr__(self, name: str):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.materialisiere(), name)
+
+    @property
+    def __dict__(self) -> dict:
+        return vars(self.materialisiere())
+
+    def __setattr__(self, name: str, wert) -> None:
+        if name in FunktionsAusdruck.__slots__:
+            object.__setattr__(self, name, wert)
+        else:
+            setattr(self.materialisiere(), name, wert)
+
+    def __str__(self) -> str:
+        return str(self.materialisiere())
+
+    def __repr__(self) -> str:
+        return f"FunktionsAusdruck({self.materialisiere()!r})"
+
+    def __eq__(self, other) -> bool:
+        return self.materialisiere() == other
+
+    def __hash__(self) -> int:
+        return hash(self.materialisiere())
+
+    def __reduce__(self):
+        return Funktion, (self.term_sympy,)
+
+
+# Knoten gelten als Funktion, ohne deren Slots und Konstruktor zu erben
+Funktion.register(FunktionsAusdruck)
+
+
 # Factory-Funktion für Konsistenz und Abwärtskompatibilität
 
 
@@ -4,9 +4,25 @@ Ganzrationale Funktionen (Polynome) für das Schul-Analysis Framework.
 Pädagogischer Wrapper mit spezialisierten Methoden für lineare und quadratische Funktionen.
 """
 
+import math
+from numbers import Rational, Real
+
 import sympy as sp
 
 from .funktion import Funktion
+from .polynom import DichtesPolynom
+from .sympy_types import ExactNullstellenListe, Nullstelle
+
+
+def _ist_reelle_zahl(wert) -> bool:
+    """Zahlen, die das Horner-Schema exakt auswerten kann (auch NumPy-Skalare)"""
+    if isinstance(wert, bool):
+        return False
+    if isinstance(wert, (Rational, sp.Rational)):
+        return True
+    if isinstance(wert, (Real, sp.Float)):
+        return math.isfinite(float(wert))
+    return False
 
 
 class GanzrationaleFunktion(Funktion):
@@ -18,10 +34,12 @@ class GanzrationaleFunktion(Funktion):
 
     Examples:
         >>> f = GanzrationaleFunktion("x^2 - 4x + 3")
-        >>> g = GanzrationaleFunktion([1, -4, 3])  # x² - 4x + 3
+        >>> g = GanzrationaleFunktion([3, -4, 1])  # x² - 4x + 3 (a_0 zuerst)
         >>> h = GanzrationaleFunktion({2: 1, 1: -4, 0: 3})  # x² - 4x + 3
     """
 
+    __slots__ = ("koeffizienten", "_polynom")
+
     def __init__(
         self,
         eingabe: str | list[float] | dict[int, float] | sp.Basic,
@@ -32,7 +50,7 @@ class GanzrationaleFunktion(Funktion):
         Konstruktor für ganzrationale Funktionen.
 
         Args:
-            eingabe: String ("x^3-2x+1"), Liste ([1, 0, -2, 1]), Dictionary ({3: 1, 1: -2, 0: 1}) oder SymPy-Ausdruck
+            eingabe: String ("x^3-2x+1"), Liste a_0, ..., a_n ([1, -2, 0, 1]), Dictionary ({3: 1, 1: -2, 0: 1}) oder SymPy-Ausdruck
             variable: Optional expliziter Variablenname (überschreibt automatische Erkennung)
             parameter: Optionale Liste von Parameternamen (überschreibt automatische Erkennung)
         """
@@ -41,10 +59,9 @@ class GanzrationaleFunktion(Funktion):
         # Speichere Original-Eingabe für deutsche Fehlermeldungen
         self.original_eingabe = str(eingabe)
 
-        # Konvertiere verschiedene Eingabeformate zu String für die Basisklasse
+        # Koeffizienten werden direkt zum Ausdruck, ohne Umweg über den Parser
         if isinstance(eingabe, (list, dict)):
-            eingabe_str = self._konvertiere_eingabe_zu_string(eingabe)
-            super().__init__(eingabe_str)
+            super().__init__(self._koeffizienten_zu_ausdruck(eingabe, variable))
         else:
             super().__init__(eingabe)
 
@@ -59,70 +76,148 @@ class GanzrationaleFunktion(Funktion):
         # 🔥 SPEZIFISCHE ATTRIBUTE für ganzrationale Funktionen 🔥
         self.koeffizienten = self._extrahiere_koeffizienten()
 
-    def _konvertiere_eingabe_zu_string(self, eingabe: list | dict) -> str:
-        """Konvertiert Listen- oder Dictionary-Eingabe zu String"""
-        if isinstance(eingabe, list):
-            return self._liste_zu_string(eingabe)
-        elif isinstance(eingabe, dict):
-            return self._dict_zu_string(eingabe)
+    @staticmethod
+    def _koeffizienten_zu_ausdruck(
+        koeffizienten: list | dict, variable: str | None
+    ) -> sp.Expr:
+        """Baut a_0 + a_1·x + ... direkt aus Liste oder Dictionary (ohne Parser)"""
+        if isinstance(koeffizienten, dict):
+            grade = koeffizienten
+        elif isinstance(koeffizienten, list):
+            grade = dict(enumerate(koeffizienten))
         else:
             raise TypeError("Eingabe muss Liste oder Dictionary sein")
-
-    def _liste_zu_string(self, koeffizienten: list[float]) -> str:
-        """Konvertiert Koeffizienten-Liste zu String-Repräsentation"""
-        terme = []
-        for i, koeff in enumerate(reversed(koeffizienten)):
-            if koeff == 0:
-                continue
-            grad = len(koeffizienten) - 1 - i
-            if grad == 0:
-                terme.append(str(koeff))
-            elif grad == 1:
-                if koeff == 1:
-                    terme.append("x")
-                elif koeff == -1:
-                    terme.append("-x")
-                else:
-                    terme.append(f"{koeff}x")
-            else:
-                if koeff == 1:
-                    terme.append(f"x^{grad}")
-                elif koeff == -1:
-                    terme.append(f"-x^{grad}")
-                else:
-                    terme.append(f"{koeff}x^{grad}")
-
-        if not terme:
-            return "0"
-
-        # Ersten Term ohne Vorzeichen, Rest mit Vorzeichen
-        ergebnis = terme[0]
-        for term in terme[1:]:
-            if term.startswith("-"):
-                ergebnis += f" - {term[1:]}"
-            else:
-                ergebnis += f" + {term}"
-
-        return ergebnis
-
-    def _dict_zu_string(self, koeffizienten: dict[int, float]) -> str:
-        """Konvertiert Koeffizienten-Dictionary zu String-Repräsentation"""
-        # Konvertiere zu Liste und verwende vorhandene Methode
-        max_grad = max(koeffizienten.keys()) if koeffizienten else 0
-        liste = [0.0] * (max_grad + 1)
-        for grad, koeff in koeffizienten.items():
-            liste[grad] = koeff
-        return self._liste_zu_string(liste)
+        x = sp.Symbol(variable or "x")
+        return sp.Add(*(sp.sympify(k) * x**grad for grad, k in grade.items() if k != 0))
 
     def _extrahiere_koeffizienten(self) -> list[sp.Basic]:
         """Extrahiert Koeffizienten aus SymPy-Ausdruck"""
         try:
             poly = sp.Poly(self.term_sympy, self._variable_symbol)
-            coeffs = poly.all_coeffs()
-            coeffs.reverse()
-            return coeffs
         except Exception:
             return []
+        coeffs = poly.all_coeffs()
+        coeffs.reverse()
+        return coeffs
+
+    @property
+    def polynom(self) -> DichtesPolynom | None:
+        """
+        Dichte, exakte Koeffizientendarstellung.
+
+        None, wenn der Term Parameter oder Gleitkomma-Koeffizienten enthält;
+        dann rechnen alle Methoden wie bei `Funktion` mit SymPy. Wird erst
+        beim ersten Zugriff aus den Koeffizienten aufgebaut.
+        """
+        gespeichert = getattr(self, "_polynom", None)
+        if gespeichert is None or gespeichert[0] is not self.term_sympy:
+            koeffizienten = self.koeffizienten
+            polynom = (
+                DichtesPolynom(koeffizienten)
+                if koeffizienten and all(k.is_Rational for k in koeffizienten)
+                else None
+            )
+            gespeichert = self._polynom = (self.term_sympy, polynom)
+        return gespeichert[1]
+
+    def _berechne_wert(self, x_wert):
+        # Zahlen exakt über das Horner-Schema, alles andere wie bei Funktion
+        polynom = self.polynom
+        if polynom is None or not _ist_reelle_zahl(x_wert):
+            return super()._berechne_wert(x_wert)
+        ergebnis = polynom.wert(x_wert)
+        ergebnis = sp.Rational(ergebnis.numerator, ergebnis.denominator)
+        if isinstance(x_wert, (Rational, sp.Rational)):
+            return ergebnis
+        return sp.Float(ergebnis)
+
+    def auswerten(self, x_werte):
+        """
+        Funktionswerte für ein ganzes Array (Gleitkomma, z.B. zum Zeichnen).
+
+        Examples:
+            >>> GanzrationaleFunktion("x^2 - 4").auswerten(np.linspace(-3, 3, 200))
+        """
+        import numpy as np
+
+        polynom = self.polynom
+        if polynom is not None:
+            return polynom.auswerten(x_werte)
+        x = np.asarray(x_werte, dtype=float)
+        return np.vectorize(lambda t: float(self.wert(float(t))))(x)
+
+    def _abgeleiteter_term(self, ordnung: int) -> sp.Expr:
+        polynom = self.polynom
+        if polynom is None:
+            return super()._abgeleiteter_term(ordnung)
+        return polynom.ableitung(ordnung).als_ausdruck(self._variable_symbol)
+
+    def _stammfunktion_term(self) -> sp.Expr:
+        polynom = self.polynom
+        if polynom is None:
+            return super()._stammfunktion_term()
+        return polynom.stammfunktion().als_ausdruck(self._variable_symbol)
+
+    def _nullstellen_ganzrational(self) -> ExactNullstellenListe:
+        """
+        Nullstellen über quadratfreie Zerlegung und Isolationsintervalle.
+
+        Die Intervalle hängen am gespeicherten Polynom; `nullstellen_naeherung`
+        verfeinert sie später weiter.
+        """
+        polynom = self.polynom
+        if polynom is None:
+            return super()._nullstellen_ganzrational()
+        return self._nullstellen_aus_polynom(polynom)
+
+    def nullstellen_naeherung(self, stellen: int = 15) -> ExactNullstellenListe:
+        """
+        Reelle Nullstellen als Dezimalzahlen auf `stellen` Nachkommastellen.
+
+        Verfeinert die Isolationsintervalle, statt numerisch neu zu lösen;
+        rationale Nullstellen bleiben exakt.
+
+        Beispiele:
+            >>> f = GanzrationaleFunktion("x^2 - 2")
+            >>> [n.x for n in f.nullstellen_naeherung(5)]
+            [1.41421, -1.41421]
+        """
+        polynom = self.polynom
+        if polynom is None:
+            raise ValueError(
+                "Näherung nur für Polynome mit rationalen Koeffizienten möglich"
+            )
+        lösungen = []
+        for nullstelle, vielfachheit in reversed(
+            polynom.nullstellen_mit_vielfachheit()
+        ):
+            rational = nullstelle.rational()
+            if rational is not None:
+                x_wert = sp.Rational(rational.numerator, rational.denominator)
+            else:
+                naeherung = nullstelle.naeherung(stellen + 1)
+                x_wert = sp.Float(
+                    sp.Rational(naeherung.numerator, naeherung.denominator),
+                    stellen + len(str(abs(int(naeherung)))),
+                )
+            lösungen.append(
+                Nullstelle(
+                    x=x_wert, multiplicitaet=vielfachheit, exakt=rational is not None
+                )
+            )
+        return lösungen
+
+    def _stelle_zustand_wieder_her(self, daten: dict) -> None:
+        super()._stelle_zustand_wieder_her(daten)
+        self.koeffizienten = self._extrahiere_koeffizienten()
+
+    def _term_geaendert(self) -> None:
+        super()._term_geaendert()
+        self.koeffizienten = self._extrahiere_koeffizienten()
+
+    def _kanonischer_ausdruck(self) -> sp.Basic:
+        # Ausmultipliziert: (x+1)^2 und x^2 + 2x + 1 sind strukturell gleich
+        return sp.expand(self.term_sympy)
 
     def __str__(self):
         return self.term()
@@ -0,0 +1,421 @@
+"""
+Exakte Gauß-Elimination für lineare Gleichungssysteme.
+
+Dieses Modul implementiert die bruchfreie Gauß-Elimination nach Bareiss.
+Alle Rechnungen laufen auf ganzen Zahlen (Python-``int``), sodass weder
+Rundungsfehler noch SymPy-Ausdrucksaufwand entstehen. Rang, Widersprüche
+und Determinante fallen direkt bei der Elimination mit ab, die einzelnen
+Umformungen werden für den Lösungsweg protokolliert.
+
+Für viele rechte Seiten mit gleicher Koeffizientenmatrix gibt es zusätzlich
+eine gecachte LU-Zerlegung (exakt und als NumPy-Variante).
+"""
+
+from dataclasses import dataclass, field
+from fractions import Fraction
+from functools import lru_cache
+from math import lcm
+
+import numpy as np
+
+from .instrumentierung import registriere_cache
+
+Zahl = int | Fraction
+
+
+@dataclass(frozen=True)
+class GaussSchritt:
+    """Eine protokollierte Zeilenumformung der erweiterten Matrix"""
+
+    beschreibung: str
+    matrix: tuple[tuple[int, ...], ...]
+
+
+@dataclass(frozen=True)
+class GaussErgebnis:
+    """Ergebnis einer Bareiss-Elimination von A·x = b"""
+
+    anzahl_unbekannte: int
+    rang: int  # Rang der Koeffizientenmatrix A
+    rang_erweitert: int  # Rang der erweiterten Matrix (A|b)
+    pivot_spalten: tuple[int, ...]
+    loesung: tuple[Fraction, ...] | None  # Nur bei eindeutiger Lösung
+    determinante: Fraction | None  # Nur bei quadratischem A
+    widerspruch_zeile: int | None = None  # Ursprüngliche Gleichung mit 0 = c
+    schritte: tuple[GaussSchritt, ...] = field(default=(), repr=False)
+    stufenform: tuple[tuple[int, ...], ...] = field(default=(), repr=False)
+
+    @property
+    def ist_loesbar(self) -> bool:
+        """Gibt an, ob das System mindestens eine Lösung besitzt"""
+        return self.rang == self.rang_erweitert
+
+    @property
+    def ist_eindeutig(self) -> bool:
+        """Gibt an, ob das System genau eine Lösung besitzt"""
+        return self.loesung is not None
+
+    @property
+    def freie_spalten(self) -> tuple[int, ...]:
+        """Spalten ohne Pivotelement, also frei wählbare Unbekannte"""
+        return tuple(
+            j for j in range(self.anzahl_unbekannte) if j not in self.pivot_spalten
+        )
+
+    def allgemeine_loesung(
+        self,
+    ) -> tuple[tuple[Fraction, ...], list[tuple[Fraction, ...]]] | None:
+        """
+        Allgemeine Lösung x = x_p + t_1·v_1 + ... + t_k·v_k.
+
+        Die Basisvektoren v_j gehören in der Reihenfolge zu ``freie_spalten``.
+
+        Returns:
+            (Partikulärlösung, Basis des Lösungsraums von A·x = 0) oder
+            None, wenn das System keine Lösung hat
+        """
+        if not self.ist_loesbar:
+            return None
+
+        n = self.anzahl_unbekannte
+        b = [zeile[n] for zeile in self.stufenform]
+        partikulaer = _rueckwaerts(self.stufenform, self.pivot_spalten, n, b, {})
+        basis = [
+            _rueckwaerts(self.stufenform, self.pivot_spalten, n, [0] * len(b), {j: 1})
+            for j in self.freie_spalten
+        ]
+        return partikulaer, basis
+
+
+def _rueckwaerts(
+    stufenform, pivot_spalten, n: int, rechte_seite: list[int], frei: dict[int, int]
+) -> tuple[Fraction, ...]:
+    """Rückwärtseinsetzen in der Stufenform mit vorgegebenen freien Variablen"""
+    x = [Fraction(frei.get(j, 0)) for j in range(n)]
+    for k in range(len(pivot_spalten) - 1, -1, -1):
+        zeile = stufenform[k]
+        c = pivot_spalten[k]
+        summe = Fraction(rechte_seite[k])
+        for j in range(c + 1, n):
+            if zeile[j] and x[j]:
+                summe -= zeile[j] * x[j]
+        x[c] = summe / zeile[c]
+    return tuple(x)
+
+
+def _ganzzahlige_zeile(zeile: list[Zahl]) -> tuple[list[int], int]:
+    """Multipliziert eine Zeile mit ihrem Hauptnenner"""
+    brueche = [Fraction(wert) for wert in zeile]
+    hauptnenner = lcm(1, *(b.denominator for b in brueche))
+    return [int(b * hauptnenner) for b in brueche], hauptnenner
+
+
+def bareiss_elimination(
+    matrix: list[list[Zahl]],
+    vektor: list[Zahl],
+    *,
+    protokoll: bool = True,
+) -> GaussErgebnis:
+    """
+    Löst A·x = b exakt mit der bruchfreien Gauß-Elimination nach Bareiss.
+
+    Jede Zeile wird zunächst mit ihrem Hauptnenner multipliziert. Danach gilt
+    im k-ten Schritt a_ij ← (p_k·a_ij − a_ik·a_kj) / p_(k-1), wobei die
+    Division immer aufgeht. Die Einträge bleiben dadurch ganzzahlig und
+    wachsen nur polynomiell.
+
+    Args:
+        matrix: Koeffizientenmatrix als Liste von Zeilen (int oder Fraction)
+        vektor: Rechte Seite b
+        protokoll: Ob die Zwischenschritte gespeichert werden sollen
+
+    Returns:
+        GaussErgebnis mit Rang, Lösung, Determinante und Schritten
+
+    Raises:
+        ValueError: Wenn Matrix und Vektor nicht zusammenpassen
+    """
+    m = len(matrix)
+    n = len(matrix[0]) if m else 0
+    if len(vektor) != m or any(len(zeile) != n for zeile in matrix):
+        raise ValueError(
+            f"Matrix ({m} Zeilen) und Vektor ({len(vektor)} Einträge) "
+            f"passen nicht zusammen"
+        )
+
+    M: list[list[int]] = []
+    skalierung = 1
+    for zeile, wert in zip(matrix, vektor, strict=True):
+        ganzzahlig, hauptnenner = _ganzzahlige_zeile([*zeile, wert])
+        M.append(ganzzahlig)
+        skalierung *= hauptnenner
+
+    zeilen_herkunft = list(range(m))
+    schritte: list[GaussSchritt] = []
+    vorzeichen = 1
+
+    def merke(beschreibung: str) -> None:
+        if protokoll:
+            schritte.append(
+                GaussSchritt(beschreibung, tuple(tuple(zeile) for zeile in M))
+            )
+
+    merke("Erweiterte Matrix (A|b) mit ganzzahligen Zeilen")
+
+    vorheriges_pivot = 1
+    r = 0
+    pivot_spalten: list[int] = []
+    for c in range(n):
+        if r == m:
+            break
+        pivot_zeile = next((i for i in range(r, m) if M[i][c] != 0), None)
+        if pivot_zeile is None:
+            continue
+
+        if pivot_zeile != r:
+            M[r], M[pivot_zeile] = M[pivot_zeile], M[r]
+            zeilen_herkunft[r], zeilen_herkunft[pivot_zeile] = (
+                zeilen_herkunft[pivot_zeile],
+                zeilen_herkunft[r],
+            )
+            vorzeichen = -vorzeichen
+            merke(f"Tausche Z{r + 1} ↔ Z{pivot_zeile + 1}")
+
+        pivot = M[r][c]
+        pivot_reihe = M[r]
+        for i in range(r + 1, m):
+            reihe = M[i]
+            faktor = reihe[c]
+            for j in range(c + 1, n + 1):
+                reihe[j] = (
+                    pivot * reihe[j] - faktor * pivot_reihe[j]
+                ) // vorheriges_pivot
+            reihe[c] = 0
+
+        if r + 1 < m:
+            teiler = f" / {vorheriges_pivot}" if vorheriges_pivot != 1 else ""
+            merke(
+                f"Eliminiere x{c + 1}: Zi = ({pivot}·Zi − a_i{c + 1}·Z{r + 1})"
+                f"{teiler} für i > {r + 1}"
+            )
+
+        vorheriges_pivot = pivot
+        pivot_spalten.append(c)
+        r += 1
+
+    rang = r
+    widerspruch = next((i for i in range(rang, m) if M[i][n] != 0), None)
+
+    determinante = None
+    if m == n and n:
+        # Das letzte Pivotelement ist det der skalierten Matrix
+        determinante = (
+            Fraction(vorzeichen * M[n - 1][n - 1], skalierung)
+            if rang == n
+            else Fraction(0)
+        )
+
+    loesung = None
+    if widerspruch is None and rang == n:
+        loesung = _rueckwaerts(M, pivot_spalten, n, [zeile[n] for zeile in M], {})
+
+    return GaussErgebnis(
+        anzahl_unbekannte=n,
+        rang=rang,
+        rang_erweitert=rang if widerspruch is None else rang + 1,
+        pivot_spalten=tuple(pivot_spalten),
+        loesung=loesung,
+        determinante=determinante,
+        widerspruch_zeile=(
+            zeilen_herkunft[widerspruch] if widerspruch is not None else None
+        ),
+        schritte=tuple(schritte),
+        stufenform=tuple(tuple(zeile) for zeile in M[:rang]),
+    )
+
+
+def _numpy_lu(matrix: list[list[Fraction]]) -> tuple[np.ndarray, np.ndarray]:
+    """LU-Zerlegung in Gleitkomma mit Spaltenpivotsuche (kompakt gespeichert)"""
+    LU = np.array([[float(w) for w in zeile] for zeile in matrix], dtype=float)
+    n = LU.shape[0]
+    permutation = np.arange(n)
+    for k in range(n - 1):
+        p = k + int(np.argmax(np.abs(LU[k:, k])))
+        if p != k:
+            LU[[k, p]] = LU[[p, k]]
+            permutation[[k, p]] = permutation[[p, k]]
+        LU[k + 1 :, k] /= LU[k, k]
+        LU[k + 1 :, k + 1 :] -= np.outer(LU[k + 1 :, k], LU[k, k + 1 :])
+    return LU, permutation
+
+
+class LUZerlegung:
+    """
+    Exakte LU-Zerlegung P·A = L·U einer regulären Matrix über den rationalen Zahlen.
+
+    Die Zerlegung kostet einmalig O(n³), danach ist jede weitere rechte Seite
+    in O(n²) gelöst. Für schnelle Näherungen wird zusätzlich bei Bedarf eine
+    NumPy-Zerlegung in Gleitkomma angelegt.
+    """
+
+    def __init__(self, matrix: list[list[Zahl]]):
+        """
+        Args:
+            matrix: Quadratische Koeffizientenmatrix (int oder Fraction)
+
+        Raises:
+            ValueError: Wenn die Matrix nicht quadratisch oder singulär ist
+        """
+        n = len(matrix)
+        if any(len(zeile) != n for zeile in matrix):
+            raise ValueError("LU-Zerlegung benötigt eine quadratische Matrix")
+
+        U = [[Fraction(w) for w in zeile] for zeile in matrix]
+        L = [[Fraction(0)] * n for _ in range(n)]
+        permutation = list(range(n))
+
+        for k in range(n):
+            p = next((i for i in range(k, n) if U[i][k] != 0), None)
+            if p is None:
+                raise ValueError(
+                    "Die Matrix ist singulär und besitzt keine LU-Zerlegung"
+                )
+            if p != k:
+                U[k], U[p] = U[p], U[k]
+                L[k], L[p] = L[p], L[k]
+                permutation[k], permutation[p] = permutation[p], permutation[k]
+            pivot_reihe = U[k]
+            for i in range(k + 1, n):
+                faktor = U[i][k] / pivot_reihe[k]
+                L[i][k] = faktor
+                if faktor:
+                    reihe = U[i]
+                    for j in range(k, n):
+                        reihe[j] -= faktor * pivot_reihe[j]
+
+        for k in range(n):
+            L[k][k] = Fraction(1)
+
+        self.n = n
+        self.L = L
+        self.U = U
+        self.permutation = tuple(permutation)
+        self._matrix = matrix
+        self._numerisch: tuple[np.ndarray, np.ndarray] | None = None
+
+    @property
+    def determinante(self) -> Fraction:
+        """Determinante aus dem Produkt der Diagonale von U"""
+        det = Fraction(1)
+        for k in range(self.n):
+            det *= self.U[k][k]
+        # Vorzeichen der Permutation über die Anzahl der Zyklen
+        besucht = [False] * self.n
+        transpositionen = 0
+        for start in range(self.n):
+            laenge = 0
+            i = start
+            while not besucht[i]:
+                besucht[i] = True
+                i = self.permutation[i]
+                laenge += 1
+            transpositionen += max(laenge - 1, 0)
+        return -det if transpositionen % 2 else det
+
+    def loese(self, vektor: list[Zahl]) -> tuple[Fraction, ...]:
+        """
+        Löst A·x = b exakt durch Vorwärts- und Rückwärtseinsetzen.
+
+        Args:
+            vektor: Rechte Seite b
+
+        Returns:
+            Exakte Lösung x
+        """
+        if len(vektor) != self.n:
+            raise ValueError(f"Rechte Seite hat {len(vektor)} statt {self.n} Einträge")
+        y = [Fraction(vektor[p]) for p in self.permutation]
+        for i in range(self.n):
+            zeile = self.L[i]
+            for j in range(i):
+                if zeile[j]:
+                    y[i] -= zeile[j] * y[j]
+        x = y
+        for i in range(self.n - 1, -1, -1):
+            zeile = self.U[i]
+            for j in range(i + 1, self.n):
+                if zeile[j]:
+                    x[i] -= zeile[j] * x[j]
+            x[i] /= zeile[i]
+        return tuple(x)
+
+    def loese_viele(
+        self, rechte_seiten: list[list[Zahl]]
+    ) -> list[tuple[Fraction, ...]]:
+        """
+        Löst A·x = b exakt für mehrere rechte Seiten mit derselben Zerlegung.
+
+        Args:
+            rechte_seiten: Liste von rechten Seiten b_1, ..., b_k
+
+        Returns:
+            Liste der exakten Lösungen x_1, ..., x_k
+        """
+        return [self.loese(b) for b in rechte_seiten]
+
+    def loese_numerisch(self, rechte_seiten) -> np.ndarray:
+        """
+        Löst A·x = b in Gleitkomma für k rechte Seiten in einem Aufruf.
+
+        Args:
+            rechte_seiten: Array der Form (k, n) mit den rechten Seiten
+
+        Returns:
+            Array der Form (k, n) mit den Lösungen
+        """
+        if self._numerisch is None:
+            self._numerisch = _numpy_lu(self._matrix)
+        LU, permutation = self._numerisch
+
+        B = np.asarray(rechte_seiten, dtype=float)
+        if B.ndim == 1:
+            return self.loese_numerisch(B[np.newaxis, :])[0]
+        if B.shape[1] != self.n:
+            raise ValueError(
+                f"Rechte Seiten haben {B.shape[1]} statt {self.n} Einträge"
+            )
+
+        # Spalten sind die einzelnen Systeme, Zeilen werden gemeinsam verarbeitet
+        X = B.T[permutation].copy()
+        for i in range(1, self.n):
+            X[i] -= LU[i, :i] @ X[:i]
+        for i in range(self.n - 1, -1, -1):
+            X[i] = (X[i] - LU[i, i + 1 :] @ X[i + 1 :]) / LU[i, i]
+        return X.T
+
+
+@lru_cache(maxsize=128)
+def _lu_zerlegung_cached(matrix: tuple[tuple[Fraction, ...], ...]) -> LUZerlegung:
+    """Gecachte LU-Zerlegung, Schlüssel ist die exakte Koeffizientenstruktur"""
+    return LUZerlegung([list(zeile) for zeile in matrix])
+
+
+registriere_cache("lu", _lu_zerlegung_cached)
+
+
+def lu_zerlegung(matrix: list[list[Zahl]]) -> LUZerlegung:
+    """
+    Gibt die (gecachte) LU-Zerlegung einer regulären Matrix zurück.
+
+    Gleiche Koeffizientenmatrizen, z.B. Interpolation mit festen x-Stellen,
+    werden nur einmal zerlegt.
+
+    Args:
+        matrix: Quadratische Koeffizientenmatrix
+
+    Returns:
+        LUZerlegung-Objekt
+    """
+    return _lu_zerlegung_cached(
+        tuple(tuple(Fraction(w) for w in zeile) for zeile in matrix)
+    )
@@ -0,0 +1,286 @@
+"""
+Instrumentierung für Laufzeitmessungen im Schul-Analysis Framework.
+
+Stellt Zähler und Zeitmessung pro Operation (parse, classify, diff, solve,
+simplify, evaluate, plot) sowie Treffer-Statistiken aller Caches bereit.
+Solange keine Messung läuft, kostet ein Messpunkt nur die Abfrage eines
+Modul-Flags; während einer Messung werden die Zähler unter einer Sperre
+erhöht, damit parallele Threads keine Zählungen verlieren. Für
+Log-Meldungen gibt es `Lazy`, das teure Darstellungen wie `term()` erst
+berechnet, wenn die Meldung wirklich ausgegeben wird.
+
+Examples:
+    >>> with messe_performance() as bericht:
+    ...     Funktion("x^3 - x").nullstellen
+    >>> print(bericht)
+    >>> bericht.operationen["parse"].anzahl
+"""
+
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any
+
+OPERATIONEN = ("parse", "classify", "diff", "solve", "simplify", "evaluate", "plot")
+
+# Anzahl laufender Messungen (verschachtelte `messe_performance` erlaubt)
+_aktiv = 0
+_sperre = threading.Lock()  # Schützt _aktiv und alle Zähler
+_anzahl: defaultdict[str, int] = defaultdict(int)
+_zeiten: defaultdict[str, float] = defaultdict(float)
+_cache_treffer: defaultdict[str, int] = defaultdict(int)
+_cache_fehlschlaege: defaultdict[str, int] = defaultdict(int)
+
+# Caches mit eigener Statistik (functools.lru_cache): Name → Funktion
+_lru_caches: dict[str, Callable] = {}
+
+
+class Lazy:
+    """
+    Verzögerter Log-Parameter: `funktion(*args)` wird erst bei `str()` aufgerufen.
+
+    Examples:
+        >>> logger.debug("Berechne f(%s) für %s", x_wert, Lazy(self.term))
+    """
+
+    __slots__ = ("_funktion", "_args")
+
+    def __init__(self, funktion: Callable[..., Any], *args: Any):
+        self._funktion = funktion
+        self._args = args
+
+    def __str__(self) -> str:
+        return str(self._funktion(*self._args))
+
+    __repr__ = __str__
+
+
+def ist_aktiv() -> bool:
+    """Prüft, ob gerade eine Performance-Messung läuft"""
+    return _aktiv > 0
+
+
+def gemessen(operation: str) -> Callable[[Callable], Callable]:
+    """
+    Dekorator: zählt Aufrufe und misst die Laufzeit (inklusive Unteraufrufe).
+
+    `cache_info` und `cache_clear` eines darunterliegenden lru_cache bleiben
+    erreichbar.
+
+    Args:
+        operation: Name der Operation, z.B. "diff"
+    """
+
+    def dekorator(funktion: Callable) -> Callable:
+        @wraps(funktion)
+        def wrapper(*args, **kwargs):
+            if not _aktiv:
+                return funktion(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return funktion(*args, **kwargs)
+            finally:
+                dauer = time.perf_counter() - start
+                with _sperre:
+                    _anzahl[operation] += 1
+                    _zeiten[operation] += dauer
+
+        for attribut in ("cache_info", "cache_clear"):
+            if hasattr(funktion, attribut):
+                setattr(wrapper, attribut, getattr(funktion, attribut))
+        return wrapper
+
+    return dekorator
+
+
+class Messung:
+    """
+    Kontextmanager für Messpunkte, die keine ganze Funktion umfassen.
+
+    Examples:
+        >>> with Messung("classify"):
+        ...     typ = bestimme_typ(ausdruck)
+    """
+
+    __slots__ = ("operation", "_start")
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        self._start = 0.0
+
+    def __enter__(self) -> "Messung":
+        if _aktiv:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if _aktiv and self._start:
+            dauer = time.perf_counter() - self._start
+            with _sperre:
+                _anzahl[self.operation] += 1
+                _zeiten[self.operation] += dauer
+
+
+def cache_zugriff(name: str, treffer: bool) -> None:
+    """
+    Erfasst einen Zugriff auf einen selbst verwalteten (dict-)Cache.
+
+    Args:
+        name: Name des Caches, z.B. "ableitung"
+        treffer: True bei Cache-Treffer, False bei Neuberechnung
+    """
+    if _aktiv:
+        with _sperre:
+            if treffer:
+                _cache_treffer[name] += 1
+            else:
+                _cache_fehlschlaege[name] += 1
+
+
+def registriere_cache(name: str, funktion: Callable) -> Callable:
+    """
+    Meldet einen lru_cache für die Cache-Statistik an.
+
+    Args:
+        name: Anzeigename des Caches
+        funktion: Mit functools.lru_cache dekorierte Funktion
+
+    Returns:
+        Die unveränderte Funktion (als Dekorator verwendbar)
+    """
+    _lru_caches[name] = funktion
+    return funktion
+
+
+def leere_caches() -> None:
+    """Leert alle angemeldeten lru_caches (z.B. für Messungen mit kaltem Cache)"""
+    for funktion in _lru_caches.values():
+        funktion.cache_clear()
+
+
+@dataclass(frozen=True)
+class OperationsStatistik:
+    """Aufrufe und Gesamtlaufzeit einer Operation"""
+
+    anzahl: int
+    zeit: float  # Sekunden, inklusive verschachtelter Aufrufe
+
+    @property
+    def mittlere_zeit(self) -> float:
+        return self.zeit / self.anzahl if self.anzahl else 0.0
+
+
+@dataclass(frozen=True)
+class CacheStatistik:
+    """Treffer und Fehlschläge eines Caches"""
+
+    treffer: int
+    fehlschlaege: int
+
+    @property
+    def trefferquote(self) -> float:
+        gesamt = self.treffer + self.fehlschlaege
+        return self.treffer / gesamt if gesamt else 0.0
+
+
+@dataclass
+class PerformanceBericht:
+    """Ergebnis von `messe_performance`; wird beim Verlassen des Blocks gefüllt"""
+
+    dauer: float = 0.0
+    operationen: dict[str, OperationsStatistik] = field(default_factory=dict)
+    caches: dict[str, CacheStatistik] = field(default_factory=dict)
+
+    def als_dict(self) -> dict[str, Any]:
+        """Bericht als einfache Datenstruktur (z.B. für JSON)"""
+        return {
+            "dauer": self.dauer,
+            "operationen": {
+                name: {"anzahl": s.anzahl, "zeit": s.zeit}
+                for name, s in self.operationen.items()
+            },
+            "caches": {
+                name: {"treffer": s.treffer, "fehlschlaege": s.fehlschlaege}
+                for name, s in self.caches.items()
+            },
+        }
+
+    def __str__(self) -> str:
+        zeilen = [f"Performance-Bericht ({self.dauer * 1000:.1f} ms)"]
+        if self.operationen:
+            zeilen.append(f"  {'Operation':<12}{'Aufrufe':>9}{'Zeit [ms]':>12}")
+            for name, s in self.operationen.items():
+                zeilen.append(f"  {name:<12}{s.anzahl:>9}{s.zeit * 1000:>12.2f}")
+        if self.caches:
+            zeilen.append(f"  {'Cache':<12}{'Treffer':>9}{'Fehlschl.':>12}{'Quote':>8}")
+            for name, s in self.caches.items():
+                zeilen.append(
+                    f"  {name:<12}{s.treffer:>9}{s.fehlschlaege:>12}"
+                    f"{s.trefferquote:>8.0%}"
+                )
+        return "\n".join(zeilen)
+
+
+def _schnappschuss() -> tuple[dict, dict, dict, dict]:
+    lru = {name: funktion.cache_info() for name, funktion in _lru_caches.items()}
+    with _sperre:
+        return (
+            dict(_anzahl),
+            dict(_zeiten),
+            {
+                name: (_cache_treffer[name], _cache_fehlschlaege[name])
+                for name in _cache_treffer.keys() | _cache_fehlschlaege.keys()
+            },
+            {name: (info.hits, info.misses) for name, info in lru.items()},
+        )
+
+
+@contextmanager
+def messe_performance() -> Iterator[PerformanceBericht]:
+    """
+    Misst alle instrumentierten Operationen und Caches innerhalb des Blocks.
+
+    Returns:
+        PerformanceBericht, der nach dem Block die Messwerte enthält
+    """
+    global _aktiv
+    bericht = PerformanceBericht()
+    anzahl_vorher, zeiten_vorher, dict_vorher, lru_vorher = _schnappschuss()
+    with _sperre:
+        _aktiv += 1
+    start = time.perf_counter()
+    try:
+        yield bericht
+    finally:
+        bericht.dauer = time.perf_counter() - start
+        with _sperre:
+            _aktiv -= 1
+        anzahl, zeiten, dict_caches, lru_caches = _schnappschuss()
+
+        for name in OPERATIONEN + tuple(sorted(anzahl.keys() - set(OPERATIONEN))):
+            differenz = anzahl.get(name, 0) - anzahl_vorher.get(name, 0)
+            if differenz:
+                bericht.operationen[name] = OperationsStatistik(
+                    differenz, zeiten[name] - zeiten_vorher.get(name, 0.0)
+                )
+
+        for caches, vorher in ((dict_caches, dict_vorher), (lru_caches, lru_vorher)):
+            for name, (treffer, fehlschlaege) in sorted(caches.items()):
+                alt_treffer, alt_fehlschlaege = vorher.get(name, (0, 0))
+                statistik = CacheStatistik(
+                    treffer - alt_treffer, fehlschlaege - alt_fehlschlaege
+                )
+                if statistik.treffer or statistik.fehlschlaege:
+                    bericht.caches[name] = statistik
+
+
+def cache_statistik() -> dict[str, CacheStatistik]:
+    """Aktuelle Gesamtstatistik aller angemeldeten lru_caches"""
+    return {
+        name: CacheStatistik(info.hits, info.misses)
+        for name, info in ((n, f.cache_info()) for n, f in _lru_caches.items())
+    }
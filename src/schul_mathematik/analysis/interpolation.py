@@ -0,0 +1,283 @@
+"""
+Polynominterpolation mit dividierten Differenzen nach Newton.
+
+Die Newton-Koeffizienten werden exakt mit Brüchen (oder auf Wunsch in
+Gleitkomma) berechnet, neue Punkte lassen sich in O(n) anhängen. Für schnelle Auswertung in Gleitkomma (z.B.
+beim Zeichnen) werden baryzentrische Gewichte mitgeführt, die numerisch
+stabiler sind als das ausmultiplizierte Polynom.
+"""
+
+from fractions import Fraction
+
+import numpy as np
+import sympy as sp
+
+from ..gemeinsam.zahlen import als_bruch
+
+
+class NewtonInterpolation:
+    """
+    Interpolationspolynom in Newton-Form mit exakten dividierten Differenzen.
+
+    p(x) = c0 + c1·(x − x0) + c2·(x − x0)(x − x1) + ...
+
+    Examples:
+        >>> p = NewtonInterpolation([(1, 2), (2, 3), (3, 6)])
+        >>> p.wert(4)                   # Fraction(11, 1)
+        >>> p.punkt_hinzufuegen(4, 0)   # O(n), ohne Neuberechnung
+        >>> p.als_funktion().term()
+    """
+
+    def __init__(self, punkte=(), exakt: bool = True):
+        """
+        Args:
+            punkte: Iterierbare (x, y)-Paare mit paarweise verschiedenen x
+            exakt: Rechnen mit Brüchen; bei False in Gleitkomma (z.B. für
+                   Messwerte mit vielen Nachkommastellen)
+        """
+        self.exakt = exakt
+        self._zahl = als_bruch if exakt else float
+        self.x_werte: list = []
+        self.y_werte: list = []
+        self.koeffizienten: list = []  # Newton-Koeffizienten c_k
+        self._letzte_zeile: list = []  # Differenzen bis zum letzten Punkt
+        self._gewichte = np.empty(0)  # Baryzentrische Gewichte (float)
+        for x, y in punkte:
+            self.punkt_hinzufuegen(x, y)
+
+    @property
+    def grad(self) -> int:
+        """Höchstmöglicher Grad des Interpolationspolynoms (Punkte − 1)"""
+        return len(self.x_werte) - 1
+
+    def punkt_hinzufuegen(self, x, y) -> "NewtonInterpolation":
+        """
+        Fügt einen Stützpunkt hinzu und aktualisiert die Koeffizienten in O(n).
+
+        Args:
+            x: x-Koordinate (darf noch nicht vorkommen)
+            y: y-Koordinate
+
+        Returns:
+            self, damit Aufrufe verkettet werden können
+
+        Raises:
+            ValueError: Wenn die x-Stelle bereits vorhanden ist
+        """
+        x, y = self._zahl(x), self._zahl(y)
+        if x in self.x_werte:
+            raise ValueError(f"Die Stelle x = {x} ist bereits ein Stützpunkt")
+
+        # Neue Zeile im Differenzenschema: f[x_n], f[x_n-1, x_n], ...
+        zeile = [y]
+        n = len(self.x_werte)
+        for k in range(1, n + 1):
+            zeile.append(
+                (zeile[k - 1] - self._letzte_zeile[k - 1]) / (x - self.x_werte[n - k])
+            )
+
+        # Baryzentrische Gewichte w_j = 1 / Π (x_j − x_k)
+        x_float = float(x)
+        if n:
+            abstaende = self._x_float() - x_float
+            self._gewichte = np.append(
+                self._gewichte / abstaende, 1.0 / np.prod(-abstaende)
+            )
+        else:
+            self._gewichte = np.array([1.0])
+
+        self.x_werte.append(x)
+        self.y_werte.append(y)
+        self.koeffizienten.append(zeile[-1])
+        self._letzte_zeile = zeile
+        return self
+
+    def _x_float(self) -> np.ndarray:
+        return np.array([float(x) for x in self.x_werte])
+
+    def wert(self, x) -> Fraction | float:
+        """
+        Funktionswert über das Horner-Schema der Newton-Form.
+
+        Args:
+            x: Stelle (int, float, Fraction oder SymPy-Zahl)
+
+        Returns:
+            Funktionswert als Bruch (exakt) bzw. float
+        """
+        x = self._zahl(x)
+        ergebnis = self._zahl(0)
+        for k in range(len(self.koeffizienten) - 1, -1, -1):
+            ergebnis = ergebnis * (x - self.x_werte[k]) + self.koeffizienten[k]
+        return ergebnis
+
+    def auswerten(self, x_werte) -> np.ndarray:
+        """
+        Schnelle Gleitkomma-Auswertung mit der baryzentrischen Formel.
+
+        Args:
+            x_werte: Einzelne Stelle oder Array von Stellen
+
+        Returns:
+            Array der Funktionswerte
+        """
+        if not self.x_werte:
+            raise ValueError("Keine Stützpunkte vorhanden")
+
+        x = np.atleast_1d(np.asarray(x_werte, dtype=float))
+        knoten = self._x_float()
+        y = np.array([float(w) for w in self.y_werte])
+
+        differenz = x[:, np.newaxis] - knoten[np.newaxis, :]
+        treffer = differenz == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terme = self._gewichte / differenz
+            ergebnis = (terme @ y) / terme.sum(axis=1)
+
+        # Exakt auf einem Stützpunkt: dort ist der Wert bekannt
+        zeilen, spalten = np.nonzero(treffer)
+        ergebnis[zeilen] = y[spalten]
+        return ergebnis
+
+    def monom_koeffizienten(self) -> list[Fraction | float]:
+        """
+        Koeffizienten in Monomform [a_n, ..., a_1, a_0] (höchster Grad zuerst).
+
+        Die Umrechnung aus der Newton-Form ist ein Horner-Schema in O(n²).
+        """
+        # Koeffizienten aufsteigend: p = a_0 + a_1 x + ...
+        aufsteigend = []
+        for k in range(len(self.koeffizienten) - 1, -1, -1):
+            # p ← p·(x − x_k) + c_k
+            neu = [self._zahl(0)] * (len(aufsteigend) + 1)
+            for i, a in enumerate(aufsteigend):
+                neu[i + 1] += a
+                neu[i] -= a * self.x_werte[k]
+            neu[0] += self.koeffizienten[k]
+            aufsteigend = neu
+
+        while len(aufsteigend) > 1 and aufsteigend[-1] == 0:
+            aufsteigend.pop()
+        return aufsteigend[::-1]
+
+    def als_ausdruck(self, variable: sp.Symbol | None = None) -> sp.Expr:
+        """Ausmultiplizierter SymPy-Ausdruck des Interpolationspolynoms"""
+        variable = variable if variable is not None else sp.Symbol("x")
+        koeffizienten = [
+            sp.Rational(k.numerator, k.denominator) if self.exakt else sp.Float(k)
+            for k in self.monom_koeffizienten()
+        ]
+        return sp.Poly(koeffizienten, variable).as_expr()
+
+    def als_funktion(self):
+        """Interpolationspolynom als GanzrationaleFunktion"""
+        from .ganzrationale import GanzrationaleFunktion
+
+        return GanzrationaleFunktion(self.als_ausdruck())
+
+    def __len__(self) -> int:
+        return len(self.x_werte)
+
+    def __repr__(self) -> str:
+        return f"NewtonInterpolation({len(self)} Punkte, Grad ≤ {self.grad})"
+
+
+def konfluente_vandermonde_zeile(x, ordnung: int, grad: int) -> list[Fraction]:
+    """
+    Zeile der konfluenten Vandermonde-Matrix: k-te Ableitung von 1, x, ..., x^grad.
+
+    Für die Bedingung f^(k)(x0) = w ist der Eintrag zu a_j gleich
+    j·(j−1)·...·(j−k+1)·x0^(j−k).
+
+    Args:
+        x: Stelle x0
+        ordnung: Ableitungsordnung k (0 für den Funktionswert)
+        grad: Grad des gesuchten Polynoms
+
+    Returns:
+        Exakte Matrixzeile mit grad + 1 Einträgen
+    """
+    x = als_bruch(x)
+    zeile = []
+    for j in range(grad + 1):
+        if j < ordnung:
+            zeile.append(Fraction(0))
+            continue
+        faktor = 1
+        for i in range(j - ordnung + 1, j + 1):
+            faktor *= i
+        zeile.append(faktor * x ** (j - ordnung))
+    return zeile
+
+
+def hermite_koeffizienten(
+    bedingungen: list[tuple], grad: int
+) -> tuple[tuple[Fraction, ...], dict[int, tuple[Fraction, ...]]] | None:
+    """
+    Löst das konfluente Vandermonde-System f^(k)(x_i) = w_i exakt.
+
+    Quadratische Systeme laufen über die gecachte LU-Zerlegung, sodass viele
+    Bedingungssätze mit gleichen Stellen und Ordnungen nur eine Zerlegung
+    brauchen. Unter- oder überbestimmte Systeme löst die Bareiss-Elimination.
+
+    Args:
+        bedingungen: Tripel (x_i, k_i, w_i) für f^(k_i)(x_i) = w_i
+        grad: Grad des gesuchten Polynoms
+
+    Returns:
+        (Koeffizienten a_0, ..., a_grad einer Lösung, {j: Richtung zum freien a_j})
+        oder None, wenn sich die Bedingungen widersprechen
+    """
+    from .gauss import bareiss_elimination, lu_zerlegung
+
+    matrix = [konfluente_vandermonde_zeile(x, k, grad) for x, k, _ in bedingungen]
+    vektor = [als_bruch(w) for _, _, w in bedingungen]
+
+    if len(matrix) == grad + 1:
+        try:
+            return lu_zerlegung(matrix).loese(vektor), {}
+        except ValueError:
+            pass  # Singulär: Bareiss unterscheidet widersprüchlich/unterbestimmt
+
+    ergebnis = bareiss_elimination(matrix, vektor, protokoll=False)
+    allgemein = ergebnis.allgemeine_loesung()
+    if allgemein is None:
+        return None
+    partikulaer, basis = allgemein
+    return partikulaer, dict(zip(ergebnis.freie_spalten, basis, strict=True))
+
+
+def hermite_koeffizienten_symbolisch(
+    bedingungen: list[tuple], grad: int
+) -> tuple[tuple[sp.Expr, ...], dict[int, tuple[sp.Expr, ...]]] | None:
+    """
+    Löst das konfluente Vandermonde-System f^(k)(x_i) = w_i exakt mit SymPy.
+
+    Für Bedingungen mit Parametern oder irrationalen Stellen und Werten, bei
+    denen die Bruchrechnung von hermite_koeffizienten nicht anwendbar ist.
+
+    Returns:
+        Wie hermite_koeffizienten, mit SymPy-Ausdrücken statt Brüchen
+    """
+    matrix = sp.Matrix(
+        [
+            [
+                sp.ff(j, k) * sp.sympify(x) ** (j - k) if j >= k else 0
+                for j in range(grad + 1)
+            ]
+            for x, k, _ in bedingungen
+        ]
+    )
+    vektor = sp.Matrix([sp.sympify(w) for _, _, w in bedingungen])
+    try:
+        loesung, freie = matrix.gauss_jordan_solve(vektor)
+    except ValueError:
+        return None
+
+    partikulaer = tuple(sp.simplify(w.subs(dict.fromkeys(freie, 0))) for w in loesung)
+    richtungen = {}
+    for tau in freie:
+        # Die freien Koeffizienten stehen in der Lösung unverändert als tau
+        j = next(i for i, w in enumerate(loesung) if w == tau)
+        richtungen[j] = tuple(sp.simplify(w.diff(tau)) for w in loesung)
+    return partikulaer, richtungen
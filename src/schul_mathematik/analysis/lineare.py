@@ -22,6 +22,8 @@ class LineareFunktion(GanzrationaleFunktion):
         >>> h = LineareFunktion(m=2, b=3)  # 2x + 3
     """
 
+    __slots__ = ("_m", "_b")
+
     def __init__(
         self,
         eingabe: str | list[float] | dict[int, float] | sp.Basic | None = None,
@@ -66,6 +68,22 @@ class LineareFunktion(GanzrationaleFunktion):
                 "Hast du vielleicht eine quadratische Funktion (mit x²) gemeint?"
             )
 
+    def _zustand_als_dict(self) -> dict:
+        zustand = super()._zustand_als_dict()
+        if self._m is not None:
+            zustand["m"], zustand["b"] = self._m, self._b
+        return zustand
+
+    def _stelle_zustand_wieder_her(self, daten: dict) -> None:
+        super()._stelle_zustand_wieder_her(daten)
+        self._m = daten.get("m")
+        self._b = daten.get("b")
+
+    def _term_geaendert(self) -> None:
+        super()._term_geaendert()
+        # m und b aus dem Konstruktor gelten nicht mehr
+        self._m = self._b = None
+
     @property
     def steigung(self) -> float | sp.Basic:
         """Gibt die Steigung m zurück"""
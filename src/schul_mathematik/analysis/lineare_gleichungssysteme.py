@@ -8,11 +8,18 @@ aus Funktionsbedingungen.
 Basierend auf SymPy für symbolische Mathematik.
 """
 
+import re
 from dataclasses import dataclass
+from fractions import Fraction
 from typing import Protocol
 
+import numpy as np
 import sympy as sp
 
+from ..gemeinsam.zahlen import als_rational, ist_rational
+from .gauss import GaussErgebnis, LUZerlegung, bareiss_elimination, lu_zerlegung
+from .instrumentierung import gemessen
+
 # ====================
 # Spezifische LGS-Fehlerklassen
 # ====================
@@ -42,6 +49,17 @@ class LGSInkonsistenzError(ValueError):
     pass
 
 
+def _als_exakt(wert) -> sp.Expr:
+    """
+    Wandelt einen Koeffizienten in einen exakten SymPy-Wert um.
+
+    Dezimalzahlen werden über ihre Dezimaldarstellung übernommen (0.1 → 1/10),
+    irrationale Zahlen wie sqrt(2) und Symbole bleiben unverändert.
+    """
+    wert = sp.sympify(wert)
+    return wert.xreplace({f: als_rational(f) for f in wert.atoms(sp.Float)})
+
+
 class ParametrischeFunktionProtocol(Protocol):
     """Protocol für Funktionen, die mit LGS kompatibel sein sollen"""
 
@@ -90,7 +108,7 @@ class LineareGleichung:
 
     def extrahiere_koeffizienten(
         self, parameter: list[sp.Symbol]
-    ) -> dict[sp.Symbol, float]:
+    ) -> dict[sp.Symbol, sp.Expr]:
         """
         Extrahiert die Koeffizienten der Parameter aus der Gleichung.
 
@@ -100,36 +118,35 @@ class LineareGleichung:
             parameter: Liste der Parameter (z.B. [a, b, c])
 
         Returns:
-            Dictionary mit Parameter -> Koeffizient
+            Dictionary mit Parameter -> exakter Koeffizient
 
         Raises:
             ValueError: Wenn die Gleichung nicht linear in den Parametern ist
-                        oder ein Koeffizient nicht in eine Zahl umgewandelt werden kann.
         """
-        poly = self.gleichung.as_poly(*parameter)
+        poly = self._als_poly(parameter)
+        return {p: _als_exakt(poly.coeff_monomial(p)) for p in parameter}
 
-        # Überprüfen, ob die Gleichung linear in den Parametern ist
-        if poly is None or any(d > 1 for d in poly.degree_list()):
-            raise ValueError(
-                f"Gleichung '{self.gleichung} = 0' ist nicht linear in den Parametern {parameter}."
-            )
+    def konstante(self, parameter: list[sp.Symbol]) -> sp.Expr:
+        """
+        Gibt die rechte Seite b der Normalform a1*p1 + ... + an*pn = b zurück.
 
-        koeffizienten = {}
-        for p in parameter:
-            # Extrahiere den Koeffizienten für den Parameter p
-            koeff = poly.coeff_monomial(p)
-            try:
-                # Versuche, den Koeffizienten in eine Gleitkommazahl umzuwandeln
-                koeffizienten[p] = float(koeff)
-            except (TypeError, ValueError):
-                raise ValueError(
-                    f"Der Koeffizient '{koeff}' für Parameter '{p}' ist nicht numerisch."
-                )
+        Args:
+            parameter: Liste der Parameter
 
-        # Der konstante Term kann hier ignoriert werden, da er bereits durch
-        # die Normalisierung der Gleichung (... - rechte_seite = 0) berücksichtigt ist.
+        Returns:
+            Exakter Wert der rechten Seite
+        """
+        poly = self._als_poly(parameter)
+        return -_als_exakt(poly.coeff_monomial(1))
 
-        return koeffizienten
+    def _als_poly(self, parameter: list[sp.Symbol]) -> sp.Poly:
+        """Wandelt die Gleichung in ein in den Parametern lineares Polynom um"""
+        poly = self.gleichung.as_poly(*parameter) if parameter else None
+        if parameter and (poly is None or any(d > 1 for d in poly.degree_list())):
+            raise ValueError(
+                f"Gleichung '{self.gleichung} = 0' ist nicht linear in den Parametern {parameter}."
+            )
+        return poly if poly is not None else sp.Poly(self.gleichung, sp.Dummy())
 
     def __str__(self):
         """Didaktische String-Darstellung"""
@@ -150,6 +167,8 @@ class LineareGleichungssystem:
         self._parameter = None
         self._matrix = None
         self._vektor = None
+        self._gauss = None
+        self._gauss_jordan = None
         self._lösung = None
 
     def _finde_parameter(self) -> list[sp.Symbol]:
@@ -187,7 +206,14 @@ class LineareGleichungssystem:
                 if not ist_wirklich_variable:
                     gefilterte_symbole.append(symbol)
 
-        return sorted(gefilterte_symbole, key=lambda x: str(x))
+        # Natürliche Sortierung, damit a2 vor a10 kommt
+        return sorted(
+            gefilterte_symbole,
+            key=lambda s: [
+                int(teil) if teil.isdigit() else teil
+                for teil in re.split(r"(\d+)", str(s))
+            ],
+        )
 
     @property
     def parameter(self) -> list[sp.Symbol]:
@@ -210,52 +236,97 @@ class LineareGleichungssystem:
         """
         Erstellt die Koeffizientenmatrix und den Ergebnisvektor.
 
+        Alle Einträge sind exakt: Brüche, irrationale Zahlen oder Symbole.
+
         Returns:
             Tuple (Matrix, Vektor)
         """
         if self._matrix is not None and self._vektor is not None:
             return self._matrix, self._vektor
 
-        # n and m were unused, removing them
-
-        # Initialisiere Matrix und Vektor
         matrix_data = []
         vektor_data = []
 
-        for _i, gl in enumerate(self.gleichungen):
+        for gl in self.gleichungen:
             koeffizienten = gl.extrahiere_koeffizienten(self.parameter)
+            matrix_data.append([koeffizienten[p] for p in self.parameter])
+            vektor_data.append(gl.konstante(self.parameter))
 
-            # Erstelle Zeile für die Matrix
-            zeile = [koeffizienten.get(p, 0.0) for p in self.parameter]
-            matrix_data.append(zeile)
+        self._matrix = sp.Matrix(
+            len(matrix_data), len(self.parameter), [w for z in matrix_data for w in z]
+        )
+        self._vektor = sp.Matrix(vektor_data)
 
-            # Rechtes Seite der Gleichung (negiert, weil wir ...=0 Form haben)
-            konstante = gl.gleichung
-            for p in self.parameter:
-                konstante = konstante.subs(p, 0)
+        return self._matrix, self._vektor
 
-            if konstante.is_number:
-                vektor_data.append(-float(konstante))
-            else:
-                vektor_data.append(0.0)
+    @property
+    def ist_rational(self) -> bool:
+        """Gibt an, ob alle Koeffizienten und rechten Seiten Brüche sind"""
+        A, b = self.erstelle_matrix_und_vektor()
+        return all(w.is_Rational for w in A) and all(w.is_Rational for w in b)
 
-        self._matrix = sp.Matrix(matrix_data)
-        self._vektor = sp.Matrix(vektor_data)
+    def _pruefe_rational(self, verfahren: str) -> None:
+        if not self.ist_rational:
+            raise ValueError(
+                f"{verfahren} braucht rationale Koeffizienten; "
+                "dieses System wird mit löse() exakt über SymPy gelöst."
+            )
 
-        return self._matrix, self._vektor
+    @property
+    def gauss(self) -> GaussErgebnis:
+        """
+        Ergebnis der exakten Gauß-Elimination (Bareiss), wird nur einmal berechnet.
+
+        Enthält Rang, Determinante, Lösung und die protokollierten Umformungen.
 
-    def löse(self) -> dict[sp.Symbol, float]:
+        Raises:
+            ValueError: Wenn ein Koeffizient nicht rational ist (z.B. sqrt(2))
+        """
+        if self._gauss is None:
+            self._pruefe_rational("Die Bareiss-Elimination")
+            A, b = self.erstelle_matrix_und_vektor()
+            matrix = [
+                [Fraction(int(A[i, j].p), int(A[i, j].q)) for j in range(A.cols)]
+                for i in range(A.rows)
+            ]
+            vektor = [Fraction(int(w.p), int(w.q)) for w in b]
+            self._gauss = bareiss_elimination(matrix, vektor)
+        return self._gauss
+
+    def _löse_symbolisch(self) -> tuple[sp.Matrix, sp.Matrix] | None:
+        """
+        Gauß-Jordan über SymPy für irrationale oder symbolische Koeffizienten.
+
+        Returns:
+            (Lösung, freie Parameter) wie bei Matrix.gauss_jordan_solve
+            oder None, wenn sich die Gleichungen widersprechen
         """
-        Löse das lineare Gleichungssystem.
+        if self._gauss_jordan is None:
+            A, b = self.erstelle_matrix_und_vektor()
+            try:
+                self._gauss_jordan = A.gauss_jordan_solve(b)
+            except ValueError:
+                self._gauss_jordan = False
+        return self._gauss_jordan or None
+
+    @gemessen("solve")
+    def löse(self) -> dict[sp.Symbol, sp.Expr]:
+        """
+        Löse das lineare Gleichungssystem exakt.
+
+        Rationale Systeme laufen über die Bareiss-Elimination, Systeme mit
+        irrationalen oder symbolischen Koeffizienten über SymPy (Gauß-Jordan).
 
         Returns:
-            Dictionary mit Parameter-Werten
+            Dictionary mit exakten Parameter-Werten
 
         Raises:
-            LGSKeineLoesungError: Wenn das System keine Lösung hat
+            LGSInkonsistenzError: Wenn sich die Gleichungen widersprechen
             LGSUnendlichVieleLoesungenError: Wenn das System unendlich viele Lösungen hat
-            LGSNumerischeInstabilitaetError: Wenn das System numerisch instabil ist
         """
+        if self._lösung is not None:
+            return self._lösung
+
         # Validierung vor dem Lösen
         warnungen = self.validiere_gleichungen()
         if warnungen:
@@ -269,76 +340,35 @@ class LineareGleichungssystem:
         if not ist_konsistent:
             raise LGSInkonsistenzError(f"Inkonsistentes System: {nachricht}")
 
-        if self._lösung is not None:
-            return self._lösung
-
-        A, b = self.erstelle_matrix_und_vektor()
-
-        # Prüfe die Lösbarkeit
-        if A.rows != A.cols:
-            raise ValueError(
-                f"Rechenfehler: Du hast {self.anzahl_parameter} Unbekannte, "
-                f"aber {self.anzahl_gleichungen} Gleichungen angegeben. "
-                f"Um eine eindeutige Lösung zu finden, brauchst du genauso viele "
-                f"Gleichungen wie Unbekannte."
-            )
-
-        try:
-            # Versuche zu lösen
-            lösung_symbols = sp.linsolve((A, b), self.parameter)
-
-            if lösung_symbols.is_empty:
-                raise LGSKeineLoesungError(
-                    "Logikfehler: Dieses Gleichungssystem hat keine Lösung. "
-                    "Deine Bedingungen widersprechen sich. Überprüfe, ob du "
-                    "zum Beispiel einem Punkt zwei verschiedene y-Werte zugewiesen hast."
+        if not self.ist_rational:
+            loesung, freie = self._löse_symbolisch()
+            if freie:
+                raise LGSUnendlichVieleLoesungenError(
+                    "Information fehlt: Dieses Gleichungssystem hat unendlich viele "
+                    f"Lösungen (frei wählbare Parameter: {len(freie)}). Du hast nicht "
+                    "genügend voneinander unabhängige Bedingungen für eine "
+                    "eindeutige Funktion."
                 )
+            self._lösung = {
+                param: sp.simplify(wert)
+                for param, wert in zip(self.parameter, loesung, strict=True)
+            }
+            return self._lösung
 
-            # Extrahiere die Lösung
-            if hasattr(lösung_symbols, "__iter__") and len(lösung_symbols) > 0:
-                lösung_tuple = list(lösung_symbols)[0]
-
-                if len(lösung_tuple) != len(self.parameter):
-                    raise LGSUnendlichVieleLoesungenError(
-                        "Information fehlt: Dieses Gleichungssystem hat unendlich viele "
-                        "Lösungen. Deine Bedingungen sind nicht alle voneinander abhängig. "
-                        "Du hast nicht genügend Informationen für eine eindeutige Funktion."
-                    )
-
-                # Konvertiere zu Dictionary
-                self._lösung = {}
-                for param, wert in zip(self.parameter, lösung_tuple, strict=False):
-                    if wert.is_number:
-                        self._lösung[param] = float(wert)
-                    else:
-                        self._lösung[param] = wert
-
-            else:
-                raise ValueError("Unerwartete Lösungsform von SymPy")
-
-        except (ValueError, TypeError) as e:
-            # SymPy-spezifische Fehler
-            if "singular" in str(e).lower() or "not invertible" in str(e).lower():
-                raise LGSNumerischeInstabilitaetError(
-                    "Das Gleichungssystem ist nicht eindeutig lösbar. "
-                    "Die Bedingungen sind linear abhängig."
-                )
-            else:
-                raise ValueError(f"SymPy-Lösungsfehler: {str(e)}")
-        except LGSKeineLoesungError:
-            # Lässt unsere eigenen Fehler durchgehen
-            raise
-        except LGSUnendlichVieleLoesungenError:
-            # Lässt unsere eigenen Fehler durchgehen
-            raise
-        except Exception as e:
-            # Unerwartete Fehler
-            raise ValueError(
-                f"Unerwarteter Fehler beim Lösen des Gleichungssystems. "
-                f"Dies könnte auf ein komplexes mathematisches Problem hindeuten. "
-                f"Fehlerdetails: {str(e)}"
+        ergebnis = self.gauss
+        if not ergebnis.ist_eindeutig:
+            freie = ", ".join(str(self.parameter[j]) for j in ergebnis.freie_spalten)
+            raise LGSUnendlichVieleLoesungenError(
+                "Information fehlt: Dieses Gleichungssystem hat unendlich viele "
+                f"Lösungen (Rang {ergebnis.rang} bei {self.anzahl_parameter} Unbekannten, "
+                f"frei wählbar: {freie}). Du hast nicht genügend voneinander "
+                "unabhängige Bedingungen für eine eindeutige Funktion."
             )
 
+        self._lösung = {
+            param: sp.Rational(wert.numerator, wert.denominator)
+            for param, wert in zip(self.parameter, ergebnis.loesung, strict=True)
+        }
         return self._lösung
 
     def löse_für_funktion(self, funktion: ParametrischeFunktionProtocol):
@@ -362,6 +392,102 @@ class LineareGleichungssystem:
                 funktion = funktion.subs(param, wert)
             return funktion
 
+    @property
+    def lu(self) -> LUZerlegung:
+        """
+        Exakte LU-Zerlegung der Koeffizientenmatrix.
+
+        Die Zerlegung wird über die Koeffizientenstruktur gecacht, sodass
+        Systeme mit gleicher Matrix (z.B. feste x-Stellen) sie teilen.
+
+        Raises:
+            LGSNumerischeInstabilitaetError: Wenn die Matrix nicht regulär ist
+            ValueError: Wenn ein Koeffizient nicht rational ist
+        """
+        self._pruefe_rational("Die exakte LU-Zerlegung")
+        A, _ = self.erstelle_matrix_und_vektor()
+        if A.rows != A.cols:
+            raise LGSNumerischeInstabilitaetError(
+                f"Für eine LU-Zerlegung braucht man genauso viele Gleichungen "
+                f"({self.anzahl_gleichungen}) wie Unbekannte ({self.anzahl_parameter})."
+            )
+        try:
+            return lu_zerlegung(
+                [
+                    [Fraction(int(A[i, j].p), int(A[i, j].q)) for j in range(A.cols)]
+                    for i in range(A.rows)
+                ]
+            )
+        except ValueError:
+            raise LGSNumerischeInstabilitaetError(
+                "Das Gleichungssystem ist nicht eindeutig lösbar. "
+                "Die Bedingungen sind linear abhängig."
+            ) from None
+
+    def löse_viele(self, rechte_seiten, numerisch: bool = False) -> np.ndarray:
+        """
+        Löst das System für viele rechte Seiten mit einer einzigen LU-Zerlegung.
+
+        Args:
+            rechte_seiten: k Zeilen mit je einem neuen Wert pro Gleichung,
+                           die anstelle von ``rechte_seite`` eingesetzt werden
+            numerisch: Gleitkomma-Lösung über NumPy statt exakter Brüche
+
+        Returns:
+            Array der Form (k, Anzahl Parameter); Spalten in der Reihenfolge
+            von ``parameter``, exakt als SymPy-Brüche oder als float
+
+        Examples:
+            >>> system = LGS_aus_matrix([[1, 1], [1, -1]])
+            >>> system.löse_viele([[3, 1], [5, 1]])  # [[2, 1], [3, 2]]
+        """
+        lu = self.lu
+        _, b = self.erstelle_matrix_und_vektor()
+
+        # Konstante Terme der linken Seiten verschieben jede rechte Seite gleich
+        versatz = [
+            b[i] - _als_exakt(gl.rechte_seite) for i, gl in enumerate(self.gleichungen)
+        ]
+
+        if numerisch:
+            B = np.atleast_2d(np.asarray(rechte_seiten, dtype=float))
+            return lu.loese_numerisch(B + np.array(versatz, dtype=float))
+
+        loesungen = lu.loese_viele(
+            [
+                [
+                    Fraction(int(w.p), int(w.q))
+                    for w in (
+                        als_rational(y) + v for y, v in zip(zeile, versatz, strict=True)
+                    )
+                ]
+                for zeile in rechte_seiten
+            ]
+        )
+        return np.array(
+            [[sp.Rational(w.numerator, w.denominator) for w in x] for x in loesungen],
+            dtype=object,
+        ).reshape(len(loesungen), self.anzahl_parameter)
+
+    def löse_viele_für_funktion(
+        self, funktion: ParametrischeFunktionProtocol, rechte_seiten
+    ) -> list:
+        """
+        Erstellt für jede rechte Seite eine Funktion mit den gelösten Parametern.
+
+        Args:
+            funktion: Die parametrische Funktion (z.B. a*x^2 + b*x + c)
+            rechte_seiten: k Zeilen mit je einem Wert pro Gleichung
+
+        Returns:
+            Liste von k Funktionen mit eingesetzten Parameterwerten
+        """
+        namen = [str(p) for p in self.parameter]
+        return [
+            funktion.mit_wert(**dict(zip(namen, zeile, strict=True)))
+            for zeile in self.löse_viele(rechte_seiten)
+        ]
+
     def zeige_gleichungen(self):
         """Zeigt die Gleichungen in didaktischer Form"""
         print("Extrahierte Gleichungen:")
@@ -430,35 +556,49 @@ class LineareGleichungssystem:
 
         # Zeige jede Zeile
         for i in range(A.rows):
-            zeile_vals = [f"{A[i, j]:8.3f}" for j in range(A.cols)]
-            print(f"   A = | {'  '.join(zeile_vals)} | {b[i, 0]:8.3f}")
+            zeile_vals = [f"{str(A[i, j]):>8}" for j in range(A.cols)]
+            print(f"   A = | {'  '.join(zeile_vals)} | {str(b[i, 0]):>8}")
 
-        # Schritt 4: Lösbarkeit prüfen
+        if not self.ist_rational:
+            print(
+                "\n4️⃣  Lösungsmethode: Gauß-Jordan mit SymPy (nicht-rationale Koeffizienten)"
+            )
+            print("-" * 30)
+            self._zeige_loesung_und_probe()
+            return
+
+        # Schritt 4: Lösbarkeit prüfen (Ränge aus der Elimination)
+        ergebnis = self.gauss
         print("\n4️⃣  Lösbarkeitsanalyse:")
         print("-" * 30)
-        if A.rows != A.cols:
-            print("   ⚠️  Nicht quadratische Matrix")
-            print(f"   {A.rows} × {A.cols} System")
+        print(f"   Rang(A) = {ergebnis.rang}, Rang(A|b) = {ergebnis.rang_erweitert}")
+        if ergebnis.determinante is not None:
+            print(f"   Determinante: det(A) = {ergebnis.determinante}")
+        if not ergebnis.ist_loesbar:
+            print("   ❌ Rang(A) < Rang(A|b) → Keine Lösung")
+        elif ergebnis.ist_eindeutig:
+            print("   ✅ Rang = Anzahl Unbekannte → Eindeutige Lösung existiert")
         else:
-            try:
-                det = A.det()
-                print(f"   Determinante: det(A) = {det}")
-                if abs(det) < 1e-10:
-                    print("   ❌ Determinante ≈ 0 → Keine eindeutige Lösung")
-                else:
-                    print("   ✅ Determinante ≠ 0 → Eindeutige Lösung existiert")
-            except Exception:
-                print("   ⚠️  Determinante konnte nicht berechnet werden")
-
-        # Schritt 5: Lösung berechnen (wenn möglich)
-        print("\n5️⃣  Lösungsmethode: SymPy linsolve()")
+            print("   ❌ Rang < Anzahl Unbekannte → Keine eindeutige Lösung")
+
+        # Schritt 5: Gauß-Schritte aus der gespeicherten Elimination
+        print("\n5️⃣  Lösungsmethode: Gauß-Elimination (bruchfrei nach Bareiss)")
         print("-" * 30)
+        for schritt in ergebnis.schritte:
+            print(f"   {schritt.beschreibung}:")
+            for zeile in schritt.matrix:
+                links = "  ".join(f"{w:>6}" for w in zeile[:-1])
+                print(f"      | {links} | {zeile[-1]:>6} |")
 
+        self._zeige_loesung_und_probe()
+
+    def _zeige_loesung_und_probe(self):
+        """Zeigt die Lösung und setzt sie zur Probe in alle Gleichungen ein"""
         try:
             lösung = self.löse()
-            print("   ✅ Lösung gefunden:")
+            print("\n   ✅ Lösung gefunden:")
             for param, wert in lösung.items():
-                print(f"      {param} = {wert:.6f}")
+                print(f"      {param} = {wert}")
 
             # Schritt 6: Verifikation
             print("\n6️⃣  Verifikation:")
@@ -466,30 +606,17 @@ class LineareGleichungssystem:
             print("   Einsetzen der Lösung in die ursprünglichen Gleichungen:")
 
             for i, gl in enumerate(self.gleichungen, 1):
-                # Substituiere die Lösung in die linke Seite
-                linke_seite_mit_loesung = gl.linke_seite
-                for param, wert in lösung.items():
-                    linke_seite_mit_loesung = linke_seite_mit_loesung.subs(param, wert)
-
-                # Berechne numerischen Wert
                 try:
-                    wert_links = float(linke_seite_mit_loesung)
-                    wert_rechts = gl.rechte_seite
-                    differenz = abs(wert_links - wert_rechts)
-
-                    if differenz < 1e-10:
-                        status = "✅"
-                    else:
-                        status = "❌"
-
+                    wert_links = gl.linke_seite.subs(lösung)
+                    differenz = sp.simplify(wert_links - _als_exakt(gl.rechte_seite))
+                    status = "✅" if differenz == 0 else "❌"
                     print(
-                        f"   {status} Gleichung {i}: {wert_links:.6f} ≈ {wert_rechts:.6f} (Diff: {differenz:.2e})"
+                        f"   {status} Gleichung {i}: {wert_links} = {gl.rechte_seite}"
                     )
-
-                except Exception:
+                except ValueError:
                     print(f"   ⚠️  Gleichung {i}: Konnte nicht verifiziert werden")
 
-        except Exception as e:
+        except ValueError as e:
             print(f"   ❌ Lösung fehlgeschlagen: {e}")
 
         print("\n" + "=" * 50)
@@ -527,46 +654,48 @@ class LineareGleichungssystem:
                         f"⚠️  Gleichung {i + 1} und {j + 1} haben identische linke Seiten: {text1}"
                     )
 
-        # Prüfe 4: Numerische Stabilität (Konditionszahl)
-        try:
-            A, _ = self.erstelle_matrix_und_vektor()
-            if hasattr(A, "condition_number"):
-                cond = A.condition_number()
-                if cond > 1000:
-                    warnungen.append(
-                        f"⚠️  Schlechte Konditionszahl: {cond:.2e} - numerisch instabil"
-                    )
-        except Exception:
-            pass  # Fehler bei Konditionszahlberechnung ignorieren
-
         return warnungen
 
     def pruefe_konsistenz(self) -> tuple[bool, str]:
         """
-        Prüft die Konsistenz des Gleichungssystems
+        Prüft die Konsistenz des Gleichungssystems über Rang(A) und Rang(A|b)
 
         Returns:
             (ist_konsistent, nachricht) Tuple
         """
-        # Prüfe offensichtliche Widersprüche
-        for i, gl1 in enumerate(self.gleichungen):
-            for j, gl2 in enumerate(self.gleichungen):
-                if i >= j:
-                    continue
-
-                # Prüfe ob linke Seiten gleich aber rechte Seiten unterschiedlich
-                if str(gl1.linke_seite) == str(gl2.linke_seite):
-                    if abs(gl1.rechte_seite - gl2.rechte_seite) > 1e-10:
-                        return (
-                            False,
-                            f"Widerspruch: Gleichung {i + 1} und {j + 1} haben gleiche linke Seiten aber unterschiedliche rechte Seiten",
-                        )
-
-        # Prüfe auf triviale Lösungen (alle Parameter = 0)
-        if all(gl.rechte_seite == 0 for gl in self.gleichungen):
-            return True, "Triviale Lösung möglich (alle Parameter = 0)"
-
-        return True, "System scheint konsistent"
+        if not self.ist_rational:
+            loesung = self._löse_symbolisch()
+            if loesung is None:
+                return False, "Widerspruch: Rang(A) < Rang(A|b)"
+            if loesung[1]:
+                return True, "System ist konsistent, aber unterbestimmt"
+            return True, "System ist konsistent und eindeutig lösbar"
+
+        ergebnis = self.gauss
+
+        if not ergebnis.ist_loesbar:
+            nummer = ergebnis.widerspruch_zeile + 1
+            return (
+                False,
+                f"Widerspruch: Gleichung {nummer} führt nach der Elimination auf "
+                f"0 = c mit c ≠ 0 (Rang(A) = {ergebnis.rang} < "
+                f"Rang(A|b) = {ergebnis.rang_erweitert})",
+            )
+
+        if all(w == 0 for w in self.erstelle_matrix_und_vektor()[1]):
+            return (
+                True,
+                "Homogenes System: Triviale Lösung möglich (alle Parameter = 0)",
+            )
+
+        if not ergebnis.ist_eindeutig:
+            return (
+                True,
+                f"System ist konsistent, aber unterbestimmt (Rang {ergebnis.rang} "
+                f"bei {self.anzahl_parameter} Unbekannten)",
+            )
+
+        return True, "System ist konsistent und eindeutig lösbar"
 
     def __str__(self):
         """String-Darstellung des Gleichungssystems"""
@@ -609,15 +738,23 @@ def LGS(*bedingungen) -> LineareGleichungssystem:
 
 def interpolationspolynom(
     punkte: list[tuple[float, float]],
+    ausfuehrlich: bool = False,
 ):
     """
-    Erzeugt ein Interpolationspolynom durch gegebene Punkte mittels LGS
+    Erzeugt ein Interpolationspolynom durch gegebene Punkte
+
+    Standardmäßig wird das Polynom exakt mit dividierten Differenzen nach
+    Newton berechnet (O(n²), ohne Ausgabe). Punkte mit irrationalen oder
+    symbolischen Koordinaten (sqrt(2), pi, a) löst SymPy über das
+    Vandermonde-System. Mit ``ausfuehrlich=True`` wird zusätzlich der
+    klassische Weg über ein LGS mit Lösungsweg ausgegeben.
 
     Args:
         punkte: Liste von (x, y) Punkten, durch die das Polynom gehen soll
+        ausfuehrlich: Lösungsweg über das LGS ausgeben
 
     Returns:
-        Parametrische Funktion mit den gefundenen Parametern
+        GanzrationaleFunktion durch alle Punkte
 
     Raises:
         ValueError: Wenn zu wenige Punkte oder ungültige Punkte
@@ -636,64 +773,78 @@ def interpolationspolynom(
     if len(punkte) < 2:
         raise ValueError("Mindestens 2 Punkte erforderlich")
 
-    # Bestimme den Grad des Polynoms (n Punkte → n-1 Grad)
-    n = len(punkte)
-    grad = n - 1
-
-    # Importiere benötigte Klassen
-    from .parametrisch import Parameter, ParametrischeFunktion, Variable
+    from .ganzrationale import GanzrationaleFunktion
+    from .interpolation import NewtonInterpolation
 
-    # Erstelle Variable und Parameter
-    x = Variable("x")
-    parameter = [Parameter(f"a{i}") for i in range(grad + 1)]
+    if all(ist_rational(k) for punkt in punkte for k in punkt):
+        interpolation = NewtonInterpolation(punkte)
+        f_konkret = interpolation.als_funktion()
+        wert = interpolation.wert
+    else:
+        x = sp.Symbol("x")
+        ausdruck = _interpolation_symbolisch(punkte, x)
+        f_konkret = GanzrationaleFunktion(ausdruck)
 
-    # Erstelle allgemeine Polynom-Funktion
-    # f(x) = a0 + a1*x + a2*x² + ... + an*x^n
-    koeffizienten = parameter[::-1]  # Umgekehrt, damit a0 Konstante ist
+        def wert(x_wert):
+            return sp.simplify(ausdruck.subs(x, _als_exakt(x_wert)))
 
-    # Fülle mit Nullen auf, wenn nötig
-    while len(koeffizienten) <= grad:
-        koeffizienten.insert(0, 0)
+    if ausfuehrlich:
+        _zeige_interpolation_als_lgs(punkte)
 
-    f = ParametrischeFunktion(koeffizienten, [x])
+        print("\n✅ Gefundenes Interpolationspolynom:")
+        print(f"   f(x) = {f_konkret.term()}")
 
-    # Erstelle Gleichungen aus den Punkten
-    gleichungen = []
-    for _i, (x_wert, y_wert) in enumerate(punkte):
-        gl = f(x_wert) == y_wert
-        gleichungen.append(gl)
+        print("\n🔍 Verifikation:")
+        for x_wert, y_wert in punkte:
+            y_berechnet = wert(x_wert)
+            stimmt = sp.simplify(sp.sympify(y_berechnet) - _als_exakt(y_wert)) == 0
+            status = "✅" if stimmt else "❌"
+            print(f"   {status} f({x_wert}) = {y_berechnet}")
 
-    # Erstelle und löse LGS
-    lgs = LGS(*gleichungen)
+    return f_konkret
 
-    print(f"🔍 Interpolation durch {n} Punkte:")
-    print(f"   Polynomgrad: {grad}")
-    print(f"   Gesuchte Parameter: {', '.join(str(p) for p in parameter)}")
-    print()
 
-    # Zeige Lösungsweg für pädagogischen Wert
-    lgs.zeige_loesungsweg()
+def _interpolation_symbolisch(punkte: list[tuple], x: sp.Symbol) -> sp.Expr:
+    """Löst das Vandermonde-System mit SymPy (für nicht rationale Punkte)"""
+    x_werte = [_als_exakt(x_wert) for x_wert, _ in punkte]
+    for i, x_wert in enumerate(x_werte):
+        if any(sp.simplify(x_wert - frueher) == 0 for frueher in x_werte[:i]):
+            raise ValueError(f"Die Stelle x = {x_wert} ist bereits ein Stützpunkt")
 
-    # Löse das System
-    lösung = lgs.löse()
+    n = len(x_werte)
+    matrix = sp.Matrix(n, n, lambda i, j: x_werte[i] ** j)
+    rechte_seite = sp.Matrix([_als_exakt(y_wert) for _, y_wert in punkte])
+    koeffizienten, _ = matrix.gauss_jordan_solve(rechte_seite)
+    return sp.expand(sum(sp.simplify(k) * x**j for j, k in enumerate(koeffizienten)))
 
-    # Erstelle die konkrete Funktion
-    f_konkret = f.mit_wert(**{str(p): v for p, v in lösung.items()})
 
-    print("\n✅ Gefundenes Interpolationspolynom:")
-    print(f"   f(x) = {f_konkret.term()}")
+def _zeige_interpolation_als_lgs(punkte: list[tuple[float, float]]):
+    """Gibt den Lösungsweg der Interpolation über ein LGS aus"""
+    n = len(punkte)
+    grad = n - 1
 
-    # Verifikation
-    print("\n🔍 Verifikation:")
-    for x_wert, y_wert in punkte:
-        y_berechnet = f_konkret.wert(x_wert)
-        differenz = abs(y_berechnet - y_wert)
-        status = "✅" if differenz < 1e-10 else "❌"
-        print(
-            f"   {status} f({x_wert}) = {y_berechnet:.6f} ≈ {y_wert} (Diff: {differenz:.2e})"
+    x = sp.Symbol("x")
+    parameter = [sp.Symbol(f"a{i}") for i in range(grad + 1)]
+    # f(x) = a0 + a1*x + a2*x² + ... + an*x^n
+    polynom = sum(p * x**i for i, p in enumerate(parameter))
+
+    lgs = LGS(
+        *(
+            LineareGleichung(
+                polynom.subs(x, _als_exakt(x_wert)),
+                _als_exakt(y_wert),
+                f"f({x_wert}) = {y_wert}",
+            )
+            for x_wert, y_wert in punkte
         )
+    )
 
-    return f_konkret
+    print(f"🔍 Interpolation durch {n} Punkte:")
+    print(f"   Polynomgrad: {grad}")
+    print(f"   Gesuchte Parameter: {', '.join(str(p) for p in parameter)}")
+    print()
+
+    lgs.zeige_loesungsweg()
 
 
 # ====================
@@ -813,18 +964,22 @@ def plotte_loesung(
 
 # Zusätzliche Hilfsfunktionen für komplexere Anwendungsfälle
 def LGS_aus_matrix(
-    matrix: list[list[float]], vektor: list[float]
+    matrix: list[list[float]], vektor: list[float] | None = None
 ) -> LineareGleichungssystem:
     """
     Erstellt ein LGS direkt aus einer Matrix und einem Vektor.
 
     Args:
         matrix: Koeffizientenmatrix als Liste von Listen
-        vektor: Ergebnisvektor als Liste
+        vektor: Ergebnisvektor als Liste (Standard: Nullvektor, z.B. wenn die
+                rechten Seiten erst mit ``löse_viele`` übergeben werden)
 
     Returns:
         LineareGleichungssystem-Objekt
     """
+    if vektor is None:
+        vektor = [0] * len(matrix)
+
     # Erstelle symbolische Parameter
     n_params = len(matrix[0]) if matrix else 0
     parameter = [sp.Symbol(f"p{i}") for i in range(n_params)]
@@ -0,0 +1,142 @@
+"""
+Periodische Lösungsscharen trigonometrischer Gleichungen.
+
+`solveset` liefert für sin(3x) = 0 keine Liste, sondern Bildmengen wie
+{2nπ/3 | n ∈ ℤ} ∪ {2nπ/3 + π/3 | n ∈ ℤ}. `PeriodischeLoesung` fasst solche
+Scharen zu Basislösungen in [0, p) und einer gemeinsamen Periode p zusammen
+und zählt die Lösungen in einem Intervall direkt auf: Der Bereich für k
+ergibt sich aus ⌈(a - b)/p⌉ ≤ k ≤ ⌊(e - b)/p⌋, es wird also nichts
+durchprobiert.
+
+Examples:
+    >>> schar = PeriodischeLoesung.aus_menge(sp.solveset(sp.sin(3*x), x, sp.S.Reals))
+    >>> schar
+    PeriodischeLoesung(basen=(0, pi/3), periode=2*pi/3)
+    >>> len(schar.im_intervall(-100, 100))
+    191
+"""
+
+from dataclasses import dataclass
+from math import gcd, lcm
+
+import sympy as sp
+
+# Ausschnitt, den `nullstellen()` von periodischen Nullstellen liefert
+TRIG_BEREICH = (-2 * sp.pi, 2 * sp.pi)
+
+
+@dataclass(frozen=True, slots=True)
+class PeriodischeLoesung:
+    """Lösungsschar {b + k·periode | b ∈ basen, k ∈ ℤ}"""
+
+    basen: tuple[sp.Expr, ...]  # Aufsteigend sortiert, jeweils in [0, periode)
+    periode: sp.Expr  # Exakt und positiv
+
+    @classmethod
+    def aus_menge(cls, menge: sp.Set) -> "PeriodischeLoesung | None":
+        """
+        Erzeugt die Schar aus einem `solveset`-Ergebnis.
+
+        Returns:
+            None, wenn die Menge keine Vereinigung ganzzahlig parametrisierter
+            Bildmengen mit gemeinsamer Periode ist (z.B. ConditionSet)
+        """
+        teile = menge.args if isinstance(menge, sp.Union) else (menge,)
+        scharen = []
+        for teil in teile:
+            schar = _lineare_schar(teil)
+            if schar is None:
+                return None
+            scharen.append(schar)
+        if not scharen:
+            return None
+
+        periode = _gemeinsame_periode([p for _, p in scharen])
+        if periode is None:
+            return None
+
+        basen: list[sp.Expr] = []
+        for basis, p in scharen:
+            for j in range(int(periode / p)):
+                kandidat = _normiere(basis + j * p, periode)
+                if not any(sp.expand(kandidat - b) == 0 for b in basen):
+                    basen.append(kandidat)
+        # Einmal pro Basis numerisch sortieren, danach nur noch exakt rechnen
+        basen.sort(key=lambda b: float(b))
+        return cls(tuple(basen), periode)
+
+    def im_intervall(self, von, bis) -> list[sp.Expr]:
+        """
+        Alle Lösungen in [von, bis], aufsteigend sortiert.
+
+        Args:
+            von: Untere Grenze (exakt oder Zahl)
+            bis: Obere Grenze (exakt oder Zahl)
+        """
+        von, bis = sp.sympify(von), sp.sympify(bis)
+        if bis < von:
+            return []
+        grenzen = [
+            (
+                int(sp.ceiling((von - b) / self.periode)),
+                int(sp.floor((bis - b) / self.periode)),
+            )
+            for b in self.basen
+        ]
+        if not grenzen:
+            return []
+        # Weil alle Basen in [0, p) liegen, ist (k, Basis) bereits sortiert
+        return [
+            b + k * self.periode
+            for k in range(min(u for u, _ in grenzen), max(o for _, o in grenzen) + 1)
+            for b, (unten, oben) in zip(self.basen, grenzen, strict=True)
+            if unten <= k <= oben
+        ]
+
+    def enthaelt(self, wert) -> bool:
+        """Prüft exakt, ob `wert` zur Schar gehört"""
+        rest = _normiere(sp.sympify(wert), self.periode)
+        return any(sp.expand(rest - b) == 0 for b in self.basen)
+
+    def __contains__(self, wert) -> bool:
+        return self.enthaelt(wert)
+
+    def __str__(self) -> str:
+        basen = ", ".join(str(b) for b in self.basen)
+        return f"x ∈ {{{basen}}} + k·{self.periode}, k ∈ ℤ"
+
+
+def _lineare_schar(teil: sp.Set) -> tuple[sp.Expr, sp.Expr] | None:
+    """Zerlegt {a·n + b | n ∈ ℤ} in (b, |a|)"""
+    if not isinstance(teil, sp.ImageSet) or teil.base_sets != (sp.S.Integers,):
+        return None
+    (n,) = teil.lamda.variables
+    ausdruck = sp.expand(teil.lamda.expr)
+    schritt = ausdruck.coeff(n)
+    basis = ausdruck.subs(n, 0)
+    if (
+        schritt == 0
+        or schritt.free_symbols
+        or basis.free_symbols
+        or sp.expand(ausdruck - schritt * n - basis) != 0
+    ):
+        return None
+    return basis, abs(schritt)
+
+
+def _gemeinsame_periode(perioden: list[sp.Expr]) -> sp.Expr | None:
+    """Kleinstes gemeinsames Vielfaches, falls alle Verhältnisse rational sind"""
+    erste = perioden[0]
+    zaehler, nenner = 1, 0
+    for periode in perioden:
+        verhaeltnis = periode / erste
+        if not verhaeltnis.is_Rational:
+            return None
+        zaehler = lcm(zaehler, int(verhaeltnis.p))
+        nenner = gcd(nenner, int(verhaeltnis.q))
+    return erste * sp.Rational(zaehler, nenner)
+
+
+def _normiere(wert: sp.Expr, periode: sp.Expr) -> sp.Expr:
+    """Exakter Vertreter von `wert` in [0, periode)"""
+    return sp.expand(wert - sp.floor(wert / periode) * periode)
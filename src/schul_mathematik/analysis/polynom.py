@@ -0,0 +1,456 @@
+"""
+Dichte Koeffizientendarstellung für Polynome mit rationalen Koeffizienten.
+
+`DichtesPolynom` speichert a_0, ..., a_n exakt als Brüche und zusätzlich als
+Gleitkomma-Spiegel für die Auswertung auf Arrays. Auswerten (Horner),
+Ableiten und Aufleiten kosten O(n), die quadratfreie Zerlegung nach Yun
+liefert alle Vielfachheiten in einem Durchgang. SymPy wird nur für die
+Anzeige und für Polynome mit Parametern oder Gleitkomma-Koeffizienten
+gebraucht; dafür gibt `aus_poly` None zurück.
+
+Examples:
+    >>> p = DichtesPolynom([-4, 0, 1])  # x² - 4
+    >>> p.wert(3)
+    Fraction(5, 1)
+    >>> p.ableitung().koeffizienten
+    (Fraction(0, 1), Fraction(2, 1))
+"""
+
+import math
+from fractions import Fraction
+from functools import cmp_to_key
+
+import sympy as sp
+
+from ..gemeinsam.zahlen import als_bruch
+
+
+def _ohne_fuehrende_nullen(koeffizienten: list[Fraction]) -> tuple[Fraction, ...]:
+    while koeffizienten and koeffizienten[-1] == 0:
+        koeffizienten.pop()
+    return tuple(koeffizienten)
+
+
+class DichtesPolynom:
+    """
+    Polynom a_0 + a_1·x + ... + a_n·x^n mit exakten Koeffizienten.
+
+    Args:
+        koeffizienten: a_0, ..., a_n (aufsteigend), z.B. int, Fraction,
+            SymPy-Zahlen oder Dezimalzahlen (0.1 → 1/10)
+    """
+
+    __slots__ = ("koeffizienten", "_gleitkomma", "_nullstellen")
+
+    def __init__(self, koeffizienten):
+        self.koeffizienten = _ohne_fuehrende_nullen(
+            [als_bruch(k) for k in koeffizienten]
+        )
+        self._gleitkomma = None
+        self._nullstellen = None
+
+    @classmethod
+    def _aus_bruechen(cls, koeffizienten: list[Fraction]) -> "DichtesPolynom":
+        polynom = cls.__new__(cls)
+        polynom.koeffizienten = _ohne_fuehrende_nullen(koeffizienten)
+        polynom._gleitkomma = None
+        polynom._nullstellen = None
+        return polynom
+
+    @classmethod
+    def aus_poly(cls, poly: sp.Poly) -> "DichtesPolynom | None":
+        """
+        Übernimmt die Koeffizienten eines SymPy-Polynoms.
+
+        Returns:
+            None, wenn nicht alle Koeffizienten rational sind (Parameter,
+            Gleitkommazahlen, Wurzeln)
+        """
+        if not (poly.domain.is_ZZ or poly.domain.is_QQ):
+            return None
+        return cls._aus_bruechen(
+            [Fraction(int(k.p), int(k.q)) for k in reversed(poly.all_coeffs())]
+        )
+
+    @property
+    def grad(self) -> int:
+        """Grad des Polynoms (-1 für das Nullpolynom)"""
+        return len(self.koeffizienten) - 1
+
+    @property
+    def gleitkomma(self):
+        """Koeffizienten als float-Array (aufsteigend)"""
+        import numpy as np
+
+        if self._gleitkomma is None:
+            self._gleitkomma = np.array([float(k) for k in self.koeffizienten])
+        return self._gleitkomma
+
+    def wert(self, x) -> Fraction:
+        """Exakter Funktionswert über das Horner-Schema"""
+        x = als_bruch(x)
+        ergebnis = Fraction(0)
+        for k in reversed(self.koeffizienten):
+            ergebnis = ergebnis * x + k
+        return ergebnis
+
+    def auswerten(self, x_werte):
+        """
+        Horner-Schema in Gleitkomma für ganze Arrays.
+
+        Args:
+            x_werte: Einzelne Stelle oder Array von Stellen
+
+        Returns:
+            Array der Funktionswerte
+        """
+        import numpy as np
+
+        x = np.asarray(x_werte, dtype=float)
+        ergebnis = np.zeros_like(x)
+        for k in self.gleitkomma[::-1]:
+            ergebnis = ergebnis * x + k
+        return ergebnis
+
+    def ableitung(self, ordnung: int = 1) -> "DichtesPolynom":
+        """k-te Ableitung in O(n)"""
+        koeffizienten = list(self.koeffizienten)
+        for _ in range(ordnung):
+            koeffizienten = [i * k for i, k in enumerate(koeffizienten)][1:]
+        return DichtesPolynom._aus_bruechen(koeffizienten)
+
+    def stammfunktion(self) -> "DichtesPolynom":
+        """Stammfunktion mit Integrationskonstante 0 in O(n)"""
+        return DichtesPolynom._aus_bruechen(
+            [Fraction(0)] + [k / (i + 1) for i, k in enumerate(self.koeffizienten)]
+        )
+
+    def quadratfreie_zerlegung(self) -> list[tuple["DichtesPolynom", int]]:
+        """
+        Zerlegung f = c · Π q_i^i mit quadratfreien, paarweise teilerfremden q_i.
+
+        Die Nullstellen von q_i sind genau die Nullstellen von f mit
+        Vielfachheit i (Algorithmus von Yun).
+
+        Returns:
+            Paare (q_i, i) mit normierten q_i vom Grad ≥ 1
+        """
+        if self.grad < 1:
+            return []
+        ableitung = self.ableitung()
+        teiler = _ggt(self, ableitung)
+        c = _teile(self, teiler)
+        d = _minus(_teile(ableitung, teiler), c.ableitung())
+        zerlegung = []
+        vielfachheit = 1
+        while c.grad > 0:
+            faktor = _ggt(c, d)
+            if faktor.grad > 0:
+                zerlegung.append((faktor, vielfachheit))
+            c = _teile(c, faktor)
+            d = _minus(_teile(d, faktor), c.ableitung())
+            vielfachheit += 1
+        return zerlegung
+
+    def nullstellen_mit_vielfachheit(self) -> list[tuple["IsolierteNullstelle", int]]:
+        """
+        Alle reellen Nullstellen mit Vielfachheit, aufsteigend sortiert.
+
+        Die Isolationsintervalle bleiben am Polynom gespeichert: spätere
+        Aufrufe (auch mit höherer Genauigkeit) verfeinern sie weiter,
+        statt neu zu beginnen.
+        """
+        if self._nullstellen is None:
+            nullstellen = [
+                (nullstelle, vielfachheit)
+                for faktor, vielfachheit in self.quadratfreie_zerlegung()
+                for nullstelle in faktor._isolierte()
+            ]
+            nullstellen.sort(key=cmp_to_key(lambda a, b: _vergleiche(a[0], b[0])))
+            self._nullstellen = nullstellen
+        return self._nullstellen
+
+    def exakte_nullstellen(self, variable: sp.Symbol) -> list[tuple[sp.Expr, int]]:
+        """
+        Reelle Nullstellen als exakte SymPy-Zahlen mit Vielfachheit (aufsteigend).
+
+        Rationale Nullstellen kommen aus dem Satz über rationale Nullstellen,
+        irrationale aus `sp.roots` für den Restfaktor vom Grad ≤ 4 (Wurzeln)
+        oder als `CRootOf`.
+        """
+        werte: dict[int, sp.Expr] = {}
+        faktoren: dict[int, tuple[DichtesPolynom, list]] = {}
+        for nullstelle, _ in self.nullstellen_mit_vielfachheit():
+            rational = nullstelle.rational()
+            if rational is not None:
+                werte[id(nullstelle)] = sp.Rational(
+                    rational.numerator, rational.denominator
+                )
+            else:
+                faktoren.setdefault(id(nullstelle.polynom), (nullstelle.polynom, []))
+                faktoren[id(nullstelle.polynom)][1].append(nullstelle)
+        for faktor, irrational in faktoren.values():
+            werte.update(faktor._irrationale_werte(irrational, variable))
+        return [
+            (werte[id(nullstelle)], vielfachheit)
+            for nullstelle, vielfachheit in self.nullstellen_mit_vielfachheit()
+        ]
+
+    def _isoliere(self) -> list["IsolierteNullstelle"]:
+        """Isolationsintervalle eines quadratfreien Polynoms (Sturmsche Kette)"""
+        if self.grad < 1:
+            return []
+        kette = self._sturm_kette()
+
+        def wechsel(x: Fraction) -> int:
+            vorzeichen = [w > 0 for w in (p.wert(x) for p in kette) if w != 0]
+            return sum(a != b for a, b in zip(vorzeichen, vorzeichen[1:], strict=False))
+
+        # Cauchy-Schranke: alle Nullstellen liegen echt in (-s, s)
+        fuehrend = abs(self.koeffizienten[-1])
+        schranke = 1 + max(abs(k) for k in self.koeffizienten[:-1]) / fuehrend
+        ergebnis = []
+        stapel = [(-schranke, schranke, wechsel(-schranke), wechsel(schranke))]
+        while stapel:
+            a, b, wa, wb = stapel.pop()
+            if wa - wb == 1:
+                ergebnis.append(IsolierteNullstelle(self, a, b))
+                continue
+            if wa - wb == 0:
+                continue
+            mitte = (a + b) / 2
+            if self.wert(mitte) != 0:
+                wm = wechsel(mitte)
+                stapel += [(a, mitte, wa, wm), (mitte, b, wm, wb)]
+                continue
+            # Treffer: exakte Nullstelle, Nachbarschaft ohne weitere Nullstelle
+            ergebnis.append(IsolierteNullstelle(self, mitte, mitte))
+            abstand = (b - a) / 4
+            while True:
+                links, rechts = mitte - abstand, mitte + abstand
+                if (
+                    self.wert(links) != 0
+                    and self.wert(rechts) != 0
+                    and wechsel(links) - wechsel(rechts) == 1
+                ):
+                    break
+                abstand /= 2
+            stapel += [
+                (a, links, wa, wechsel(links)),
+                (rechts, b, wechsel(rechts), wb),
+            ]
+        return sorted(ergebnis, key=lambda n: n.intervall[0])
+
+    def _sturm_kette(self) -> list["DichtesPolynom"]:
+        kette = [self, self.ableitung()]
+        while kette[-1].grad > 0:
+            rest = _division_mit_rest(kette[-2], kette[-1])[1]
+            if rest.grad < 0:
+                break
+            kette.append(DichtesPolynom._aus_bruechen([-k for k in rest.koeffizienten]))
+        return kette
+
+    def _leitkoeffizient_ganzzahlig(self) -> int:
+        """Leitkoeffizient des primitiven ganzzahligen Vielfachen"""
+        nenner = math.lcm(*(k.denominator for k in self.koeffizienten))
+        ganz = [int(k * nenner) for k in self.koeffizienten]
+        return abs(ganz[-1]) // math.gcd(*ganz)
+
+    def _irrationale_werte(
+        self, irrational: list["IsolierteNullstelle"], variable: sp.Symbol
+    ) -> dict[int, sp.Expr]:
+        """Exakte Werte der irrationalen Nullstellen dieses quadratfreien Faktors"""
+        rest = self
+        for nullstelle in self._isolierte():
+            rational = nullstelle.rational()
+            if rational is not None:
+                rest = _teile(rest, DichtesPolynom._aus_bruechen([-rational, 1]))
+
+        if rest.grad <= 4:
+            wurzeln = [w for w in sp.roots(rest.als_poly(variable)) if w.is_real]
+            if len(wurzeln) == len(irrational):
+                # Zuordnung über die Isolationsintervalle, nicht über Rundung
+                zuordnung = {}
+                for nullstelle in irrational:
+                    a, b = nullstelle.verfeinere(Fraction(1, 10**20))
+                    unten = sp.Rational(a.numerator, a.denominator)
+                    oben = sp.Rational(b.numerator, b.denominator)
+                    for w in wurzeln:
+                        if unten <= sp.N(w, 30) <= oben:
+                            zuordnung[id(nullstelle)] = w
+                            break
+                if len(zuordnung) == len(irrational):
+                    return zuordnung
+
+        # Index der reellen Nullstelle innerhalb dieses Faktors (aufsteigend)
+        poly = self.als_poly(variable)
+        alle = self._isolierte()
+        return {
+            id(nullstelle): sp.CRootOf(poly, alle.index(nullstelle))
+            for nullstelle in irrational
+        }
+
+    def _isolierte(self) -> list["IsolierteNullstelle"]:
+        """Isolierte Nullstellen dieses (quadratfreien) Polynoms, gespeichert"""
+        if self._nullstellen is None:
+            self._nullstellen = [(n, 1) for n in self._isoliere()]
+        return [n for n, _ in self._nullstellen]
+
+    def als_ausdruck(self, variable: sp.Symbol) -> sp.Expr:
+        """Ausmultiplizierter SymPy-Ausdruck (für Anzeige und Sonderfälle)"""
+        return sp.Add(
+            *(
+                sp.Rational(k.numerator, k.denominator) * variable**i
+                for i, k in enumerate(self.koeffizienten)
+                if k
+            )
+        )
+
+    def als_poly(self, variable: sp.Symbol) -> sp.Poly:
+        """SymPy-Polynom über ℚ"""
+        return sp.Poly(
+            [
+                sp.Rational(k.numerator, k.denominator)
+                for k in reversed(self.koeffizienten)
+            ]
+            or [0],
+            variable,
+            domain=sp.QQ,
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DichtesPolynom):
+            return NotImplemented
+        return self.koeffizienten == other.koeffizienten
+
+    def __hash__(self) -> int:
+        return hash(self.koeffizienten)
+
+    def __repr__(self) -> str:
+        return f"DichtesPolynom({[str(k) for k in self.koeffizienten]})"
+
+
+_UNBEKANNT = object()
+
+
+class IsolierteNullstelle:
+    """
+    Reelle Nullstelle eines quadratfreien Polynoms mit Isolationsintervall.
+
+    Das offene Intervall (links, rechts) enthält genau diese Nullstelle, an
+    den Rändern hat das Polynom verschiedene Vorzeichen; bei links == rechts
+    ist der Wert exakt. Verfeinert wird bei Bedarf durch Bisektion, das
+    schmalere Intervall bleibt gespeichert.
+    """
+
+    __slots__ = ("polynom", "intervall", "_rational")
+
+    def __init__(self, polynom: DichtesPolynom, links: Fraction, rechts: Fraction):
+        self.polynom = polynom
+        self.intervall = (links, rechts)
+        self._rational = links if links == rechts else _UNBEKANNT
+
+    def verfeinere(self, breite: Fraction) -> tuple[Fraction, Fraction]:
+        """Halbiert das Intervall, bis es höchstens `breite` breit ist"""
+        a, b = self.intervall
+        if b - a <= breite:
+            return a, b
+        links_positiv = self.polynom.wert(a) > 0
+        while b - a > breite:
+            mitte = (a + b) / 2
+            wert = self.polynom.wert(mitte)
+            if wert == 0:
+                a = b = mitte
+            elif (wert > 0) == links_positiv:
+                a = mitte
+            else:
+                b = mitte
+        # Eine Zuweisung: gleichzeitige Leser sehen altes oder neues Intervall
+        self.intervall = (a, b)
+        return a, b
+
+    def rational(self) -> Fraction | None:
+        """
+        Exakter Wert, falls die Nullstelle rational ist.
+
+        Nach dem Satz über rationale Nullstellen ist jede rationale Nullstelle
+        p/q mit q | Leitkoeffizient L, also von der Form k/L. Ist das
+        Intervall schmaler als 1/(2L), kommt nur ein k infrage.
+        """
+        if self._rational is _UNBEKANNT:
+            nenner = self.polynom._leitkoeffizient_ganzzahlig()
+            a, b = self.verfeinere(Fraction(1, 2 * nenner))
+            kandidat = Fraction(math.ceil(a * nenner), nenner)
+            if a == b:
+                self._rational = a
+            elif kandidat < b and self.polynom.wert(kandidat) == 0:
+                self._rational = kandidat
+            else:
+                self._rational = None
+        return self._rational
+
+    def naeherung(self, stellen: int = 15) -> Fraction:
+        """Mittelpunkt eines Intervalls der Breite ≤ 10^-stellen"""
+        a, b = self.verfeinere(Fraction(1, 10**stellen))
+        return (a + b) / 2
+
+    def __repr__(self) -> str:
+        a, b = self.intervall
+        return f"IsolierteNullstelle({float(a)}, {float(b)})"
+
+
+def _vergleiche(a: IsolierteNullstelle, b: IsolierteNullstelle) -> int:
+    """Ordnet verschiedene Nullstellen, indem überlappende Intervalle verfeinert werden"""
+    while True:
+        a_links, a_rechts = a.intervall
+        b_links, b_rechts = b.intervall
+        if a_rechts <= b_links:
+            return -1
+        if b_rechts <= a_links:
+            return 1
+        a.verfeinere((a_rechts - a_links) / 2)
+        b.verfeinere((b_rechts - b_links) / 2)
+
+
+def _minus(p: DichtesPolynom, q: DichtesPolynom) -> DichtesPolynom:
+    laenge = max(len(p.koeffizienten), len(q.koeffizienten))
+    a = p.koeffizienten + (Fraction(0),) * (laenge - len(p.koeffizienten))
+    b = q.koeffizienten + (Fraction(0),) * (laenge - len(q.koeffizienten))
+    return DichtesPolynom._aus_bruechen([x - y for x, y in zip(a, b, strict=True)])
+
+
+def _division_mit_rest(
+    p: DichtesPolynom, q: DichtesPolynom
+) -> tuple[DichtesPolynom, DichtesPolynom]:
+    if q.grad < 0:
+        raise ZeroDivisionError("Division durch das Nullpolynom")
+    rest = list(p.koeffizienten)
+    quotient = [Fraction(0)] * max(p.grad - q.grad + 1, 0)
+    fuehrend = q.koeffizienten[-1]
+    for i in range(len(quotient) - 1, -1, -1):
+        faktor = rest[i + q.grad] / fuehrend
+        quotient[i] = faktor
+        if faktor:
+            for j, k in enumerate(q.koeffizienten):
+                rest[i + j] -= faktor * k
+    return (
+        DichtesPolynom._aus_bruechen(quotient),
+        DichtesPolynom._aus_bruechen(rest[: q.grad] if q.grad > 0 else []),
+    )
+
+
+def _teile(p: DichtesPolynom, q: DichtesPolynom) -> DichtesPolynom:
+    """Exakte Division (q teilt p)"""
+    return _division_mit_rest(p, q)[0]
+
+
+def _normiert(p: DichtesPolynom) -> DichtesPolynom:
+    fuehrend = p.koeffizienten[-1]
+    return DichtesPolynom._aus_bruechen([k / fuehrend for k in p.koeffizienten])
+
+
+def _ggt(p: DichtesPolynom, q: DichtesPolynom) -> DichtesPolynom:
+    """Normierter größter gemeinsamer Teiler (euklidischer Algorithmus)"""
+    while q.grad >= 0:
+        p, q = q, _division_mit_rest(p, q)[1]
+    return _normiert(p) if p.grad >= 0 else p
@@ -22,6 +22,8 @@ class QuadratischeFunktion(GanzrationaleFunktion):
         >>> h = QuadratischeFunktion(a=1, b=-4, c=3)  # x² - 4x + 3
     """
 
+    __slots__ = ("_a", "_b", "_c")
+
     def __init__(
         self,
         eingabe: str | list[float] | dict[int, float] | sp.Basic | None = None,
@@ -87,6 +89,23 @@ class QuadratischeFunktion(GanzrationaleFunktion):
                 "Hast du vielleicht eine lineare Funktion (ohne x²) oder eine höhergradige Funktion gemeint?"
             )
 
+    def _zustand_als_dict(self) -> dict:
+        zustand = super()._zustand_als_dict()
+        if self._a is not None:
+            zustand["a"], zustand["b"], zustand["c"] = self._a, self._b, self._c
+        return zustand
+
+    def _stelle_zustand_wieder_her(self, daten: dict) -> None:
+        super()._stelle_zustand_wieder_her(daten)
+        self._a = daten.get("a")
+        self._b = daten.get("b")
+        self._c = daten.get("c")
+
+    def _term_geaendert(self) -> None:
+        super()._term_geaendert()
+        # a, b und c aus dem Konstruktor gelten nicht mehr
+        self._a = self._b = self._c = None
+
     @property
     def oeffnungsfaktor(self) -> float | sp.Basic:
         """Gibt den Öffnungsfaktor a zurück"""
@@ -17,13 +17,15 @@ from typing import Any
 import numpy as np
 import plotly.graph_objects as go
 import sympy as sp
-from sympy import solve, symbols
+from sympy import symbols
 
-from .config import config
+from ..gemeinsam.zahlen import als_bruch, ist_gleitkomma, ist_rational
+from .config import aktuelle_konfiguration
 from .errors import (
     SchulAnalysisError,
 )
 from .ganzrationale import GanzrationaleFunktion
+from .interpolation import hermite_koeffizienten, hermite_koeffizienten_symbolisch
 
 
 class SchmiegkurvenError(SchulAnalysisError):
@@ -142,63 +144,103 @@ class Schmiegkurve:
 
     def _erstelle_schmiegkurve(self) -> GanzrationaleFunktion:
         """
-        Erstellt die Schmiegkurve durch Lösung des linearen Gleichungssystems.
+        Erstellt die Schmiegkurve über das konfluente Vandermonde-System.
+
+        Jede Bedingung f(x_i) = y_i bzw. f'(x_i) = m_i ist direkt eine exakte
+        Matrixzeile; freie Koeffizienten bei unterbestimmten Systemen bleiben
+        als Parameter a_j im Ergebnis stehen. Rationale Bedingungen werden mit
+        Brüchen gelöst, Parameter und irrationale Zahlen mit SymPy.
 
         Returns:
             Die resultierende ganzrationale Funktion
         """
         x = symbols("x")
 
-        # Erstelle allgemeines Polynom vom Grad self.grad
-        koeffizienten = [sp.symbols(f"a_{i}") for i in range(self.grad + 1)]
-        polynom = sum(a * x**i for i, a in enumerate(koeffizienten))
-
-        # Erstelle Gleichungssystem
-        gleichungen = []
-
-        # Punktbedingungen: f(x_i) = y_i
-        for x_i, y_i in self.punkte:
-            gleichung = polynom.subs(x, x_i) - y_i  # type: ignore
-            gleichungen.append(gleichung)
+        # Bedingungen als (Stelle, Ableitungsordnung, Wert)
+        bedingungen = [(x_i, 0, y_i) for x_i, y_i in self.punkte]
 
         # Tangentenbedingungen: f'(x_i) = t_i
-        if self.tangenten:
-            ableitung = polynom.diff(x)  # type: ignore
-            for i, (x_i, _) in enumerate(self.punkte):
-                if self.tangenten[i] is not None:
-                    gleichung = ableitung.subs(x, x_i) - self.tangenten[i]
-                    gleichungen.append(gleichung)
+        for i, (x_i, _) in enumerate(self.punkte):
+            if self.tangenten and self.tangenten[i] is not None:
+                bedingungen.append((x_i, 1, self.tangenten[i]))
 
         # Normalenbedingungen: f'(x_i) = -1/n_i (da n * t = -1)
-        if self.normalen:
-            ableitung = polynom.diff(x)  # type: ignore
-            for i, (x_i, _) in enumerate(self.punkte):
-                if self.normalen[i] is not None:
-                    if self.normalen[i] == 0:
-                        raise UngueltigePunkteError(
-                            f"An Punkt {i}: Normale kann nicht horizontal sein"
-                        )
-                    tangente_aus_normale = -1 / self.normalen[i]
-                    gleichung = ableitung.subs(x, x_i) - tangente_aus_normale
-                    gleichungen.append(gleichung)
+        for i, (x_i, _) in enumerate(self.punkte):
+            if self.normalen and self.normalen[i] is not None:
+                if self.normalen[i] == 0:
+                    raise UngueltigePunkteError(
+                        f"An Punkt {i}: Normale kann nicht horizontal sein"
+                    )
+                normale = self.normalen[i]
+                if ist_gleitkomma(normale):
+                    tangente = -1 / normale
+                elif ist_rational(normale):
+                    tangente = -1 / als_bruch(normale)
+                else:
+                    tangente = -1 / sp.sympify(normale)
+                bedingungen.append((x_i, 1, tangente))
 
-        # Löse das Gleichungssystem
-        try:
-            loesung = solve(gleichungen, koeffizienten, dict=True)
+        if all(ist_rational(x_i) and ist_rational(w) for x_i, _, w in bedingungen):
+            loesung = hermite_koeffizienten(bedingungen, self.grad)
+        else:
+            loesung = hermite_koeffizienten_symbolisch(bedingungen, self.grad)
+        if loesung is None:
+            raise KeineLoesungError(
+                "Fehler bei Lösung des Gleichungssystems: "
+                "Keine Lösung für das Gleichungssystem gefunden"
+            )
+        partikulaer, richtungen = loesung
 
-            if not loesung:
-                raise KeineLoesungError(
-                    "Keine Lösung für das Gleichungssystem gefunden"
-                )
+        # Gleitkomma-Eingaben liefern wie bisher Gleitkomma-Koeffizienten
+        gleitkomma = any(
+            ist_gleitkomma(wert) for bedingung in bedingungen for wert in bedingung
+        )
 
-            # Setze die Lösung in das Polynom ein
-            geloestes_polynom = polynom.subs(loesung[0])  # type: ignore
+        koeffizienten = []
+        for i, wert in enumerate(partikulaer):
+            koeffizient = sp.sympify(wert)
+            if gleitkomma:
+                koeffizient = sp.N(koeffizient)
+            for j, richtung in richtungen.items():
+                if richtung[i]:
+                    koeffizient += sp.sympify(richtung[i]) * sp.Symbol(f"a_{j}")
+            koeffizienten.append(koeffizient)
 
-            # Konvertiere zu ganzrationaler Funktion
-            return GanzrationaleFunktion(geloestes_polynom)
+        polynom = sum(k * x**i for i, k in enumerate(koeffizienten))
+        return GanzrationaleFunktion(polynom)
 
-        except Exception as e:
-            raise KeineLoesungError(f"Fehler bei Lösung des Gleichungssystems: {e}")
+    @classmethod
+    def viele(
+        cls,
+        punkte_mengen: list[list[tuple[float, float]]],
+        tangenten_mengen: list[list[float | None]] | None = None,
+        normalen_mengen: list[list[float | None]] | None = None,
+        grad: int | None = None,
+    ) -> list["Schmiegkurve"]:
+        """
+        Erzeugt viele Schmiegkurven auf einmal, z.B. für Aufgabenvarianten.
+
+        Bedingungssätze mit gleichen x-Stellen und gleicher Art von Bedingungen
+        führen auf dieselbe Matrix, die nur einmal LU-zerlegt wird.
+
+        Args:
+            punkte_mengen: Für jede Kurve eine Liste von (x, y) Punkten
+            tangenten_mengen: Für jede Kurve optionale Tangentensteigungen
+            normalen_mengen: Für jede Kurve optionale Normalensteigungen
+            grad: Gemeinsamer Grad (wird sonst je Kurve bestimmt)
+
+        Returns:
+            Liste von Schmiegkurven in derselben Reihenfolge
+        """
+        anzahl = len(punkte_mengen)
+        tangenten_mengen = tangenten_mengen or [None] * anzahl
+        normalen_mengen = normalen_mengen or [None] * anzahl
+        return [
+            cls(punkte, tangenten=tangenten, normalen=normalen, grad=grad)
+            for punkte, tangenten, normalen in zip(
+                punkte_mengen, tangenten_mengen, normalen_mengen, strict=True
+            )
+        ]
 
     @classmethod
     def schmiegparabel(
@@ -457,6 +499,7 @@ class Schmiegkurve:
         x_kurve = np.linspace(x_range[0], x_range[1], punkte)
         y_kurve = [self.wert(x) for x in x_kurve]
 
+        konfig = aktuelle_konfiguration()
         fig = go.Figure()
 
         # Hauptkurve
@@ -466,7 +509,7 @@ class Schmiegkurve:
                 y=y_kurve,
                 mode="lines",
                 name=f"Schmiegkurve: {self.term}",
-                line={"color": config.COLORS["primary"], "width": 3},
+                line={"color": konfig.COLORS["primary"], "width": 3},
             )
         )
 
@@ -482,7 +525,7 @@ class Schmiegkurve:
                     mode="markers",
                     name="Stützpunkte",
                     marker={
-                        "color": config.COLORS["secondary"],
+                        "color": konfig.COLORS["secondary"],
                         "size": 10,
                         "symbol": "circle",
                     },
@@ -513,7 +556,7 @@ class Schmiegkurve:
                             mode="lines",
                             name=f"Tangente bei P{i + 1}",
                             line={
-                                "color": config.COLORS["tertiary"],
+                                "color": konfig.COLORS["tertiary"],
                                 "width": 2,
                                 "dash": "dash",
                             },
@@ -522,15 +565,15 @@ class Schmiegkurve:
 
         # Layout konfigurieren
         fig.update_layout(
-            **config.get_plot_config(),
+            **konfig.get_plot_config(),
             title=kwargs.get("title", f"Schmiegkurve durch {len(self.punkte)} Punkte"),
             xaxis={
-                **config.get_axis_config(mathematical_mode=True),
+                **konfig.get_axis_config(mathematical_mode=True),
                 "range": x_range,
                 "title": "x",
             },
             yaxis={
-                **config.get_axis_config(mathematical_mode=False),
+                **konfig.get_axis_config(mathematical_mode=False),
                 "title": f"f(x) = {self.term}",
             },
         )
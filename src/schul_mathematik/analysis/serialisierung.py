@@ -0,0 +1,241 @@
+"""
+Kompakte Serialisierung von Funktionen und Analyseergebnissen.
+
+Ein Funktionsobjekt trägt neben dem Term Listen von Variablen und Parametern,
+mehrere Caches und typspezifischen Zustand (Koeffizienten, Strukturanalyse,
+Komponenten). Für den Transport zwischen Prozessen wird nur der kanonische
+Ausdruck in einer Präfixform übertragen - verschachtelte Tupel aus
+SymPy-Klassennamen und Argumenten - plus der Zustand, der sich nicht billig
+neu berechnen lässt. Beim Laden wird weder geparst noch neu klassifiziert.
+
+Die Präfixform ist JSON-kompatibel (Listen statt Tupel werden akzeptiert):
+
+    x^2 - 4           →  ("Add", ("Pow", ("Symbol", "x"), 2), -4)
+    sin(x)/2          →  ("Mul", ("Rational", 1, 2), ("sin", ("Symbol", "x")))
+
+Examples:
+    >>> daten = Funktion("x^3 - 3*x").to_dict(mit_ergebnissen=True)
+    >>> g = Funktion.from_dict(daten)
+    >>> h = pickle.loads(pickle.dumps(g))   # nutzt dieselbe Darstellung
+"""
+
+from typing import Any
+
+import sympy as sp
+
+FORMAT_VERSION = 1
+
+
+# =============================================================================
+# PRÄFIXFORM FÜR SYMPY-AUSDRÜCKE
+# =============================================================================
+
+
+def ausdruck_zu_praefix(ausdruck: Any) -> Any:
+    """
+    Wandelt einen SymPy-Ausdruck in die kompakte Präfixform um.
+
+    Args:
+        ausdruck: SymPy-Ausdruck (oder int)
+
+    Returns:
+        int für ganze Zahlen, sonst ein Tupel (Kopf, *Argumente)
+
+    Raises:
+        ValueError: Bei Ausdrücken ohne Entsprechung im sympy-Namensraum
+    """
+    if isinstance(ausdruck, int):
+        return ausdruck
+    if isinstance(ausdruck, sp.Integer):
+        return int(ausdruck)
+    if isinstance(ausdruck, sp.Rational):
+        return ("Rational", int(ausdruck.p), int(ausdruck.q))
+    if isinstance(ausdruck, sp.Float):
+        vorzeichen, mantisse, exponent, bits = ausdruck._mpf_
+        return ("Float", vorzeichen, int(mantisse), exponent, bits, ausdruck._prec)
+    if isinstance(ausdruck, sp.Symbol):
+        annahmen = getattr(ausdruck, "_assumptions_orig", None)
+        if type(ausdruck) is not sp.Symbol:
+            raise ValueError(
+                f"Symbol-Typ '{type(ausdruck).__name__}' nicht unterstützt"
+            )
+        if annahmen:
+            return ("Symbol", ausdruck.name, dict(annahmen))
+        return ("Symbol", ausdruck.name)
+
+    name = type(ausdruck).__name__
+    if ausdruck.is_Atom:
+        if getattr(sp.S, name, None) is not ausdruck:
+            raise ValueError(f"Atom '{ausdruck}' kann nicht serialisiert werden")
+        return ("S", name)
+    if getattr(sp, name, None) is not type(ausdruck):
+        raise ValueError(f"Ausdruckstyp '{name}' kann nicht serialisiert werden")
+    return (name, *(ausdruck_zu_praefix(argument) for argument in ausdruck.args))
+
+
+def praefix_zu_ausdruck(praefix: Any) -> sp.Basic:
+    """
+    Baut einen SymPy-Ausdruck aus der Präfixform wieder auf (ohne Parser).
+
+    Args:
+        praefix: Ergebnis von `ausdruck_zu_praefix` (auch nach JSON-Rundreise)
+
+    Returns:
+        Der ursprüngliche SymPy-Ausdruck
+
+    Raises:
+        ValueError: Bei unbekannten Köpfen
+    """
+    if isinstance(praefix, int):
+        return sp.Integer(praefix)
+
+    kopf, *argumente = praefix
+    if kopf == "Symbol":
+        name, *annahmen = argumente
+        return sp.Symbol(name, **(annahmen[0] if annahmen else {}))
+    if kopf == "Rational":
+        return sp.Rational(*argumente)
+    if kopf == "Float":
+        *mpf, genauigkeit = argumente
+        return sp.Float._new(tuple(mpf), genauigkeit)
+    if kopf == "S":
+        return getattr(sp.S, argumente[0])
+
+    klasse = getattr(sp, kopf, None)
+    if not (isinstance(klasse, type) and issubclass(klasse, sp.Basic)):
+        raise ValueError(f"Unbekannter Ausdruckstyp '{kopf}'")
+    argumente = [praefix_zu_ausdruck(argument) for argument in argumente]
+    try:
+        # Die Argumente stammen aus einem fertigen Ausdruck: erneutes Auswerten
+        # wäre unnötige Arbeit und könnte die Darstellung verändern
+        return klasse(*argumente, evaluate=False)
+    except TypeError:
+        return klasse(*argumente)
+
+
+# =============================================================================
+# FUNKTIONEN
+# =============================================================================
+
+
+def _funktionsklassen() -> dict[str, type]:
+    from .exponential import ExponentialFunktion
+    from .funktion import Funktion
+    from .ganzrationale import GanzrationaleFunktion
+    from .lineare import LineareFunktion
+    from .quadratisch import QuadratischeFunktion
+    from .strukturiert import (
+        KompositionFunktion,
+        ProduktFunktion,
+        QuotientFunktion,
+        SummeFunktion,
+    )
+    from .trigonometrisch import TrigonometrischeFunktion
+
+    return {
+        klasse.__name__: klasse
+        for klasse in (
+            Funktion,
+            GanzrationaleFunktion,
+            LineareFunktion,
+            QuadratischeFunktion,
+            ExponentialFunktion,
+            TrigonometrischeFunktion,
+            ProduktFunktion,
+            SummeFunktion,
+            QuotientFunktion,
+            KompositionFunktion,
+        )
+    }
+
+
+def funktion_zu_dict(funktion, mit_ergebnissen: bool = False) -> dict[str, Any]:
+    """
+    Kompakte Darstellung einer Funktion (siehe `Funktion.to_dict`).
+
+    Args:
+        funktion: Beliebiges Funktionsobjekt des Frameworks
+        mit_ergebnissen: Gecachte Nullstellen und Ableitungen mitnehmen
+    """
+    from .funktion import FunktionsAusdruck
+
+    # Verzögerte Rechenergebnisse werden als ihre typisierte Funktion gespeichert
+    if isinstance(funktion, FunktionsAusdruck):
+        funktion = funktion.materialisiere()
+
+    typ = type(funktion).__name__
+    if _funktionsklassen().get(typ) is not type(funktion):
+        raise ValueError(f"Funktionstyp '{typ}' kann nicht serialisiert werden")
+
+    daten = {
+        "version": FORMAT_VERSION,
+        "typ": typ,
+        "term": ausdruck_zu_praefix(funktion.term_sympy),
+        "variable": str(funktion._variable_symbol),
+        **funktion._zustand_als_dict(),
+    }
+    if funktion.name is not None:
+        daten["name"] = funktion.name
+    if mit_ergebnissen:
+        ergebnisse = _ergebnisse_als_dict(funktion)
+        if ergebnisse:
+            daten["ergebnisse"] = ergebnisse
+    return daten
+
+
+def funktion_aus_dict(daten: dict[str, Any]):
+    """
+    Stellt eine Funktion aus `funktion_zu_dict` wieder her (siehe `Funktion.from_dict`).
+
+    Raises:
+        ValueError: Bei unbekannter Formatversion oder unbekanntem Typ
+    """
+    if daten.get("version") != FORMAT_VERSION:
+        raise ValueError(
+            f"Serialisierungsformat {daten.get('version')} wird nicht unterstützt "
+            f"(erwartet: {FORMAT_VERSION})"
+        )
+    klasse = _funktionsklassen().get(daten["typ"])
+    if klasse is None:
+        raise ValueError(f"Unbekannter Funktionstyp '{daten['typ']}'")
+
+    # Weder __new__ (Typerkennung) noch __init__ (Parser) durchlaufen
+    funktion = object.__new__(klasse)
+    funktion._stelle_zustand_wieder_her(daten)
+    if "ergebnisse" in daten:
+        _ergebnisse_wiederherstellen(funktion, daten["ergebnisse"])
+    return funktion
+
+
+def _ergebnisse_als_dict(funktion) -> dict[str, Any]:
+    ergebnisse: dict[str, Any] = {}
+    nullstellen = getattr(funktion, "_nullstellen_cache", None)
+    if nullstellen is not None:
+        ergebnisse["nullstellen"] = [
+            (ausdruck_zu_praefix(n.x), n.multiplicitaet, n.exakt) for n in nullstellen
+        ]
+    ableitungen = getattr(funktion, "_ableitung_cache", None)
+    if ableitungen:
+        ergebnisse["ableitungen"] = {
+            str(ordnung): funktion_zu_dict(ableitung)
+            for (ordnung, _), ableitung in ableitungen.items()
+        }
+    return ergebnisse
+
+
+def _ergebnisse_wiederherstellen(funktion, ergebnisse: dict[str, Any]) -> None:
+    from .sympy_types import Nullstelle
+
+    if "nullstellen" in ergebnisse:
+        funktion._nullstellen_cache = [
+            Nullstelle(praefix_zu_ausdruck(x), multiplicitaet, exakt)
+            for x, multiplicitaet, exakt in ergebnisse["nullstellen"]
+        ]
+    if "ableitungen" in ergebnisse:
+        funktion._ableitung_cache = {
+            (int(ordnung), id(funktion)): funktion_aus_dict(ableitung)
+            for ordnung, ableitung in ergebnisse["ableitungen"].items()
+        }
+        funktion._ableitung_cache_max_size = 50
+        funktion._ableitung_cache_hits = 0
+        funktion._ableitung_cache_misses = 0
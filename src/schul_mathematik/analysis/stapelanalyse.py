@@ -0,0 +1,304 @@
+"""
+Stapelverarbeitung: Kurvendiskussionen für viele Funktionen parallel.
+
+Für Arbeitsblätter und Lösungsschlüssel mit hunderten Funktionen verteilt
+`analysiere_viele` komplette Analysen auf einen Prozesspool. Terme werden im
+Worker-Prozess geparst, Funktionsobjekte über ihre kompakte Serialisierung
+(`Funktion.to_dict`) übertragen; zurück kommt nur ein kompaktes,
+picklebares `Analyseergebnis` (Strings, Zahlen, Tupel, Dicts). Ergebnisse werden in
+der Reihenfolge ihrer Fertigstellung geliefert.
+
+Fehler bleiben auf ihren Term beschränkt: Ausnahmen landen in
+`Analyseergebnis.fehler`, ein Zeitlimit bricht nur den betroffenen Term ab,
+und stürzt ein Worker-Prozess ab, werden die offenen Terme einzeln (nacheinander)
+in neuen Prozessen wiederholt. Eingaben, die sich nicht in einen Term umwandeln
+lassen, liefern ein Ergebnis mit Fehler statt den Stapel abzubrechen.
+
+Examples:
+    >>> terme = ["x^3 - 3*x", "x^4 - 2*x^2", "(x^2 + 1)/(x - 1)"]
+    >>> for ergebnis in analysiere_viele(terme, workers=4, timeout=10):
+    ...     print(ergebnis.term, ergebnis.werte["nullstellen"])
+"""
+
+import os
+import signal
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from typing import Any
+
+import sympy as sp
+
+
+def _ableitung(f):
+    return f.ableitung()
+
+
+def _extrempunkte(f):
+    return f.extrempunkte_optimiert()
+
+
+def _wendepunkte(f):
+    return f.wendepunkte_optimiert()
+
+
+def _graph(f):
+    from .visualisierung import Graph
+
+    return Graph(f)
+
+
+def _api(name: str) -> Callable[[Any], Any]:
+    def aspekt(f):
+        from . import api
+
+        return getattr(api, name)(f)
+
+    return aspekt
+
+
+# Name des Aspekts → Berechnung auf der Funktion
+ASPEKTE: dict[str, Callable[[Any], Any]] = {
+    "nullstellen": _api("Nullstellen"),
+    "extrempunkte": _extrempunkte,
+    "wendepunkte": _wendepunkte,
+    "symmetrie": _api("Symmetrie"),
+    "ableitung": _ableitung,
+    "graph": _graph,
+}
+
+STANDARD_ASPEKTE = ("nullstellen", "extrempunkte", "wendepunkte", "symmetrie")
+
+
+@dataclass(frozen=True)
+class Analyseergebnis:
+    """Kompaktes Ergebnis einer Kurvendiskussion"""
+
+    index: int  # Position in der Eingabe
+    eingabe: str
+    term: str | None = None  # Normalisierter Term (None, wenn nicht parsebar)
+    werte: dict[str, Any] = field(default_factory=dict)
+    fehler: dict[str, str] = field(default_factory=dict)
+    dauer: float = 0.0  # Sekunden im Worker
+
+    @property
+    def ok(self) -> bool:
+        return not self.fehler
+
+
+class _Zeitueberschreitung(BaseException):
+    """Vom Alarm-Signal ausgelöst; BaseException, damit `except Exception` im
+    Framework den Abbruch nicht verschluckt"""
+
+
+@contextmanager
+def _zeitlimit(sekunden: float | None) -> Iterator[None]:
+    """Bricht den Block nach `sekunden` ab (POSIX, nur im Hauptthread)"""
+    if (
+        not sekunden
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def alarm(_signum, _frame):
+        raise _Zeitueberschreitung
+
+    vorher = signal.signal(signal.SIGALRM, alarm)
+    signal.setitimer(signal.ITIMER_REAL, sekunden)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, vorher)
+
+
+def _kompakt(wert: Any) -> Any:
+    """Wandelt Analyseergebnisse in kleine, picklebare Python-Objekte um"""
+    if wert is None or isinstance(wert, (bool, int, float, str)):
+        return wert
+    if isinstance(wert, sp.Integer):
+        return int(wert)
+    if isinstance(wert, sp.Basic):
+        return str(wert)
+    if isinstance(wert, Enum):
+        return wert.value
+    if is_dataclass(wert):  # Nullstelle, Extrempunkt, Wendepunkt, ...
+        return {feld.name: _kompakt(getattr(wert, feld.name)) for feld in fields(wert)}
+    if isinstance(wert, dict):
+        return {str(k): _kompakt(v) for k, v in wert.items()}
+    if isinstance(wert, (list, tuple, set)):
+        return tuple(_kompakt(v) for v in wert)
+    if hasattr(wert, "to_json"):  # Plotly-Figur
+        return wert.to_json()
+    if callable(getattr(wert, "term", None)):  # Funktion, z.B. Ableitung
+        return wert.term()
+    return str(wert)
+
+
+def _als_text(eingabe: Any) -> str:
+    return eingabe if isinstance(eingabe, str) else eingabe.term()
+
+
+def _analysiere(
+    index: int, eingabe: Any, aspekte: tuple[str, ...], timeout: float | None
+) -> Analyseergebnis:
+    """Eine komplette Analyse; läuft im Worker-Prozess"""
+    from .funktion import Funktion
+
+    start = time.perf_counter()
+    term = None
+    werte: dict[str, Any] = {}
+    fehler: dict[str, str] = {}
+    try:
+        with _zeitlimit(timeout):
+            try:
+                f = Funktion(eingabe) if isinstance(eingabe, str) else eingabe
+                term = f.term()
+            except Exception as e:
+                fehler["funktion"] = f"{type(e).__name__}: {e}"
+            else:
+                for aspekt in aspekte:
+                    try:
+                        werte[aspekt] = _kompakt(ASPEKTE[aspekt](f))
+                    except Exception as e:
+                        fehler[aspekt] = f"{type(e).__name__}: {e}"
+    except _Zeitueberschreitung:
+        meldung = f"Zeitlimit von {timeout} s überschritten"
+        if term is None and "funktion" not in fehler:
+            fehler["funktion"] = meldung
+        for aspekt in aspekte:
+            if term is not None and aspekt not in werte and aspekt not in fehler:
+                fehler[aspekt] = meldung
+
+    return Analyseergebnis(
+        index, _als_text(eingabe), term, werte, fehler, time.perf_counter() - start
+    )
+
+
+def _absturz(index: int, eingabe: Any) -> Analyseergebnis:
+    return Analyseergebnis(
+        index, _als_text(eingabe), fehler={"funktion": "Worker-Prozess abgestürzt"}
+    )
+
+
+def _im_pool(
+    auftraege: dict[int, Any],
+    aspekte: tuple[str, ...],
+    workers: int,
+    timeout: float | None,
+    mp_context,
+) -> Iterator[Analyseergebnis]:
+    offen = dict(auftraege)
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+    try:
+        futures = [
+            pool.submit(_analysiere, index, eingabe, aspekte, timeout)
+            for index, eingabe in offen.items()
+        ]
+        for future in as_completed(futures):
+            try:
+                ergebnis = future.result()
+            except BrokenProcessPool:
+                continue
+            del offen[ergebnis.index]
+            yield ergebnis
+    finally:
+        # Auch bei vorzeitig beendeter Iteration nicht auf offene Terme warten
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    # Nach einem Absturz ist unklar, welcher Term schuld war: die übrigen
+    # werden einzeln wiederholt, damit nur der Verursacher scheitert. Die
+    # Wiederholungen laufen nacheinander, nicht parallel.
+    for index, eingabe in offen.items():
+        with ProcessPoolExecutor(max_workers=1, mp_context=mp_context) as einzeln:
+            try:
+                yield einzeln.submit(
+                    _analysiere, index, eingabe, aspekte, timeout
+                ).result()
+            except BrokenProcessPool:
+                yield _absturz(index, eingabe)
+
+
+def analysiere_viele(
+    terme: Iterable[Any],
+    aspekte: Iterable[str] = STANDARD_ASPEKTE,
+    workers: int | None = None,
+    timeout: float | None = None,
+    mp_context=None,
+) -> Iterator[Analyseergebnis]:
+    """
+    Analysiert viele Funktionen parallel in einem Prozesspool.
+
+    Args:
+        terme: Funktionsterme als Strings oder Funktionsobjekte (diese
+            werden kompakt übertragen und im Worker nicht neu geparst)
+        aspekte: Auswahl aus `ASPEKTE` ("nullstellen", "extrempunkte",
+            "wendepunkte", "symmetrie", "ableitung", "graph")
+        workers: Anzahl der Prozesse (Standard: alle Kerne, 1 = ohne Pool
+            im aktuellen Prozess)
+        timeout: Zeitlimit pro Term in Sekunden (über SIGALRM; auf
+            Plattformen ohne `signal.setitimer` wirkungslos)
+        mp_context: Optionaler multiprocessing-Kontext, z.B. "spawn"
+
+    Yields:
+        Analyseergebnis je Term, in der Reihenfolge der Fertigstellung
+        (`index` gibt die Position in der Eingabe an); Eingaben ohne
+        `term()` (z.B. None) liefern sofort ein Ergebnis mit Fehler
+
+    Note:
+        Stürzt ein Worker-Prozess ab, werden alle noch offenen Terme
+        nacheinander in je einem eigenen Prozess wiederholt. Bei vielen
+        offenen Termen dauert der Rest des Stapels dann entsprechend länger.
+
+    Raises:
+        ValueError: Bei unbekannten Aspekten
+
+    Examples:
+        >>> ergebnisse = sorted(
+        ...     analysiere_viele(["x^2 - 4", "x^3"], aspekte=["nullstellen"]),
+        ...     key=lambda e: e.index,
+        ... )
+        >>> [n["x"] for n in ergebnisse[0].werte["nullstellen"]]
+        [2, -2]
+    """
+    aspekte = tuple(aspekte)
+    unbekannt = [aspekt for aspekt in aspekte if aspekt not in ASPEKTE]
+    if unbekannt:
+        raise ValueError(
+            f"Unbekannte Aspekte: {', '.join(unbekannt)}. "
+            f"Verfügbar: {', '.join(ASPEKTE)}"
+        )
+
+    from .funktion import Funktion
+
+    # Ungültige Eingaben scheitern einzeln, statt den Stapel abzubrechen
+    auftraege: dict[int, Any] = {}
+    for index, term in enumerate(terme):
+        if isinstance(term, (str, Funktion)):
+            auftraege[index] = term
+            continue
+        try:
+            auftraege[index] = term.term()
+        except Exception as e:
+            yield Analyseergebnis(
+                index, repr(term), fehler={"funktion": f"{type(e).__name__}: {e}"}
+            )
+    workers = min(workers or os.cpu_count() or 1, len(auftraege) or 1)
+
+    if workers == 1:
+        for index, eingabe in auftraege.items():
+            yield _analysiere(index, eingabe, aspekte, timeout)
+        return
+
+    if isinstance(mp_context, str):
+        import multiprocessing
+
+        mp_context = multiprocessing.get_context(mp_context)
+    yield from _im_pool(auftraege, aspekte, workers, timeout, mp_context)
@@ -4,6 +4,7 @@ Automatische Funktionszerlegung für das Schul-Analysis Framework.
 Vereinfachte Version, die zuverlässig die Grundstrukturen erkennt.
 """
 
+from contextvars import ContextVar
 from enum import Enum
 from typing import Any
 
@@ -11,6 +12,7 @@ import sympy as sp
 
 from .errors import SchulAnalysisError
 from .funktion import Funktion
+from .instrumentierung import gemessen
 
 
 class FunktionsTyp(Enum):
@@ -34,6 +36,10 @@ class StrukturAnalyseError(SchulAnalysisError):
     pass
 
 
+# Läuft im aktuellen Kontext gerade eine Strukturanalyse?
+_analyse_laeuft: ContextVar[bool] = ContextVar("_analyse_laeuft", default=False)
+
+
 def _klassifiziere_einfache_funktion(
     expr: sp.Basic, variable: sp.Symbol
 ) -> FunktionsTyp:
@@ -320,6 +326,7 @@ def _faktorisiere_exponential_summe(
         return False, expr, sp.Integer(1)
 
 
+@gemessen("classify")
 def analysiere_funktionsstruktur(
     funktion: str | sp.Basic | Funktion,
 ) -> dict[str, Any]:
@@ -337,11 +344,11 @@ def analysiere_funktionsstruktur(
         >>> print(ergebnis['struktur'])
         'produkt'
     """
-    # Rekursionsschutz
-    if hasattr(analysiere_funktionsstruktur, "_in_progress"):
+    # Rekursionsschutz (pro Thread bzw. asyncio-Task, nicht global)
+    if _analyse_laeuft.get():
         raise StrukturAnalyseError("Rekursion in der Strukturanalyse erkannt")
 
-    analysiere_funktionsstruktur._in_progress = True
+    marke = _analyse_laeuft.set(True)
 
     try:
         # Konvertiere zu SymPy-Ausdruck
@@ -505,8 +512,7 @@ def analysiere_funktionsstruktur(
         )
     finally:
         # Rekursionsschutz zurücksetzen
-        if hasattr(analysiere_funktionsstruktur, "_in_progress"):
-            del analysiere_funktionsstruktur._in_progress
+        _analyse_laeuft.reset(marke)
 
 
 def erstelle_strukturierte_funktion(
@@ -10,15 +10,27 @@ PÄDAGOGISCHER ANSATZ:
 - Transparente Integration in bestehendes Framework
 """
 
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 import sympy as sp
+from sympy import simplify, solve
 
 from .funktion import Funktion
 from .ganzrationale import GanzrationaleFunktion
+from .instrumentierung import gemessen
+from .periodisch import TRIG_BEREICH
 from .struktur import analysiere_funktionsstruktur
-from .sympy_types import Nullstelle, ExactNullstellenListe, validate_exact_results
-
-from sympy import solve, simplify, solveset, S, Interval
-from .sympy_types import preserve_exact_types
+from .sympy_types import (
+    ExactNullstellenListe,
+    Nullstelle,
+    preserve_exact_types,
+    validate_exact_results,
+)
 
 
 class StrukturierteFunktion(Funktion):
@@ -26,9 +38,13 @@ class StrukturierteFunktion(Funktion):
     Basisklasse für alle strukturierten Funktionen.
 
     Diese Klasse erweitert die Basis-Funktion um strukturierte Komponenten
-    und sorgt für intelligente Typisierung der Komponenten.
+    und sorgt für intelligente Typisierung der Komponenten. Die Komponenten
+    werden erst beim ersten Zugriff aus den bereits geparsten
+    Teilausdrücken der Strukturanalyse erzeugt.
     """
 
+    __slots__ = ("_struktur_info", "_komponenten")
+
     def __init__(self, eingabe, struktur_info=None):
         """
         Initialisiert eine strukturierte Funktion.
@@ -37,38 +53,93 @@ class StrukturierteFunktion(Funktion):
             eingabe: Der Funktionsterm als String oder SymPy-Ausdruck
             struktur_info: Bereits analysierte Strukturinformationen
         """
+        # Initialisiere die Basis-Funktion
+        super().__init__(eingabe)
+        self._komponenten = None  # Typisierte Komponenten erst bei Bedarf
+
         # Speichere Strukturinformationen
         if struktur_info is None:
-            # Vermeide Rekursion: Verwende die Strukturanalyse nur, wenn sie nicht bereits läuft
-            from .struktur import analysiere_funktionsstruktur, StrukturAnalyseError
+            struktur_info = self._analysiere_struktur(eingabe)
+        self._struktur_info = struktur_info
 
-            try:
-                self._struktur_info = analysiere_funktionsstruktur(eingabe)
-            except StrukturAnalyseError:
-                # Bei Rekursion oder Fehler, erstelle Basis-Strukturinfo
-                self._struktur_info = {
-                    "original_term": str(eingabe),
-                    "struktur": "unbekannt",
-                    "komponenten": [
-                        {
-                            "ausdruck": eingabe,
-                            "typ": "unbekannt",
-                            "term": str(eingabe),
-                            "latex": str(eingabe),
-                        }
-                    ],
-                    "variable": "x",
-                    "latex": str(eingabe),
-                    "kann_faktorisiert_werden": False,
-                }
-        else:
-            self._struktur_info = struktur_info
-
-        # Initialisiere die Basis-Funktion
-        super().__init__(eingabe)
+    def _analysiere_struktur(self, eingabe) -> dict:
+        """
+        Analysiert den bereits geparsten Term; bei laufender Analyse
+        (Rekursion) oder Fehler entsteht eine Basis-Strukturinfo.
+        """
+        from .struktur import StrukturAnalyseError
 
-        # Erstelle typisierte Komponenten
-        self._komponenten = self._erzeuge_typisierte_komponenten()
+        try:
+            return analysiere_funktionsstruktur(self)
+        except StrukturAnalyseError:
+            return {
+                "original_term": str(eingabe),
+                "struktur": "unbekannt",
+                "komponenten": [
+                    {
+                        "ausdruck": self.term_sympy,
+                        "typ": "unbekannt",
+                        "term": str(eingabe),
+                        "latex": str(eingabe),
+                    }
+                ],
+                "variable": str(self._variable_symbol),
+                "latex": str(eingabe),
+                "kann_faktorisiert_werden": False,
+            }
+
+    def _term_geaendert(self) -> None:
+        super()._term_geaendert()
+        self._komponenten = None
+        self._struktur_info = self._analysiere_struktur(self.term_sympy)
+
+    def _zustand_als_dict(self) -> dict:
+        from .serialisierung import ausdruck_zu_praefix
+
+        zustand = super()._zustand_als_dict()
+        zustand["struktur"] = {
+            **self._struktur_info,
+            "komponenten": [
+                {
+                    **komponente,
+                    "ausdruck": ausdruck_zu_praefix(komponente["ausdruck"])
+                    if isinstance(komponente["ausdruck"], sp.Basic)
+                    else komponente["ausdruck"],
+                }
+                for komponente in self._struktur_info["komponenten"]
+            ],
+        }
+        # Nur bereits erzeugte Komponenten; sonst entstehen sie beim Laden
+        # wie hier erst bei Bedarf aus der Struktur
+        if self._komponenten is not None:
+            zustand["komponenten"] = [
+                komponente.to_dict() if komponente is not None else None
+                for komponente in self._komponenten
+            ]
+        return zustand
+
+    def _stelle_zustand_wieder_her(self, daten: dict) -> None:
+        from .serialisierung import praefix_zu_ausdruck
+
+        super()._stelle_zustand_wieder_her(daten)
+        self._struktur_info = {
+            **daten["struktur"],
+            "komponenten": [
+                {
+                    **komponente,
+                    "ausdruck": komponente["ausdruck"]
+                    if isinstance(komponente["ausdruck"], str)
+                    else praefix_zu_ausdruck(komponente["ausdruck"]),
+                }
+                for komponente in daten["struktur"]["komponenten"]
+            ],
+        }
+        self._komponenten = None
+        if "komponenten" in daten:
+            self._komponenten = [
+                Funktion.from_dict(komponente) if komponente is not None else None
+                for komponente in daten["komponenten"]
+            ]
 
     def _erzeuge_typisierte_komponenten(self) -> list[Funktion]:
         """
@@ -80,21 +151,26 @@ class StrukturierteFunktion(Funktion):
         komponenten = []
 
         for komp_info in self._struktur_info["komponenten"]:
-            komp_term = komp_info["term"]
+            # Bereits geparster Teilausdruck; nur alte Daten tragen Strings
+            komp_ausdruck = komp_info.get("ausdruck", komp_info["term"])
             komp_typ = komp_info["typ"]
 
             # Erstelle typisierte Komponente basierend auf dem Typ
-            typisierte_komp = self._erzeuge_typisierte_komponente(komp_term, komp_typ)
+            typisierte_komp = self._erzeuge_typisierte_komponente(
+                komp_ausdruck, komp_typ
+            )
             komponenten.append(typisierte_komp)
 
         return komponenten
 
-    def _erzeuge_typisierte_komponente(self, term: str, typ: str) -> Funktion | None:
+    def _erzeuge_typisierte_komponente(
+        self, ausdruck: sp.Basic | str, typ: str
+    ) -> Funktion | None:
         """
         Erzeugt eine einzelne typisierte Komponente mit intelligenten Stop-Bedingungen.
 
         Args:
-            term: Der Term als String
+            ausdruck: Der Teilausdruck (SymPy-Ausdruck oder String)
             typ: Der erkannte Typ
 
         Returns:
@@ -104,43 +180,43 @@ class StrukturierteFunktion(Funktion):
         from .exponential import ExponentialFunktion
         from .trigonometrisch import TrigonometrischeFunktion
 
+        if isinstance(ausdruck, str):
+            ausdruck = self._parse_string_to_sympy(ausdruck)
+
         # Stop-Bedingungen: Nicht weiter zerlegen - Gibt spezifische Typen zurück
-        if self._sollte_nicht_weiter_zerlegt_werden(term, typ):
+        if self._sollte_nicht_weiter_zerlegt_werden(ausdruck, typ):
             if typ == "ganzrational":
                 # Für ganzrationale Funktionen: direkt spezifische Typen bestimmen
-                import sympy as sp
-
                 try:
-                    expr = sp.sympify(term, rational=True)  # type: ignore
-                    grad = expr.as_poly(sp.symbols("x")).degree()
+                    grad = ausdruck.as_poly(self._variable_symbol).degree()
 
                     from .lineare import LineareFunktion
                     from .quadratisch import QuadratischeFunktion
 
                     if grad == 1:
-                        return LineareFunktion(term)
+                        return LineareFunktion(ausdruck)
                     elif grad == 2:
-                        return QuadratischeFunktion(term)
+                        return QuadratischeFunktion(ausdruck)
                     else:
-                        return GanzrationaleFunktion(term)
+                        return GanzrationaleFunktion(ausdruck)
                 except Exception:
-                    return GanzrationaleFunktion(term)
+                    return GanzrationaleFunktion(ausdruck)
             elif typ == "konstante":
-                return GanzrationaleFunktion(term)
+                return GanzrationaleFunktion(ausdruck)
 
         # Für komplexe Typen: Erstelle spezifische Instanzen
         elif typ == "exponentiell":
-            return ExponentialFunktion(term)
+            return ExponentialFunktion(ausdruck)
         elif typ == "trigonometrisch":
-            return TrigonometrischeFunktion(term)
+            return TrigonometrischeFunktion(ausdruck)
         elif typ == "logarithmisch":
             # TODO: Logarithmische Funktion implementieren
-            return Funktion(term)
+            return Funktion(ausdruck)
         else:
             # Für unbekannte Typen: Standard-Funktion
-            return Funktion(term)
+            return Funktion(ausdruck)
 
-    def _sollte_nicht_weiter_zerlegt_werden(self, term: str, typ: str) -> bool:
+    def _sollte_nicht_weiter_zerlegt_werden(self, ausdruck: sp.Basic, typ: str) -> bool:
         """
         Intelligente Stop-Bedingungen für die Zerlegungstiefe.
 
@@ -156,15 +232,13 @@ class StrukturierteFunktion(Funktion):
 
         # Prüfe, ob es sich um einen "einfachen" Ausdruck handelt
         try:
-            expr = sp.sympify(term, rational=True)  # type: ignore
-
             # Konstanten prüfen
-            if hasattr(expr, "is_constant") and expr.is_constant():
+            if hasattr(ausdruck, "is_constant") and ausdruck.is_constant():
                 return True
 
             # Einfache Polynome (Grad <= 2) nicht weiter zerlegen
-            if expr.is_polynomial(sp.symbols("x")):
-                grad = sp.degree(expr, sp.symbols("x"))
+            if ausdruck.is_polynomial(self._variable_symbol):
+                grad = sp.degree(ausdruck, self._variable_symbol)
                 if grad <= 2:  # Lineare und quadratische Polynome
                     return True
 
@@ -175,9 +249,15 @@ class StrukturierteFunktion(Funktion):
 
     @property
     def komponenten(self) -> list[Funktion]:
-        """Gibt die typisierten Komponenten zurück."""
+        """Gibt die typisierten Komponenten zurück (beim ersten Zugriff erzeugt)."""
+        if self._komponenten is None:
+            self._komponenten = self._erzeuge_typisierte_komponenten()
         return self._komponenten
 
+    def _komponente(self, index: int) -> Funktion | None:
+        komponenten = self.komponenten
+        return komponenten[index] if len(komponenten) > index else None
+
     @property
     def struktur(self) -> str:
         """Gibt die Struktur der Funktion zurück."""
@@ -187,11 +267,7 @@ class StrukturierteFunktion(Funktion):
 class ProduktFunktion(StrukturierteFunktion):
     """Repräsentiert ein Produkt von Funktionen mit typisierten Faktoren."""
 
-    def __init__(self, eingabe, struktur_info=None):
-        super().__init__(eingabe, struktur_info)
-
-        # Spezifische Eigenschaften für Produkte
-        self._faktoren = self._komponenten
+    __slots__ = ()
 
     @property
     def funktionstyp(self) -> str:
@@ -201,21 +277,22 @@ class ProduktFunktion(StrukturierteFunktion):
     @property
     def faktoren(self) -> list[Funktion]:
         """Gibt die typisierten Faktoren des Produkts zurück."""
-        return self._faktoren
+        return self.komponenten
 
     @property
     def faktor1(self) -> Funktion | None:
         """Gibt den ersten Faktor zurück."""
-        return self._faktoren[0] if len(self._faktoren) > 0 else None
+        return self._komponente(0)
 
     @property
     def faktor2(self) -> Funktion | None:
         """Gibt den zweiten Faktor zurück."""
-        return self._faktoren[1] if len(self._faktoren) > 1 else None
+        return self._komponente(1)
 
     def __str__(self):
         return f"Produkt({', '.join(str(f) for f in self.faktoren)})"
 
+    @gemessen("solve")
     def nullstellen(
         self, real: bool = True, runden: int | None = None
     ) -> ExactNullstellenListe:
@@ -225,8 +302,8 @@ class ProduktFunktion(StrukturierteFunktion):
         Für f(x) = F₁(x) × F₂(x) × ... × Fₙ(x) = 0 gilt:
         f(x) = 0 ⇔ mindestens ein Fᵢ(x) = 0
 
-        Diese Methode nutzt Sympy's Vereinfachung für zuverlässige
-        Duplikatserkennung bei symbolischen Ausdrücken.
+        Aufwendige Faktoren werden parallel in einem Prozesspool gelöst
+        (siehe `FAKTOR_WORKERS`), lineare und quadratische direkt.
 
         Args:
             real: Nur reelle Nullstellen zurückgeben (Standard: True)
@@ -235,23 +312,22 @@ class ProduktFunktion(StrukturierteFunktion):
         Returns:
             Liste der Nullstellen mit korrekten Vielfachheiten
         """
-        # Sammle alle Nullstellen von allen Faktoren
-        alle_nullstellen = []
-
-        for faktor in self.faktoren:
-            if hasattr(faktor, "nullstellen"):
-                # Alle Klassen verwenden jetzt konsistent die nullstellen() Methode
-                faktor_nullstellen = faktor.nullstellen(real=real, runden=runden)
-                alle_nullstellen.extend(faktor_nullstellen)
+        faktoren = [f for f in self.faktoren if hasattr(f, "nullstellen")]
+        ergebnisse = _loese_faktoren(faktoren, real, runden)
 
-        # Kombiniere die Nullstellen mit Sympy-Vereinfachung
-        return self._kombiniere_mit_sympy_simplify(alle_nullstellen)
+        # Sammle alle Nullstellen von allen Faktoren (in Faktor-Reihenfolge)
+        alle_nullstellen = [n for ergebnis in ergebnisse for n in ergebnis]
+        return self._kombiniere_nullstellen(alle_nullstellen)
 
-    def _kombiniere_mit_sympy_simplify(
+    def _kombiniere_nullstellen(
         self, alle_nullstellen: list[Nullstelle]
     ) -> ExactNullstellenListe:
         """
-        Kombiniert Nullstellen mit Sympy's zuverlässiger Vereinfachung.
+        Fasst gleiche Nullstellen zusammen und addiert ihre Vielfachheiten.
+
+        Gleiche Ausdrücke werden über ihren Hash gefunden. Verschieden
+        geschriebene Nullstellen landen über ihren numerischen Wert im
+        selben Eimer und werden nur dann symbolisch verglichen.
 
         Args:
             alle_nullstellen: Liste aller Nullstellen von allen Faktoren
@@ -259,71 +335,51 @@ class ProduktFunktion(StrukturierteFunktion):
         Returns:
             Kombinierte Liste mit korrekten Vielfachheiten
         """
-        vereinfachte_map = {}
+        kombiniert: dict = {}  # x-Wert → Nullstelle (erste Darstellung gewinnt)
+        eimer: dict[tuple, list] = {}  # numerischer Schlüssel → x-Werte
 
         for nullstelle in alle_nullstellen:
-            # Handle verschiedene Formate von Nullstellen (alt und neu)
-            # Altes Format: direktes SymPy-Objekt (z.B. Zero, Pi)
-            # Neues Format: Nullstelle-Datenklasse mit .x Attribut
-
+            # Altes Format: direktes SymPy-Objekt mit Vielfachheit 1
             if hasattr(nullstelle, "x"):
-                # Neues Format: Nullstelle-Datenklasse
                 x_wert = nullstelle.x
                 multiplicitaet = nullstelle.multiplicitaet
                 exakt = nullstelle.exakt
             else:
-                # Altes Format: direktes SymPy-Objekt
-                x_wert = nullstelle
-                multiplicitaet = 1  # Standard-Vielfachheit
-                exakt = True  # SymPy-Ergebnisse sind exakt
-
-            # Versuche zu vereinfachen, aber handle Fehler gracefully
-            try:
-                if hasattr(x_wert, "is_Number") and x_wert.is_Number:
-                    # Für numerische Werte: direkt verwenden
-                    x_vereinfacht = x_wert
-                else:
-                    # Für symbolische Ausdrücke: vereinfachen
-                    x_vereinfacht = simplify(x_wert)
-            except Exception:
-                # Bei Vereinfachungsfehlern: Originalwert verwenden
-                x_vereinfacht = x_wert
-
-            # Erstelle einen hashbaren Schlüssel
-            try:
-                # Versuche eine String-Repräsentation
-                schlüssel = str(x_vereinfacht)
-            except Exception:
-                # Fallback: Verwende den Index als Schlüssel (sollte selten vorkommen)
-                schlüssel = f"unbekannt_{id(nullstelle)}"
-
-            if schlüssel in vereinfachte_map:
-                # Addiere die Vielfachheiten zur bestehenden Nullstelle
-                vorhandene = vereinfachte_map[schlüssel]
-                neue_multiplicitaet = vorhandene.multiplicitaet + multiplicitaet
-
-                # Ersetze die vorhandene Nullstelle mit neuer Vielfachheit
-                vereinfachte_map[schlüssel] = Nullstelle(
-                    x=x_vereinfacht,
-                    multiplicitaet=neue_multiplicitaet,
-                    exakt=vorhandene.exakt and exakt,
+                x_wert, multiplicitaet, exakt = nullstelle, 1, True
+
+            ziel = x_wert if x_wert in kombiniert else None
+            schluessel = None
+            if ziel is None:
+                schluessel = _numerischer_schluessel(x_wert)
+                for kandidat in eimer.get(schluessel, ()):
+                    if self._sind_symbolisch_gleich(x_wert, kandidat):
+                        ziel = kandidat
+                        break
+
+            if ziel is None:
+                kombiniert[x_wert] = Nullstelle(
+                    x=x_wert, multiplicitaet=multiplicitaet, exakt=exakt
                 )
+                if schluessel is not None:
+                    eimer.setdefault(schluessel, []).append(x_wert)
             else:
-                # Füge neue vereinfachte Nullstelle hinzu
-                vereinfachte_map[schlüssel] = Nullstelle(
-                    x=x_vereinfacht,
-                    multiplicitaet=multiplicitaet,
-                    exakt=exakt,
+                vorhandene = kombiniert[ziel]
+                kombiniert[ziel] = Nullstelle(
+                    x=ziel,
+                    multiplicitaet=vorhandene.multiplicitaet + multiplicitaet,
+                    exakt=vorhandene.exakt and exakt,
                 )
 
-        return list(vereinfachte_map.values())
+        return list(kombiniert.values())
 
     def _sind_symbolisch_gleich(self, ausdruck1: sp.Expr, ausdruck2: sp.Expr) -> bool:
         """
         Prüft ob zwei symbolische Ausdrücke äquivalent sind.
 
         Diese Methode erkennt äquivalente Ausdrücke auch in verschiedenen
-        Darstellungsformen, was für die Multiplicity-Erkennung wichtig ist.
+        Darstellungsformen (z.B. -b/a und c mit Parametern), was für die
+        Multiplicity-Erkennung wichtig ist. Ausgewertet wird an zufälligen
+        Punkten statt mit simplify.
 
         Args:
             ausdruck1: Erster symbolischer Ausdruck
@@ -332,41 +388,12 @@ class ProduktFunktion(StrukturierteFunktion):
         Returns:
             True wenn die Ausdrücke äquivalent sind
         """
-        try:
-            # Vereinfache beide Ausdrücke
-            einfach1 = sp.simplify(ausdruck1)
-            einfach2 = sp.simplify(ausdruck2)
-
-            # Prüfe auf direkte Gleichheit
-            if einfach1 == einfach2:
-                return True
-
-            # Prüfe ob eines das Negative des anderen ist (wichtig für Vorzeichen)
-            if einfach1 == -einfach2:
-                return True
-
-            # Prüfe ob expandierte Formen gleich sind
-            if sp.expand(einfach1) == sp.expand(einfach2):
-                return True
-
-            # Spezialfall: Verhältnisse wie -b/a == c
-            # Dies erfordert Lösung von Gleichungen
-            try:
-                # Prüfe ob einfach1 - einfach2 = 0 für alle Werte gilt
-                diff = sp.simplify(einfach1 - einfach2)
-                if diff == 0:
-                    return True
-
-                # Prüfe ob die Differenz nach Expansion null ist
-                if sp.expand(diff) == 0:
-                    return True
-            except:
-                pass
-
-            return False
+        from .aequivalenz import sind_aequivalent
 
+        try:
+            return sind_aequivalent(ausdruck1, ausdruck2)
         except Exception:
-            # Bei Fehlern in der symbolischen Vereinfachung
+            # Bei Fehlern in der Auswertung
             return False
 
     def _kombiniere_nullstellen_intelligent(
@@ -417,14 +444,132 @@ class ProduktFunktion(StrukturierteFunktion):
         return kombinierte
 
 
+# =============================================================================
+# NULLSTELLEN VON PRODUKTEN: PARALLELE FAKTOREN UND ZUSAMMENFASSUNG
+# =============================================================================
+
+# Prozesse für aufwendige Faktoren (None = alle Kerne, 1 = ohne Pool)
+FAKTOR_WORKERS: int | None = None
+
+_faktor_pool: ProcessPoolExecutor | None = None
+_faktor_pool_sperre = threading.Lock()
+
+
+def _faktor_nullstellen(faktor: Funktion, real: bool, runden: int | None) -> list:
+    """Nullstellen eines Faktors; läuft auch im Worker-Prozess"""
+    return list(faktor.nullstellen(real=real, runden=runden))
+
+
+def _ist_einfacher_faktor(faktor: Funktion) -> bool:
+    """Konstanten, lineare und quadratische Faktoren löst man schneller,
+    als man sie an einen anderen Prozess schickt"""
+    term, variable = faktor.term_sympy, faktor._variable_symbol
+    try:
+        return term.is_polynomial(variable) and sp.degree(term, variable) <= 2
+    except Exception:
+        return False
+
+
+def _hole_faktor_pool(workers: int) -> ProcessPoolExecutor:
+    global _faktor_pool
+    with _faktor_pool_sperre:
+        if _faktor_pool is None:
+            _faktor_pool = ProcessPoolExecutor(max_workers=workers)
+        return _faktor_pool
+
+
+def _verwerfe_faktor_pool(pool: ProcessPoolExecutor) -> None:
+    global _faktor_pool
+    with _faktor_pool_sperre:
+        if _faktor_pool is pool:
+            _faktor_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _loese_faktoren(
+    faktoren: list[Funktion], real: bool, runden: int | None
+) -> list[list]:
+    """
+    Nullstellen aller Faktoren in Faktor-Reihenfolge.
+
+    Sind mindestens zwei Faktoren aufwendig und mehrere Kerne verfügbar,
+    werden diese im Prozesspool gelöst, während der aktuelle Prozess die
+    einfachen Faktoren übernimmt. Bricht der Pool, wird sequentiell
+    weitergerechnet.
+    """
+    workers = FAKTOR_WORKERS or os.cpu_count() or 1
+    aufwendig = [i for i, f in enumerate(faktoren) if not _ist_einfacher_faktor(f)]
+    if (
+        workers < 2
+        or len(aufwendig) < 2
+        or multiprocessing.current_process().daemon  # Keine Kindprozesse
+    ):
+        return [_faktor_nullstellen(f, real, runden) for f in faktoren]
+
+    ergebnisse: list[list | None] = [None] * len(faktoren)
+    pool = _hole_faktor_pool(workers)
+    try:
+        futures = {
+            i: pool.submit(_faktor_nullstellen, faktoren[i], real, runden)
+            for i in aufwendig
+        }
+    except (BrokenProcessPool, RuntimeError):
+        _verwerfe_faktor_pool(pool)
+        futures = {}
+
+    for i, faktor in enumerate(faktoren):
+        if i not in futures:
+            ergebnisse[i] = _faktor_nullstellen(faktor, real, runden)
+    for i, future in futures.items():
+        try:
+            ergebnisse[i] = future.result()
+        except BrokenProcessPool:
+            _verwerfe_faktor_pool(pool)
+            ergebnisse[i] = _faktor_nullstellen(faktoren[i], real, runden)
+    return ergebnisse
+
+
+# Kleinere Anteile gelten beim Schlüssel als Rechenrauschen
+_RAUSCHGRENZE = 1e-20
+
+
+def _numerischer_schluessel(x_wert) -> tuple[float, float] | None:
+    """
+    Gerundeter numerischer Wert als Schlüssel für die Zusammenfassung.
+
+    Parameter werden mit festen, ihren Annahmen entsprechenden Zufallswerten
+    belegt. Gleiche Schlüssel sind nur ein Hinweis; entschieden wird danach
+    symbolisch.
+    """
+    import random
+
+    from .aequivalenz import _zufallswert
+
+    try:
+        ausdruck = sp.sympify(x_wert)
+        if ausdruck.free_symbols:
+            ausdruck = ausdruck.xreplace(
+                {
+                    symbol: _zufallswert(symbol, random.Random(symbol.name))
+                    for symbol in ausdruck.free_symbols
+                }
+            )
+        wert = complex(ausdruck.evalf(30))
+    except (TypeError, ValueError, ArithmeticError, sp.SympifyError):
+        return None
+    if not (math.isfinite(wert.real) and math.isfinite(wert.imag)):
+        return None
+    # Auswertungsrauschen (z.B. ±2e-38 beim Casus irreducibilis) ohne Vorzeichen
+    teile = (
+        0.0 if abs(teil) < _RAUSCHGRENZE else teil for teil in (wert.real, wert.imag)
+    )
+    return tuple(float(f"{teil:.9e}") for teil in teile)
+
+
 class SummeFunktion(StrukturierteFunktion):
     """Repräsentiert eine Summe von Funktionen mit typisierten Summanden."""
 
-    def __init__(self, eingabe, struktur_info=None):
-        super().__init__(eingabe, struktur_info)
-
-        # Spezifische Eigenschaften für Summen
-        self._summanden = self._komponenten
+    __slots__ = ()
 
     @property
     def funktionstyp(self) -> str:
@@ -434,18 +579,19 @@ class SummeFunktion(StrukturierteFunktion):
     @property
     def summanden(self) -> list[Funktion]:
         """Gibt die typisierten Summanden der Summe zurück."""
-        return self._summanden
+        return self.komponenten
 
     @property
     def summand1(self) -> Funktion | None:
         """Gibt den ersten Summanden zurück."""
-        return self._summanden[0] if len(self._summanden) > 0 else None
+        return self._komponente(0)
 
     @property
     def summand2(self) -> Funktion | None:
         """Gibt den zweiten Summanden zurück."""
-        return self._summanden[1] if len(self._summanden) > 1 else None
+        return self._komponente(1)
 
+    @gemessen("solve")
     def nullstellen(
         self, real: bool = True, runden: int | None = None
     ) -> ExactNullstellenListe:
@@ -455,7 +601,8 @@ class SummeFunktion(StrukturierteFunktion):
         Strategie:
         1. Versuche Sympy's solve() direkt auf die Summe
         2. Bei Schwierigkeiten: Vereinfache die gesamte Summe und versuche es erneut
-        3. Für trigonometrische Funktionen: Nutze solveset für allgemeine Lösungen
+        3. Für trigonometrische Funktionen: Lösungsschar aus solveset, davon die
+           Lösungen in TRIG_BEREICH (alle anderen: `nullstellen_im_intervall`)
         4. Akzeptiere, dass einige Summen nicht exakt lösbar sind
 
         Args:
@@ -502,117 +649,15 @@ class SummeFunktion(StrukturierteFunktion):
             # Bei Fehlern gehe zur nächsten Strategie
             pass
 
-        # Strategie 3: Für trigonometrische Funktionen - nutze solveset für bessere Lösungen
-        try:
-            term_str = str(self.term_sympy).lower()
-            if any(func in term_str for func in ["sin", "cos", "tan"]):
-                # Nutze solveset für bessere trigonometrische Lösungen
-                allgemeine_lösungen = solveset(
-                    self.term_sympy, self._variable_symbol, domain=S.Reals
-                )
-
-                ergebnisse = []
-
-                # Hilfsfunktion zur Extraktion konkreter Lösungen aus ImageSet
-                from sympy import pi
-
-                def extrahiere_lösungen_aus_imageset(
-                    image_set, x_bereich=(-2 * pi, 2 * pi)
-                ):
-                    """Extrahiert konkrete Lösungen aus einem ImageSet."""
-                    if not hasattr(image_set, "lamda"):
-                        return []
-
-                    lambda_expr = image_set.lamda
-                    n_symbol = lambda_expr.variables[0]  # Normalerweise _n
-                    lösungen = []
-
-                    # Probiere verschiedene n-Werte für Schulmathematik-Bereich
-                    for n_val in range(-3, 4):
-                        try:
-                            lösung = lambda_expr.expr.subs(n_symbol, n_val)
-
-                            # Prüfe, ob die Lösung im gewünschten Bereich liegt
-                            if hasattr(lösung, "evalf"):
-                                lösung_num = float(lösung.evalf())
-                                if x_bereich[0] <= lösung_num <= x_bereich[1]:
-                                    lösungen.append(lösung)
-                            else:
-                                # Symbolische Lösungen immer hinzufügen
-                                lösungen.append(lösung)
-                        except Exception:
-                            continue
-
-                    return lösungen
-
-                # Verarbeite verschiedene solveset-Ergebnistypen
-                try:
-                    from sympy import ImageSet, Union
-
-                    print(f"DEBUG: Verarbeite solveset-Ergebnis...")
-                    if isinstance(allgemeine_lösungen, Union):
-                        print(
-                            f"DEBUG: Ist Union mit {len(allgemeine_lösungen.args)} Args"
-                        )
-                        # Behandle Union von mehreren ImageSets
-                        for i, arg in enumerate(allgemeine_lösungen.args):
-                            print(f"DEBUG: Arg {i}: {arg} (Typ: {type(arg)})")
-                            if isinstance(arg, ImageSet):
-                                print(f"DEBUG: Verarbeite ImageSet...")
-                                lösungen = extrahiere_lösungen_aus_imageset(arg)
-                                print(f"DEBUG: Gefundene Lösungen: {lösungen}")
-                                for lösung in lösungen:
-                                    if hasattr(lösung, "is_real") and lösung.is_real:
-                                        ergebnisse.append(
-                                            Nullstelle(x=lösung, exakt=True)
-                                        )
-                    elif isinstance(allgemeine_lösungen, ImageSet):
-                        print(f"DEBUG: Ist einzelnes ImageSet")
-                        # Einzelnes ImageSet
-                        lösungen = extrahiere_lösungen_aus_imageset(allgemeine_lösungen)
-                        for lösung in lösungen:
-                            if hasattr(lösung, "is_real") and lösung.is_real:
-                                ergebnisse.append(Nullstelle(x=lösung, exakt=True))
-                except Exception as e:
-                    print(f"DEBUG: Fehler bei der Verarbeitung: {e}")
-                    import traceback
-
-                    traceback.print_exc()
-
-                if ergebnisse:
-                    # Entferne Duplikate mit vereinfachtem Vergleich
-                    vereinfachte_ergebnisse = []
-                    seen = set()
-                    for ergebnis in ergebnisse:
-                        # Vereinfache und erstelle Schlüssel
-                        vereinfacht = simplify(ergebnis.x)
-                        schlüssel = str(vereinfacht)
-                        if schlüssel not in seen:
-                            seen.add(schlüssel)
-                            # Ersetze mit vereinfachter Version
-                            vereinfachte_ergebnisse.append(
-                                Nullstelle(x=vereinfacht, exakt=True)
-                            )
-
-                    if vereinfachte_ergebnisse:
-                        # Sortiere für bessere Darstellung
-                        try:
-                            from sympy import pi
-
-                            vereinfachte_ergebnisse.sort(
-                                key=lambda n: float(n.x.evalf())
-                            )
-                        except:
-                            pass
-
-                        return vereinfachte_ergebnisse
-        except Exception as e:
-            print(f"DEBUG: Exception in Strategy 3: {e}")
-            import traceback
-
-            traceback.print_exc()
-            # Bei Fehlern gehe zur letzten Strategie
-            pass
+        # Strategie 3: Für trigonometrische Funktionen - periodische Lösungsschar
+        term_str = str(self.term_sympy).lower()
+        if any(func in term_str for func in ["sin", "cos", "tan"]):
+            schar = self.nullstellen_schar()
+            if schar is not None:
+                return [
+                    Nullstelle(x=lösung, exakt=True)
+                    for lösung in schar.im_intervall(*TRIG_BEREICH)
+                ]
 
         # Strategie 4: Keine Lösung gefunden - akzeptiere dies und gib leere Liste zurück
         return []
@@ -635,18 +680,7 @@ class QuotientFunktion(StrukturierteFunktion):
         - Alle haben polstellen(), definitionsluecken(), etc.
     """
 
-    def __init__(self, eingabe, struktur_info=None):
-        super().__init__(eingabe, struktur_info)
-
-        # Spezifische Eigenschaften für Quotienten
-        self._zaehler = self._komponenten[0] if len(self._komponenten) > 0 else None
-        self._nenner = self._komponenten[1] if len(self._komponenten) > 1 else None
-
-        # 🔥 PÄDAGOGISCHES CACHING FÜR QUOTIENTEN 🔥
-        self._cache = {
-            "polstellen": None,
-            "definitionsluecken": None,
-        }
+    __slots__ = ()
 
     @property
     def funktionstyp(self) -> str:
@@ -656,12 +690,12 @@ class QuotientFunktion(StrukturierteFunktion):
     @property
     def zaehler(self) -> Funktion:
         """Gibt den typisierten Zähler zurück."""
-        return self._zaehler
+        return self._komponente(0)
 
     @property
     def nenner(self) -> Funktion:
         """Gibt den typisierten Nenner zurück."""
-        return self._nenner
+        return self._komponente(1)
 
     def polstellen(self) -> list[float]:
         """
@@ -674,7 +708,7 @@ class QuotientFunktion(StrukturierteFunktion):
         Returns:
             Liste der x-Werte, an denen der Nenner null wird
         """
-        if self._cache["polstellen"] is None:
+        if self._cache.get("polstellen") is None:
             if self.nenner is None:
                 raise ValueError("QuotientFunktion hat keinen gültigen Nenner")
 
@@ -707,10 +741,11 @@ class QuotientFunktion(StrukturierteFunktion):
         Returns:
             Liste der x-Werte, an denen die Funktion nicht definiert ist
         """
-        if self._cache["definitionsluecken"] is None:
+        if self._cache.get("definitionsluecken") is None:
             self._cache["definitionsluecken"] = self.polstellen()
         return self._cache["definitionsluecken"]
 
+    @gemessen("solve")
     @preserve_exact_types
     def nullstellen(
         self, real: bool = True, runden: int | None = None
@@ -792,12 +827,7 @@ class QuotientFunktion(StrukturierteFunktion):
 class KompositionFunktion(StrukturierteFunktion):
     """Repräsentiert eine Komposition von Funktionen mit typisierter Basis und Exponent."""
 
-    def __init__(self, eingabe, struktur_info=None):
-        super().__init__(eingabe, struktur_info)
-
-        # Spezifische Eigenschaften für Kompositionen
-        self._basis = self._komponenten[0] if len(self._komponenten) > 0 else None
-        self._exponent = self._komponenten[1] if len(self._komponenten) > 1 else None
+    __slots__ = ()
 
     @property
     def funktionstyp(self) -> str:
@@ -807,13 +837,14 @@ class KompositionFunktion(StrukturierteFunktion):
     @property
     def basis(self) -> Funktion:
         """Gibt die typisierte Basis zurück."""
-        return self._basis
+        return self._komponente(0)
 
     @property
     def exponent(self) -> Funktion:
         """Gibt den typisierten Exponenten zurück."""
-        return self._exponent
+        return self._komponente(1)
 
+    @gemessen("solve")
     @preserve_exact_types
     def nullstellen(
         self, real: bool = True, runden: int | None = None
@@ -6,7 +6,7 @@ die von allen anderen Modulen gemeinsam genutzt werden können.
 """
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 import sympy as sp
 
@@ -79,11 +79,12 @@ class Parameter(SymbolischeGroesse):
 
 
 # Interne Versionen zur Vermeidung von zirkulären Imports
-@dataclass
+@dataclass(slots=True)
 class _Variable:
     """Interne Variable-Klasse für symbolische Berechnungen"""
 
     name: str
+    _symbol: sp.Symbol = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self._symbol = sp.Symbol(self.name)
@@ -99,11 +100,12 @@ class _Variable:
         return f"_Variable('{self.name}')"
 
 
-@dataclass
+@dataclass(slots=True)
 class _Parameter:
     """Interne Parameter-Klasse für symbolische Berechnungen"""
 
     name: str
+    _symbol: sp.Symbol = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         self._symbol = sp.Symbol(self.name)
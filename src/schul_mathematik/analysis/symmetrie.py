@@ -6,7 +6,7 @@ Einfache Wrapper für Symmetrie-Erkennung mit intelligenter Heuristik.
 
 import sympy as sp
 
-from .funktion import Funktion
+from .funktion import Funktion, FunktionsAusdruck
 
 
 def Achsensymmetrie(
@@ -27,7 +27,10 @@ def Achsensymmetrie(
         >>> Achsensymmetrie("x^3")           # None
     """
     # Konvertiere zu Funktion-Objekt
-    if not isinstance(funktion, Funktion):
+    if isinstance(funktion, FunktionsAusdruck):
+        # Rechenergebnisse erst typisieren, unten wird nach der Klasse verzweigt
+        f = funktion.materialisiere()
+    elif not isinstance(funktion, Funktion):
         f = Funktion(funktion)
     else:
         f = funktion
@@ -102,7 +102,7 @@ class AsymptotenTyp(Enum):
 # =============================================================================
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Nullstelle:
     """Präzise Typisierung für Nullstellen mit zusätzlichen Informationen."""
 
@@ -127,12 +127,12 @@ class Nullstelle:
         return [self.x] * self.multiplicitaet
 
     def is_equivalent(self, other: "Nullstelle") -> bool:
-        """Prüft, ob zwei Nullstellen äquivalent sind (symbolischer Vergleich)."""
+        """Prüft, ob zwei Nullstellen äquivalent sind (Stichproben statt simplify)."""
         try:
-            from sympy import simplify
+            from .aequivalenz import sind_aequivalent
 
-            return simplify(self.x - other.x) == 0
-        except:
+            return sind_aequivalent(self.x, other.x)
+        except Exception:
             return str(self.x) == str(other.x)
 
     def __iter__(self):
@@ -140,7 +140,7 @@ class Nullstelle:
         return iter(self.to_list_with_multiplicity())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Extremstelle:
     """Präzise Typisierung für Extremstellen (x-Koordinaten) mit vollständigen Informationen."""
 
@@ -152,7 +152,7 @@ class Extremstelle:
         return f"{self.typ.value} bei x = {self.x}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Extrempunkt:
     """Präzise Typisierung für Extrempunkte ((x,y)-Koordinaten) mit vollständigen Informationen."""
 
@@ -165,7 +165,7 @@ class Extrempunkt:
         return f"{self.typ.value} bei P({self.x}|{self.y})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Wendestelle:
     """Präzise Typisierung für Wendestellen (x-Koordinaten) mit vollständigen Informationen."""
 
@@ -177,7 +177,7 @@ class Wendestelle:
         return f"{self.typ.value} bei x = {self.x}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Wendepunkt:
     """Präzise Typisierung für Wendepunkte mit vollständigen Informationen."""
 
@@ -190,7 +190,7 @@ class Wendepunkt:
         return f"{self.typ.value} bei P({self.x}|{self.y})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StationaereStelle:
     """Präzise Typisierung für stationäre Stellen mit vollständigen Informationen."""
 
@@ -202,7 +202,7 @@ class StationaereStelle:
         return f"Stationäre Stelle bei x = {self.x} ({self.typ.value})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sattelpunkt:
     """Präzise Typisierung für Sattelpunkte mit vollständiger Klassifizierung.
 
@@ -227,7 +227,7 @@ class Sattelpunkt:
         return f"Sattelpunkt ({typ_beschreibung}) bei P({self.x}|{self.y})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Polstelle:
     """Präzise Typisierung für Polstellen mit zusätzlichen Informationen."""
 
@@ -240,7 +240,7 @@ class Polstelle:
         return f"{self.typ.value} bei x = {self.x}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Asymptote:
     """Präzise Typisierung für Asymptoten mit vollständigen Informationen."""
 
@@ -252,7 +252,7 @@ class Asymptote:
         return f"{self.typ.value}: {self.gleichung} für {self.bedingung}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Schnittpunkt:
     """Präzise Typisierung für Schnittpunkte zwischen zwei Funktionen."""
 
@@ -264,7 +264,7 @@ class Schnittpunkt:
         return f"Schnittpunkt bei P({self.x}|{self.y})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class IntegralResult:
     """Präzise Typisierung für Integral-Ergebnisse."""
 
@@ -10,6 +10,7 @@ symbolische Berechnungen mit SymPy.
 
 import sympy as sp
 
+from .aequivalenz import sind_aequivalent
 from .funktion import Funktion
 
 
@@ -51,21 +52,8 @@ def assert_gleich(
         expr1 = _konvertiere_zu_sympy(ausdruck1, variable)
         expr2 = _konvertiere_zu_sympy(ausdruck2, variable)
 
-        # Berechne die Differenz und vereinfache
-        differenz = expr1 - expr2
-
-        # Spezialisierte Vereinfachung für trigonometrische Ausdrücke
-        # Prüfe auf trigonometrische Funktionen durch String-Matching, da .has() nicht immer funktioniert
-        trig_functions = ["sin", "cos", "tan", "cot", "sec", "csc"]
-        ausdruck_str = str(differenz)
-
-        if any(func in ausdruck_str.lower() for func in trig_functions):
-            differenz = sp.trigsimp(differenz)
-        else:
-            differenz = sp.simplify(differenz)  # type: ignore
-
-        # Prüfe, ob die Differenz Null ist
-        if differenz != 0:
+        # Zufällige Stichproben statt simplify/trigsimp der Differenz
+        if not sind_aequivalent(expr1, expr2):
             if nachricht is None:
                 nachricht = f"Ausdrücke nicht äquivalent: '{ausdruck1}' ≠ '{ausdruck2}'"
             raise AssertionError(nachricht)
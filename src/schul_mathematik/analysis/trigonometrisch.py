@@ -4,14 +4,19 @@ Trigonometrische Funktionen für das Schul-Analysis Framework.
 Einfache Implementierung für trigonometrische Funktionen wie sin(x), cos(x), etc.
 """
 
+import logging
 from typing import Union
 
 import sympy as sp
 from sympy import diff, latex, solve
 
 from .funktion import Funktion
+from .instrumentierung import Lazy, gemessen
+from .periodisch import TRIG_BEREICH
 from .sympy_types import VALIDATION_EXACT, validate_function_result
 
+logger = logging.getLogger(__name__)
+
 
 class TrigonometrischeFunktion(Funktion):
     """
@@ -23,6 +28,8 @@ class TrigonometrischeFunktion(Funktion):
     - tan(x/2)
     """
 
+    __slots__ = ()
+
     def __init__(self, eingabe: Union[str, sp.Basic, "Funktion"]):
         """
         Konstruktor für trigonometrische Funktionen.
@@ -54,13 +61,14 @@ class TrigonometrischeFunktion(Funktion):
                 "Hast du vielleicht eine ganzrationale, gebrochen-rationale oder exponentiale Funktion gemeint?"
             )
 
-        # 🔥 CACHE für wiederholte Berechnungen
-        self._cache = {}
-
+    @gemessen("solve")
     def nullstellen(self, real: bool = True, runden=None) -> list[sp.Basic]:
         """
         Berechnet die Nullstellen der trigonometrischen Funktion.
 
+        Periodische Nullstellen werden in TRIG_BEREICH aufgezählt, für andere
+        Bereiche siehe `nullstellen_im_intervall`.
+
         Args:
             real: Nur reelle Nullstellen zurückgeben
             runden: Anzahl Nachkommastellen für Rundung
@@ -70,8 +78,11 @@ class TrigonometrischeFunktion(Funktion):
         """
         # 🔥 UNIFIED ARCHITECTURE: Verwende Basis-Klassen-Properties 🔥
         try:
-            # Verwende SymPy's solve für die Gleichung
-            lösungen = solve(self.term_sympy, self._variable_symbol)
+            schar = self.nullstellen_schar()
+            if schar is not None:
+                lösungen = schar.im_intervall(*TRIG_BEREICH)
+            else:
+                lösungen = solve(self.term_sympy, self._variable_symbol)
 
             nullstellen_liste = []
             for lösung in lösungen:
@@ -88,10 +99,8 @@ class TrigonometrischeFunktion(Funktion):
         except (AttributeError, TypeError, ValueError) as e:
             # Für komplexe trigonometrische Funktionen: leere Liste zurückgeben
             # Logge den Fehler für Debugging-Zwecke
-            import logging
-
-            logging.debug(
-                f"Nullstellen-Berechnung fehlgeschlagen für {self.term()}: {e}"
+            logger.debug(
+                "Nullstellen-Berechnung fehlgeschlagen für %s: %s", Lazy(self.term), e
             )
             return []
 
@@ -183,10 +192,10 @@ class TrigonometrischeFunktion(Funktion):
 
         except (AttributeError, ValueError, TypeError) as e:
             # Logge den Fehler für Debugging-Zwecke
-            import logging
-
-            logging.debug(
-                f"Periodenlängen-Berechnung fehlgeschlagen für {self.term()}: {e}"
+            logger.debug(
+                "Periodenlängen-Berechnung fehlgeschlagen für %s: %s",
+                Lazy(self.term),
+                e,
             )
             return 0.0  # type: ignore
 
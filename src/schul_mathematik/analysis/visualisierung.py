@@ -10,8 +10,9 @@ import math
 import numpy as np
 import plotly.graph_objects as go
 
-from .config import SchulAnalysisConfig, config
+from .config import aktuelle_konfiguration
 from .funktion import Funktion
+from .instrumentierung import gemessen
 
 
 def _fuege_punkte_fuer_mehrfache_funktionen_hinzu(
@@ -53,7 +54,7 @@ def _fuege_punkte_fuer_mehrfache_funktionen_hinzu(
                                         mode="markers",
                                         name=f"{funk_name} Nullstelle x={x_ns:.3f}",
                                         marker={
-                                            "color": SchulAnalysisConfig.COLORS.get(
+                                            "color": aktuelle_konfiguration().COLORS.get(
                                                 "secondary", "red"
                                             ),
                                             "size": 10,
@@ -847,7 +848,8 @@ def _finde_interessante_punkte(funktion):
         import logging
 
         logging.debug(
-            f"Fehler beim Berechnen von Sonderpunkten für {getattr(funktion, 'term_str', str(funktion))}"
+            "Fehler beim Berechnen von Sonderpunkten für %s",
+            getattr(funktion, "term_str", funktion),
         )
         pass
 
@@ -1508,19 +1510,26 @@ def _erstelle_plotly_figur_mit_intelligenten_achsen(
     else:
         polstellen = []
 
-    for x in x_werte:
-        try:
-            # Prüfe, ob x nahe einer Polstelle ist
-            ist_nahe_polstelle = any(abs(x - ps) < 0.1 for ps in polstellen)
-            if ist_nahe_polstelle:
-                continue
+    # Polynome ohne Parameter: Horner-Schema auf dem ganzen Array
+    if getattr(funktion, "polynom", None) is not None:
+        y_array = funktion.auswerten(x_werte)
+        endlich = np.isfinite(y_array)
+        gueltige_x = x_werte[endlich].tolist()
+        y_werte = y_array[endlich].tolist()
+    else:
+        for x in x_werte:
+            try:
+                # Prüfe, ob x nahe einer Polstelle ist
+                ist_nahe_polstelle = any(abs(x - ps) < 0.1 for ps in polstellen)
+                if ist_nahe_polstelle:
+                    continue
 
-            y = funktion.wert(x)
-            if _ist_endlich(y):
-                y_werte.append(_formatiere_float(y))
-                gueltige_x.append(x)
-        except (ValueError, ZeroDivisionError, OverflowError):
-            continue
+                y = funktion.wert(x)
+                if _ist_endlich(y):
+                    y_werte.append(_formatiere_float(y))
+                    gueltige_x.append(x)
+            except (ValueError, ZeroDivisionError, OverflowError):
+                continue
 
     # Erstelle die Figur
     fig = go.Figure()
@@ -1533,7 +1542,7 @@ def _erstelle_plotly_figur_mit_intelligenten_achsen(
                 y=y_werte,
                 mode="lines",
                 name=f"f(x) = {funktion.term()}",
-                line=config.get_line_config(color_key="primary"),
+                line=aktuelle_konfiguration().get_line_config(color_key="primary"),
                 hovertemplate="<b>x</b>: %{x:.3f}<br><b>f(x)</b>: %{y:.3f}<extra></extra>",
             )
         )
@@ -1552,7 +1561,7 @@ def _erstelle_plotly_figur_mit_intelligenten_achsen(
                                 y=[0],
                                 mode="markers",
                                 name=f"Nullstelle x={x_ns:.3f}",
-                                marker=config.get_marker_config(
+                                marker=aktuelle_konfiguration().get_marker_config(
                                     color_key="secondary", size=10
                                 ),
                                 showlegend=False,
@@ -1585,7 +1594,7 @@ def _erstelle_plotly_figur_mit_intelligenten_achsen(
                                 y=[_formatiere_float(y_es)],
                                 mode="markers",
                                 name=f"{art} ({x_es:.3f}|{_formatiere_float(y_es):.3f})",
-                                marker=config.get_marker_config(
+                                marker=aktuelle_konfiguration().get_marker_config(
                                     color_key=color, size=12
                                 ),
                                 showlegend=False,
@@ -1616,7 +1625,7 @@ def _erstelle_plotly_figur_mit_intelligenten_achsen(
                                 y=[y_ws],
                                 mode="markers",
                                 name=f"Wendepunkt ({x_ws:.3f}|{y_ws:.3f})",
-                                marker=config.get_marker_config(
+                                marker=aktuelle_konfiguration().get_marker_config(
                                     color_key="tertiary", size=10
                                 ),
                                 showlegend=False,
@@ -1646,11 +1655,11 @@ def _erstelle_plotly_figur_mit_intelligenten_achsen(
                 )
 
     # 🔥 INTELLIGENTE ACHSENKONFIGURATION 🔥
-    layout_config = config.get_plot_config()
+    layout_config = aktuelle_konfiguration().get_plot_config()
 
     # Intelligente Achsenkonfiguration basierend auf Schrittweiten
     xaxis_config = {
-        **config.get_axis_config(
+        **aktuelle_konfiguration().get_axis_config(
             mathematical_mode=False
         ),  # Kein 1:1-Verhältnis für bessere Sichtbarkeit
         "range": [float(x_min), float(x_max)],
@@ -1662,7 +1671,7 @@ def _erstelle_plotly_figur_mit_intelligenten_achsen(
     }
 
     yaxis_config = {
-        **config.get_axis_config(mathematical_mode=False),
+        **aktuelle_konfiguration().get_axis_config(mathematical_mode=False),
         "range": [float(y_min), float(y_max)],
         "title": "f(x)",
         "autorange": False,  # Stellt sicher dass unsere Range verwendet wird
@@ -1986,6 +1995,7 @@ def _berechne_finale_grenzen(funktion, x_min=None, x_max=None, y_min=None, y_max
 # ====================
 
 
+@gemessen("plot")
 def Graph(*funktionen, x_min=None, x_max=None, y_min=None, y_max=None, **kwargs):
     """Erzeugt einen Graphen für eine oder mehrere Funktionen mit vereinfachter Bereichskontrolle
 
@@ -2195,12 +2205,12 @@ def Graph(*funktionen, x_min=None, x_max=None, y_min=None, y_max=None, **kwargs)
         _fuege_flaeche_zu_graph_hinzu(fig, funktionen, x_min, x_max, **kwargs)
 
         # Konfiguration
-        layout_config = config.get_plot_config()
+        layout_config = aktuelle_konfiguration().get_plot_config()
         layout_config.update(
             {
                 "title": kwargs.get("titel", "Vergleich mehrerer Funktionen"),
                 "xaxis": {
-                    **config.get_axis_config(
+                    **aktuelle_konfiguration().get_axis_config(
                         mathematical_mode=False
                     ),  # Keine 1:1 Aspect Ratio für mehrere Funktionen!
                     "range": [float(x_min), float(x_max)],
@@ -2211,7 +2221,7 @@ def Graph(*funktionen, x_min=None, x_max=None, y_min=None, y_max=None, **kwargs)
                     "fixedrange": False,
                 },
                 "yaxis": {
-                    **config.get_axis_config(mathematical_mode=False),
+                    **aktuelle_konfiguration().get_axis_config(mathematical_mode=False),
                     "range": [float(y_min), float(y_max)],
                     "title": "y",
                     "autorange": False,
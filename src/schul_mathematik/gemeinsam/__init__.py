@@ -7,8 +7,13 @@ Validierungsfunktionen und Basis-Visualisierung.
 
 from ..analysis.errors import *  # Alle Fehlerklassen importieren
 from ..analysis.sympy_types import *  # Alle Typ-Definitionen importieren
+from .zahlen import als_bruch, als_rational, ist_gleitkomma, ist_rational
 
 __all__ = [
+    "als_bruch",
+    "als_rational",
+    "ist_gleitkomma",
+    "ist_rational",
     # Wird später mit gemeinsam genutzten Komponenten gefüllt
     # Typ-Definitionen und Fehlerklassen werden aus analysis importiert
 ]
@@ -0,0 +1,52 @@
+"""
+Exakte Zahlumwandlung für alle Module
+
+Zahlen aus Eingaben (int, float, Fraction, SymPy-Zahlen, Zeichenketten aus
+CSV-Dateien) werden verlustfrei in Brüche umgewandelt. Gleitkommazahlen
+werden über ihre Dezimaldarstellung übernommen, damit 0.1 wirklich 1/10 ist.
+"""
+
+from fractions import Fraction
+from numbers import Integral, Rational, Real
+
+import sympy as sp
+
+
+def als_bruch(wert) -> Fraction:
+    """Wandelt eine Zahl exakt in einen Bruch um (0.1 → 1/10)
+
+    Raises:
+        ValueError: Wenn der Wert keine rationale Zahl ist (z.B. sqrt(2), a)
+    """
+    if isinstance(wert, Fraction):
+        return wert
+    if isinstance(wert, sp.Rational):
+        return Fraction(int(wert.p), int(wert.q))
+    if isinstance(wert, Integral):
+        return Fraction(int(wert))
+    try:
+        return Fraction(str(wert).strip())
+    except ValueError:
+        raise ValueError(f"'{wert}' ist keine rationale Zahl") from None
+
+
+def als_rational(wert) -> sp.Rational:
+    """Wandelt eine Zahl exakt in einen SymPy-Bruch um (0.1 → 1/10)"""
+    bruch = als_bruch(wert)
+    return sp.Rational(bruch.numerator, bruch.denominator)
+
+
+def ist_rational(wert) -> bool:
+    """Prüft, ob sich ein Wert mit als_bruch exakt umwandeln lässt"""
+    try:
+        als_bruch(wert)
+    except (ValueError, TypeError):
+        return False
+    return True
+
+
+def ist_gleitkomma(wert) -> bool:
+    """Prüft, ob ein Wert als Gleitkommazahl übergeben wurde"""
+    return isinstance(wert, sp.Float) or (
+        isinstance(wert, Real) and not isinstance(wert, Rational)
+    )
@@ -5,14 +5,17 @@ Enthält alle Funktionalitäten für Punkte, Geraden, Ebenen,
 Abstandsberechnungen, Schnittberechnungen, etc.
 """
 
-# Hier werden später die Klassen und Funktionen für analytische Geometrie importiert
-# .punkte_geraden import Punkt, Gerade, Ebene
+from .punkte_geraden import Ebene, Gerade, Punkt
+
+# Hier werden später weitere Klassen und Funktionen für analytische Geometrie importiert
 # .abstaende import abstand_punkt_gerade, abstand_zwei_geraden
 # .visualisierung import zeichne_punkt, zeichne_gerade, zeichne_ebene
 
 __all__ = [
-    # Wird später mit Klassen und Funktionen gefüllt
-    # "Punkt", "Gerade", "Ebene",
+    "Punkt",
+    "Gerade",
+    "Ebene",
+    # Wird später mit weiteren Klassen und Funktionen gefüllt
     # "abstand_punkt_gerade", "abstand_zwei_geraden",
     # "zeichne_punkt", "zeichne_gerade", "zeichne_ebene",
 ]
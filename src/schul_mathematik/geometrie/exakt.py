@@ -0,0 +1,97 @@
+"""
+Exakter Rechenkern für Punkte, Geraden und Ebenen
+
+Koordinaten werden als Tupel von Brüchen geführt und über geschlossene
+Formeln (Skalarprodukt, Kreuzprodukt, Determinanten) verknüpft. Nur wenn
+eine Koordinate symbolisch ist (Parameter, Wurzeln, ...), wird mit
+SymPy-Ausdrücken gerechnet.
+"""
+
+from fractions import Fraction
+
+import sympy as sp
+
+from ..gemeinsam.zahlen import als_bruch
+
+
+def _koordinate(wert) -> Fraction | sp.Expr:
+    try:
+        return als_bruch(wert)
+    except (ValueError, TypeError):
+        return sp.sympify(wert)
+
+
+def vektor(koordinaten) -> tuple:
+    """Koordinaten als Tupel aus Brüchen, symbolische Einträge als SymPy-Ausdruck"""
+    return tuple(_koordinate(k) for k in koordinaten)
+
+
+def als_sympy(wert) -> sp.Expr:
+    """Wandelt einen Bruch in eine SymPy-Zahl um (0.1 → 1/10)"""
+    if isinstance(wert, Fraction):
+        return sp.Rational(wert.numerator, wert.denominator)
+    return sp.sympify(wert)
+
+
+def ist_null(wert) -> bool:
+    """Prüft exakt auf 0; symbolische Werte müssen identisch verschwinden"""
+    if isinstance(wert, Fraction):
+        return wert == 0
+    return wert == 0 or sp.simplify(wert) == 0
+
+
+def differenz(a: tuple, b: tuple) -> tuple:
+    """a - b komponentenweise"""
+    return tuple(x - y for x, y in zip(a, b, strict=True))
+
+
+def skalarprodukt(a: tuple, b: tuple) -> Fraction | sp.Expr:
+    """a · b"""
+    summe = Fraction(0)
+    for x, y in zip(a, b, strict=True):
+        summe += x * y
+    return summe
+
+
+def kreuzprodukt(a: tuple, b: tuple) -> tuple:
+    """a × b für dreidimensionale Vektoren"""
+    a1, a2, a3 = a
+    b1, b2, b3 = b
+    return (a2 * b3 - a3 * b2, a3 * b1 - a1 * b3, a1 * b2 - a2 * b1)
+
+
+def determinante(a: tuple, b: tuple) -> Fraction | sp.Expr:
+    """Determinante der 2×2-Matrix mit den Spalten a und b"""
+    return a[0] * b[1] - a[1] * b[0]
+
+
+def ist_nullvektor(v: tuple) -> bool:
+    return all(ist_null(k) for k in v)
+
+
+def sind_parallel(a: tuple, b: tuple) -> bool:
+    """Kollinearität über Determinante (2D) bzw. Kreuzprodukt (3D)"""
+    if len(a) == 2:
+        return ist_null(determinante(a, b))
+    return ist_nullvektor(kreuzprodukt(a, b))
+
+
+def abstandsquadrat_zur_geraden(w: tuple, v: tuple) -> Fraction | sp.Expr:
+    """Quadrat des Abstands von w zur Ursprungsgeraden mit Richtung v
+
+    Nach der Lagrange-Identität gilt |w × v|² = |w|²·|v|² - (w·v)².
+    """
+    wv = skalarprodukt(w, v)
+    vv = skalarprodukt(v, v)
+    return (skalarprodukt(w, w) * vv - wv * wv) / vv
+
+
+def wurzel(quadrat) -> sp.Expr:
+    """Exakte Quadratwurzel eines nichtnegativen Werts"""
+    return sp.sqrt(als_sympy(quadrat))
+
+
+def kosinusquadrat(a: tuple, b: tuple) -> Fraction | sp.Expr:
+    """cos² des Winkels zwischen den Richtungen a und b"""
+    ab = skalarprodukt(a, b)
+    return ab * ab / (skalarprodukt(a, a) * skalarprodukt(b, b))
@@ -5,10 +5,26 @@ Grundlegende Klassen für Vektoren, Punkte, Geraden und Ebenen
 mit Operationen und Berechnungen im 2D und 3D Raum
 """
 
+from fractions import Fraction
+
 import sympy as sp
-from sympy import Matrix, solve, symbols
+from sympy import Matrix
 
 from ..gemeinsam import *
+from .exakt import (
+    abstandsquadrat_zur_geraden,
+    als_sympy,
+    determinante,
+    differenz,
+    ist_null,
+    ist_nullvektor,
+    kosinusquadrat,
+    kreuzprodukt,
+    sind_parallel,
+    skalarprodukt,
+    vektor,
+    wurzel,
+)
 
 
 class Punkt:
@@ -45,12 +61,8 @@ class Punkt:
         if self.dimension != other.dimension:
             raise ValueError("Punkte müssen gleiche Dimension haben")
 
-        sum_quadrate = 0
-        for i in range(self.dimension):
-            diff = self.koordinaten[i] - other.koordinaten[i]
-            sum_quadrate += diff**2
-
-        return sp.sqrt(sum_quadrate)
+        d = differenz(vektor(self.koordinaten), vektor(other.koordinaten))
+        return wurzel(skalarprodukt(d, d))
 
     def __add__(self, other: "Punkt") -> "Punkt":
         """Vektoraddition"""
@@ -107,55 +119,104 @@ class Gerade:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def _vektoren(self) -> tuple[tuple, tuple]:
+        a = vektor(self.aufpunkt.koordinaten)
+        return a, vektor(self.richtungsvektor.koordinaten)
+
     def enthaelt_punkt(self, punkt: Punkt) -> bool:
-        """Prüft, ob ein Punkt auf der Geraden liegt"""
+        """Prüft, ob ein Punkt auf der Geraden liegt (P - A parallel zu V)"""
         if self.dimension != punkt.dimension:
             return False
 
-        # Löse A + r·V = P für r
-        for i in range(self.dimension):
-            gleichung = sp.Eq(
-                self.aufpunkt.koordinaten[i]
-                + symbols("r") * self.richtungsvektor.koordinaten[i],
-                punkt.koordinaten[i],
-            )
-            loesung = solve(gleichung, symbols("r"))
-            if loesung:
-                return True
-        return False
+        a, v = self._vektoren()
+        return sind_parallel(differenz(vektor(punkt.koordinaten), a), v)
+
+    def ist_parallel_zu(self, other: "Gerade") -> bool:
+        """Prüft, ob die Richtungsvektoren kollinear sind (auch bei Identität)"""
+        self._pruefe_dimension(other)
+        return sind_parallel(self._vektoren()[1], other._vektoren()[1])
+
+    def ist_identisch_mit(self, other: "Gerade") -> bool:
+        return self.ist_parallel_zu(other) and self.enthaelt_punkt(other.aufpunkt)
+
+    def ist_windschief_zu(self, other: "Gerade") -> bool:
+        return self.lage_zu(other) == "windschief"
+
+    def lage_zu(self, other: "Gerade") -> str:
+        """Lagebeziehung zu einer Geraden: identisch, parallel, schneidend oder windschief"""
+        self._pruefe_dimension(other)
+        a1, v1 = self._vektoren()
+        a2, v2 = other._vektoren()
+        w = differenz(a2, a1)
+
+        if sind_parallel(v1, v2):
+            return "identisch" if sind_parallel(w, v1) else "parallel"
+        if self.dimension == 2 or ist_null(skalarprodukt(w, kreuzprodukt(v1, v2))):
+            return "schneidend"
+        return "windschief"
 
     def schnittpunkt_mit(self, other: "Gerade") -> Punkt | None:
-        """Berechnet den Schnittpunkt mit einer anderen Geraden"""
-        if self.dimension != other.dimension:
-            raise ValueError("Geraden müssen gleiche Dimension haben")
+        """Berechnet den Schnittpunkt mit einer anderen Geraden
+
+        Returns:
+            None bei parallelen, identischen oder windschiefen Geraden
+        """
+        self._pruefe_dimension(other)
+        a1, v1 = self._vektoren()
+        a2, v2 = other._vektoren()
+        w = differenz(a2, a1)
 
         if self.dimension == 2:
-            # 2D: Löse das Gleichungssystem
-            r, s = symbols("r s")
-
-            # Gleichungssystem: A1 + r·V1 = A2 + s·V2
-            gleichungen = []
-            for i in range(2):
-                gl = sp.Eq(
-                    self.aufpunkt.koordinaten[i]
-                    + r * self.richtungsvektor.koordinaten[i],
-                    other.aufpunkt.koordinaten[i]
-                    + s * other.richtungsvektor.koordinaten[i],
-                )
-                gleichungen.append(gl)
-
-            loesung = solve(gleichungen, [r, s])
-            if loesung:
-                r_wert = loesung[r]
-                # Berechnung des Schnittpunkts
-                schnitt_koordinaten = [
-                    self.aufpunkt.koordinaten[i]
-                    + r_wert * self.richtungsvektor.koordinaten[i]
-                    for i in range(2)
-                ]
-                return Punkt(schnitt_koordinaten, f"{self.name}∩{other.name}")
-
-        return None  # Kein Schnittpunkt gefunden oder parallel
+            # Cramersche Regel für A1 + r·V1 = A2 + s·V2
+            d = determinante(v1, v2)
+            if ist_null(d):
+                return None
+            r = determinante(w, v2) / d
+        else:
+            # r·(V1 × V2) = W × V2, lösbar nur für komplanare Geraden
+            n = kreuzprodukt(v1, v2)
+            if ist_nullvektor(n) or not ist_null(skalarprodukt(w, n)):
+                return None
+            r = skalarprodukt(kreuzprodukt(w, v2), n) / skalarprodukt(n, n)
+
+        schnitt_koordinaten = [
+            als_sympy(ai + r * vi) for ai, vi in zip(a1, v1, strict=True)
+        ]
+        return Punkt(schnitt_koordinaten, f"{self.name}∩{other.name}")
+
+    def abstand_zu_punkt(self, punkt: Punkt) -> sp.Expr:
+        """Abstand eines Punktes von der Geraden"""
+        if self.dimension != punkt.dimension:
+            raise ValueError("Punkt und Gerade müssen gleiche Dimension haben")
+
+        a, v = self._vektoren()
+        return wurzel(
+            abstandsquadrat_zur_geraden(differenz(vektor(punkt.koordinaten), a), v)
+        )
+
+    def abstand_zu(self, other: "Gerade") -> sp.Expr:
+        """Abstand zu einer anderen Geraden (0 bei Schnitt oder Identität)"""
+        lage = self.lage_zu(other)
+        if lage == "parallel":
+            return self.abstand_zu_punkt(other.aufpunkt)
+        if lage == "windschief":
+            a1, v1 = self._vektoren()
+            a2, v2 = other._vektoren()
+            n = kreuzprodukt(v1, v2)
+            wn = skalarprodukt(differenz(a2, a1), n)
+            return wurzel(wn * wn / skalarprodukt(n, n))
+        return sp.Integer(0)
+
+    def schnittwinkel(self, other: "Gerade") -> sp.Expr:
+        """Winkel zwischen den Richtungsvektoren im Bogenmaß, zwischen 0 und π/2"""
+        self._pruefe_dimension(other)
+        return sp.acos(
+            wurzel(kosinusquadrat(self._vektoren()[1], other._vektoren()[1]))
+        )
+
+    def _pruefe_dimension(self, other: "Gerade") -> None:
+        if self.dimension != other.dimension:
+            raise ValueError("Geraden müssen gleiche Dimension haben")
 
 
 class Ebene:
@@ -195,38 +256,108 @@ class Ebene:
     def __repr__(self) -> str:
         return self.__str__()
 
+    def _normale(self) -> tuple:
+        return kreuzprodukt(
+            vektor(self.richtungsvektor1.koordinaten),
+            vektor(self.richtungsvektor2.koordinaten),
+        )
+
     def normalenvektor(self) -> Punkt:
         """Berechnet den Normalenvektor der Ebene (Kreuzprodukt)"""
-        v1 = self.richtungsvektor1.als_matrix()
-        v2 = self.richtungsvektor2.als_matrix()
+        return Punkt([als_sympy(k) for k in self._normale()], f"n_{self.name}")
 
-        # Kreuzprodukt in 3D
-        kreuz = (
-            Matrix([[0, -v1[2], v1[1]], [v1[2], 0, -v1[0]], [-v1[1], v1[0], 0]]) * v2
-        )
-
-        return Punkt([kreuz[0], kreuz[1], kreuz[2]], f"n_{self.name}")
+    def _abstand_zum_aufpunkt(self, punkt: Punkt) -> Fraction | sp.Expr:
+        """n · (P - A), verschwindet genau für Punkte der Ebene"""
+        w = differenz(vektor(punkt.koordinaten), vektor(self.aufpunkt.koordinaten))
+        return skalarprodukt(self._normale(), w)
 
     def enthaelt_punkt(self, punkt: Punkt) -> bool:
-        """Prüft, ob ein Punkt in der Ebene liegt"""
+        """Prüft, ob ein Punkt in der Ebene liegt (n · (P - A) = 0)"""
         if self.dimension != punkt.dimension:
             return False
 
-        # Löse A + r·U + s·V = P für r und s
-        r, s = symbols("r s")
-        gleichungen = []
+        return ist_null(self._abstand_zum_aufpunkt(punkt))
+
+    def enthaelt_gerade(self, gerade: Gerade) -> bool:
+        return self.lage_zu_gerade(gerade) == "enthalten"
+
+    def lage_zu_gerade(self, gerade: Gerade) -> str:
+        """Lagebeziehung zu einer Geraden: enthalten, parallel oder schneidend"""
+        self._pruefe_gerade(gerade)
+        if not ist_null(skalarprodukt(self._normale(), gerade._vektoren()[1])):
+            return "schneidend"
+        return "enthalten" if self.enthaelt_punkt(gerade.aufpunkt) else "parallel"
+
+    def lage_zu_ebene(self, other: "Ebene") -> str:
+        """Lagebeziehung zu einer Ebene: identisch, parallel oder schneidend"""
+        if not sind_parallel(self._normale(), other._normale()):
+            return "schneidend"
+        return "identisch" if self.enthaelt_punkt(other.aufpunkt) else "parallel"
+
+    def schnittpunkt_mit_gerade(self, gerade: Gerade) -> Punkt | None:
+        """Schnittpunkt mit einer Geraden, None bei paralleler oder enthaltener Gerade"""
+        self._pruefe_gerade(gerade)
+        n = self._normale()
+        a, v = gerade._vektoren()
+        nv = skalarprodukt(n, v)
+        if ist_null(nv):
+            return None
+
+        r = -self._abstand_zum_aufpunkt(gerade.aufpunkt) / nv
+        schnitt_koordinaten = [
+            als_sympy(ai + r * vi) for ai, vi in zip(a, v, strict=True)
+        ]
+        return Punkt(schnitt_koordinaten, f"{self.name}∩{gerade.name}")
+
+    def schnittgerade_mit(self, other: "Ebene", name: str = "s") -> Gerade | None:
+        """Schnittgerade zweier Ebenen, None bei parallelen oder identischen Ebenen"""
+        n1, n2 = self._normale(), other._normale()
+        u = kreuzprodukt(n1, n2)
+        uu = skalarprodukt(u, u)
+        if ist_null(uu):
+            return None
+
+        # Aufpunkt P = (d1·(n2 × u) + d2·(u × n1)) / |u|² erfüllt n1·P = d1 und n2·P = d2
+        d1 = skalarprodukt(n1, vektor(self.aufpunkt.koordinaten))
+        d2 = skalarprodukt(n2, vektor(other.aufpunkt.koordinaten))
+        p = [
+            als_sympy((d1 * x + d2 * y) / uu)
+            for x, y in zip(kreuzprodukt(n2, u), kreuzprodukt(u, n1), strict=True)
+        ]
+        return Gerade(Punkt(p, "A"), Punkt([als_sympy(k) for k in u], "u"), name)
+
+    def abstand_zu_punkt(self, punkt: Punkt) -> sp.Expr:
+        """Abstand |n · (P - A)| / |n| eines Punktes von der Ebene"""
+        if self.dimension != punkt.dimension:
+            raise ValueError("Punkt und Ebene müssen gleiche Dimension haben")
+
+        d = self._abstand_zum_aufpunkt(punkt)
+        n = self._normale()
+        return wurzel(d * d / skalarprodukt(n, n))
 
-        for i in range(3):
-            gl = sp.Eq(
-                self.aufpunkt.koordinaten[i]
-                + r * self.richtungsvektor1.koordinaten[i]
-                + s * self.richtungsvektor2.koordinaten[i],
-                punkt.koordinaten[i],
+    def abstand_zu(self, other: "Gerade | Ebene") -> sp.Expr:
+        """Abstand zu einer parallelen Geraden oder Ebene, sonst 0"""
+        if isinstance(other, Gerade):
+            lage = self.lage_zu_gerade(other)
+        else:
+            lage = self.lage_zu_ebene(other)
+        if lage == "parallel":
+            return self.abstand_zu_punkt(other.aufpunkt)
+        return sp.Integer(0)
+
+    def schnittwinkel(self, other: "Gerade | Ebene") -> sp.Expr:
+        """Schnittwinkel mit einer Geraden oder Ebene im Bogenmaß, zwischen 0 und π/2"""
+        if isinstance(other, Gerade):
+            self._pruefe_gerade(other)
+            # Winkel zur Geraden ergänzt den Winkel zur Normalen zu π/2
+            return sp.asin(
+                wurzel(kosinusquadrat(self._normale(), other._vektoren()[1]))
             )
-            gleichungen.append(gl)
+        return sp.acos(wurzel(kosinusquadrat(self._normale(), other._normale())))
 
-        loesung = solve(gleichungen, [r, s])
-        return bool(loesung)
+    def _pruefe_gerade(self, gerade: Gerade) -> None:
+        if gerade.dimension != 3:
+            raise ValueError("Gerade muss 3-dimensional sein")
 
 
 # Komfort-Funktionen
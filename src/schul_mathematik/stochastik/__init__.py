@@ -5,22 +5,55 @@ Enthält alle Funktionalitäten für Wahrscheinlichkeitsrechnung,
 statistische Verteilungen, Datenanalyse, etc.
 """
 
-from .verteilungen import (
-    Binomialverteilung,
-    Normalverteilung,
-    StatistischeVerteilung,
-)
-from .visualisierung import (
-    zeichne_binomialverteilung,
-    zeichne_normalverteilung,
-)
-from .wrapper import (
-    BinomialCDF,
-    BinomialPDF,
-    NormalCDF,
-    NormalIntervall,
-    NormalPDF,
-)
+from .._lazy import lazy_attribute
+
+# sympy.stats, NumPy und Plotly werden erst beim ersten Zugriff geladen
+_LAZY = {
+    **dict.fromkeys(
+        (
+            "Datenzusammenfassung",
+            "Histogramm",
+            "LaufendeRegression",
+            "LaufendeStatistik",
+            "Quantilspeicher",
+            "analysiere_csv",
+            "beschreibe_daten",
+            "lese_csv_bloecke",
+            "regression_csv",
+        ),
+        ".datenanalyse",
+    ),
+    **dict.fromkeys(
+        ("Binomialverteilung", "Normalverteilung", "StatistischeVerteilung"),
+        ".verteilungen",
+    ),
+    **dict.fromkeys(
+        (
+            "zeichne_binomialverteilung",
+            "zeichne_histogramm",
+            "zeichne_normalverteilung",
+            "zeichne_regression",
+            "zeichne_vergleich_zwei_normalverteilungen",
+        ),
+        ".visualisierung",
+    ),
+    **dict.fromkeys(
+        (
+            "BinomialCDF",
+            "BinomialPDF",
+            "NormalCDF",
+            "NormalIntervall",
+            "NormalPDF",
+            "StandardnormalCDF",
+            "StandardnormalPDF",
+            "Sigma1Bereich",
+            "Sigma2Bereich",
+            "Sigma3Bereich",
+        ),
+        ".wrapper",
+    ),
+}
+__getattr__, __dir__ = lazy_attribute(__name__, globals(), _LAZY)
 
 __all__ = [
     # Verteilungsklassen
@@ -33,7 +66,19 @@ __all__ = [
     "NormalPDF",
     "NormalCDF",
     "NormalIntervall",
+    # Datenanalyse
+    "LaufendeStatistik",
+    "LaufendeRegression",
+    "Quantilspeicher",
+    "Histogramm",
+    "Datenzusammenfassung",
+    "beschreibe_daten",
+    "analysiere_csv",
+    "regression_csv",
+    "lese_csv_bloecke",
     # Visualisierung
     "zeichne_binomialverteilung",
     "zeichne_normalverteilung",
+    "zeichne_histogramm",
+    "zeichne_regression",
 ]
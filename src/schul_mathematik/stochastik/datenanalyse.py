@@ -0,0 +1,762 @@
+"""
+Datenanalyse für das Stochastik-Modul
+
+Beschreibende Statistik für große Datensätze (Umfragen, Messreihen) aus CSV-Dateien.
+Die Daten werden blockweise gelesen und laufend ausgewertet, sodass auch Dateien mit
+Millionen Zeilen in beschränktem Speicher analysiert werden können:
+
+- Mittelwert, Varianz und Standardabweichung nach Welford (blockweise nach Chan vereinigt)
+- exakte Quantile durch Sortieren eines speicherabgebildeten Arrays (numpy.memmap)
+- Histogramme mit festen Klassen
+- Regressionsgeraden über laufende Ko-Momente
+
+Für kleine Datensätze liefern alle Kennzahlen auf Wunsch (exakt=True) exakte
+SymPy-Brüche statt Gleitkommazahlen.
+"""
+
+import csv
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from fractions import Fraction
+
+import numpy as np
+import sympy as sp
+
+from ..gemeinsam.zahlen import als_bruch, als_rational
+
+# Standard-Blockgröße beim Lesen von CSV-Dateien (Zeilen pro Block)
+STANDARD_BLOCKGROESSE = 65_536
+
+# Obergrenze für exakt gespeicherte Einzelwerte (exakte Quantile)
+MAX_EXAKTE_WERTE = 100_000
+
+
+# =============================================================================
+# CSV-EINGABE
+# =============================================================================
+
+
+def lese_csv_bloecke(
+    pfad: str | os.PathLike,
+    spalten: list[str],
+    block_groesse: int = STANDARD_BLOCKGROESSE,
+    trennzeichen: str = ",",
+    dezimalkomma: bool = False,
+    kodierung: str = "utf-8",
+) -> Iterator[dict[str, list[str]]]:
+    """Liest ausgewählte Spalten einer CSV-Datei blockweise
+
+    Zeilen, in denen einer der gewünschten Werte fehlt, werden übersprungen,
+    damit zusammengehörige Werte (z.B. für Regressionen) in allen Spalten
+    an derselben Position stehen.
+
+    Args:
+        pfad: Pfad zur CSV-Datei (erste Zeile enthält die Spaltennamen)
+        spalten: Namen der zu lesenden Spalten
+        block_groesse: Anzahl der Zeilen pro Block
+        trennzeichen: Feldtrennzeichen (z.B. ";" bei deutschen Excel-Exporten)
+        dezimalkomma: Dezimalkomma statt Dezimalpunkt ("3,5" -> "3.5")
+        kodierung: Zeichenkodierung der Datei
+
+    Yields:
+        Dictionary Spaltenname -> Liste der Rohwerte (als Strings) des Blocks
+    """
+    if block_groesse < 1:
+        raise ValueError("Die Blockgröße muss mindestens 1 sein")
+
+    with open(pfad, newline="", encoding=kodierung) as datei:
+        leser = csv.reader(datei, delimiter=trennzeichen)
+        try:
+            kopfzeile = [name.strip() for name in next(leser)]
+        except StopIteration:
+            return
+
+        fehlend = [s for s in spalten if s not in kopfzeile]
+        if fehlend:
+            raise ValueError(
+                f"Spalte(n) {', '.join(fehlend)} nicht in der CSV-Datei gefunden. "
+                f"Vorhandene Spalten: {', '.join(kopfzeile)}"
+            )
+        indizes = [kopfzeile.index(s) for s in spalten]
+
+        block: dict[str, list[str]] = {s: [] for s in spalten}
+        anzahl = 0
+        for zeile in leser:
+            try:
+                werte = [zeile[i].strip() for i in indizes]
+            except IndexError:
+                continue
+            if not all(werte):
+                continue
+            if dezimalkomma:
+                werte = [w.replace(".", "").replace(",", ".") for w in werte]
+            for s, w in zip(spalten, werte, strict=True):
+                block[s].append(w)
+            anzahl += 1
+            if anzahl >= block_groesse:
+                yield block
+                block = {s: [] for s in spalten}
+                anzahl = 0
+
+        if anzahl:
+            yield block
+
+
+# =============================================================================
+# LAUFENDE KENNZAHLEN
+# =============================================================================
+
+
+class LaufendeStatistik:
+    """Laufender Mittelwert, Varianz und Extremwerte nach Welford
+
+    Werte können einzeln oder blockweise hinzugefügt werden; Blöcke werden
+    vektorisiert ausgewertet und mit der Formel von Chan et al. vereinigt.
+    Der Speicherbedarf ist unabhängig von der Anzahl der Werte.
+
+    Args:
+        exakt: Zusätzlich exakte Summen mitführen und Kennzahlen als
+               SymPy-Brüche liefern (nur für kleine Datensätze sinnvoll)
+
+    Examples:
+        >>> s = LaufendeStatistik(exakt=True)
+        >>> s.hinzufuegen_viele(["1.5", "2", "2.5"])
+        >>> s.mittelwert
+        2
+    """
+
+    def __init__(self, exakt: bool = False):
+        self.exakt = exakt
+        self.anzahl = 0
+        self._mittel = 0.0
+        self._m2 = 0.0
+        self.minimum: float | sp.Rational | None = None
+        self.maximum: float | sp.Rational | None = None
+        # Exakte Summen Σx und Σx² (nur im exakten Modus)
+        self._summe = Fraction(0)
+        self._quadratsumme = Fraction(0)
+
+    def hinzufuegen(self, wert) -> None:
+        """Fügt einen einzelnen Wert hinzu (klassischer Welford-Schritt)"""
+        x = float(wert)
+        self.anzahl += 1
+        delta = x - self._mittel
+        self._mittel += delta / self.anzahl
+        self._m2 += delta * (x - self._mittel)
+        self._aktualisiere_extrema(x, x)
+        if self.exakt:
+            b = als_bruch(wert)
+            self._summe += b
+            self._quadratsumme += b * b
+            self._aktualisiere_exakte_extrema(b, b)
+
+    def hinzufuegen_viele(self, werte: Iterable) -> None:
+        """Fügt einen Block von Werten hinzu"""
+        if not isinstance(werte, np.ndarray):
+            werte = list(werte)
+        if len(werte) == 0:
+            return
+
+        block = np.asarray(werte, dtype=float)
+        n_b = block.size
+        mittel_b = float(block.mean())
+        m2_b = float(((block - mittel_b) ** 2).sum())
+        self._vereinige_momente(n_b, mittel_b, m2_b)
+        self._aktualisiere_extrema(float(block.min()), float(block.max()))
+
+        if self.exakt:
+            brueche = [als_bruch(w) for w in werte]
+            self._summe += sum(brueche, Fraction(0))
+            self._quadratsumme += sum((b * b for b in brueche), Fraction(0))
+            self._aktualisiere_exakte_extrema(min(brueche), max(brueche))
+
+    def vereinige(self, andere: "LaufendeStatistik") -> "LaufendeStatistik":
+        """Vereinigt die Kennzahlen einer anderen Teilstatistik (z.B. anderer Datei)"""
+        if andere.anzahl == 0:
+            return self
+        # Vor der Vereinigung merken, ob bereits exakte Extrema vorliegen
+        exakte_extrema = self.exakt and andere.exakt and self.anzahl > 0
+        self._vereinige_momente(andere.anzahl, andere._mittel, andere._m2)
+        if self.exakt and andere.exakt:
+            self._summe += andere._summe
+            self._quadratsumme += andere._quadratsumme
+            if exakte_extrema:
+                self.minimum = min(self.minimum, andere.minimum)
+                self.maximum = max(self.maximum, andere.maximum)
+            else:
+                self.minimum, self.maximum = andere.minimum, andere.maximum
+        else:
+            self.exakt = False
+            self._aktualisiere_extrema(float(andere.minimum), float(andere.maximum))
+        return self
+
+    def _vereinige_momente(self, n_b: int, mittel_b: float, m2_b: float) -> None:
+        """Chan-Formel: vereinigt (n, Mittelwert, M2) zweier Teilmengen"""
+        n_a = self.anzahl
+        n = n_a + n_b
+        delta = mittel_b - self._mittel
+        self._mittel += delta * n_b / n
+        self._m2 += m2_b + delta * delta * n_a * n_b / n
+        self.anzahl = n
+
+    def _aktualisiere_extrema(self, kleinster: float, groesster: float) -> None:
+        if self.exakt:
+            return
+        if self.minimum is None or kleinster < self.minimum:
+            self.minimum = kleinster
+        if self.maximum is None or groesster > self.maximum:
+            self.maximum = groesster
+
+    def _aktualisiere_exakte_extrema(self, kleinster: Fraction, groesster: Fraction):
+        kleinster_r, groesster_r = als_rational(kleinster), als_rational(groesster)
+        if self.minimum is None or kleinster_r < self.minimum:
+            self.minimum = kleinster_r
+        if self.maximum is None or groesster_r > self.maximum:
+            self.maximum = groesster_r
+
+    def _pruefe_nicht_leer(self) -> None:
+        if self.anzahl == 0:
+            raise ValueError("Keine Daten vorhanden - füge zuerst Werte hinzu")
+
+    @property
+    def mittelwert(self) -> float | sp.Rational:
+        """Arithmetisches Mittel x̄"""
+        self._pruefe_nicht_leer()
+        if self.exakt:
+            return als_rational(self._summe / self.anzahl)
+        return self._mittel
+
+    def varianz(self, stichprobe: bool = False) -> float | sp.Rational:
+        """Varianz der Daten
+
+        Args:
+            stichprobe: Stichprobenvarianz s² (Division durch n-1) statt
+                        empirischer Varianz σ² (Division durch n)
+        """
+        self._pruefe_nicht_leer()
+        nenner = self.anzahl - 1 if stichprobe else self.anzahl
+        if nenner == 0:
+            raise ValueError(
+                "Für die Stichprobenvarianz werden mindestens 2 Werte benötigt"
+            )
+        if self.exakt:
+            m2 = self._quadratsumme - self._summe * self._summe / self.anzahl
+            return als_rational(m2 / nenner)
+        return self._m2 / nenner
+
+    def standardabweichung(self, stichprobe: bool = False) -> float | sp.Expr:
+        """Standardabweichung (Wurzel der Varianz)"""
+        varianz = self.varianz(stichprobe=stichprobe)
+        if self.exakt:
+            return sp.sqrt(varianz)
+        return float(np.sqrt(varianz))
+
+    def __str__(self) -> str:
+        if self.anzahl == 0:
+            return "LaufendeStatistik(leer)"
+        return (
+            f"LaufendeStatistik(n={self.anzahl}, x̄={self.mittelwert}, "
+            f"σ²={self.varianz()})"
+        )
+
+
+class Quantilspeicher:
+    """Exakte Quantile großer Datenmengen über ein speicherabgebildetes Array
+
+    Die Werte werden blockweise in eine temporäre Binärdatei geschrieben.
+    Für die Quantilberechnung wird die Datei als numpy.memmap eingeblendet
+    und an Ort und Stelle sortiert - das Betriebssystem lagert dabei nur die
+    gerade benötigten Seiten in den Arbeitsspeicher ein.
+
+    Im exakten Modus werden die Werte stattdessen als Brüche im Speicher
+    gehalten (höchstens MAX_EXAKTE_WERTE Werte).
+    """
+
+    def __init__(self, exakt: bool = False, verzeichnis: str | None = None):
+        self.exakt = exakt
+        self.anzahl = 0
+        self._sortiert = True
+        self._exakte_werte: list[Fraction] = []
+        self._datei = None
+        self._verzeichnis = verzeichnis
+
+    def hinzufuegen_viele(self, werte: Iterable) -> None:
+        """Fügt einen Block von Werten hinzu"""
+        if self.exakt:
+            neue = [als_bruch(w) for w in werte]
+            if self.anzahl + len(neue) > MAX_EXAKTE_WERTE:
+                raise ValueError(
+                    f"Exakte Quantile sind nur für höchstens {MAX_EXAKTE_WERTE} Werte "
+                    "möglich. Verwende exakt=False für große Datensätze."
+                )
+            self._exakte_werte.extend(neue)
+            self.anzahl += len(neue)
+        else:
+            block = np.asarray(
+                list(werte) if not isinstance(werte, np.ndarray) else werte,
+                dtype=np.float64,
+            )
+            if block.size == 0:
+                return
+            if self._datei is None:
+                self._datei = tempfile.NamedTemporaryFile(
+                    prefix="schul_quantile_",
+                    suffix=".bin",
+                    dir=self._verzeichnis,
+                    delete=False,
+                )
+            self._datei.write(block.tobytes())
+            self.anzahl += int(block.size)
+        self._sortiert = False
+
+    def _sortierte_werte(self):
+        """Sortiert die gespeicherten Werte einmalig und gibt sie zurück"""
+        if self.anzahl == 0:
+            raise ValueError("Keine Daten vorhanden - füge zuerst Werte hinzu")
+        if self.exakt:
+            if not self._sortiert:
+                self._exakte_werte.sort()
+                self._sortiert = True
+            return self._exakte_werte
+
+        self._datei.flush()
+        daten = np.memmap(
+            self._datei.name, dtype=np.float64, mode="r+", shape=(self.anzahl,)
+        )
+        if not self._sortiert:
+            daten.sort(kind="quicksort")
+            daten.flush()
+            self._sortiert = True
+        return daten
+
+    def quantil(self, p: float | sp.Rational) -> float | sp.Rational:
+        """Berechnet das p-Quantil (lineare Interpolation wie numpy.quantile)
+
+        Args:
+            p: Anteil zwischen 0 und 1 (z.B. 0.5 für den Median)
+        """
+        if not 0 <= p <= 1:
+            raise ValueError(f"Der Anteil p muss zwischen 0 und 1 liegen, nicht {p}")
+
+        werte = self._sortierte_werte()
+        if self.exakt:
+            position = als_bruch(p) * (self.anzahl - 1)
+            unten = int(position)
+            anteil = position - unten
+            wert = werte[unten]
+            if anteil:
+                wert += anteil * (werte[unten + 1] - werte[unten])
+            return als_rational(wert)
+
+        position = float(p) * (self.anzahl - 1)
+        unten = int(np.floor(position))
+        oben = min(unten + 1, self.anzahl - 1)
+        anteil = position - unten
+        return float(werte[unten] + anteil * (werte[oben] - werte[unten]))
+
+    def median(self) -> float | sp.Rational:
+        """Median (0.5-Quantil)"""
+        return self.quantil(sp.Rational(1, 2) if self.exakt else 0.5)
+
+    def schliessen(self) -> None:
+        """Löscht die temporäre Datei"""
+        if self._datei is not None:
+            self._datei.close()
+            try:
+                os.unlink(self._datei.name)
+            except OSError:
+                pass
+            self._datei = None
+        self._exakte_werte = []
+        self.anzahl = 0
+
+    def __enter__(self) -> "Quantilspeicher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.schliessen()
+
+    def __del__(self):
+        self.schliessen()
+
+
+class Histogramm:
+    """Histogramm mit festen, gleich breiten Klassen
+
+    Werte außerhalb von [untere_grenze, obere_grenze] werden separat als
+    Unter- bzw. Überlauf gezählt. Die rechte Grenze gehört zur letzten Klasse.
+
+    Args:
+        untere_grenze: Linke Grenze der ersten Klasse
+        obere_grenze: Rechte Grenze der letzten Klasse
+        anzahl_klassen: Anzahl der Klassen
+    """
+
+    def __init__(self, untere_grenze: float, obere_grenze: float, anzahl_klassen: int):
+        if anzahl_klassen < 1:
+            raise ValueError("Ein Histogramm braucht mindestens eine Klasse")
+        if not untere_grenze < obere_grenze:
+            raise ValueError("Die untere Grenze muss kleiner als die obere Grenze sein")
+
+        self.untere_grenze = untere_grenze
+        self.obere_grenze = obere_grenze
+        self.anzahl_klassen = anzahl_klassen
+        self.klassengrenzen = np.linspace(
+            untere_grenze, obere_grenze, anzahl_klassen + 1
+        )
+        self.haeufigkeiten = np.zeros(anzahl_klassen, dtype=np.int64)
+        self.unterlauf = 0
+        self.ueberlauf = 0
+
+    def hinzufuegen_viele(self, werte: Iterable) -> None:
+        """Zählt einen Block von Werten in die Klassen ein"""
+        block = np.asarray(
+            list(werte) if not isinstance(werte, np.ndarray) else werte, dtype=float
+        )
+        if block.size == 0:
+            return
+        self.unterlauf += int((block < self.untere_grenze).sum())
+        self.ueberlauf += int((block > self.obere_grenze).sum())
+        zaehlung, _ = np.histogram(block, bins=self.klassengrenzen)
+        self.haeufigkeiten += zaehlung
+
+    @property
+    def anzahl(self) -> int:
+        """Anzahl der Werte innerhalb der Klassen"""
+        return int(self.haeufigkeiten.sum())
+
+    @property
+    def klassenmitten(self) -> np.ndarray:
+        """Mitten der Klassen"""
+        return (self.klassengrenzen[:-1] + self.klassengrenzen[1:]) / 2
+
+    @property
+    def klassenbreite(self) -> float:
+        """Breite einer Klasse"""
+        return (self.obere_grenze - self.untere_grenze) / self.anzahl_klassen
+
+    def relative_haeufigkeiten(self) -> np.ndarray:
+        """Relative Häufigkeiten bezogen auf die Werte innerhalb der Klassen"""
+        if self.anzahl == 0:
+            return np.zeros(self.anzahl_klassen)
+        return self.haeufigkeiten / self.anzahl
+
+
+class LaufendeRegression:
+    """Lineare Regression y = m·x + b über laufende Ko-Momente
+
+    Mittelwerte, Quadratsummen und Ko-Moment werden blockweise nach Welford/Chan
+    aktualisiert, sodass beliebig viele Wertepaare in konstantem Speicher
+    ausgewertet werden können.
+
+    Args:
+        exakt: Zusätzlich exakte Summen mitführen und Ergebnisse als
+               SymPy-Brüche liefern
+    """
+
+    def __init__(self, exakt: bool = False):
+        self.exakt = exakt
+        self.anzahl = 0
+        self._mittel_x = 0.0
+        self._mittel_y = 0.0
+        self._m2_x = 0.0
+        self._m2_y = 0.0
+        self._c_xy = 0.0
+        # Exakte Summen Σx, Σy, Σx², Σy², Σxy
+        self._summen = [Fraction(0)] * 5
+
+    def hinzufuegen_viele(self, x_werte: Iterable, y_werte: Iterable) -> None:
+        """Fügt einen Block von Wertepaaren hinzu"""
+        if not isinstance(x_werte, np.ndarray):
+            x_werte = list(x_werte)
+        if not isinstance(y_werte, np.ndarray):
+            y_werte = list(y_werte)
+        if len(x_werte) != len(y_werte):
+            raise ValueError("x- und y-Werte müssen gleich viele Einträge haben")
+        if len(x_werte) == 0:
+            return
+
+        x = np.asarray(x_werte, dtype=float)
+        y = np.asarray(y_werte, dtype=float)
+        n_b = x.size
+        mx_b, my_b = float(x.mean()), float(y.mean())
+        dx, dy = x - mx_b, y - my_b
+
+        n_a = self.anzahl
+        n = n_a + n_b
+        delta_x = mx_b - self._mittel_x
+        delta_y = my_b - self._mittel_y
+        faktor = n_a * n_b / n
+        self._m2_x += float((dx * dx).sum()) + delta_x * delta_x * faktor
+        self._m2_y += float((dy * dy).sum()) + delta_y * delta_y * faktor
+        self._c_xy += float((dx * dy).sum()) + delta_x * delta_y * faktor
+        self._mittel_x += delta_x * n_b / n
+        self._mittel_y += delta_y * n_b / n
+        self.anzahl = n
+
+        if self.exakt:
+            sx, sy, sxx, syy, sxy = self._summen
+            for xw, yw in zip(x_werte, y_werte, strict=True):
+                bx, by = als_bruch(xw), als_bruch(yw)
+                sx += bx
+                sy += by
+                sxx += bx * bx
+                syy += by * by
+                sxy += bx * by
+            self._summen = [sx, sy, sxx, syy, sxy]
+
+    def _exakte_momente(self) -> tuple[Fraction, Fraction, Fraction]:
+        """Exakte Quadratsummen Sxx, Syy und Ko-Moment Sxy"""
+        n = self.anzahl
+        sx, sy, sxx, syy, sxy = self._summen
+        return sxx - sx * sx / n, syy - sy * sy / n, sxy - sx * sy / n
+
+    def _pruefe_bestimmt(self) -> None:
+        if self.anzahl < 2:
+            raise ValueError(
+                "Für eine Regressionsgerade werden mindestens 2 Wertepaare benötigt"
+            )
+        if (self._exakte_momente()[0] if self.exakt else self._m2_x) == 0:
+            raise ValueError(
+                "Alle x-Werte sind gleich - die Regressionsgerade ist nicht bestimmt"
+            )
+
+    @property
+    def steigung(self) -> float | sp.Rational:
+        """Steigung m der Regressionsgeraden"""
+        self._pruefe_bestimmt()
+        if self.exakt:
+            s_xx, _, s_xy = self._exakte_momente()
+            return als_rational(s_xy / s_xx)
+        return self._c_xy / self._m2_x
+
+    @property
+    def achsenabschnitt(self) -> float | sp.Rational:
+        """y-Achsenabschnitt b der Regressionsgeraden"""
+        m = self.steigung
+        if self.exakt:
+            sx, sy = self._summen[0], self._summen[1]
+            return als_rational((sy - als_bruch(m) * sx) / self.anzahl)
+        return self._mittel_y - m * self._mittel_x
+
+    @property
+    def korrelation(self) -> float | sp.Expr:
+        """Korrelationskoeffizient r nach Bravais-Pearson"""
+        self._pruefe_bestimmt()
+        if self.exakt:
+            s_xx, s_yy, s_xy = self._exakte_momente()
+            if s_yy == 0:
+                return sp.Integer(0)
+            return als_rational(s_xy) / sp.sqrt(als_rational(s_xx * s_yy))
+        if self._m2_y == 0:
+            return 0.0
+        return self._c_xy / float(np.sqrt(self._m2_x * self._m2_y))
+
+    def als_funktion(self):
+        """Gibt die Regressionsgerade als Funktion zurück"""
+        from ..analysis.funktion import Funktion
+
+        m, b = self.steigung, self.achsenabschnitt
+        if not self.exakt:
+            m, b = sp.Float(m), sp.Float(b)
+        return Funktion(m * sp.Symbol("x") + b)
+
+    def __str__(self) -> str:
+        return f"Regressionsgerade y = {self.steigung}·x + {self.achsenabschnitt}"
+
+
+# =============================================================================
+# ZUSAMMENFASSUNG UND KOMFORT-FUNKTIONEN
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class Datenzusammenfassung:
+    """Beschreibende Kennzahlen eines Datensatzes"""
+
+    anzahl: int
+    mittelwert: float | sp.Rational
+    varianz: float | sp.Rational  # empirische Varianz σ²
+    standardabweichung: float | sp.Expr
+    minimum: float | sp.Rational
+    maximum: float | sp.Rational
+    quantile: dict = field(default_factory=dict)  # Anteil p -> Quantilwert
+    histogramm: Histogramm | None = None
+
+    @property
+    def median(self) -> float | sp.Rational | None:
+        """Median, falls das 0.5-Quantil berechnet wurde"""
+        for p, wert in self.quantile.items():
+            if float(p) == 0.5:
+                return wert
+        return None
+
+    def __str__(self) -> str:
+        zeilen = [
+            f"n = {self.anzahl}",
+            f"x̄ = {self.mittelwert}",
+            f"σ² = {self.varianz}",
+            f"σ = {self.standardabweichung}",
+            f"Minimum = {self.minimum}",
+            f"Maximum = {self.maximum}",
+        ]
+        zeilen.extend(f"Q({p}) = {wert}" for p, wert in self.quantile.items())
+        return "\n".join(zeilen)
+
+
+def _werte_bloecke(werte: Iterable, block_groesse: int) -> Iterator[list]:
+    """Zerlegt eine beliebige Wertefolge in Blöcke"""
+    block = []
+    for wert in werte:
+        block.append(wert)
+        if len(block) >= block_groesse:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def _fasse_zusammen(
+    bloecke: Iterable,
+    quantile: Iterable,
+    histogramm: tuple[float, float, int] | None,
+    exakt: bool,
+) -> Datenzusammenfassung:
+    """Gemeinsame Auswertung für Listen und CSV-Dateien"""
+    quantile = tuple(quantile)
+    statistik = LaufendeStatistik(exakt=exakt)
+    hist = Histogramm(*histogramm) if histogramm is not None else None
+
+    with Quantilspeicher(exakt=exakt) as speicher:
+        for block in bloecke:
+            statistik.hinzufuegen_viele(block)
+            if quantile:
+                speicher.hinzufuegen_viele(block)
+            if hist is not None:
+                hist.hinzufuegen_viele(block)
+
+        if statistik.anzahl == 0:
+            raise ValueError("Der Datensatz enthält keine Werte")
+
+        quantilwerte = {
+            (als_rational(als_bruch(p)) if exakt else p): speicher.quantil(p)
+            for p in quantile
+        }
+
+    return Datenzusammenfassung(
+        anzahl=statistik.anzahl,
+        mittelwert=statistik.mittelwert,
+        varianz=statistik.varianz(),
+        standardabweichung=statistik.standardabweichung(),
+        minimum=statistik.minimum,
+        maximum=statistik.maximum,
+        quantile=quantilwerte,
+        histogramm=hist,
+    )
+
+
+def beschreibe_daten(
+    werte: Iterable,
+    quantile: Iterable = (0.25, 0.5, 0.75),
+    histogramm: tuple[float, float, int] | None = None,
+    exakt: bool = False,
+    block_groesse: int = STANDARD_BLOCKGROESSE,
+) -> Datenzusammenfassung:
+    """Beschreibende Statistik einer Wertefolge (Liste, Generator, Array)
+
+    Args:
+        werte: Messwerte (Zahlen oder Zahl-Strings)
+        quantile: Gewünschte Quantile als Anteile zwischen 0 und 1
+        histogramm: Optional (untere_grenze, obere_grenze, anzahl_klassen)
+        exakt: Ergebnisse als exakte SymPy-Brüche (für kleine Datensätze)
+        block_groesse: Anzahl der Werte, die gemeinsam verarbeitet werden
+
+    Returns:
+        Datenzusammenfassung mit allen Kennzahlen
+
+    Examples:
+        >>> z = beschreibe_daten([1, 2, 3, 4], exakt=True)
+        >>> z.mittelwert, z.varianz
+        (5/2, 5/4)
+    """
+    return _fasse_zusammen(
+        _werte_bloecke(werte, block_groesse), quantile, histogramm, exakt
+    )
+
+
+def analysiere_csv(
+    pfad: str | os.PathLike,
+    spalte: str,
+    quantile: Iterable = (0.25, 0.5, 0.75),
+    histogramm: tuple[float, float, int] | None = None,
+    exakt: bool = False,
+    block_groesse: int = STANDARD_BLOCKGROESSE,
+    trennzeichen: str = ",",
+    dezimalkomma: bool = False,
+) -> Datenzusammenfassung:
+    """Beschreibende Statistik einer Spalte einer (großen) CSV-Datei
+
+    Die Datei wird blockweise gelesen; der Speicherbedarf hängt nur von der
+    Blockgröße ab. Quantile werden über eine temporäre Datei exakt bestimmt.
+
+    Args:
+        pfad: Pfad zur CSV-Datei
+        spalte: Name der auszuwertenden Spalte
+        quantile: Gewünschte Quantile als Anteile zwischen 0 und 1
+        histogramm: Optional (untere_grenze, obere_grenze, anzahl_klassen)
+        exakt: Ergebnisse als exakte SymPy-Brüche (für kleine Datensätze)
+        block_groesse: Anzahl der Zeilen pro Block
+        trennzeichen: Feldtrennzeichen der CSV-Datei
+        dezimalkomma: Zahlen verwenden ein Dezimalkomma
+
+    Returns:
+        Datenzusammenfassung mit allen Kennzahlen
+    """
+    bloecke = (
+        block[spalte]
+        for block in lese_csv_bloecke(
+            pfad,
+            [spalte],
+            block_groesse=block_groesse,
+            trennzeichen=trennzeichen,
+            dezimalkomma=dezimalkomma,
+        )
+    )
+    return _fasse_zusammen(bloecke, quantile, histogramm, exakt)
+
+
+def regression_csv(
+    pfad: str | os.PathLike,
+    x_spalte: str,
+    y_spalte: str,
+    exakt: bool = False,
+    block_groesse: int = STANDARD_BLOCKGROESSE,
+    trennzeichen: str = ",",
+    dezimalkomma: bool = False,
+) -> LaufendeRegression:
+    """Regressionsgerade zweier Spalten einer (großen) CSV-Datei
+
+    Args:
+        pfad: Pfad zur CSV-Datei
+        x_spalte: Spalte der unabhängigen Größe
+        y_spalte: Spalte der abhängigen Größe
+        exakt: Ergebnisse als exakte SymPy-Brüche (für kleine Datensätze)
+        block_groesse: Anzahl der Zeilen pro Block
+        trennzeichen: Feldtrennzeichen der CSV-Datei
+        dezimalkomma: Zahlen verwenden ein Dezimalkomma
+
+    Returns:
+        LaufendeRegression mit Steigung, Achsenabschnitt und Korrelation
+    """
+    regression = LaufendeRegression(exakt=exakt)
+    for block in lese_csv_bloecke(
+        pfad,
+        [x_spalte, y_spalte],
+        block_groesse=block_groesse,
+        trennzeichen=trennzeichen,
+        dezimalkomma=dezimalkomma,
+    ):
+        regression.hinzufuegen_viele(block[x_spalte], block[y_spalte])
+    return regression
@@ -225,3 +225,124 @@ def zeichne_vergleich_zwei_normalverteilungen(
     )
 
     return fig
+
+
+def zeichne_histogramm(
+    histogramm,
+    relativ: bool = False,
+    farbe: str = "blue",
+    titel: str | None = None,
+) -> go.Figure:
+    """Zeichnet ein Histogramm mit festen Klassen aus der Datenanalyse
+
+    Args:
+        histogramm: Histogramm-Objekt (siehe stochastik.datenanalyse)
+        relativ: Relative statt absolute Häufigkeiten anzeigen
+        farbe: Farbe für die Balken
+        titel: Optionaler Titel
+
+    Returns:
+        Plotly Figure-Objekt
+    """
+    if relativ:
+        hoehen = histogramm.relative_haeufigkeiten()
+        y_titel = "relative Häufigkeit"
+    else:
+        hoehen = histogramm.haeufigkeiten
+        y_titel = "absolute Häufigkeit"
+
+    grenzen = histogramm.klassengrenzen
+    beschriftungen = [
+        f"[{grenzen[i]:g}; {grenzen[i + 1]:g})" for i in range(len(grenzen) - 1)
+    ]
+
+    fig = go.Figure()
+    fig.add_trace(
+        go.Bar(
+            x=histogramm.klassenmitten,
+            y=hoehen,
+            width=histogramm.klassenbreite,
+            customdata=beschriftungen,
+            hovertemplate="Klasse %{customdata}<br>%{y}<extra></extra>",
+            marker_color=farbe,
+            marker_line_color="black",
+            marker_line_width=1,
+            opacity=0.7,
+        )
+    )
+
+    fig.update_layout(
+        title=titel or f"Histogramm ({histogramm.anzahl} Werte)",
+        xaxis_title="Klassen",
+        yaxis_title=y_titel,
+        showlegend=False,
+        bargap=0,
+    )
+
+    return fig
+
+
+def zeichne_regression(
+    regression,
+    x_werte: list[float] | None = None,
+    y_werte: list[float] | None = None,
+    x_bereich: tuple | None = None,
+    farbe: str = "red",
+) -> go.Figure:
+    """Zeichnet eine Regressionsgerade, optional mit (Stichproben-)Datenpunkten
+
+    Bei großen Datensätzen sollte nur eine Stichprobe der Punkte übergeben
+    werden - die Gerade selbst wird aus den laufenden Kennzahlen berechnet.
+
+    Args:
+        regression: LaufendeRegression-Objekt (siehe stochastik.datenanalyse)
+        x_werte, y_werte: Optionale Datenpunkte für das Streudiagramm
+        x_bereich: Darstellungsbereich (automatisch aus den Punkten, wenn None)
+        farbe: Farbe der Geraden
+
+    Returns:
+        Plotly Figure-Objekt
+    """
+    m = float(regression.steigung)
+    b = float(regression.achsenabschnitt)
+
+    if x_bereich is None:
+        if x_werte is not None and len(x_werte) > 0:
+            x_bereich = (float(min(x_werte)), float(max(x_werte)))
+        else:
+            x_bereich = (-10, 10)
+
+    fig = go.Figure()
+
+    if x_werte is not None and y_werte is not None:
+        fig.add_trace(
+            go.Scatter(
+                x=x_werte,
+                y=y_werte,
+                mode="markers",
+                name="Daten",
+                marker_color="blue",
+                opacity=0.6,
+            )
+        )
+
+    x_linie = np.array(x_bereich, dtype=float)
+    fig.add_trace(
+        go.Scatter(
+            x=x_linie,
+            y=m * x_linie + b,
+            mode="lines",
+            name=f"y = {m:.4g}·x + {b:.4g}",
+            line_color=farbe,
+            line_width=2,
+        )
+    )
+
+    fig.update_layout(
+        title=f"Regressionsgerade (r = {float(regression.korrelation):.3f})",
+        xaxis_title="x",
+        yaxis_title="y",
+        showlegend=True,
+    )
+
+    return fig
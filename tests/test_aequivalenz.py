@@ -0,0 +1,153 @@
+"""
+Tests für die Äquivalenzprüfung durch zufällige Stichproben.
+
+Überprüft gleiche und ungleiche Ausdrücke mit Variablen und Parametern,
+Annahmen an Symbole, Pole, stückweise Ausdrücke, den Beweismodus und die
+Anbindung an Funktion, Nullstelle und ProduktFunktion.
+"""
+
+import random
+
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis import aequivalenz
+from schul_mathematik.analysis.aequivalenz import sind_aequivalent, stichprobentest
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.sympy_types import Nullstelle
+
+
+class TestStichproben:
+    """Tests für den Stichprobentest ohne symbolischen Rückfall"""
+
+    def setup_method(self):
+        self.rng = random.Random(1)
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ("x^2 - 1", "(x - 1)*(x + 1)"),
+            ("2x + 4", "2*(x + 2)"),
+            ("1/(x - 1) - 1/(x + 1)", "2/(x^2 - 1)"),
+            ("sin(x)^2 + cos(x)^2", "1"),
+            ("exp(2*x)", "exp(x)^2"),
+            ("-b/a", "(-b*k)/(a*k)"),
+            ("sqrt(2)/2", "1/sqrt(2)"),
+        ],
+    )
+    def test_gleich(self, a, b):
+        """Äquivalente Ausdrücke werden erkannt, auch mit Parametern"""
+        assert stichprobentest(a, b, rng=self.rng) is True
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ("x + 1", "x + 2"),
+            ("a*x + a", "a*(x + 2)"),
+            ("sqrt(x^2)", "x"),
+            ("(x + 1)^20", "(x + 1)^20 + 10^-30"),
+            ("2", "-2"),
+        ],
+    )
+    def test_ungleich(self, a, b):
+        """Ein Gegenbeispiel genügt, auch bei winzigen Unterschieden"""
+        assert stichprobentest(a, b, rng=self.rng) is False
+
+    def test_annahmen_werden_beachtet(self):
+        """Positive Symbole werden nur positiv belegt"""
+        p = sp.Symbol("p", positive=True)
+        assert stichprobentest(sp.sqrt(p**2), p, rng=self.rng) is True
+
+    def test_unentschieden(self, monkeypatch):
+        """Ohne auswertbare Punkte entscheidet der Test nicht"""
+        monkeypatch.setattr(aequivalenz, "_auswerten", lambda *_: None)
+        assert stichprobentest("x", "x + 0*y + 1", rng=self.rng) is None
+
+
+class TestSindAequivalent:
+    """Tests für die Kombination aus Stichproben und Beweis"""
+
+    def test_ohne_simplify(self, monkeypatch):
+        """Entschiedene Fälle kommen ohne simplify aus"""
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("simplify aufgerufen")
+
+        monkeypatch.setattr(sp, "simplify", verboten)
+        assert sind_aequivalent("(x + 1)^3", "x^3 + 3x^2 + 3x + 1")
+        assert not sind_aequivalent("x^2", "x^3")
+
+    def test_beweis(self, monkeypatch):
+        """Mit beweis=True wird Gleichheit symbolisch bestätigt"""
+        aufrufe = []
+        original = aequivalenz._symbolisch_gleich
+        monkeypatch.setattr(
+            aequivalenz,
+            "_symbolisch_gleich",
+            lambda a, b: aufrufe.append((a, b)) or original(a, b),
+        )
+
+        assert sind_aequivalent("sin(2x)", "2*sin(x)*cos(x)", beweis=True)
+        assert not sind_aequivalent("sin(2x)", "sin(x)", beweis=True)
+        assert len(aufrufe) == 1
+
+    def test_rueckfall_bei_unentschieden(self, monkeypatch):
+        """Ohne auswertbare Punkte wird symbolisch entschieden"""
+        monkeypatch.setattr(aequivalenz, "stichprobentest", lambda *_: None)
+        assert sind_aequivalent("x^2 - 1", "(x - 1)*(x + 1)")
+        assert not sind_aequivalent("x", "x + 1")
+
+
+class TestStueckweise:
+    """Tests für Ausdrücke mit Knicken, Sprüngen und Verzweigungspunkten"""
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ("sqrt(x^2)", "x"),
+            ("Abs(x)", "x"),
+            ("log(x^2)", "2*log(x)"),
+            ("Abs(x - a)", "x - a"),
+        ],
+    )
+    def test_nie_falsch_gleich(self, a, b):
+        """Beide Vorzeichen werden belegt, Gleichheit braucht einen Beweis"""
+        for seed in range(200):
+            assert stichprobentest(a, b, rng=random.Random(seed)) is False
+            assert not sind_aequivalent(a, b, rng=random.Random(seed))
+
+    @pytest.mark.parametrize(
+        "a, b",
+        [
+            ("sqrt(x^2)", "Abs(x)"),
+            ("Abs(x)^2", "x^2"),
+            ("Abs(x*y)", "Abs(x)*Abs(y)"),
+        ],
+    )
+    def test_gleich(self, a, b):
+        """Über den reellen Zahlen gleiche Ausdrücke werden bestätigt"""
+        assert sind_aequivalent(a, b)
+
+
+class TestAnbindung:
+    """Tests für die Nutzung im Framework"""
+
+    def test_funktion_ist_aequivalent(self):
+        """ist_aequivalent nutzt die Stichproben"""
+        f = Funktion("sin(x)^2 + cos(x)^2")
+        assert f.ist_aequivalent("1")
+        assert f.ist_aequivalent("1", beweis=True)
+        assert not f.ist_aequivalent("x")
+
+    def test_nullstelle(self):
+        """Nullstellen in verschiedener Schreibweise sind äquivalent"""
+        assert Nullstelle(sp.sqrt(8)).is_equivalent(Nullstelle(2 * sp.sqrt(2)))
+        assert not Nullstelle(sp.Integer(2)).is_equivalent(Nullstelle(sp.Integer(-2)))
+
+    def test_produkt_vorzeichen(self):
+        """Nullstellen mit entgegengesetztem Vorzeichen werden nicht verschmolzen"""
+        f = Funktion("(x - 2)*exp(x)*(x + 2)")
+        zusammen = f._kombiniere_nullstellen_intelligent(
+            [Nullstelle(sp.Integer(2)), Nullstelle(sp.Integer(-2))]
+        )
+        assert [(n.x, n.multiplicitaet) for n in zusammen] == [(2, 1), (-2, 1)]
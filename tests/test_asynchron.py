@@ -0,0 +1,126 @@
+"""
+Tests für die asynchrone Analyse-API.
+
+Überprüft die Ergebnisse im Worker-Prozess, das Abbrechen überholter
+Anfragen (inklusive Beenden des Workers), die Thread-Variante und die
+schrittweise gelieferten Nullstellen.
+"""
+
+import asyncio
+import math
+import time
+
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis import asynchron
+from schul_mathematik.analysis.asynchron import (
+    Rechenkanal,
+    extrempunkte_async,
+    nullstellen_async,
+    nullstellen_schrittweise,
+)
+from schul_mathematik.analysis.funktion import Funktion
+
+
+def _ausfuehren(koroutine):
+    return asyncio.run(asyncio.wait_for(koroutine, timeout=60))
+
+
+class TestErgebnisse:
+    """Tests für die asynchronen Varianten der Haupt-API"""
+
+    def test_nullstellen_aus_term(self):
+        """Terme werden im Worker geparst und analysiert"""
+        nullstellen = _ausfuehren(nullstellen_async("x^2 - 4"))
+        assert {n.x for n in nullstellen} == {2, -2}
+
+    def test_funktionsobjekt(self):
+        """Funktionsobjekte werden übertragen und Fehler weitergereicht"""
+        extrempunkte = _ausfuehren(extrempunkte_async(Funktion("x^3 - 3*x")))
+        assert {(p.x, p.y) for p in extrempunkte} == {(1, -2), (-1, 2)}
+
+        with pytest.raises(Exception, match="Ungültig|Fehler|Syntax"):
+            _ausfuehren(nullstellen_async("x^^2"))
+
+    def test_thread_variante(self):
+        """Ohne Prozesse wird in einem Thread gerechnet"""
+
+        async def ablauf():
+            async with Rechenkanal(prozess=False) as kanal:
+                return await nullstellen_async("x^2 - 9", kanal=kanal)
+
+        assert {n.x for n in _ausfuehren(ablauf())} == {3, -3}
+
+
+class TestAbbrechen:
+    """Tests für überholte Anfragen"""
+
+    def test_neue_anfrage_bricht_alte_ab(self):
+        """Die alte Anfrage endet mit CancelledError, ihr Worker wird beendet"""
+
+        async def ablauf():
+            async with Rechenkanal() as kanal:
+                alt = asyncio.create_task(kanal.ausfuehren(time.sleep, 60))
+                await asyncio.sleep(0.2)
+                worker = list(kanal._pool._pool)
+
+                neu = await nullstellen_async("x - 1", kanal=kanal)
+                with pytest.raises(asyncio.CancelledError):
+                    await alt
+                return neu, worker
+
+        start = time.perf_counter()
+        neu, worker = _ausfuehren(ablauf())
+
+        assert [n.x for n in neu] == [1]
+        assert not any(prozess.is_alive() for prozess in worker)
+        assert time.perf_counter() - start < 30
+
+    def test_abbruch_von_aussen(self):
+        """Ein abgebrochener Task beendet auch den Worker"""
+
+        async def ablauf():
+            kanal = Rechenkanal()
+            task = asyncio.create_task(kanal.ausfuehren(time.sleep, 60))
+            await asyncio.sleep(0.2)
+            worker = list(kanal._pool._pool)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return kanal, worker
+
+        kanal, worker = _ausfuehren(ablauf())
+        assert kanal._pool is None
+        assert not any(prozess.is_alive() for prozess in worker)
+
+
+class TestSchrittweise:
+    """Tests für nullstellen_schrittweise"""
+
+    def _teile(self, term):
+        async def ablauf():
+            return [teil async for teil in nullstellen_schrittweise(term)]
+
+        return _ausfuehren(ablauf())
+
+    def test_erst_numerisch_dann_exakt(self):
+        """Näherungen kommen vor den exakten Nullstellen"""
+        numerisch, exakt = self._teile("x^3 - 2")
+
+        assert (numerisch.art, numerisch.endgueltig) == ("numerisch", False)
+        assert numerisch.werte == pytest.approx([2 ** (1 / 3)])
+        assert (exakt.art, exakt.endgueltig) == ("exakt", True)
+        assert [n.x for n in exakt.werte] == [sp.root(2, 3)]
+
+    def test_transzendent_ohne_polstellen(self):
+        """Vorzeichenwechsel an Polstellen werden nicht als Nullstellen gemeldet"""
+        assert asynchron._numerische_nullstellen("1/x") == []
+        naeherungen = asynchron._numerische_nullstellen("sin(x)")
+        assert naeherungen == pytest.approx([k * math.pi for k in range(-3, 4)])
+
+    def test_parameter(self):
+        """Mit Parametern gibt es keine Näherung, nur das exakte Ergebnis"""
+        numerisch, exakt = self._teile("a*x - 1")
+        assert numerisch.werte == []
+        assert exakt.endgueltig
@@ -0,0 +1,127 @@
+"""
+Tests für die Benchmark-Suite.
+
+Überprüft Messlogik (kalt/warm, Median/IQR, Speicherspitze), den Vergleich
+mit einer Baseline und den Exit-Code des Regressions-Gates.
+"""
+
+import copy
+import json
+
+import pytest
+
+from benchmarks.__main__ import main
+from benchmarks.faelle import FAELLE
+from benchmarks.messung import Fall, messe
+from benchmarks.vergleich import als_json, lade, vergleiche
+
+
+def _zaehlender_fall():
+    """Fall, der mitzählt, wie oft vorbereitet und ausgeführt wurde"""
+    protokoll = {"vorbereitet": 0, "ausgefuehrt": 0}
+
+    def vorbereiten():
+        protokoll["vorbereitet"] += 1
+
+        def aufruf():
+            protokoll["ausgefuehrt"] += 1
+            return [0] * 1000
+
+        return aufruf
+
+    return Fall("test/zaehler", vorbereiten), protokoll
+
+
+class TestMessung:
+    """Tests für kalte und warme Messungen"""
+
+    def test_kalt_bereitet_jede_wiederholung_neu_vor(self):
+        """Kalte Läufe bereiten vor jeder Wiederholung neu vor"""
+        fall, protokoll = _zaehlender_fall()
+        ergebnis = messe(fall, "kalt", wiederholungen=4)
+        # 4 Messungen + 1 Lauf für die Speicherspitze
+        assert protokoll["vorbereitet"] == 5
+        assert ergebnis.wiederholungen == 4
+        assert ergebnis.minimum <= ergebnis.median
+        assert ergebnis.iqr >= 0
+        assert ergebnis.speicher_spitze >= 1000 * 8
+
+    def test_warm_bereitet_einmal_vor(self):
+        """Warme Läufe bereiten einmal vor und wärmen einmal auf"""
+        fall, protokoll = _zaehlender_fall()
+        messe(fall, "warm", wiederholungen=3)
+        # Messreihe: Aufwärmen + 3; Speicherspitze: Aufwärmen + 1
+        assert protokoll["vorbereitet"] == 2
+        assert protokoll["ausgefuehrt"] == 6
+
+    def test_unbekannter_modus(self):
+        """Nur kalt und warm sind erlaubt"""
+        fall, _ = _zaehlender_fall()
+        with pytest.raises(ValueError, match="lauwarm"):
+            messe(fall, "lauwarm")
+
+    def test_faelle_sind_eindeutig(self):
+        """Jeder Fallname kommt nur einmal vor"""
+        namen = [fall.name for fall in FAELLE]
+        assert len(namen) == len(set(namen))
+
+
+class TestVergleich:
+    """Tests für das Regressions-Gate"""
+
+    def setup_method(self):
+        """Baseline mit einem Fall: 10 ms, 1 MiB"""
+        self.baseline = als_json(
+            {"f": {"kalt": {"median": 0.010, "speicher_spitze": 1024 * 1024}}}
+        )
+
+    def _aktuell(self, median, speicher=1024 * 1024):
+        return als_json(
+            {"f": {"kalt": {"median": median, "speicher_spitze": speicher}}}
+        )
+
+    def test_keine_regression(self):
+        """Schwankungen unter der Schwelle sind erlaubt"""
+        assert vergleiche(self.baseline, self._aktuell(0.012)) == []
+
+    def test_zeit_regression(self):
+        """Deutlich langsamere Fälle werden gemeldet"""
+        abweichungen = vergleiche(self.baseline, self._aktuell(0.020))
+        assert len(abweichungen) == 1
+        assert abweichungen[0].groesse == "median"
+        assert abweichungen[0].faktor == pytest.approx(2)
+
+    def test_speicher_regression(self):
+        """Auch eine höhere Speicherspitze ist eine Regression"""
+        abweichungen = vergleiche(self.baseline, self._aktuell(0.010, 3 * 1024 * 1024))
+        assert [a.groesse for a in abweichungen] == ["speicher_spitze"]
+
+    def test_mindestdifferenz(self):
+        """Sehr schnelle Fälle schlagen nicht wegen Messrauschen an"""
+        baseline = als_json({"f": {"kalt": {"median": 1e-5}}})
+        aktuell = als_json({"f": {"kalt": {"median": 3e-5}}})
+        assert vergleiche(baseline, aktuell) == []
+
+
+class TestKommandozeile:
+    """Tests für python -m benchmarks"""
+
+    def test_baseline_und_vergleich(self, tmp_path, capsys):
+        """Vergleich mit frischer Baseline besteht, mit schnellerer schlägt fehl"""
+        pfad = tmp_path / "baseline.json"
+        argumente = ["--filter", "parsen/polynom", "--wiederholungen", "2"]
+        assert main(["baseline", "--baseline", str(pfad), *argumente]) == 0
+
+        gespeichert = lade(pfad)
+        assert set(gespeichert["faelle"]["parsen/polynom"]) == {"kalt", "warm"}
+        assert (
+            main(["vergleich", "--baseline", str(pfad), "--schwelle", "10", *argumente])
+            == 0
+        )
+
+        manipuliert = copy.deepcopy(gespeichert)
+        for werte in manipuliert["faelle"]["parsen/polynom"].values():
+            werte["median"] /= 1000
+        pfad.write_text(json.dumps(manipuliert))
+        assert main(["vergleich", "--baseline", str(pfad), *argumente]) == 1
+        assert "Regression" in capsys.readouterr().out
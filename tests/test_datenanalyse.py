@@ -0,0 +1,235 @@
+"""
+Tests für die blockweise Datenanalyse im Stochastik-Modul.
+
+Überprüft Welford-Kennzahlen, exakte Quantile, Histogramme und
+Regressionsgeraden - sowohl für Listen als auch für CSV-Dateien.
+"""
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from schul_mathematik.stochastik.datenanalyse import (
+    Histogramm,
+    LaufendeRegression,
+    LaufendeStatistik,
+    Quantilspeicher,
+    analysiere_csv,
+    beschreibe_daten,
+    lese_csv_bloecke,
+    regression_csv,
+)
+from schul_mathematik.stochastik.visualisierung import (
+    zeichne_histogramm,
+    zeichne_regression,
+)
+
+
+@pytest.fixture
+def messreihe():
+    """Reproduzierbare, normalverteilte Messreihe"""
+    return np.random.default_rng(42).normal(170, 8, 50_000)
+
+
+@pytest.fixture
+def csv_datei(tmp_path):
+    """Kleine CSV-Datei im deutschen Excel-Format (Semikolon, Dezimalkomma)"""
+    pfad = tmp_path / "messung.csv"
+    zeilen = ["zeit;weg"]
+    for i in range(20):
+        zeilen.append(f"{i},5;{3 * i + 2}")
+    zeilen.append(";99")  # fehlender Wert wird übersprungen
+    pfad.write_text("\n".join(zeilen) + "\n", encoding="utf-8")
+    return pfad
+
+
+class TestLaufendeStatistik:
+    """Tests für Mittelwert, Varianz und Standardabweichung nach Welford"""
+
+    def test_blockweise_gleich_numpy(self, messreihe):
+        """Blockweise Auswertung stimmt mit numpy überein"""
+        statistik = LaufendeStatistik()
+        for block in np.array_split(messreihe, 7):
+            statistik.hinzufuegen_viele(block)
+
+        assert statistik.anzahl == messreihe.size
+        assert statistik.mittelwert == pytest.approx(messreihe.mean())
+        assert statistik.varianz() == pytest.approx(messreihe.var())
+        assert statistik.varianz(stichprobe=True) == pytest.approx(
+            messreihe.var(ddof=1)
+        )
+        assert statistik.minimum == messreihe.min()
+        assert statistik.maximum == messreihe.max()
+
+    def test_einzelwerte_und_bloecke_gemischt(self):
+        """Einzelne Werte und Blöcke ergeben dieselben Kennzahlen"""
+        statistik = LaufendeStatistik()
+        statistik.hinzufuegen(1)
+        statistik.hinzufuegen_viele([2, 3])
+        statistik.hinzufuegen(4)
+        assert statistik.mittelwert == pytest.approx(2.5)
+        assert statistik.varianz() == pytest.approx(1.25)
+
+    def test_exakte_ergebnisse(self):
+        """Im exakten Modus werden SymPy-Brüche geliefert"""
+        statistik = LaufendeStatistik(exakt=True)
+        statistik.hinzufuegen_viele(["0.1", "0.2", "0.4"])
+
+        assert statistik.mittelwert == sp.Rational(7, 30)
+        assert statistik.varianz() == sp.Rational(7, 450)
+        assert statistik.minimum == sp.Rational(1, 10)
+        assert statistik.maximum == sp.Rational(2, 5)
+        assert statistik.standardabweichung() == sp.sqrt(sp.Rational(7, 450))
+
+    def test_vereinigen(self, messreihe):
+        """Zwei Teilstatistiken lassen sich vereinigen"""
+        links, rechts = LaufendeStatistik(), LaufendeStatistik()
+        links.hinzufuegen_viele(messreihe[:1000])
+        rechts.hinzufuegen_viele(messreihe[1000:])
+        links.vereinige(rechts)
+        assert links.anzahl == messreihe.size
+        assert links.varianz() == pytest.approx(messreihe.var())
+
+    def test_leere_statistik(self):
+        """Ohne Daten gibt es eine verständliche Fehlermeldung"""
+        with pytest.raises(ValueError, match="Keine Daten"):
+            _ = LaufendeStatistik().mittelwert
+
+
+class TestQuantile:
+    """Tests für exakte Quantile über speicherabgebildete Arrays"""
+
+    def test_quantile_wie_numpy(self, messreihe):
+        """Quantile stimmen mit numpy.quantile überein"""
+        with Quantilspeicher() as speicher:
+            for block in np.array_split(messreihe, 5):
+                speicher.hinzufuegen_viele(block)
+            for p in (0, 0.1, 0.25, 0.5, 0.9, 1):
+                assert speicher.quantil(p) == pytest.approx(np.quantile(messreihe, p))
+
+    def test_exakte_quantile(self):
+        """Exakte Quantile mit linearer Interpolation"""
+        speicher = Quantilspeicher(exakt=True)
+        speicher.hinzufuegen_viele([4, 1, 3, 2])
+        assert speicher.median() == sp.Rational(5, 2)
+        assert speicher.quantil(sp.Rational(1, 4)) == sp.Rational(7, 4)
+
+    def test_ungueltiger_anteil(self):
+        """Anteile außerhalb von [0, 1] werden abgelehnt"""
+        speicher = Quantilspeicher()
+        speicher.hinzufuegen_viele([1, 2, 3])
+        with pytest.raises(ValueError):
+            speicher.quantil(1.5)
+
+
+class TestHistogramm:
+    """Tests für Histogramme mit festen Klassen"""
+
+    def test_haeufigkeiten_wie_numpy(self, messreihe):
+        """Häufigkeiten stimmen mit numpy.histogram überein"""
+        histogramm = Histogramm(140, 200, 12)
+        for block in np.array_split(messreihe, 3):
+            histogramm.hinzufuegen_viele(block)
+
+        erwartet, _ = np.histogram(messreihe, bins=12, range=(140, 200))
+        assert list(histogramm.haeufigkeiten) == list(erwartet)
+        assert histogramm.unterlauf == int((messreihe < 140).sum())
+        assert histogramm.ueberlauf == int((messreihe > 200).sum())
+        assert histogramm.relative_haeufigkeiten().sum() == pytest.approx(1)
+
+    def test_ungueltige_klassen(self):
+        """Ungültige Klassengrenzen werden abgelehnt"""
+        with pytest.raises(ValueError):
+            Histogramm(5, 1, 3)
+
+
+class TestRegression:
+    """Tests für die laufende Regressionsgerade"""
+
+    def test_exakte_gerade(self):
+        """Punkte auf einer Geraden werden exakt wiedergefunden"""
+        regression = LaufendeRegression(exakt=True)
+        regression.hinzufuegen_viele([0, 1, 2], ["0.5", "1", "1.5"])
+        assert regression.steigung == sp.Rational(1, 2)
+        assert regression.achsenabschnitt == sp.Rational(1, 2)
+        assert regression.korrelation == 1
+        assert regression.als_funktion().wert(4) == sp.Rational(5, 2)
+
+    def test_blockweise_wie_polyfit(self):
+        """Blockweise Regression stimmt mit numpy.polyfit überein"""
+        rng = np.random.default_rng(7)
+        x = rng.uniform(0, 10, 10_000)
+        y = 1.5 * x - 3 + rng.normal(0, 1, x.size)
+
+        regression = LaufendeRegression()
+        for xb, yb in zip(np.array_split(x, 4), np.array_split(y, 4), strict=True):
+            regression.hinzufuegen_viele(xb, yb)
+
+        m, b = np.polyfit(x, y, 1)
+        assert regression.steigung == pytest.approx(m)
+        assert regression.achsenabschnitt == pytest.approx(b)
+        assert regression.korrelation == pytest.approx(np.corrcoef(x, y)[0, 1])
+
+    def test_gleiche_x_werte(self):
+        """Senkrechte Punktwolke hat keine Regressionsgerade"""
+        regression = LaufendeRegression()
+        regression.hinzufuegen_viele([1, 1, 1], [1, 2, 3])
+        with pytest.raises(ValueError, match="x-Werte"):
+            _ = regression.steigung
+
+
+class TestCSVAnalyse:
+    """Tests für das blockweise Lesen von CSV-Dateien"""
+
+    def test_bloecke_und_fehlende_werte(self, csv_datei):
+        """Blöcke haben die gewünschte Größe, unvollständige Zeilen fehlen"""
+        bloecke = list(
+            lese_csv_bloecke(
+                csv_datei, ["zeit", "weg"], block_groesse=8, trennzeichen=";"
+            )
+        )
+        assert [len(b["zeit"]) for b in bloecke] == [8, 8, 4]
+
+    def test_unbekannte_spalte(self, csv_datei):
+        """Unbekannte Spalten führen zu einer klaren Fehlermeldung"""
+        with pytest.raises(ValueError, match="geschwindigkeit"):
+            next(lese_csv_bloecke(csv_datei, ["geschwindigkeit"], trennzeichen=";"))
+
+    def test_analysiere_csv_exakt(self, csv_datei):
+        """Exakte Kennzahlen einer CSV-Spalte mit Dezimalkomma"""
+        zusammenfassung = analysiere_csv(
+            csv_datei,
+            "zeit",
+            trennzeichen=";",
+            dezimalkomma=True,
+            exakt=True,
+            block_groesse=6,
+        )
+        assert zusammenfassung.anzahl == 20
+        assert zusammenfassung.mittelwert == 10
+        assert zusammenfassung.median == 10
+        assert zusammenfassung.minimum == sp.Rational(1, 2)
+
+    def test_regression_csv(self, csv_datei):
+        """Regressionsgerade aus zwei CSV-Spalten"""
+        regression = regression_csv(
+            csv_datei, "zeit", "weg", trennzeichen=";", dezimalkomma=True, exakt=True
+        )
+        # weg = 3*i + 2 mit zeit = i + 1/2  =>  weg = 3*zeit + 1/2
+        assert regression.steigung == 3
+        assert regression.achsenabschnitt == sp.Rational(1, 2)
+
+
+class TestVisualisierung:
+    """Tests für die Plotly-Darstellung der Datenanalyse"""
+
+    def test_histogramm_und_regression_zeichnen(self):
+        """Histogramm und Regressionsgerade erzeugen Plotly-Figuren"""
+        zusammenfassung = beschreibe_daten([1, 2, 2, 3, 3, 3, 4], histogramm=(0, 5, 5))
+        fig = zeichne_histogramm(zusammenfassung.histogramm, relativ=True)
+        assert len(fig.data) == 1
+
+        regression = LaufendeRegression()
+        regression.hinzufuegen_viele([0, 1, 2], [1, 3, 5])
+        fig = zeichne_regression(regression, [0, 1, 2], [1, 3, 5])
+        assert len(fig.data) == 2
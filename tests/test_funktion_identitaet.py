@@ -0,0 +1,113 @@
+"""
+Tests für Hash, Gleichheit und Internierung von Funktionen.
+
+Überprüft die strukturelle Gleichheit über die Normalform, die explizite
+mathematische Äquivalenz und die Internierungstabelle.
+"""
+
+import gc
+
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis import funktion as funktion_modul
+from schul_mathematik.analysis.errors import UngueltigeFunktionError
+from schul_mathematik.analysis.funktion import Funktion
+
+
+class TestHashUndGleichheit:
+    """Tests für __hash__ und das strukturelle __eq__"""
+
+    def test_hashbar(self):
+        """Funktionen taugen als Schlüssel für Dicts und Sets"""
+        f = Funktion("x^2 - 4")
+        tabelle = {f: "Parabel"}
+
+        assert tabelle[Funktion("x^2 - 4")] == "Parabel"
+        assert len({f, Funktion("x^2 - 4"), Funktion("x^3")}) == 2
+
+    def test_normalform_ganzrational(self):
+        """Ausmultiplizierte Polynome sind gleich, auch bei anderer Schreibweise"""
+        f = Funktion("(x + 1)^2")
+        g = Funktion("x^2 + 2x + 1")
+
+        assert f == g
+        assert hash(f) == hash(g)
+
+    def test_variable_zaehlt(self):
+        """Gleicher Ausdruck in anderer Variable ist eine andere Funktion"""
+        assert Funktion("x^2") != Funktion("t^2")
+        assert Funktion("x^2") != "x^2"
+
+    def test_eq_ohne_simplify(self, monkeypatch):
+        """== vereinfacht nicht"""
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("simplify aufgerufen")
+
+        f = Funktion("sin(x)^2 + cos(x)^2")
+        g = Funktion("sin(x)^2 + cos(x)^2 + 0*x")
+        monkeypatch.setattr(sp, "simplify", verboten)
+        monkeypatch.setattr(sp.Expr, "equals", verboten)
+
+        assert f == g
+        assert f != Funktion("sin(x)")
+
+    def test_schluessel_folgt_dem_term(self):
+        """Nach einer Änderung von term_sympy wird der Schlüssel neu gebildet"""
+        f = Funktion("(x^2 - 1)/(x - 1)")
+        vorher = f._kanonischer_schluessel()
+        f.term_sympy = sp.Symbol("x") + 1
+
+        assert f._kanonischer_schluessel() != vorher
+        assert f._kanonischer_schluessel()[0] == sp.Symbol("x") + 1
+
+    def test_gehasht_unveraenderlich(self):
+        """Nach hash() lehnt die Funktion Termänderungen ab"""
+        f = Funktion("(x^2 - 1)/(x - 1)")
+        menge = {f}
+
+        with pytest.raises(UngueltigeFunktionError):
+            f.kürzen()
+        assert f in menge
+        assert Funktion(f).kürzen().term_sympy == sp.Symbol("x") + 1
+
+
+class TestAequivalenz:
+    """Tests für ist_aequivalent"""
+
+    def test_verschiedene_schreibweisen(self):
+        """Mathematisch gleiche Terme sind äquivalent, aber nicht =="""
+        f = Funktion("sin(x)^2 + cos(x)^2")
+
+        assert f.ist_aequivalent("1")
+        assert f != Funktion("1")
+
+    def test_nicht_aequivalent(self):
+        """Verschiedene Funktionen sind nicht äquivalent"""
+        assert not Funktion("x^2").ist_aequivalent(Funktion("x^3"))
+
+
+class TestInternierung:
+    """Tests für Funktion.interniert"""
+
+    def test_gleiche_eingabe_gleiches_objekt(self):
+        """Gleiche Eingaben liefern dasselbe Objekt, ohne erneut zu parsen"""
+        f = Funktion.interniert("x^3 - 3x")
+
+        assert Funktion.interniert(" x^3 - 3x ") is f
+        assert Funktion.interniert("x*(x^2 - 3)") is f
+
+    def test_eintraege_verschwinden(self):
+        """Die Tabelle hält Funktionen nicht am Leben"""
+        Funktion.interniert("x^5 + 7")
+        gc.collect()
+
+        assert "x^5 + 7" not in funktion_modul._INTERNIERT_EINGABE
+
+    def test_funktionsobjekt(self):
+        """Bereits erzeugte Funktionen werden über ihre Normalform interniert"""
+        f = Funktion("x^2 + 5")
+
+        assert Funktion.interniert(f) is f
+        assert Funktion.interniert("x^2 + 5") is f
@@ -0,0 +1,96 @@
+"""
+Tests für verzögerte Rechenergebnisse (FunktionsAusdruck).
+
+Überprüft, dass Rechenketten keine Zwischenfunktionen analysieren,
+Funktionswerte ohne Typerkennung entstehen und die typisierte Funktion
+erst bei Analyse oder Darstellung genau einmal erzeugt wird.
+"""
+
+import pickle
+
+import sympy as sp
+
+from schul_mathematik.analysis.funktion import Funktion, FunktionsAusdruck
+from schul_mathematik.analysis.ganzrationale import GanzrationaleFunktion
+from schul_mathematik.analysis.quadratisch import QuadratischeFunktion
+from schul_mathematik.analysis.serialisierung import funktion_aus_dict, funktion_zu_dict
+from schul_mathematik.analysis.symmetrie import Achsensymmetrie
+
+x = sp.Symbol("x")
+
+
+class TestRechenkette:
+    """Tests für Ketten von Rechenoperationen"""
+
+    def setup_method(self):
+        self.f = Funktion("x^2")
+        self.g = Funktion("sin(x)")
+        self.h = Funktion("3x - 6")
+
+    def test_ohne_zwischenfunktionen(self, monkeypatch):
+        """Rechnen und Auswerten erzeugen keine Funktionsobjekte"""
+        erzeugt = []
+        erstelle = Funktion._erstelle_symbole_ausdruecke
+
+        def zaehle(funktion):
+            erzeugt.append(funktion)
+            return erstelle(funktion)
+
+        monkeypatch.setattr(Funktion, "_erstelle_symbole_ausdruecke", zaehle)
+
+        k = self.f + 2 * self.g - self.h / 3
+        assert isinstance(k, Funktion)
+        assert isinstance(k, FunktionsAusdruck)
+        assert k.term_sympy == x**2 + 2 * sp.sin(x) - x + 2
+        assert k.wert(0) == 2
+        assert k(sp.pi) == sp.pi**2 - sp.pi + 2
+        assert erzeugt == []
+
+        k.ableitung()
+        assert erzeugt
+        ziel = k.materialisiere()
+        str(k)
+        assert k.materialisiere() is ziel
+
+    def test_typisiert(self):
+        """Analyse und Darstellung nutzen die erkannte Funktionsklasse"""
+        k = self.f - 2 * self.h - 4
+        assert type(k.materialisiere()) is QuadratischeFunktion
+        assert [n.x for n in k.nullstellen()] == [4, 2]
+        assert str(k) == "x^2 - 6*x + 8"
+        assert k == Funktion("x^2 - 6x + 8")
+
+    def test_isinstance(self):
+        """Typprüfungen auf Unterklassen brauchen materialisiere()"""
+        k = self.f + Funktion("x")
+        assert isinstance(k, Funktion)
+        assert not isinstance(k, GanzrationaleFunktion)
+        assert k._ziel is None  # Typprüfungen lösen keine Typerkennung aus
+        assert isinstance(k.materialisiere(), QuadratischeFunktion)
+        assert not isinstance((self.f + self.g).materialisiere(), GanzrationaleFunktion)
+        assert repr(k) == f"FunktionsAusdruck({k.materialisiere()!r})"
+        assert vars(k) == vars(k.materialisiere())
+
+    def test_verzweigung_nach_typ(self):
+        """Aufrufer, die nach der Klasse verzweigen, typisieren selbst"""
+        k = Funktion("x^2") - Funktion("2x")
+        assert Achsensymmetrie(k) == 1
+
+    def test_aenderungen(self):
+        """Attribute und Termänderungen landen bei der typisierten Funktion"""
+        k = self.f + self.h
+        k.name = "k"
+        k.term_sympy = x**2
+        assert k.materialisiere().name == "k"
+        assert k.term_sympy == x**2
+
+
+class TestSerialisierung:
+    """Tests für das Speichern verzögerter Ergebnisse"""
+
+    def test_als_typisierte_funktion(self):
+        """to_dict und pickle speichern die typisierte Funktion"""
+        k = Funktion("x^2") + Funktion("1")
+        geladen = funktion_aus_dict(funktion_zu_dict(k))
+        assert type(geladen) is QuadratischeFunktion
+        assert type(pickle.loads(pickle.dumps(k))) is QuadratischeFunktion
@@ -0,0 +1,151 @@
+"""
+Tests für Punkte, Geraden und Ebenen der Analytischen Geometrie.
+
+Überprüft den exakten Rechenkern (Brüche statt sp.solve), die
+Lagebeziehungen von Geraden und Ebenen in 2D und 3D, Abstände und
+Schnittwinkel sowie den Rückfall auf SymPy bei symbolischen Koordinaten.
+"""
+
+from fractions import Fraction
+
+import sympy as sp
+
+from schul_mathematik.geometrie import Ebene, Gerade, Punkt
+from schul_mathematik.geometrie.exakt import vektor
+
+
+def _g(a, v, name="g"):
+    return Gerade(Punkt(a), Punkt(v), name)
+
+
+class TestExakterKern:
+    """Tests für die Koordinatendarstellung"""
+
+    def test_brueche(self):
+        """Zahlen werden exakt zu Brüchen, Symbole bleiben SymPy-Ausdrücke"""
+        a = sp.Symbol("a")
+        assert vektor([1, 0.1, sp.Rational(2, 3)]) == (
+            Fraction(1),
+            Fraction(1, 10),
+            Fraction(2, 3),
+        )
+        assert vektor([a, 2])[0] == a
+
+    def test_ohne_solve(self, monkeypatch):
+        """Lagebeziehungen kommen ohne Gleichungslöser aus"""
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("solve aufgerufen")
+
+        monkeypatch.setattr(sp, "solve", verboten)
+        g = _g([0, 0, 0], [1, 1, 0])
+        h = _g([1, 0, 0], [-1, 1, 0])
+        e = Ebene(Punkt([0, 0, 1]), Punkt([1, 0, 0]), Punkt([0, 1, 0]))
+
+        assert g.schnittpunkt_mit(h).koordinaten == [
+            sp.Rational(1, 2),
+            sp.Rational(1, 2),
+            0,
+        ]
+        assert e.lage_zu_gerade(g) == "parallel"
+
+
+class TestGerade:
+    """Tests für Geraden in 2D und 3D"""
+
+    def test_enthaelt_punkt(self):
+        """Alle Koordinaten müssen zum selben Parameter passen"""
+        g = _g([1, 2, 3], [1, 1, 1])
+        assert g.enthaelt_punkt(Punkt([3, 4, 5]))
+        assert not g.enthaelt_punkt(Punkt([3, 4, 6]))
+        assert not _g([0, 0], [1, 2]).enthaelt_punkt(Punkt([1, 3]))
+        assert _g([0, 5], [1, 0]).enthaelt_punkt(Punkt([Fraction(7, 3), 5]))
+
+    def test_schnittpunkt_2d(self):
+        """Schnittpunkt über die Cramersche Regel"""
+        g = _g([0, 0], [1, 2])
+        h = _g([3, 0], [-1, 1], "h")
+        s = g.schnittpunkt_mit(h)
+        assert s.koordinaten == [1, 2]
+        assert s.name == "g∩h"
+        assert g.lage_zu(h) == "schneidend"
+        assert g.schnittpunkt_mit(_g([1, 0], [2, 4])) is None
+
+    def test_lagebeziehungen_3d(self):
+        """Identisch, parallel, schneidend und windschief"""
+        g = _g([0, 0, 0], [1, 0, 0])
+        assert g.lage_zu(_g([5, 0, 0], [-2, 0, 0])) == "identisch"
+        assert g.lage_zu(_g([0, 1, 0], [3, 0, 0])) == "parallel"
+        assert g.lage_zu(_g([2, -1, 0], [0, 1, 0])) == "schneidend"
+        assert g.ist_windschief_zu(_g([0, 0, 1], [0, 1, 0]))
+        assert g.schnittpunkt_mit(_g([0, 0, 1], [0, 1, 0])) is None
+        assert g.schnittpunkt_mit(_g([2, -1, 0], [0, 1, 0])).koordinaten == [2, 0, 0]
+
+    def test_abstaende(self):
+        """Abstände zu Punkten, parallelen und windschiefen Geraden"""
+        g = _g([0, 0, 0], [1, 0, 0])
+        assert g.abstand_zu_punkt(Punkt([7, 3, 4])) == 5
+        assert g.abstand_zu(_g([0, 1, 1], [2, 0, 0])) == sp.sqrt(2)
+        assert g.abstand_zu(_g([0, 0, 3], [0, 1, 0])) == 3
+        assert g.abstand_zu(_g([1, 1, 0], [0, 1, 0])) == 0
+        assert _g([0, 0], [1, 1]).abstand_zu_punkt(Punkt([1, 0])) == sp.sqrt(2) / 2
+
+    def test_schnittwinkel(self):
+        """Exakter Winkel zwischen 0 und π/2"""
+        g = _g([0, 0], [1, 0])
+        assert g.schnittwinkel(_g([0, 0], [-1, 1])) == sp.pi / 4
+        assert g.schnittwinkel(_g([0, 0], [0, 3])) == sp.pi / 2
+
+
+class TestEbene:
+    """Tests für Ebenen"""
+
+    def setup_method(self):
+        # E: z = 2
+        self.e = Ebene(Punkt([0, 0, 2]), Punkt([1, 1, 0]), Punkt([0, 2, 0]))
+
+    def test_normalenvektor(self):
+        """Kreuzprodukt der Richtungsvektoren"""
+        assert self.e.normalenvektor().koordinaten == [0, 0, 2]
+
+    def test_enthaelt_punkt(self):
+        """n · (P - A) = 0"""
+        assert self.e.enthaelt_punkt(Punkt([Fraction(5, 7), -3, 2]))
+        assert not self.e.enthaelt_punkt(Punkt([0, 0, 2.1]))
+
+    def test_gerade(self):
+        """Schnittpunkt, Lage, Abstand und Winkel zu Geraden"""
+        g = _g([1, 1, 0], [1, 0, 1])
+        assert self.e.schnittpunkt_mit_gerade(g).koordinaten == [3, 1, 2]
+        assert self.e.lage_zu_gerade(g) == "schneidend"
+        assert self.e.schnittwinkel(g) == sp.pi / 4
+
+        parallel = _g([0, 0, -1], [1, 0, 0])
+        assert self.e.lage_zu_gerade(parallel) == "parallel"
+        assert self.e.schnittpunkt_mit_gerade(parallel) is None
+        assert self.e.abstand_zu(parallel) == 3
+        assert self.e.enthaelt_gerade(_g([4, 4, 2], [0, 1, 0]))
+
+    def test_ebenen(self):
+        """Lage, Schnittgerade und Abstand zweier Ebenen"""
+        f = Ebene(Punkt([1, 0, 0]), Punkt([0, 1, 0]), Punkt([0, 0, 1]), "F")
+        assert self.e.lage_zu_ebene(f) == "schneidend"
+        s = self.e.schnittgerade_mit(f)
+        assert self.e.enthaelt_punkt(s.aufpunkt)
+        assert f.enthaelt_punkt(s.aufpunkt)
+        assert self.e.enthaelt_gerade(s) and f.enthaelt_gerade(s)
+        assert self.e.schnittwinkel(f) == sp.pi / 2
+
+        parallel = Ebene(Punkt([0, 0, -1]), Punkt([1, 0, 0]), Punkt([0, 1, 0]))
+        assert self.e.lage_zu_ebene(parallel) == "parallel"
+        assert self.e.schnittgerade_mit(parallel) is None
+        assert self.e.abstand_zu(parallel) == 3
+        assert self.e.abstand_zu_punkt(Punkt([9, 9, 7])) == 5
+
+    def test_symbolisch(self):
+        """Parameter werden mit SymPy behandelt"""
+        a = sp.Symbol("a")
+        assert self.e.enthaelt_punkt(Punkt([a, a**2, 2]))
+        assert not self.e.enthaelt_punkt(Punkt([0, 0, a]))
+        assert _g([0, 0, 0], [a, a, a]).enthaelt_punkt(Punkt([2 * a, 2 * a, 2 * a]))
+        assert self.e.abstand_zu_punkt(Punkt([0, 0, sp.sqrt(2)])) == 2 - sp.sqrt(2)
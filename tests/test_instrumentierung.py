@@ -0,0 +1,141 @@
+"""
+Tests für die Instrumentierung (Zähler, Zeitmessung, Cache-Statistiken).
+
+Überprüft den Performance-Bericht von messe_performance, die verzögerte
+Formatierung von Log-Meldungen und dass ohne Messung nichts gezählt wird.
+"""
+
+import logging
+from functools import lru_cache
+
+from schul_mathematik.analysis import instrumentierung
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.instrumentierung import (
+    Lazy,
+    Messung,
+    cache_statistik,
+    gemessen,
+    messe_performance,
+)
+from schul_mathematik.analysis.lineare_gleichungssysteme import LGS_aus_matrix
+
+
+class TestMessePerformance:
+    """Tests für den Performance-Bericht"""
+
+    def test_operationen_werden_gezaehlt(self):
+        """Parse, Ableitung, Lösen und Auswerten erscheinen im Bericht"""
+        with messe_performance() as bericht:
+            f = Funktion("x^3 - 3*x + 1")
+            f.ableitung()
+            f.wert(2)
+            f.nullstellen()
+
+        for operation in ("parse", "diff", "evaluate", "solve"):
+            assert bericht.operationen[operation].anzahl >= 1
+            assert bericht.operationen[operation].zeit >= 0
+        assert bericht.dauer > 0
+        assert "diff" in str(bericht)
+
+    def test_cache_treffer(self):
+        """Wiederholte Ableitungen und Funktionswerte sind Cache-Treffer"""
+        f = Funktion("x^4 - x")
+        with messe_performance() as bericht:
+            for _ in range(3):
+                f.ableitung()
+                f.wert(5)
+
+        assert bericht.caches["ableitung"].treffer == 2
+        assert bericht.caches["ableitung"].fehlschlaege == 1
+        assert bericht.caches["wert"].trefferquote == 2 / 3
+
+    def test_lru_caches(self):
+        """Auch lru_caches wie die LU-Zerlegung liefern Statistiken"""
+        with messe_performance() as bericht:
+            for _ in range(2):
+                LGS_aus_matrix([[3, 1], [1, 7]]).löse_viele([[1, 2]])
+
+        assert bericht.caches["lu"].treffer >= 1
+        assert "lu" in cache_statistik()
+
+    def test_verschachtelte_messungen(self):
+        """Innere Messungen sehen nur ihren eigenen Block"""
+        f = Funktion("x^2 + 3*x")
+        with messe_performance() as aussen:
+            f.ableitung(2)
+            with messe_performance() as innen:
+                f.wert(1)
+
+        assert "diff" not in innen.operationen
+        assert aussen.operationen["evaluate"].anzahl == 1
+        assert aussen.operationen["diff"].anzahl == 1
+
+    def test_als_dict(self):
+        """Der Bericht lässt sich als einfache Datenstruktur ausgeben"""
+        with messe_performance() as bericht:
+            with Messung("plot"):
+                pass
+        daten = bericht.als_dict()
+        assert daten["operationen"]["plot"]["anzahl"] == 1
+
+
+class TestOhneMessung:
+    """Tests für inaktive Instrumentierung"""
+
+    def test_nichts_wird_gezaehlt(self):
+        """Ohne laufende Messung bleiben die Zähler unverändert"""
+
+        @gemessen("test_inaktiv")
+        def quadrat(wert):
+            return wert * wert
+
+        assert quadrat(4) == 16
+        assert not instrumentierung.ist_aktiv()
+        assert "test_inaktiv" not in instrumentierung._anzahl
+
+    def test_cache_info_bleibt_erreichbar(self):
+        """Gemessene lru_cache-Funktionen behalten cache_info"""
+
+        @gemessen("test_lru")
+        @lru_cache(maxsize=4)
+        def verdoppeln(wert):
+            return 2 * wert
+
+        verdoppeln(1)
+        verdoppeln(1)
+        assert verdoppeln.cache_info().hits == 1
+
+
+class TestLazyLogging:
+    """Tests für verzögerte Log-Parameter"""
+
+    def test_term_nur_bei_aktivem_level(self, caplog):
+        """term() wird nur berechnet, wenn DEBUG-Meldungen ausgegeben werden"""
+        aufrufe = []
+
+        def teuer():
+            aufrufe.append(1)
+            return "x^2"
+
+        logger = logging.getLogger("schul_mathematik.test")
+        with caplog.at_level(logging.INFO, logger="schul_mathematik.test"):
+            logger.debug("Berechne %s", Lazy(teuer))
+        assert aufrufe == []
+
+        with caplog.at_level(logging.DEBUG, logger="schul_mathematik.test"):
+            logger.debug("Berechne %s", Lazy(teuer))
+        assert aufrufe
+        assert "Berechne x^2" in caplog.text
+
+    def test_ableitung_ohne_debug_ruft_term_nicht_auf(self, caplog, monkeypatch):
+        """Cache-Treffer bei ableitung() formatieren den Term nicht"""
+        f = Funktion("x^3 + 2*x")
+        f.ableitung()
+
+        def term_verboten(_funktion):
+            raise AssertionError("term() darf nicht aufgerufen werden")
+
+        monkeypatch.setattr(type(f), "term", term_verboten)
+        with caplog.at_level(logging.INFO, logger="schul_mathematik"):
+            f.ableitung()
+            f.wert(3)
@@ -0,0 +1,127 @@
+"""
+Tests für die Newton-Interpolation und interpolationspolynom.
+
+Überprüft exakte dividierte Differenzen, das Hinzufügen einzelner Punkte,
+die baryzentrische Gleitkomma-Auswertung und irrationale Stützpunkte.
+"""
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis.ganzrationale import GanzrationaleFunktion
+from schul_mathematik.analysis.interpolation import NewtonInterpolation
+from schul_mathematik.analysis.lineare_gleichungssysteme import interpolationspolynom
+
+
+class TestNewtonInterpolation:
+    """Tests für die Newton-Form mit exakten Brüchen"""
+
+    def test_parabel_durch_drei_punkte(self):
+        """Newton-Koeffizienten und Monomform einer Parabel"""
+        p = NewtonInterpolation([(1, 2), (2, 3), (3, 6)])
+        assert p.koeffizienten == [2, 1, 1]
+        assert p.monom_koeffizienten() == [1, -2, 3]
+        assert p.wert(4) == 11
+
+    def test_punkt_hinzufuegen(self):
+        """Schrittweises Hinzufügen ergibt dasselbe Polynom"""
+        punkte = [(0, 1), (1, 3), (-1, 5), (2, 0), (Fraction(1, 2), 7)]
+        schrittweise = NewtonInterpolation()
+        for x, y in punkte:
+            schrittweise.punkt_hinzufuegen(x, y)
+        assert schrittweise.monom_koeffizienten() == (
+            NewtonInterpolation(punkte[::-1]).monom_koeffizienten()
+        )
+        assert all(schrittweise.wert(x) == y for x, y in punkte)
+
+    def test_dezimalzahlen_exakt(self):
+        """Dezimalzahlen werden als Brüche übernommen"""
+        p = NewtonInterpolation([(0.5, 0.1), (1.5, 0.3)])
+        assert p.monom_koeffizienten() == [Fraction(1, 5), 0]
+
+    def test_doppelte_stelle(self):
+        """Zwei Punkte mit gleicher x-Stelle werden abgelehnt"""
+        p = NewtonInterpolation([(1, 2)])
+        with pytest.raises(ValueError, match="bereits"):
+            p.punkt_hinzufuegen(1, 3)
+
+    def test_baryzentrisch_wie_exakt(self):
+        """Die baryzentrische Auswertung stimmt mit der exakten überein"""
+        punkte = [(i, (-1) ** i * i**2) for i in range(12)]
+        p = NewtonInterpolation(punkte)
+        stellen = np.linspace(-0.5, 11.5, 40)
+        erwartet = [float(p.wert(x)) for x in stellen]
+        assert np.allclose(p.auswerten(stellen), erwartet)
+        assert p.auswerten([3])[0] == 9 * -1
+
+    def test_gleitkomma_modus(self):
+        """Im Gleitkomma-Modus bleibt die Runge-Funktion auf Tschebyschow-Knoten genau"""
+        knoten = np.cos(np.pi * (2 * np.arange(40) + 1) / 80)
+        p = NewtonInterpolation(
+            zip(knoten, 1 / (1 + 25 * knoten**2), strict=True), exakt=False
+        )
+        stellen = np.linspace(-1, 1, 101)
+        assert np.max(np.abs(p.auswerten(stellen) - 1 / (1 + 25 * stellen**2))) < 1e-2
+
+
+class TestInterpolationspolynom:
+    """Tests für die Hilfsfunktion interpolationspolynom"""
+
+    def test_liefert_ganzrationale_funktion(self):
+        """Ergebnis ist eine exakte ganzrationale Funktion"""
+        f = interpolationspolynom([(1, 2), (2, 3), (3, 6)])
+        assert isinstance(f, GanzrationaleFunktion)
+        assert f.term() == "x^2 - 2*x + 3"
+
+    def test_gerade(self):
+        """Zwei Punkte ergeben eine Gerade"""
+        f = interpolationspolynom([(0, 1), (2, 5)])
+        assert f.wert(1) == 3
+
+    def test_still_ohne_ausfuehrlich(self, capsys):
+        """Ohne ausfuehrlich=True wird nichts ausgegeben"""
+        interpolationspolynom([(0, 1), (1, 0), (2, 1)])
+        assert capsys.readouterr().out == ""
+
+    def test_ausfuehrlicher_loesungsweg(self, capsys):
+        """Mit ausfuehrlich=True wird der LGS-Lösungsweg gezeigt"""
+        f = interpolationspolynom([(0, 1), (1, 0), (2, 1)], ausfuehrlich=True)
+        ausgabe = capsys.readouterr().out
+        assert "LÖSUNGSWEG" in ausgabe
+        assert "a0, a1, a2" in ausgabe
+        assert f.wert(3) == 4
+
+    def test_viele_punkte(self):
+        """50 ganzzahlige Punkte werden exakt interpoliert"""
+        punkte = [(i, (i * 7) % 11) for i in range(50)]
+        p = NewtonInterpolation(punkte)
+        assert p.grad == 49
+        assert all(p.wert(x) == y for x, y in punkte)
+        assert sp.Poly(p.als_ausdruck(), sp.Symbol("x")).degree() <= 49
+
+    def test_irrationale_punkte(self, capsys):
+        """Wurzeln, π und Parameter werden über SymPy exakt interpoliert"""
+        punkte = [(0, sp.sqrt(2)), (1, 1), (2, 0)]
+        f = interpolationspolynom(punkte, ausfuehrlich=True)
+        assert "❌" not in capsys.readouterr().out
+        assert all(sp.simplify(f.wert(x) - y) == 0 for x, y in punkte)
+
+        f = interpolationspolynom([(0, 1), (sp.pi, 0)])
+        assert sp.simplify(f.wert(sp.pi / 2) - sp.Rational(1, 2)) == 0
+
+        a = sp.Symbol("a")
+        f = interpolationspolynom([(0, a), (1, 1), (2, 0)])
+        assert [f.wert(x) for x in (0, 1, 2)] == [a, 1, 0]
+
+    def test_doppelte_irrationale_stelle(self):
+        """Gleiche Stellen in verschiedener Schreibweise werden erkannt"""
+        with pytest.raises(ValueError, match="bereits ein Stützpunkt"):
+            interpolationspolynom([(sp.sqrt(8), 1), (2 * sp.sqrt(2), 0)])
+
+    def test_zu_wenige_punkte(self):
+        """Mindestens zwei Punkte sind nötig"""
+        with pytest.raises(ValueError):
+            interpolationspolynom([(1, 1)])
@@ -0,0 +1,105 @@
+"""
+Tests für das verzögerte Laden der Paketattribute.
+
+Überprüft, dass Plotly, NumPy und sympy.stats erst beim ersten Zugriff auf
+einen Namen geladen werden, der sie braucht, und dass alle öffentlichen
+Namen weiterhin erreichbar sind. Jeder Test startet einen frischen
+Interpreter, da die Module im Testprozess längst geladen sind.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+SCHWERE_MODULE = ("plotly", "numpy", "sympy.stats", "marimo")
+
+
+def _geladene_module(code: str) -> list[str]:
+    """Führt `code` in einem neuen Interpreter aus und meldet schwere Module"""
+    pruefung = (
+        f"import sys; print(*[m for m in {SCHWERE_MODULE!r} if m in sys.modules])"
+    )
+    prozess = subprocess.run(
+        [sys.executable, "-c", f"{code}\n{pruefung}"],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        check=True,
+    )
+    return prozess.stdout.split()
+
+
+class TestLazyImport:
+    """Tests für den schlanken Paketstart"""
+
+    def test_paketimport_ohne_schwere_module(self):
+        """`import schul_mathematik` lädt weder Plotly noch NumPy noch sympy.stats"""
+        assert _geladene_module("import schul_mathematik") == []
+
+    def test_kern_api_ohne_schwere_module(self):
+        """Funktion und Nullstellen kommen ohne Plot- und Statistikpakete aus"""
+        code = (
+            "from schul_mathematik import Funktion, Nullstellen\n"
+            "Nullstellen(Funktion('x^2 - 4'))"
+        )
+        assert _geladene_module(code) == []
+
+    def test_plotly_erst_beim_zugriff(self):
+        """Graph lädt Plotly, sympy.stats bleibt ungeladen"""
+        geladen = _geladene_module("from schul_mathematik import Graph")
+        assert "plotly" in geladen
+        assert "sympy.stats" not in geladen
+
+    def test_stochastik_erst_beim_zugriff(self):
+        """Verteilungen laden sympy.stats erst bei Bedarf"""
+        geladen = _geladene_module(
+            "import schul_mathematik.stochastik as s; s.BinomialPDF"
+        )
+        assert "sympy.stats" in geladen
+        assert "plotly" not in geladen
+
+
+class TestOeffentlicheNamen:
+    """Tests für unveränderte öffentliche Namen"""
+
+    def test_alle_namen_erreichbar(self):
+        """Jeder Name aus __all__ lässt sich auflösen"""
+        import schul_mathematik
+        import schul_mathematik.analysis
+        import schul_mathematik.stochastik
+
+        for paket in (
+            schul_mathematik,
+            schul_mathematik.analysis,
+            schul_mathematik.stochastik,
+        ):
+            for name in paket.__all__:
+                assert getattr(paket, name) is not None, name
+                assert name in dir(paket)
+
+    def test_stern_import(self):
+        """`from schul_mathematik import *` funktioniert"""
+        namensraum: dict = {}
+        exec("from schul_mathematik import *", namensraum)
+        assert "Schmiegkurve" in namensraum
+        assert "BinomialPDF" in namensraum
+
+    def test_gleiche_objekte_wie_untermodule(self):
+        """Verzögerte Namen verweisen auf dieselben Objekte wie die Module"""
+        import schul_mathematik
+        from schul_mathematik.analysis.visualisierung import Graph
+        from schul_mathematik.stochastik.wrapper import Sigma1Bereich
+
+        assert schul_mathematik.Graph is Graph
+        assert schul_mathematik.Sigma1Bereich is Sigma1Bereich
+
+    def test_unbekannter_name(self):
+        """Unbekannte Namen führen weiterhin zu AttributeError"""
+        import schul_mathematik
+
+        with pytest.raises(AttributeError):
+            _ = schul_mathematik.GibtEsNicht
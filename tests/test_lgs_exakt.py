@@ -0,0 +1,241 @@
+"""
+Tests für die exakte Gauß-Elimination (Bareiss) in linearen Gleichungssystemen.
+
+Überprüft exakte rationale Lösungen, Rang- und Widerspruchserkennung sowie
+das Protokoll der Umformungen für den Lösungsweg.
+"""
+
+import random
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.gauss import (
+    LUZerlegung,
+    bareiss_elimination,
+    lu_zerlegung,
+)
+from schul_mathematik.analysis.lineare_gleichungssysteme import (
+    LGS,
+    LGS_aus_matrix,
+    LGSInkonsistenzError,
+    LGSNumerischeInstabilitaetError,
+    LGSUnendlichVieleLoesungenError,
+    LineareGleichung,
+)
+
+a, b, c = sp.symbols("a b c")
+
+
+class TestBareissElimination:
+    """Tests für die bruchfreie Elimination auf ganzen Zahlen"""
+
+    def test_eindeutige_loesung_und_determinante(self):
+        """Eindeutige Lösung und Determinante sind exakt"""
+        ergebnis = bareiss_elimination(
+            [[2, 1, -1], [-3, -1, 2], [-2, 1, 2]], [8, -11, -3]
+        )
+        assert ergebnis.loesung == (2, 3, -1)
+        assert ergebnis.determinante == -1
+        assert ergebnis.rang == 3
+
+    def test_brueche_in_der_eingabe(self):
+        """Brüche werden zeilenweise auf ganze Zahlen skaliert"""
+        ergebnis = bareiss_elimination(
+            [[Fraction(1, 2), Fraction(1, 3)], [Fraction(1, 4), 1]], [1, 2]
+        )
+        assert ergebnis.loesung == (Fraction(4, 5), Fraction(9, 5))
+        assert ergebnis.determinante == Fraction(5, 12)
+
+    def test_rang_und_widerspruch(self):
+        """Rangdefekt und Widerspruch werden direkt erkannt"""
+        unterbestimmt = bareiss_elimination([[1, 2], [2, 4]], [3, 6])
+        assert unterbestimmt.ist_loesbar and not unterbestimmt.ist_eindeutig
+        assert unterbestimmt.freie_spalten == (1,)
+
+        widerspruch = bareiss_elimination([[1, 2], [2, 4]], [3, 7])
+        assert not widerspruch.ist_loesbar
+        assert widerspruch.widerspruch_zeile == 1
+
+    def test_zufaellige_systeme_wie_sympy(self):
+        """Rang, Determinante und Lösung stimmen mit SymPy überein"""
+        rng = random.Random(3)
+        for _ in range(200):
+            m, n = rng.randint(1, 5), rng.randint(1, 5)
+            matrix = [
+                [Fraction(rng.randint(-4, 4), rng.randint(1, 3)) for _ in range(n)]
+                for _ in range(m)
+            ]
+            if m > 2 and rng.random() < 0.5:
+                matrix[-1] = [
+                    x - 2 * y for x, y in zip(matrix[0], matrix[1], strict=True)
+                ]
+            vektor = [Fraction(rng.randint(-5, 5), rng.randint(1, 4)) for _ in range(m)]
+
+            ergebnis = bareiss_elimination(matrix, vektor, protokoll=False)
+            A = sp.Matrix(matrix).applyfunc(sp.nsimplify)
+            bv = sp.Matrix(vektor).applyfunc(sp.nsimplify)
+
+            assert ergebnis.rang == A.rank()
+            assert ergebnis.rang_erweitert == A.row_join(bv).rank()
+            if m == n:
+                assert sp.nsimplify(ergebnis.determinante) == A.det()
+            if ergebnis.loesung is not None:
+                assert A * sp.Matrix(ergebnis.loesung).applyfunc(sp.nsimplify) == bv
+
+
+class TestLineareGleichungssystemExakt:
+    """Tests für LineareGleichungssystem mit exakter Lösung"""
+
+    def test_loesung_ist_rational(self):
+        """Die Lösung enthält exakte Brüche statt Gleitkommazahlen"""
+        system = LGS(
+            LineareGleichung(9 * a + 3 * b + c, 4, "f(3)=4"),
+            LineareGleichung(4 * a + 2 * b + c, 0, "f(2)=0"),
+            LineareGleichung(b, 0, "f'(0)=0"),
+        )
+        loesung = system.löse()
+        assert loesung == {a: sp.Rational(4, 5), b: 0, c: sp.Rational(-16, 5)}
+        assert all(isinstance(w, sp.Rational) for w in loesung.values())
+
+    def test_dezimalzahlen_werden_exakt(self):
+        """Dezimalzahlen wie 0.1 werden als 1/10 behandelt"""
+        system = LGS_aus_matrix([[0.1, 0.2], [1, 0]], [0.3, 1])
+        assert list(system.löse().values()) == [1, 1]
+
+    def test_irrationale_koeffizienten(self):
+        """sqrt(2) wird nicht gerundet, sondern exakt mit SymPy gelöst"""
+        system = LGS_aus_matrix([[sp.sqrt(2), 0], [0, 1]], [2, 1])
+        assert list(system.löse().values()) == [sp.sqrt(2), 1]
+        assert not system.ist_rational
+        with pytest.raises(LGSInkonsistenzError):
+            LGS_aus_matrix([[sp.sqrt(2), 1], [sp.sqrt(8), 2]], [1, 3]).löse()
+        with pytest.raises(LGSUnendlichVieleLoesungenError):
+            LGS_aus_matrix([[sp.sqrt(2), 1], [sp.sqrt(8), 2]], [1, 2]).löse()
+
+    def test_widerspruch(self):
+        """Widersprüchliche Gleichungen werden über den Rang erkannt"""
+        system = LGS(
+            LineareGleichung(a + b, 1, "A"),
+            LineareGleichung(2 * a + 2 * b, 3, "B"),
+        )
+        ist_konsistent, nachricht = system.pruefe_konsistenz()
+        assert not ist_konsistent
+        assert "Gleichung 2" in nachricht
+        with pytest.raises(LGSInkonsistenzError):
+            system.löse()
+
+    def test_unendlich_viele_loesungen(self):
+        """Abhängige Gleichungen führen zu unendlich vielen Lösungen"""
+        system = LGS(
+            LineareGleichung(a + b, 1, "A"),
+            LineareGleichung(2 * a + 2 * b, 2, "B"),
+        )
+        with pytest.raises(LGSUnendlichVieleLoesungenError, match="frei wählbar: b"):
+            system.löse()
+
+    def test_ueberbestimmt_aber_konsistent(self):
+        """Überbestimmte, aber konsistente Systeme sind eindeutig lösbar"""
+        system = LGS(
+            LineareGleichung(a + b, 3, "A"),
+            LineareGleichung(a - b, 1, "B"),
+            LineareGleichung(2 * a, 4, "C"),
+        )
+        assert system.löse() == {a: 2, b: 1}
+
+    def test_loesungsweg_ohne_neuberechnung(self, capsys):
+        """Der Lösungsweg nutzt die gespeicherte Elimination"""
+        system = LGS(
+            LineareGleichung(a + b, 3, "A"),
+            LineareGleichung(a - b, 1, "B"),
+        )
+        ergebnis = system.gauss
+        system.zeige_loesungsweg()
+        assert system.gauss is ergebnis
+        ausgabe = capsys.readouterr().out
+        assert "Bareiss" in ausgabe
+        assert "Eliminiere" in ausgabe
+
+
+class TestLUZerlegung:
+    """Tests für die wiederverwendbare LU-Zerlegung"""
+
+    def test_exakt_und_numerisch(self):
+        """Exakte und NumPy-Lösungen stimmen überein"""
+        matrix = [[0, 2, 1], [1, 1, 1], [4, -1, 3]]
+        lu = LUZerlegung(matrix)
+        rechte_seiten = [[1, 2, 3], [0, 0, 1], [-2, 5, 7]]
+
+        exakt = lu.loese_viele(rechte_seiten)
+        numerisch = lu.loese_numerisch(rechte_seiten)
+        A = np.array(matrix, dtype=float)
+
+        for x, x_num, b in zip(exakt, numerisch, rechte_seiten, strict=True):
+            assert [sum(a * w for a, w in zip(z, x, strict=True)) for z in matrix] == b
+            assert np.allclose(A @ x_num, b)
+        assert lu.determinante == sp.Matrix(matrix).det()
+
+    def test_singulaere_matrix(self):
+        """Singuläre Matrizen haben keine LU-Zerlegung"""
+        with pytest.raises(ValueError, match="singulär"):
+            LUZerlegung([[1, 2], [2, 4]])
+
+    def test_cache_nach_struktur(self):
+        """Gleiche Koeffizientenmatrizen teilen sich eine Zerlegung"""
+        assert lu_zerlegung([[1, 2], [3, 4]]) is lu_zerlegung(
+            [[Fraction(1), 2.0], [3, 4]]
+        )
+
+
+class TestLGSBatch:
+    """Tests für das Lösen vieler rechter Seiten mit einem LGS"""
+
+    def setup_method(self):
+        """Parabel durch feste x-Stellen 0, 1, 2"""
+        self.f = Funktion("a*x^2 + b*x + c")
+        self.system = LGS(
+            *(LineareGleichung(self.f(x), 0, f"f({x}) = y") for x in (0, 1, 2))
+        )
+
+    def test_viele_rechte_seiten_exakt(self):
+        """Jede Zeile liefert die Parameter a, b, c exakt"""
+        ergebnis = self.system.löse_viele([[1, 2, 5], [0, 1, 4], [0, 0, 1]])
+        assert ergebnis.shape == (3, 3)
+        assert ergebnis.tolist() == [
+            [1, 0, 1],
+            [1, 0, 0],
+            [sp.Rational(1, 2), sp.Rational(-1, 2), 0],
+        ]
+
+    def test_viele_rechte_seiten_numerisch(self):
+        """Numerische Lösungen als float-Array"""
+        y = np.random.default_rng(0).normal(size=(100, 3))
+        ergebnis = self.system.löse_viele(y, numerisch=True)
+        a, b, c = ergebnis.T
+        assert np.allclose(c, y[:, 0])
+        assert np.allclose(a + b + c, y[:, 1])
+        assert np.allclose(4 * a + 2 * b + c, y[:, 2])
+
+    def test_als_funktionen(self):
+        """Die Lösungen lassen sich direkt als Funktionen erhalten"""
+        funktionen = self.system.löse_viele_für_funktion(self.f, [[1, 2, 5], [0, 1, 4]])
+        assert [g.term() for g in funktionen] == ["x^2 + 1", "x^2"]
+
+    def test_konstante_terme_werden_beruecksichtigt(self):
+        """Konstante Anteile der linken Seite verschieben die rechte Seite"""
+        system = LGS(
+            LineareGleichung(a + b + 1, 0, "A"),
+            LineareGleichung(a - b, 0, "B"),
+        )
+        assert system.löse_viele([[3, 1]]).tolist() == [
+            [sp.Rational(3, 2), sp.Rational(1, 2)]
+        ]
+
+    def test_singulaeres_system(self):
+        """Linear abhängige Bedingungen werden gemeldet"""
+        system = LGS_aus_matrix([[1, 2], [2, 4]])
+        with pytest.raises(LGSNumerischeInstabilitaetError):
+            system.löse_viele([[1, 2]])
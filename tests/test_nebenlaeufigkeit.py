@@ -0,0 +1,172 @@
+"""
+Tests für die gleichzeitige Nutzung des Analysis-Kerns aus mehreren Threads.
+
+Überprüft den kontextlokalen Rekursionsschutz der Strukturanalyse, die
+gesperrten Caches geteilter Funktionen, die Zähler der Instrumentierung und
+die Konfiguration pro Anfrage. Der Stresstest analysiert überlappende Terme
+in vielen Threads und vergleicht mit einer sequentiellen Referenz.
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from schul_mathematik.analysis import config as config_modul
+from schul_mathematik.analysis import instrumentierung, struktur
+from schul_mathematik.analysis.funktion import Funktion
+
+TERME = [
+    "(x^2 + 1)/(x - 1)",
+    "x^2*exp(-x)",
+    "x^3 - 3*x",
+    "sin(x) + x",
+    "(x^2 - 4)/(x + 3)",
+    "x*exp(x)",
+]
+THREADS = 8
+
+
+def _analyse(term: str) -> tuple:
+    f = Funktion(term)
+    return (
+        type(f).__name__,
+        f.ableitung().term(),
+        f.wert(2),
+        tuple(str(n.x) for n in f.nullstellen()),
+    )
+
+
+def _parallel(funktion, auftraege, threads=THREADS):
+    start = threading.Barrier(threads)
+
+    def mit_gleichzeitigem_start(auftrag):
+        start.wait(timeout=30)
+        return funktion(auftrag)
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(mit_gleichzeitigem_start, auftraege))
+
+
+class TestStresstest:
+    """Viele Threads analysieren überlappende Terme"""
+
+    def test_ergebnisse_wie_sequentiell(self):
+        """Typ, Ableitung, Funktionswert und Nullstellen stimmen überein"""
+        referenz = {term: _analyse(term) for term in TERME}
+
+        auftraege = [TERME[i % len(TERME)] for i in range(3 * THREADS)]
+        ergebnisse = _parallel(_analyse, auftraege)
+
+        for term, ergebnis in zip(auftraege, ergebnisse, strict=True):
+            assert ergebnis == referenz[term], term
+
+    def test_geteilte_funktion(self):
+        """Gleichzeitige Ableitungen einer geteilten Funktion sind konsistent"""
+        f = Funktion("x^4 - 2*x^2 + x")
+        aufrufe_pro_thread = 20
+
+        def ableiten(_):
+            return [f.ableitung(1 + i % 3) for i in range(aufrufe_pro_thread)]
+
+        ergebnisse = _parallel(ableiten, range(THREADS))
+
+        # Jede Ordnung liefert überall dasselbe Objekt aus dem Cache
+        for ordnung in (1, 2, 3):
+            objekte = {
+                id(r[i])
+                for r in ergebnisse
+                for i in range(ordnung - 1, aufrufe_pro_thread, 3)
+            }
+            assert len(objekte) == 1
+        gesamt = f._ableitung_cache_hits + f._ableitung_cache_misses
+        assert gesamt == THREADS * aufrufe_pro_thread
+
+    def test_geteilter_wert_cache(self):
+        """Verdrängen im Wert-Cache verträgt gleichzeitige Zugriffe"""
+        f = Funktion("x^2 + 1")
+
+        def auswerten(versatz):
+            return [f.wert(versatz + i) for i in range(150)]
+
+        ergebnisse = _parallel(auswerten, range(THREADS))
+
+        for versatz, werte in enumerate(ergebnisse):
+            assert werte == [(versatz + i) ** 2 + 1 for i in range(150)]
+        assert len(f._wert_cache) <= f._wert_cache_max_size
+
+
+class TestRekursionsschutz:
+    """Tests für den kontextlokalen Rekursionsschutz"""
+
+    def test_gilt_nur_im_eigenen_thread(self):
+        """Eine laufende Analyse blockiert andere Threads nicht"""
+        marke = struktur._analyse_laeuft.set(True)
+        try:
+            with pytest.raises(struktur.StrukturAnalyseError):
+                struktur.analysiere_funktionsstruktur("x*exp(x)")
+
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                info = pool.submit(
+                    struktur.analysiere_funktionsstruktur, "x*exp(x)"
+                ).result()
+            assert info["struktur"] == "produkt"
+        finally:
+            struktur._analyse_laeuft.reset(marke)
+
+
+class TestInstrumentierung:
+    """Zähler verlieren unter Last keine Zugriffe"""
+
+    def test_cache_zugriffe(self):
+        """Jeder gezählte Zugriff landet im Bericht"""
+        anzahl = 2000
+
+        def zaehlen(_):
+            for _ in range(anzahl):
+                instrumentierung.cache_zugriff("stresstest", treffer=True)
+
+        with instrumentierung.messe_performance() as bericht:
+            _parallel(zaehlen, range(THREADS))
+
+        assert bericht.caches["stresstest"].treffer == THREADS * anzahl
+
+
+class TestKonfigurationProAnfrage:
+    """Konfiguration und Aspect-Ratio gelten nur im eigenen Kontext"""
+
+    def test_konfiguration(self):
+        """Überschriebene Werte sehen andere Threads nicht"""
+
+        def thema(name):
+            with config_modul.konfiguration(PLOTLY_THEME=name):
+                return config_modul.aktuelle_konfiguration().get_plot_config()[
+                    "template"
+                ]
+
+        themen = [f"thema{i}" for i in range(THREADS)]
+        assert _parallel(thema, themen) == themen
+        assert config_modul.aktuelle_konfiguration() is config_modul.config
+        assert config_modul.config.PLOTLY_THEME == "plotly_white"
+
+    def test_unbekannte_konfiguration(self):
+        """Tippfehler werden nicht stillschweigend übernommen"""
+        with pytest.raises(AttributeError, match="PLOT_THEME"):
+            with config_modul.konfiguration(PLOT_THEME="dunkel"):
+                pass
+
+    def test_aspect_ratio(self):
+        """setze_aspect_ratio im Kontext ändert die globale Instanz nicht"""
+        pytest.importorskip("plotly")
+        from schul_mathematik.analysis import aspect_ratio
+
+        arten = ["quadratisch", "breitbild", "kino", "standard"] * (THREADS // 4)
+
+        def setzen(art):
+            with aspect_ratio.aspect_ratio_kontext():
+                aspect_ratio.setze_aspect_ratio(art)
+                return aspect_ratio.get_aspect_ratio_info()["type"]
+
+        vorher = aspect_ratio.get_aspect_ratio_info()
+        assert _parallel(setzen, arten) == arten
+        assert aspect_ratio.get_aspect_ratio_info() == vorher
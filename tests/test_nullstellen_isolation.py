@@ -0,0 +1,87 @@
+"""
+Tests für die zertifizierte Nullstellenisolation.
+
+Überprüft Sturmsche Isolationsintervalle, das exakte Erkennen rationaler
+Nullstellen über den Satz über rationale Nullstellen (statt Gleitkomma-
+vergleichen) und das Weiterverfeinern gespeicherter Intervalle.
+"""
+
+from fractions import Fraction
+
+import sympy as sp
+
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.ganzrationale import GanzrationaleFunktion
+from schul_mathematik.analysis.polynom import DichtesPolynom
+
+x = sp.Symbol("x")
+
+
+class TestIsolation:
+    """Tests für DichtesPolynom.nullstellen_mit_vielfachheit"""
+
+    def test_intervalle(self):
+        """Jedes Intervall enthält genau eine Nullstelle, aufsteigend"""
+        p = DichtesPolynom.aus_poly(sp.Poly((x**2 - 2) * (x - 1) ** 2 * (3 * x + 1), x))
+        nullstellen = p.nullstellen_mit_vielfachheit()
+
+        assert [i for _, i in nullstellen] == [1, 1, 2, 1]
+        assert [n.rational() for n, _ in nullstellen] == [
+            None,
+            Fraction(-1, 3),
+            Fraction(1),
+            None,
+        ]
+        for nullstelle, _ in nullstellen:
+            a, b = nullstelle.intervall
+            assert a == b or nullstelle.polynom.wert(a) * nullstelle.polynom.wert(b) < 0
+
+    def test_verfeinern_setzt_fort(self):
+        """Höhere Genauigkeit verfeinert das gespeicherte Intervall weiter"""
+        p = DichtesPolynom([-2, 0, 1])
+        nullstelle = p.nullstellen_mit_vielfachheit()[1][0]
+        nullstelle.naeherung(10)
+        a, b = nullstelle.intervall
+
+        assert b - a <= Fraction(1, 10**10)
+        assert p.nullstellen_mit_vielfachheit()[1][0] is nullstelle
+        nullstelle.naeherung(30)
+        assert a <= nullstelle.intervall[0] < nullstelle.intervall[1] <= b
+        assert abs(float(nullstelle.naeherung(30)) - 2**0.5) < 1e-15
+
+
+class TestGanzrationaleFunktion:
+    """Tests für die exakten Nullstellen ganzrationaler Funktionen"""
+
+    def test_grad_fuenf(self):
+        """Nicht auflösbare Polynome liefern CRootOf statt Dezimalzahlen"""
+        nullstellen = Funktion("x^5 - x - 1").nullstellen()
+        assert [n.x for n in nullstellen] == [sp.CRootOf(x**5 - x - 1, 0)]
+
+    def test_grosse_koeffizienten(self):
+        """Rationale Nullstellen mit großen Nennern bleiben exakt"""
+        f = GanzrationaleFunktion("(997x - 1000003)*(13x + 7)*(x^2 - 3)")
+        assert [n.x for n in f.nullstellen()] == [
+            sp.Rational(1000003, 997),
+            sp.sqrt(3),
+            sp.Rational(-7, 13),
+            -sp.sqrt(3),
+        ]
+
+    def test_keine_falschen_brueche(self):
+        """Irrationale Nullstellen dicht an 1/3 werden nicht als 1/3 erkannt"""
+        f = GanzrationaleFunktion("(x - 1/3)^2 - 10^(-25)")
+        werte = [n.x for n in f.nullstellen()]
+
+        assert len(werte) == 2
+        assert all(not w.is_rational for w in werte)
+        assert sp.Rational(1, 3) not in werte
+
+    def test_naeherung(self):
+        """Näherungen auf Wunsch, rationale Nullstellen bleiben exakt"""
+        f = GanzrationaleFunktion("(x^2 - 2)*(2x - 1)")
+        nullstellen = f.nullstellen_naeherung(20)
+
+        assert [n.exakt for n in nullstellen] == [False, True, False]
+        assert nullstellen[1].x == sp.Rational(1, 2)
+        assert abs(nullstellen[0].x - sp.sqrt(2)) < sp.Rational(1, 10**20)
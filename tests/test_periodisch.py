@@ -0,0 +1,101 @@
+"""
+Tests für periodische Lösungsscharen.
+
+Überprüft das Zusammenfassen der solveset-Bildmengen zu Basislösungen und
+gemeinsamer Periode, das direkte Aufzählen in einem Intervall und die
+Nullstellen trigonometrischer Funktionen.
+"""
+
+import time
+
+import sympy as sp
+
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.periodisch import PeriodischeLoesung
+
+x = sp.Symbol("x")
+
+
+def _schar(term):
+    return PeriodischeLoesung.aus_menge(sp.solveset(term, x, sp.S.Reals))
+
+
+class TestAusMenge:
+    """Tests für PeriodischeLoesung.aus_menge"""
+
+    def test_basen_und_periode(self):
+        """Bildmengen werden auf Basen in [0, p) normiert"""
+        schar = _schar(sp.sin(3 * x))
+        assert schar.periode == 2 * sp.pi / 3
+        assert schar.basen == (0, sp.pi / 3)
+
+    def test_gemeinsame_periode(self):
+        """Unterschiedliche Perioden werden über das kgV zusammengefasst"""
+        schar = _schar(sp.sin(x) + sp.sin(x / 2))
+        assert schar.periode == 4 * sp.pi
+        assert schar.basen == (0, 4 * sp.pi / 3, 2 * sp.pi, 8 * sp.pi / 3)
+
+    def test_nicht_periodisch(self):
+        """ConditionSet und endliche Mengen ergeben keine Schar"""
+        assert _schar(x + sp.sin(x)) is None
+        assert _schar(x**2 - 1) is None
+
+    def test_enthaelt(self):
+        """Zugehörigkeit wird exakt modulo der Periode geprüft"""
+        schar = _schar(sp.tan(x) - 1)
+        assert 101 * sp.pi / 4 in schar
+        assert sp.pi / 2 not in schar
+
+
+class TestImIntervall:
+    """Tests für das Aufzählen in einem Intervall"""
+
+    def test_sortiert_und_vollstaendig(self):
+        """Alle Lösungen im Intervall, aufsteigend und inklusive der Grenzen"""
+        schar = _schar(sp.sin(x) - sp.Rational(1, 3))
+        loesungen = schar.im_intervall(-2 * sp.pi, 2 * sp.pi)
+        basis = sp.asin(sp.Rational(1, 3))
+        assert loesungen == [
+            -2 * sp.pi + basis,
+            -sp.pi - basis,
+            basis,
+            sp.pi - basis,
+        ]
+        assert _schar(sp.cos(x)).im_intervall(-sp.pi / 2, sp.pi / 2) == [
+            -sp.pi / 2,
+            sp.pi / 2,
+        ]
+        assert _schar(sp.cos(x)).im_intervall(1, -1) == []
+
+    def test_grosses_intervall(self):
+        """sin(3x) auf [-100, 100] wird ohne Durchprobieren aufgezählt"""
+        f = Funktion("sin(3x)")
+        start = time.perf_counter()
+        nullstellen = f.nullstellen_im_intervall(-100, 100)
+        dauer = time.perf_counter() - start
+
+        werte = [n.x for n in nullstellen]
+        assert werte == [k * sp.pi / 3 for k in range(-95, 96)]
+        assert dauer < 2
+
+
+class TestNullstellen:
+    """Tests für die Nullstellen periodischer Funktionen"""
+
+    def test_summe_ohne_ausgabe(self, capsys):
+        """Summen liefern die Schar in TRIG_BEREICH und schreiben nichts"""
+        nullstellen = Funktion("sin(x) + cos(x)").nullstellen()
+
+        assert [n.x for n in nullstellen] == [
+            -5 * sp.pi / 4,
+            -sp.pi / 4,
+            3 * sp.pi / 4,
+            7 * sp.pi / 4,
+        ]
+        assert capsys.readouterr().out == ""
+
+    def test_ohne_schar(self):
+        """Nicht-periodische Nullstellen werden nach dem Intervall gefiltert"""
+        f = Funktion("x^2 - 4")
+        assert f.nullstellen_schar() is None
+        assert [n.x for n in f.nullstellen_im_intervall(0, 5)] == [2]
@@ -0,0 +1,111 @@
+"""
+Tests für die dichte Koeffizientendarstellung ganzrationaler Funktionen.
+
+Überprüft Horner-Auswertung (exakt und auf Arrays), Ableiten, Aufleiten,
+die quadratfreie Zerlegung sowie die Anbindung an GanzrationaleFunktion:
+direkte Konstruktion aus Koeffizienten und Rückfall auf SymPy bei
+Parametern.
+"""
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.ganzrationale import GanzrationaleFunktion
+from schul_mathematik.analysis.polynom import DichtesPolynom
+
+x = sp.Symbol("x")
+
+
+class TestDichtesPolynom:
+    """Tests für DichtesPolynom"""
+
+    def setup_method(self):
+        self.p = DichtesPolynom([1, -2, 0, 1])  # x³ - 2x + 1
+
+    def test_horner(self):
+        """Exakte Auswertung und Auswertung auf Arrays"""
+        assert self.p.wert(Fraction(1, 2)) == Fraction(1, 8)
+        assert self.p.wert(0.1) == Fraction(801, 1000)
+        stellen = np.linspace(-3, 3, 7)
+        assert self.p.auswerten(stellen) == pytest.approx(stellen**3 - 2 * stellen + 1)
+
+    def test_ableitung_und_stammfunktion(self):
+        """Ableiten und Aufleiten direkt auf den Koeffizienten"""
+        assert self.p.ableitung() == DichtesPolynom([-2, 0, 3])
+        assert self.p.ableitung(4).grad == -1
+        assert self.p.stammfunktion() == DichtesPolynom([0, 1, -1, 0, Fraction(1, 4)])
+        assert self.p.stammfunktion().ableitung() == self.p
+
+    def test_quadratfreie_zerlegung(self):
+        """Faktoren und Vielfachheiten wie bei sqf_list"""
+        term = 3 * (x - 1) ** 3 * (x + 2) ** 2 * (x**2 + 1) * (2 * x - 1)
+        p = DichtesPolynom.aus_poly(sp.Poly(term, x))
+        zerlegung = {(q.als_ausdruck(x), i) for q, i in p.quadratfreie_zerlegung()}
+
+        assert zerlegung == {
+            (sp.expand((x**2 + 1) * (x - sp.Rational(1, 2))), 1),
+            (x + 2, 2),
+            (x - 1, 3),
+        }
+        assert DichtesPolynom([5]).quadratfreie_zerlegung() == []
+
+    def test_nur_rationale_koeffizienten(self):
+        """Parameter und Gleitkomma-Koeffizienten bleiben bei SymPy"""
+        a = sp.Symbol("a")
+        assert DichtesPolynom.aus_poly(sp.Poly(a * x**2 + 1, x)) is None
+        assert DichtesPolynom.aus_poly(sp.Poly(0.5 * x**2, x)) is None
+
+
+class TestGanzrationaleFunktion:
+    """Tests für die Anbindung an GanzrationaleFunktion"""
+
+    def test_liste_ohne_parser(self, monkeypatch):
+        """Koeffizientenlisten werden nicht über einen String geparst"""
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("Parser aufgerufen")
+
+        monkeypatch.setattr(Funktion, "_parse_string_to_sympy", verboten)
+        f = GanzrationaleFunktion([1, -4, 3])
+        g = GanzrationaleFunktion({3: 2, 1: Fraction(-3, 2)}, variable="t")
+
+        assert f.polynom == DichtesPolynom([1, -4, 3])
+        assert f.term_sympy == 3 * x**2 - 4 * x + 1
+        assert g.term_sympy == 2 * sp.Symbol("t") ** 3 - sp.Rational(3, 2) * sp.Symbol(
+            "t"
+        )
+
+    def test_ohne_simplify(self, monkeypatch):
+        """Funktionswerte, Ableitung und Integral brauchen kein simplify/diff"""
+        f = Funktion("x^4 - 3x^2 + 2")
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("SymPy aufgerufen")
+
+        monkeypatch.setattr(sp.Expr, "simplify", verboten)
+        monkeypatch.setattr(sp, "diff", verboten)
+        monkeypatch.setattr(sp, "integrate", verboten)
+
+        assert f.wert(Fraction(1, 2)) == sp.Rational(21, 16)
+        assert f.wert(2.5) == pytest.approx(22.3125)
+        assert f.ableitung().term_sympy == 4 * x**3 - 6 * x
+        assert f.integral().term_sympy == x**5 / 5 - x**3 + 2 * x
+
+    def test_vielfachheiten(self):
+        """Vielfachheiten stammen aus der quadratfreien Zerlegung"""
+        f = Funktion("(x - 1)^3*(x + 2)^2*x")
+        assert [(n.x, n.multiplicitaet) for n in f.nullstellen()] == [
+            (1, 3),
+            (0, 1),
+            (-2, 2),
+        ]
+
+    def test_parameter(self):
+        """Mit Parametern rechnet die Funktion weiter mit SymPy"""
+        f = Funktion("a*x^2 + 1")
+        assert f.polynom is None
+        assert f.wert(2) == 4 * sp.Symbol("a") + 1
@@ -0,0 +1,117 @@
+"""
+Tests für die Nullstellen von Produktfunktionen.
+
+Überprüft das Zusammenfassen gleicher Nullstellen über Hash und numerischen
+Schlüssel, die Vielfachheiten und das parallele Lösen der Faktoren im
+Prozesspool.
+"""
+
+import sympy as sp
+
+from schul_mathematik.analysis import strukturiert
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.sympy_types import Nullstelle
+
+
+def _paare(nullstellen):
+    return [(n.x, n.multiplicitaet) for n in nullstellen]
+
+
+class TestZusammenfassen:
+    """Tests für _kombiniere_nullstellen"""
+
+    def setup_method(self):
+        self.f = Funktion("(x - 2)*exp(x)")
+
+    def test_gleiche_ausdruecke(self):
+        """Gleiche Nullstellen addieren ihre Vielfachheiten"""
+        zusammen = self.f._kombiniere_nullstellen(
+            [Nullstelle(sp.Integer(2), 2), Nullstelle(sp.Integer(-2)), sp.Integer(2)]
+        )
+        assert _paare(zusammen) == [(2, 3), (-2, 1)]
+
+    def test_verschiedene_schreibweisen(self):
+        """Wertgleiche Ausdrücke werden nach symbolischer Prüfung verschmolzen"""
+        wurzel = sp.sqrt(2)
+        zusammen = self.f._kombiniere_nullstellen(
+            [
+                Nullstelle(sp.Pow(1 + wurzel, 2, evaluate=False)),
+                Nullstelle(3 + 2 * wurzel, 2),
+                Nullstelle(-wurzel),
+                Nullstelle(wurzel),
+            ]
+        )
+        assert [n.multiplicitaet for n in zusammen] == [3, 1, 1]
+
+    def test_rauschen_ohne_vorzeichen(self):
+        """Winzige Imaginärteile beider Vorzeichen ergeben denselben Schlüssel"""
+        plus = sp.Rational(3, 2) + sp.Float("2.35e-38") * sp.I
+        minus = sp.Rational(3, 2) - sp.Float("4.70e-38") * sp.I
+        assert strukturiert._numerischer_schluessel(plus) == (1.5, 0.0)
+        assert strukturiert._numerischer_schluessel(minus) == (1.5, 0.0)
+
+    def test_parameter(self):
+        """Nullstellen mit Parametern werden ebenfalls erkannt"""
+        a = sp.Symbol("a")
+        zusammen = self.f._kombiniere_nullstellen(
+            [Nullstelle(1 / a), Nullstelle(a / a**2), Nullstelle(-1 / a)]
+        )
+        assert _paare(zusammen) == [(1 / a, 2), (-1 / a, 1)]
+
+    def test_ohne_simplify(self, monkeypatch):
+        """Das Zusammenfassen ruft simplify nicht auf"""
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("simplify aufgerufen")
+
+        monkeypatch.setattr(sp, "simplify", verboten)
+        monkeypatch.setattr(strukturiert, "simplify", verboten)
+        f = Funktion("x^2*(x - 1)^3*sin(x)")
+
+        assert set(_paare(f.nullstellen())) == {
+            (0, 3),
+            (1, 3),
+            *((k * sp.pi, 1) for k in (-2, -1, 1, 2)),
+        }
+
+
+class TestParalleleFaktoren:
+    """Tests für das Lösen der Faktoren im Prozesspool"""
+
+    TERM = "(x^3 - 2)*(x^4 - 5*x^2 + 4)*sin(x)*(x - 1)"
+
+    def test_wie_sequentiell(self, monkeypatch):
+        """Pool und sequentielles Lösen liefern dieselben Nullstellen"""
+        monkeypatch.setattr(strukturiert, "FAKTOR_WORKERS", 1)
+        sequentiell = Funktion(self.TERM).nullstellen()
+
+        eingereicht = []
+        original = strukturiert._hole_faktor_pool
+
+        def mitschreiben(workers):
+            pool = original(workers)
+            eingereicht.append(workers)
+            return pool
+
+        monkeypatch.setattr(strukturiert, "FAKTOR_WORKERS", 2)
+        monkeypatch.setattr(strukturiert, "_hole_faktor_pool", mitschreiben)
+        parallel = Funktion(self.TERM).nullstellen()
+
+        assert eingereicht == [2]
+        assert _paare(parallel) == _paare(sequentiell)
+        assert dict(_paare(parallel))[1] == 2
+
+    def test_einfache_faktoren_bleiben_lokal(self, monkeypatch):
+        """Ohne zwei aufwendige Faktoren wird kein Pool gestartet"""
+
+        def verboten(_workers):
+            raise AssertionError("Pool gestartet")
+
+        monkeypatch.setattr(strukturiert, "FAKTOR_WORKERS", 4)
+        monkeypatch.setattr(strukturiert, "_hole_faktor_pool", verboten)
+
+        assert set(_paare(Funktion("(x - 1)*(x^2 - 4)*exp(x)").nullstellen())) == {
+            (1, 1),
+            (2, 1),
+            (-2, 1),
+        }
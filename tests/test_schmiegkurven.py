@@ -0,0 +1,146 @@
+"""
+Tests für Schmiegkurven und Hermite-Interpolation.
+
+Die Kurven werden über das konfluente Vandermonde-System exakt bestimmt;
+die erwarteten Terme entsprechen der bisherigen Lösung mit sp.solve.
+"""
+
+import sys
+from fractions import Fraction
+
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis.config import config, konfiguration
+from schul_mathematik.analysis.gauss import _lu_zerlegung_cached
+from schul_mathematik.analysis.interpolation import (
+    hermite_koeffizienten,
+    konfluente_vandermonde_zeile,
+)
+from schul_mathematik.analysis.schmiegkurven import KeineLoesungError, Schmiegkurve
+from schul_mathematik.analysis.schmiegung import (
+    HermiteInterpolation,
+    Schmieggerade,
+    Schmiegkegel,
+    SchmiegkurveAllgemein,
+    Schmiegparabel,
+)
+
+x = sp.Symbol("x")
+
+
+class TestKonfluenteVandermonde:
+    """Tests für die Matrixzeilen und den exakten Löser"""
+
+    def test_zeilen(self):
+        """Zeilen für Funktionswert und Ableitungen"""
+        assert konfluente_vandermonde_zeile(2, 0, 3) == [1, 2, 4, 8]
+        assert konfluente_vandermonde_zeile(2, 1, 3) == [0, 1, 4, 12]
+        assert konfluente_vandermonde_zeile(2, 2, 3) == [0, 0, 2, 12]
+
+    def test_hermite_kubisch(self):
+        """f(0)=0, f'(0)=0, f(1)=1, f'(1)=0 ergibt 3x² − 2x³"""
+        koeffizienten, frei = hermite_koeffizienten(
+            [(0, 0, 0), (0, 1, 0), (1, 0, 1), (1, 1, 0)], 3
+        )
+        assert koeffizienten == (0, 0, 3, -2)
+        assert frei == {}
+
+    def test_unterbestimmt(self):
+        """Freie Koeffizienten werden als Richtungen zurückgegeben"""
+        koeffizienten, frei = hermite_koeffizienten([(1, 0, 2)], 1)
+        assert list(frei) == [1]
+        assert koeffizienten[0] + koeffizienten[1] == 2
+        assert frei[1][0] + frei[1][1] == 0
+
+    def test_widerspruch(self):
+        """Widersprüchliche Bedingungen liefern None"""
+        assert hermite_koeffizienten([(0, 0, 1), (0, 0, 2)], 2) is None
+
+
+class TestSchmiegkurven:
+    """Die Ergebnisse entsprechen den bisherigen GanzrationaleFunktion-Termen"""
+
+    @pytest.mark.parametrize(
+        ("erzeuge", "erwartet"),
+        [
+            (lambda: Schmiegparabel((0, 1), (1, 4), (2, 9)), x**2 + 2 * x + 1),
+            (
+                lambda: Schmiegparabel((0, 0), (1, 1), (2, 0), tangente1=2),
+                -(x**2) + 2 * x,
+            ),
+            (lambda: Schmiegkegel([(0, 0), (1, 1), (2, 8), (3, 27)]), x**3),
+            (lambda: Schmieggerade((0, 0), 2), 2 * x),
+            (
+                lambda: HermiteInterpolation([0, 1], [0, 1], [0, 0]),
+                -2 * x**3 + 3 * x**2,
+            ),
+            (
+                lambda: HermiteInterpolation([0, 1, 2], [0, 1, 0], [1, 0, -1]),
+                x**4 / 2 - 2 * x**3 + sp.Rational(3, 2) * x**2 + x,
+            ),
+        ],
+    )
+    def test_exakte_terme(self, erzeuge, erwartet):
+        """Exakte Eingaben liefern exakte Koeffizienten"""
+        assert sp.expand(erzeuge().funktion.term_sympy - erwartet) == 0
+
+    def test_gleitkomma_bleibt_gleitkomma(self):
+        """Gleitkomma-Eingaben liefern wie bisher Gleitkomma-Koeffizienten"""
+        kurve = SchmiegkurveAllgemein([(0, 0), (2, 4)], normalen=[-1, -0.5])
+        assert kurve.funktion.term() == "-0.25*x^3 + 1.0*x^2 + 1.0*x"
+
+    def test_unterbestimmt_mit_parametern(self):
+        """Freie Koeffizienten bleiben als Parameter a_j stehen"""
+        kurve = Schmiegkegel([(0, 0), (2, 4)], [1, None])
+        a_3 = sp.Symbol("a_3")
+        assert (
+            sp.expand(
+                kurve.funktion.term_sympy
+                - (a_3 * x**3 + (sp.Rational(1, 2) - 2 * a_3) * x**2 + x)
+            )
+            == 0
+        )
+
+    def test_parameter_in_bedingungen(self):
+        """Parameter in Punkten und Tangenten werden mit SymPy gelöst"""
+        a = sp.Symbol("a")
+        kurve = Schmiegkurve(punkte=[(0, a), (1, 1), (2, 4)])
+        erwartet = (a + 2) / 2 * x**2 - 3 * a / 2 * x + a
+        assert sp.expand(kurve.funktion.term_sympy - erwartet) == 0
+
+        kurve = Schmiegkurve(punkte=[(0, 0), (1, 1)], tangenten=[a, None])
+        assert sp.expand(kurve.funktion.term_sympy - ((1 - a) * x**2 + a * x)) == 0
+
+    def test_irrationale_stelle(self):
+        """Irrationale Stützstellen bleiben exakt"""
+        kurve = Schmiegkurve(punkte=[(sp.sqrt(2), 1), (0, 0), (1, 1)])
+        erwartet = -sp.sqrt(2) / 2 * x**2 + (sp.sqrt(2) / 2 + 1) * x
+        assert sp.expand(kurve.funktion.term_sympy - erwartet) == 0
+
+    def test_plot_mit_kontext_konfiguration(self, monkeypatch):
+        """Farben kommen aus der Konfiguration des aktuellen Kontexts"""
+        monkeypatch.setitem(sys.modules, "marimo", None)
+        kurve = Schmiegkurve([(0, 0), (1, 1), (2, 4)])
+        farben = {**config.COLORS, "primary": "#123456"}
+        with konfiguration(COLORS=farben):
+            fig = kurve.zeige_schmiegkurve_plotly()
+        assert fig.data[0].line.color == "#123456"
+        assert kurve.zeige_schmiegkurve_plotly().data[0].line.color != "#123456"
+
+    def test_keine_loesung(self):
+        """Überbestimmte, widersprüchliche Bedingungen"""
+        with pytest.raises(KeineLoesungError):
+            Schmiegparabel((0, 0), (1, 1), (2, 0), tangente1=0)
+
+    def test_viele_mit_gemeinsamer_zerlegung(self):
+        """Gleiche Stützstellen teilen sich eine LU-Zerlegung"""
+        _lu_zerlegung_cached.cache_clear()
+        kurven = Schmiegkurve.viele(
+            [[(0, y0), (1, y1)] for y0, y1 in [(0, 1), (1, 0), (2, 2)]],
+            tangenten_mengen=[[0, 0], [1, -1], [Fraction(1, 2), 3]],
+        )
+        assert len(kurven) == 3
+        assert _lu_zerlegung_cached.cache_info().misses == 1
+        for kurve in kurven:
+            assert kurve.validiere_loesung()["abweichungen"] == []
@@ -0,0 +1,143 @@
+"""
+Tests für die kompakte Serialisierung von Funktionen.
+
+Überprüft die Präfixform für SymPy-Ausdrücke, to_dict/from_dict für alle
+Funktionstypen, das Mitnehmen gecachter Ergebnisse und Pickle.
+"""
+
+import json
+import pickle
+
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis import serialisierung
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.serialisierung import (
+    ausdruck_zu_praefix,
+    praefix_zu_ausdruck,
+)
+
+
+def _json_rundreise(daten):
+    return json.loads(json.dumps(daten))
+
+
+class TestPraefixform:
+    """Tests für die Darstellung von SymPy-Ausdrücken"""
+
+    @pytest.mark.parametrize(
+        "ausdruck",
+        [
+            sp.sympify("x**2 - 4"),
+            sp.Rational(1, 3) * sp.sin(sp.Symbol("x")) + sp.pi,
+            sp.Float("0.1") * sp.exp(-sp.Symbol("t")),
+            sp.Symbol("x", positive=True) + sp.I,
+            sp.log(sp.Symbol("x")) - sp.oo,
+            sp.Mul(2, sp.sympify("6*x**2 - 5"), evaluate=False),
+        ],
+    )
+    def test_rundreise_exakt(self, ausdruck):
+        """Struktur und Annahmen bleiben auch nach JSON erhalten"""
+        zurueck = praefix_zu_ausdruck(_json_rundreise(ausdruck_zu_praefix(ausdruck)))
+        assert sp.srepr(zurueck) == sp.srepr(ausdruck)
+
+    def test_kompakt(self):
+        """Die Präfixform ist kürzer als srepr"""
+        ausdruck = sp.sympify("x**4 - 5*x**2 + 4")
+        assert ausdruck_zu_praefix(ausdruck) == (
+            "Add",
+            4,
+            ("Pow", ("Symbol", "x"), 4),
+            ("Mul", -5, ("Pow", ("Symbol", "x"), 2)),
+        )
+        assert len(repr(ausdruck_zu_praefix(ausdruck))) < len(sp.srepr(ausdruck))
+
+    def test_unbekannter_kopf(self):
+        """Nur SymPy-Klassen werden aufgebaut"""
+        with pytest.raises(ValueError, match="open"):
+            praefix_zu_ausdruck(("open", "datei.txt"))
+
+
+class TestFunktionSerialisierung:
+    """Tests für to_dict/from_dict und Pickle"""
+
+    @pytest.mark.parametrize(
+        "term",
+        [
+            "2x + 3",
+            "x^2 - 4",
+            "x^4 - 5*x^2 + 4",
+            "a*x^3 - 3*a*x",
+            "(x^2 + 1)/(x - 1)",
+            "x^2*exp(-x)",
+            "sin(x) + x",
+            "exp(2*x) - 3",
+        ],
+    )
+    def test_rundreise(self, term):
+        """Typ, Term, Parameter und typspezifischer Zustand bleiben erhalten"""
+        f = Funktion(term)
+        g = Funktion.from_dict(_json_rundreise(f.to_dict()))
+
+        assert type(g) is type(f)
+        assert g.term() == f.term()
+        assert g.term_sympy == f.term_sympy
+        assert [p.name for p in g.parameter] == [p.name for p in f.parameter]
+        assert g.ableitung().term() == f.ableitung().term()
+        if hasattr(f, "koeffizienten"):
+            assert g.koeffizienten == f.koeffizienten
+        if hasattr(f, "komponenten"):
+            assert [type(k) for k in g.komponenten] == [type(k) for k in f.komponenten]
+            assert g._struktur_info["struktur"] == f._struktur_info["struktur"]
+
+    def test_ohne_parser(self, monkeypatch):
+        """Beim Laden wird weder geparst noch klassifiziert"""
+        daten = Funktion("(x^2 + 1)/(x - 1)").to_dict()
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("Parser aufgerufen")
+
+        monkeypatch.setattr(Funktion, "_parse_string_to_sympy", verboten)
+        with monkeypatch.context() as laden:
+            laden.setattr(Funktion, "__new__", verboten)
+            g = Funktion.from_dict(daten)
+
+        # Komponenten entstehen erst jetzt, aus den gespeicherten Ausdrücken
+        assert g.zaehler.term() == "x^2 + 1"
+
+    def test_mit_ergebnissen(self):
+        """Gecachte Nullstellen und Ableitungen werden mitgenommen"""
+        f = Funktion("x^3 - 3*x")
+        f.nullstellen()
+        f.ableitung(2)
+
+        ohne = f.to_dict()
+        mit = f.to_dict(mit_ergebnissen=True)
+        assert "ergebnisse" not in ohne
+        assert set(mit["ergebnisse"]) == {"nullstellen", "ableitungen"}
+
+        g = Funktion.from_dict(_json_rundreise(mit))
+        assert g._nullstellen_cache == f.nullstellen()
+        assert g.ableitung(2).term() == "6*x"
+        assert g._ableitung_cache_hits == 1
+
+    def test_pickle(self):
+        """Pickle nutzt die kompakte Darstellung inklusive Ergebnissen"""
+        f = Funktion("x^4 - x^2")
+        f.name = "f"
+        f.nullstellen()
+
+        g = pickle.loads(pickle.dumps(f))
+
+        assert type(g) is type(f)
+        assert g.name == "f"
+        assert g.term() == f.term()
+        assert g._nullstellen_cache == f._nullstellen_cache
+
+    def test_unbekannte_version(self):
+        """Fremde Formatversionen werden abgelehnt"""
+        daten = Funktion("x^2").to_dict()
+        daten["version"] = serialisierung.FORMAT_VERSION + 1
+        with pytest.raises(ValueError, match="Serialisierungsformat"):
+            Funktion.from_dict(daten)
@@ -0,0 +1,98 @@
+"""
+Tests für den schlanken Speicheraufbau von Funktionen und Ergebnistypen.
+
+Überprüft __slots__ der Ergebnistypen, die erst bei Bedarf angelegten Caches
+und das gewohnte hasattr-Verhalten der Cache-Attribute.
+"""
+
+import pickle
+
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.symbolic import _Parameter, _Variable
+from schul_mathematik.analysis.sympy_types import (
+    Extrempunkt,
+    ExtremumTyp,
+    Nullstelle,
+    Wendepunkt,
+)
+
+
+class TestErgebnistypen:
+    """Tests für die geslotteten Ergebnis-Dataclasses"""
+
+    @pytest.mark.parametrize(
+        "ergebnis",
+        [
+            Nullstelle(sp.Integer(2)),
+            Extrempunkt(sp.Integer(1), sp.Integer(-2), ExtremumTyp.MINIMUM),
+            Wendepunkt(sp.Integer(0), sp.Integer(0)),
+            _Variable("x"),
+            _Parameter("a"),
+        ],
+    )
+    def test_kein_dict(self, ergebnis):
+        """Ergebnisse und Symbole belegen kein Instanz-Dictionary"""
+        assert not hasattr(ergebnis, "__dict__")
+        assert pickle.loads(pickle.dumps(ergebnis)) == ergebnis
+
+    def test_symbol_bleibt_erhalten(self):
+        """_Variable vergleicht nur über den Namen und kennt ihr Symbol"""
+        assert _Variable("x") == _Variable("x")
+        assert _Variable("x").symbol == sp.Symbol("x")
+        assert repr(_Parameter("a")) == "_Parameter('a')"
+
+
+class TestCachesBeiBedarf:
+    """Tests für die erst bei Bedarf angelegten Caches"""
+
+    def test_frische_funktion_ohne_caches(self):
+        """Neue Funktionen und Ableitungen tragen keine Caches"""
+        f = Funktion("x^3 - 3*x")
+        assert f._caches is None
+        assert not hasattr(f, "_ableitung_cache")
+        assert not hasattr(f, "_nullstellen_cache")
+
+        f1 = f.ableitung()
+        assert f._caches is not None
+        assert f1._caches is None
+        assert f._ableitung_cache_misses == 1
+
+    def test_keine_zusatzattribute(self):
+        """Kern- und Typattribute liegen in Slots, nicht im Instanz-Dictionary"""
+        for term in ["x^3 - 3*x", "2x + 1", "(x^2 + 1)/(x - 1)", "sin(x)"]:
+            f = Funktion(term)
+            f.ableitung()
+            f(2)
+            assert vars(f) == {}, term
+
+    def test_cache_leeren(self):
+        """Geleerte Caches bleiben benutzbar"""
+        f = Funktion("x^4 - x^2")
+        f.nullstellen()
+        f.ableitung()
+        f._cache_leeren()
+
+        assert f._ableitung_cache == {}
+        assert f._ableitung_cache_hits == 0
+        assert f.ableitung().term() == "4*x^3 - 2*x"
+
+    def test_quotient_polstellen(self):
+        """Polstellen nutzen den allgemeinen Cache ohne Vorbelegung"""
+        f = Funktion("(x^2 + 1)/(x - 1)")
+        assert f._caches is None
+        assert [p.x for p in f.polstellen()] == [1]
+        assert f._cache["polstellen"] is f.polstellen()
+
+    def test_polynom_bei_bedarf(self):
+        """Das dichte Polynom entsteht erst beim ersten Zugriff"""
+        f = Funktion("x^3 - 3*x")
+        assert not hasattr(f, "_polynom")
+        assert f.polynom.koeffizienten == (0, -3, 0, 1)
+        assert f._polynom[1] is f.polynom
+
+        f.term_sympy = sp.Symbol("x") ** 2 - sp.Rational(1, 2)
+        assert f.polynom.koeffizienten == (sp.Rational(-1, 2), 0, 1)
+        assert Funktion("a*x^2").polynom is None
@@ -0,0 +1,143 @@
+"""
+Tests für die Stapelverarbeitung (analysiere_viele).
+
+Überprüft die kompakten Ergebnisse, die Isolation fehlerhafter Terme,
+Zeitlimits pro Term und die Wiederholung nach einem Worker-Absturz.
+"""
+
+import multiprocessing
+import os
+import pickle
+import sys
+
+import pytest
+
+from schul_mathematik.analysis import stapelanalyse
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.stapelanalyse import Analyseergebnis, analysiere_viele
+
+
+def _nach_index(ergebnisse):
+    return sorted(ergebnisse, key=lambda e: e.index)
+
+
+class TestAnalysiereViele:
+    """Tests für Ergebnisse und Fehlerbehandlung"""
+
+    def test_kompakte_ergebnisse(self):
+        """Nullstellen, Extrempunkte und Symmetrie als einfache Python-Objekte"""
+        (ergebnis,) = analysiere_viele(["x^3 - 3*x"], workers=1)
+
+        assert ergebnis.ok
+        assert ergebnis.term == "x^3 - 3*x"
+        assert {n["x"] for n in ergebnis.werte["nullstellen"]} == {
+            "sqrt(3)",
+            0,
+            "-sqrt(3)",
+        }
+        assert {(p["x"], p["y"], p["typ"]) for p in ergebnis.werte["extrempunkte"]} == {
+            (1, -2, "Minimum"),
+            (-1, 2, "Maximum"),
+        }
+        assert ergebnis.werte["wendepunkte"] == (
+            {"x": 0, "y": 0, "typ": "Wendepunkt", "exakt": True},
+        )
+        assert ergebnis.werte["symmetrie"] == "Punktsymmetrisch zum Ursprung"
+        assert pickle.loads(pickle.dumps(ergebnis)) == ergebnis
+
+    def test_funktionsobjekte_und_ableitung(self):
+        """Funktionsobjekte werden direkt (ohne erneutes Parsen) analysiert"""
+        (ergebnis,) = analysiere_viele(
+            [Funktion("x^2 + 1")], aspekte=["ableitung"], workers=1
+        )
+        assert ergebnis.werte == {"ableitung": "2*x"}
+
+    def test_fehlerhafter_term_bleibt_isoliert(self):
+        """Ein ungültiger Term stoppt den Stapel nicht"""
+        ergebnisse = _nach_index(
+            analysiere_viele(["x^^2", "x^2 - 4"], aspekte=["nullstellen"], workers=1)
+        )
+
+        assert ergebnisse[0].term is None
+        assert "funktion" in ergebnisse[0].fehler
+        assert ergebnisse[1].ok
+        assert len(ergebnisse[1].werte["nullstellen"]) == 2
+
+    def test_ungueltige_eingabe_bleibt_isoliert(self):
+        """Eingaben ohne term() werden als Fehler gemeldet, nicht geworfen"""
+        ergebnisse = _nach_index(
+            analysiere_viele([None, "x^2 - 4"], aspekte=["nullstellen"], workers=1)
+        )
+
+        assert ergebnisse[0].eingabe == "None"
+        assert ergebnisse[0].fehler["funktion"].startswith("AttributeError")
+        assert ergebnisse[1].ok
+
+    def test_unbekannter_aspekt(self):
+        """Unbekannte Aspekte werden vor dem Start abgelehnt"""
+        with pytest.raises(ValueError, match="Tangentensteigung"):
+            list(analysiere_viele(["x"], aspekte=["Tangentensteigung"]))
+
+    @pytest.mark.skipif(
+        not hasattr(stapelanalyse.signal, "setitimer"), reason="braucht SIGALRM"
+    )
+    def test_zeitlimit_pro_term(self, monkeypatch):
+        """Ein zu langsamer Term wird abgebrochen, die übrigen laufen weiter"""
+        monkeypatch.setitem(stapelanalyse.ASPEKTE, "langsam", _endlos)
+
+        ergebnisse = _nach_index(
+            analysiere_viele(
+                ["x^2", "x^3"], aspekte=["langsam"], workers=1, timeout=0.2
+            )
+        )
+
+        assert all("Zeitlimit" in e.fehler["langsam"] for e in ergebnisse)
+        assert [e.term for e in ergebnisse] == ["x^2", "x^3"]
+
+
+def _endlos(_f):
+    while True:
+        pass
+
+
+def _absturz_bei_x3(f):
+    if f.term() == "x^3":
+        os._exit(1)
+    return f.term()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="braucht fork")
+class TestProzesspool:
+    """Tests für die Verteilung auf mehrere Prozesse"""
+
+    def setup_method(self):
+        self.kontext = multiprocessing.get_context("fork")
+
+    def test_alle_terme_werden_geliefert(self):
+        """Jeder Term liefert genau ein Ergebnis"""
+        terme = ["x^2 - 1", "x^3 - x", "2*x + 4", "x^4 - 1"]
+        ergebnisse = _nach_index(
+            analysiere_viele(
+                terme, aspekte=["nullstellen"], workers=2, mp_context=self.kontext
+            )
+        )
+
+        assert [e.index for e in ergebnisse] == [0, 1, 2, 3]
+        assert all(isinstance(e, Analyseergebnis) and e.ok for e in ergebnisse)
+
+    def test_worker_absturz(self, monkeypatch):
+        """Ein abstürzender Worker trifft nur den verursachenden Term"""
+        monkeypatch.setitem(stapelanalyse.ASPEKTE, "absturz", _absturz_bei_x3)
+
+        ergebnisse = _nach_index(
+            analysiere_viele(
+                ["x^2", "x^3", "x^4"],
+                aspekte=["absturz"],
+                workers=2,
+                mp_context=self.kontext,
+            )
+        )
+
+        assert ergebnisse[1].fehler == {"funktion": "Worker-Prozess abgestürzt"}
+        assert ergebnisse[0].werte == {"absturz": "x^2"}
+        assert ergebnisse[2].werte == {"absturz": "x^4"}
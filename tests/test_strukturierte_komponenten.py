@@ -0,0 +1,79 @@
+"""
+Tests für die verzögerte Erzeugung der Komponenten strukturierter Funktionen.
+
+Überprüft, dass die Konstruktion keine Komponenten erzeugt, dass sie beim
+ersten Zugriff aus den geparsten Teilausdrücken entstehen und dass eine
+strukturierte Funktion nicht öfter parst als eine einfache.
+"""
+
+import sympy as sp
+
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.instrumentierung import messe_performance
+from schul_mathematik.analysis.strukturiert import (
+    ProduktFunktion,
+    QuotientFunktion,
+    SummeFunktion,
+)
+
+
+def _parse_aufrufe(term: str) -> int:
+    with messe_performance() as bericht:
+        Funktion(term)
+    statistik = bericht.operationen.get("parse")
+    return statistik.anzahl if statistik else 0
+
+
+class TestVerzoegerteKomponenten:
+    """Tests für komponenten, faktoren, summanden, zaehler und nenner"""
+
+    def test_konstruktion_ohne_komponenten(self):
+        """term() und Ableitung brauchen keine Komponenten"""
+        f = Funktion("(x^2 - 1)*exp(x)*sin(x)")
+
+        assert isinstance(f, ProduktFunktion)
+        assert f.term()
+        f.ableitung()
+        assert f._komponenten is None
+
+    def test_erster_zugriff_erzeugt_einmal(self):
+        """Komponenten werden beim ersten Zugriff erzeugt und wiederverwendet"""
+        f = Funktion("(x^2 + 1)/(x - 1)")
+
+        assert isinstance(f, QuotientFunktion)
+        zaehler = f.zaehler
+        assert [type(k).__name__ for k in f.komponenten] == [
+            "QuadratischeFunktion",
+            "LineareFunktion",
+        ]
+        assert f.zaehler is zaehler
+        assert f.nenner.term() == "x - 1"
+
+    def test_aus_teilausdruecken_ohne_parser(self, monkeypatch):
+        """Komponenten entstehen aus SymPy-Teilausdrücken, nicht aus Strings"""
+        f = Funktion("x^2*exp(-x) + sin(x)")
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("Parser aufgerufen")
+
+        monkeypatch.setattr(Funktion, "_parse_string_to_sympy", verboten)
+        assert isinstance(f, SummeFunktion)
+        assert [type(s).__name__ for s in f.summanden] == [
+            "ProduktFunktion",
+            "TrigonometrischeFunktion",
+        ]
+        assert f.summand1.faktor2.term_sympy == sp.exp(-sp.Symbol("x"))
+
+    def test_so_billig_wie_einfache_funktion(self):
+        """Strukturierte Funktionen parsen nicht öfter als ganzrationale"""
+        einfach = _parse_aufrufe("x^3 - 3*x")
+
+        assert _parse_aufrufe("(x^2 - 1)*exp(x)*sin(x)") == einfach
+        assert _parse_aufrufe("x^2*exp(-x) + sin(x)") == einfach
+
+    def test_direkte_konstruktion(self):
+        """Ohne Strukturinfo wird der bereits geparste Term analysiert"""
+        f = ProduktFunktion("x*exp(x)")
+
+        assert f.struktur == "produkt"
+        assert [k.term() for k in f.faktoren] == ["x", "exp(x)"]
@@ -0,0 +1,122 @@
+"""
+Tests für Änderungen des Terms.
+
+Überprüft, dass jede Änderung über `term_sympy` die Version erhöht und alle
+Caches der Instanz verwirft, dass `setze_parameter` die Ausgangsfunktion
+unberührt lässt und internierte Funktionen unveränderlich sind. Die
+formatierte Darstellung wird pro Version nur einmal erzeugt.
+"""
+
+import pytest
+import sympy as sp
+
+from schul_mathematik.analysis import funktion as funktion_modul
+from schul_mathematik.analysis.errors import UngueltigeFunktionError
+from schul_mathematik.analysis.funktion import Funktion
+from schul_mathematik.analysis.ganzrationale import GanzrationaleFunktion
+
+x = sp.Symbol("x")
+
+
+class TestVersion:
+    """Tests für die Versionierung des Terms"""
+
+    def test_caches_verworfen(self):
+        """Nach einer Änderung gibt es keine veralteten Ergebnisse"""
+        f = Funktion("(x - 1)*(x + 3)")
+        assert f.wert(2) == 5
+        assert [n.x for n in f.nullstellen()] == [1, -3]
+        assert f.ableitung().term_sympy == 2 * x + 2
+
+        f.term_sympy = x**2 - 4
+        assert f.version == 1
+        assert f._caches is None
+        assert f.wert(2) == 0
+        assert [n.x for n in f.nullstellen()] == [2, -2]
+        assert f.ableitung().term_sympy == 2 * x
+
+    def test_ausmultiplizieren(self):
+        """Nur eine tatsächliche Änderung erhöht die Version"""
+        f = Funktion("(x + 1)^2")
+        f.ausmultiplizieren()
+        assert f.version == 1
+        f.ausmultiplizieren()
+        assert f.version == 1
+
+    def test_symbole_neu_klassifiziert(self):
+        """Variablen und Parameter werden nach einer Änderung nicht verdoppelt"""
+        f = Funktion("a*(x+1)*(x-2)")
+        f.ausmultiplizieren()
+        assert [str(p) for p in f.parameter] == ["a"]
+        assert [str(v) for v in f.variablen] == ["x"]
+
+        f.term_sympy = 2 * x**2
+        f.term_sympy = 3 * x
+        assert f.parameter == []
+        assert [str(v) for v in f.variablen] == ["x"]
+
+    def test_abgeleitete_attribute(self):
+        """Koeffizienten und dichtes Polynom folgen dem Term"""
+        f = GanzrationaleFunktion("x^2 - 1")
+        f.term_sympy = x**3
+        assert f.koeffizienten == [0, 0, 0, 1]
+        assert [(n.x, n.multiplicitaet) for n in f.nullstellen()] == [(0, 3)]
+
+    def test_setze_parameter_ohne_seiteneffekt(self):
+        """Die Ausgangsfunktion behält Term, Version und Caches"""
+        f = Funktion("a*x^2 + 1")
+        f.wert(1)
+        caches = f._caches
+
+        g = f.setze_parameter(a=2)
+        assert g.term_sympy == 2 * x**2 + 1
+        assert f.version == 0
+        assert f._caches is caches
+        assert len(f._wert_cache) == 1
+
+
+class TestInterniert:
+    """Tests für internierte Funktionen"""
+
+    def test_unveraenderlich(self):
+        """Geteilte Objekte dürfen nicht verändert werden"""
+        f = Funktion.interniert("(x + 2)^3")
+        with pytest.raises(UngueltigeFunktionError):
+            f.ausmultiplizieren()
+        assert f.term_sympy == (x + 2) ** 3
+
+        kopie = Funktion(f)
+        kopie.ausmultiplizieren()
+        assert Funktion.interniert("(x + 2)^3") is f
+
+
+class TestDarstellung:
+    """Tests für die gespeicherte Darstellung von term() und term_latex()"""
+
+    def test_einmal_pro_version(self, monkeypatch):
+        """Wiederholte Aufrufe formatieren nicht neu"""
+        f = Funktion("a*x^2 + (a*b + a)*x")
+        aufrufe = []
+        formatiere = funktion_modul._formatiere_mit_poly
+
+        def zaehle(*args):
+            aufrufe.append(args)
+            return formatiere(*args)
+
+        monkeypatch.setattr(funktion_modul, "_formatiere_mit_poly", zaehle)
+
+        texte = {f.term() for _ in range(50)} | {str(f)}
+        assert texte == {"a*x^2 + (a*(b + 1))*x"}
+        assert "a*x^2 + (a*(b + 1))*x" in repr(f)
+        assert len(aufrufe) == 1
+        assert f._caches.darstellung == {"term": "a*x^2 + (a*(b + 1))*x"}
+
+    def test_neue_version(self):
+        """Nach einer Änderung wird neu formatiert"""
+        f = Funktion("(x + 1)^2")
+        assert f.term() == "(x + 1)^2"
+        assert f.term_latex() == "\\left(x + 1\\right)^{2}"
+
+        f.ausmultiplizieren()
+        assert f.term() == "x^2 + 2*x + 1"
+        assert f.term_latex() == "x^{2} + 2 x + 1"
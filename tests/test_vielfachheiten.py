@@ -0,0 +1,64 @@
+"""
+Tests für die Berechnung von Vielfachheiten.
+
+Überprüft die einmalige quadratfreie Zerlegung bei Polynomen (auch mit
+Parametern) und das gemeinsame Auswerten des Ableitungsturms bei
+nicht-polynomialen Termen.
+"""
+
+import sympy as sp
+
+from schul_mathematik.analysis import funktion as funktion_modul
+from schul_mathematik.analysis.funktion import Funktion
+
+x = sp.Symbol("x")
+
+
+class TestPolynome:
+    """Vielfachheiten über sqf_list"""
+
+    def test_ohne_ableitungen(self, monkeypatch):
+        """Eine Zerlegung pro Term, keine Ableitungen pro Nullstelle"""
+        f = Funktion("(x - 1)^3*(x^2 - 2)^2*(x + 5)")
+        aufrufe = []
+        sqf_list = sp.sqf_list
+
+        def zaehle(*args, **kwargs):
+            aufrufe.append(args)
+            return sqf_list(*args, **kwargs)
+
+        def verboten(*_args, **_kwargs):
+            raise AssertionError("Ableitung gebildet")
+
+        monkeypatch.setattr(sp, "sqf_list", zaehle)
+        monkeypatch.setattr(sp, "diff", verboten)
+
+        werte = [1, sp.sqrt(2), -sp.sqrt(2), -5, 7]
+        assert f._berechne_vielfachheiten(werte) == [3, 2, 2, 1, 0]
+        assert f._berechne_vielfachheit(1) == 3
+        assert len(aufrufe) == 1
+
+    def test_parameter(self):
+        """Auch Faktoren mit Parametern werden zugeordnet"""
+        a = sp.Symbol("a")
+        f = Funktion("(x - a)^2*(x + 1)")
+        assert f._berechne_vielfachheiten([a, -1]) == [2, 1]
+
+
+class TestNichtPolynome:
+    """Vielfachheiten über den Ableitungsturm"""
+
+    def test_gemeinsam(self, monkeypatch):
+        """Jede Ableitung wird für alle Stellen nur einmal gebildet"""
+        f = Funktion("sin(x)^2*(x - 1)")
+        ordnungen = []
+        diff = funktion_modul._cached_diff.__wrapped__
+
+        def zaehle(ausdruck, variable, ordnung=1):
+            ordnungen.append(ordnung)
+            return diff(ausdruck, variable, ordnung)
+
+        monkeypatch.setattr(funktion_modul, "_cached_diff", zaehle)
+
+        assert f._berechne_vielfachheiten([0, sp.pi, 1, 2]) == [2, 2, 1, 0]
+        assert ordnungen == [1, 2]
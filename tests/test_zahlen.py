@@ -0,0 +1,41 @@
+"""
+Tests für die gemeinsame exakte Zahlumwandlung.
+
+Überprüft, dass Gleitkommazahlen, NumPy- und SymPy-Zahlen sowie
+Zeichenketten verlustfrei zu Brüchen werden und nicht-rationale Werte
+einen ValueError auslösen.
+"""
+
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from schul_mathematik.gemeinsam import als_bruch, als_rational, ist_gleitkomma
+
+
+class TestAlsBruch:
+    """Tests für als_bruch und als_rational"""
+
+    def test_dezimaldarstellung(self):
+        """0.1 wird zu 1/10, unabhängig vom Zahltyp"""
+        assert als_bruch(0.1) == Fraction(1, 10)
+        assert als_bruch(np.float32(0.1)) == Fraction(1, 10)
+        assert als_bruch(sp.Float(0.1)) == Fraction(1, 10)
+        assert als_bruch(" 2.5 ") == Fraction(5, 2)
+        assert als_bruch(np.int64(7)) == 7
+        assert als_rational(Fraction(2, 6)) == sp.Rational(1, 3)
+
+    def test_nicht_rational(self):
+        """Wurzeln und Symbole sind keine Brüche"""
+        with pytest.raises(ValueError):
+            als_bruch(sp.sqrt(2))
+        with pytest.raises(ValueError):
+            als_bruch(sp.Symbol("a"))
+
+    def test_gleitkomma(self):
+        """Gleitkommazahlen werden unabhängig vom Zahltyp erkannt"""
+        assert ist_gleitkomma(0.5) and ist_gleitkomma(np.float32(0.5))
+        assert ist_gleitkomma(sp.Float(0.5))
+        assert not ist_gleitkomma(1) and not ist_gleitkomma(Fraction(1, 2))